@@ -0,0 +1,9 @@
+"""Browser-driven load generator built on the async page objects.
+
+Runs N concurrent virtual users against a local or stage stack. Every user
+gets its own browser context and repeatedly runs a weighted journey (browse,
+author or evals) through ``pages.aio``, so load comes from the same clicks,
+waits and navigations the UI tests perform. Users start according to a
+ramp-up profile; the run reports throughput and per-step latency
+percentiles. Run ``python -m loadgen --help`` for the options.
+"""
@@ -0,0 +1,137 @@
+"""Command line entry point: ``python -m loadgen``."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from dotenv import load_dotenv
+
+from loadgen.journeys import JOURNEYS
+from loadgen.profiles import MIXES, parse_mix, start_offsets
+from loadgen.report import format_report
+from loadgen.runner import LoadRunner
+from utils.cleanup import CleanupQueue, sweep_orphans
+
+CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m loadgen",
+        description="Run concurrent browser users through the page objects.",
+    )
+    parser.add_argument(
+        "--env",
+        default="local",
+        choices=["local", "stage", "prod"],
+        help="Target environment; loads config/<env>.env (prod needs --allow-prod)",
+    )
+    parser.add_argument(
+        "--allow-prod",
+        action="store_true",
+        help="Confirm that --env prod really should receive this load",
+    )
+    parser.add_argument("--users", type=int, default=10, help="Virtual users")
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=300,
+        help="Seconds during which users start new journeys",
+    )
+    parser.add_argument(
+        "--ramp",
+        default="none",
+        help="none, linear:<seconds> or step:<count>x<seconds>",
+    )
+    parser.add_argument(
+        "--mix",
+        default="browse-heavy",
+        help=f"{', '.join(MIXES)} or weights like browse=3,author=1,evals=1",
+    )
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=1.0,
+        help="Mean pause between a user's journeys, in seconds",
+    )
+    parser.add_argument(
+        "--browsers",
+        type=int,
+        default=1,
+        help="Browser processes to spread the users' contexts over",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=15000,
+        help="Playwright timeout per action, in milliseconds",
+    )
+    parser.add_argument("--headed", action="store_true", help="Show the browsers")
+    parser.add_argument("--seed", type=int, help="Seed for journey choices")
+    parser.add_argument(
+        "--output",
+        default="test-results/load-report.json",
+        help="JSON file receiving throughput, percentiles and histograms",
+    )
+    parser.add_argument(
+        "--cleanup-journal",
+        default=".cleanup-journal",
+        help="Directory for the cleanup journal (shared with pytest)",
+    )
+    parser.add_argument(
+        "--keep-data",
+        action="store_true",
+        help="Do not delete the projects the guests created",
+    )
+    args = parser.parse_args(argv)
+    if args.env == "prod" and not args.allow_prod:
+        parser.error("--env prod sends real load to production; add --allow-prod")
+    try:
+        mix = parse_mix(args.mix, list(JOURNEYS))
+        start_offsets(args.users, args.ramp)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    load_dotenv(CONFIG_DIR / f"{args.env}.env", override=True)
+    cleanup = CleanupQueue(args.cleanup_journal)
+    runner = LoadRunner(
+        base_url=os.getenv("BASE_URL", "http://localhost:3000").rstrip("/"),
+        api_url=os.getenv("API_URL", "http://localhost:8085"),
+        cleanup=cleanup,
+        users=args.users,
+        duration=args.duration,
+        ramp=args.ramp,
+        mix=mix,
+        think_time=args.think_time,
+        browsers=args.browsers,
+        headless=not args.headed,
+        timeout_ms=args.timeout,
+        seed=args.seed,
+        keep_data=args.keep_data,
+    )
+    try:
+        stats = asyncio.run(runner.run())
+    except KeyboardInterrupt:
+        stats = runner.stats
+    for line in format_report(stats):
+        print(line)
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(stats.to_dict(), indent=2))
+    print(f"report written to {output}")
+
+    if not args.keep_data:
+        cleanup.drain()
+        deleted, failed = sweep_orphans(args.cleanup_journal)
+        print(f"cleanup: deleted {deleted} projects, {failed} failed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
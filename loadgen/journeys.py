@@ -0,0 +1,236 @@
+"""User journeys run by the virtual users, built on ``pages.aio``.
+
+Each journey is a coroutine taking the user's ``Session`` and timing its
+steps with ``session.step(name)``. A step that raises ends the journey; the
+user starts its next journey on a fresh navigation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import random
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from playwright.async_api import BrowserContext, Page
+
+from loadgen.report import LoadStats
+from pages.aio import (
+    AuthPage,
+    BrowseDetailPage,
+    BrowsePage,
+    DashboardPage,
+    EvalRunsPage,
+    EvalsPage,
+    ProjectModal,
+    PromptBuilderPage,
+    SharePage,
+)
+from utils.cleanup import CleanupQueue
+from utils.helpers import (
+    api_create_project,
+    api_create_prompt,
+    random_prompt_content,
+    unique_name,
+)
+
+SEARCH_TERMS = ["assistant", "summarize", "code review", "email", "translate"]
+EVAL_TABS = ["Datasets", "Suites", "Runs"]
+
+
+class Session:
+    """One virtual user's browser context, guest login and test data."""
+
+    def __init__(
+        self,
+        context: BrowserContext,
+        page: Page,
+        base_url: str,
+        api_url: str,
+        stats: LoadStats,
+        cleanup: CleanupQueue,
+        rng: random.Random,
+        keep_data: bool = False,
+    ) -> None:
+        """Initialize Session.
+
+        Args:
+            context: The user's browser context.
+            page: The user's page.
+            base_url: Application base URL.
+            api_url: Backend API base URL.
+            stats: Stats the steps are recorded in.
+            cleanup: Journal for the guest identity and created data.
+            rng: The user's random generator.
+            keep_data: Leave the user's API-created data in place.
+        """
+        self.context = context
+        self.page = page
+        self.base_url = base_url
+        self.api_url = api_url
+        self.stats = stats
+        self.cleanup = cleanup
+        self.rng = rng
+        self.keep_data = keep_data
+        self.token: Optional[str] = None
+        self._eval_prompt: Optional[dict] = None
+        self._created: List[dict] = []
+
+    @contextlib.asynccontextmanager
+    async def step(self, name: str) -> AsyncIterator[None]:
+        """Time the enclosed block as step ``name``.
+
+        Args:
+            name: Step name, ``<journey>.<action>``.
+
+        Yields:
+            Nothing; the block runs inside the timed step.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.stats.record_step(name, time.perf_counter() - start, error=True)
+            raise
+        self.stats.record_step(name, time.perf_counter() - start)
+
+    async def login(self) -> str:
+        """Log in as a guest through the UI, once per user.
+
+        The guest is journaled so ``--sweep-orphans`` (or the end of the
+        run) can delete the projects it created.
+
+        Returns:
+            The guest's access token.
+        """
+        if self.token is not None:
+            return self.token
+        auth = AuthPage(self.page, self.base_url)
+        async with self.step("auth.guest_login"):
+            await auth.navigate("/")
+            await auth.click_guest_login()
+            await auth.expect_url(r"/dashboard", timeout=15000)
+        cookies = await self.context.cookies(self.base_url)
+        token = next(
+            (c["value"] for c in cookies if c["name"] == "echostash_token"), None
+        )
+        if token is None:
+            raise RuntimeError("guest login did not set the echostash_token cookie")
+        self.token = token
+        self.cleanup.track_identity(self.api_url, token)
+        return token
+
+    async def eval_prompt(self) -> dict:
+        """A prompt to evaluate, created through the API on first use.
+
+        Returns:
+            Prompt dict with ``id``.
+        """
+        if self._eval_prompt is None:
+            token = await self.login()
+            project = await asyncio.to_thread(
+                api_create_project,
+                self.api_url,
+                token,
+                unique_name("proj"),
+                "Load test project",
+            )
+            self._created.append(
+                self.cleanup.track("project", project["id"], self.api_url, token)
+            )
+            self._eval_prompt = await asyncio.to_thread(
+                api_create_prompt,
+                self.api_url,
+                token,
+                project["id"],
+                {
+                    "title": unique_name("prompt"),
+                    "content": random_prompt_content(),
+                    "description": "Load test prompt",
+                },
+            )
+            self._created.append(
+                self.cleanup.track(
+                    "prompt", self._eval_prompt["id"], self.api_url, token
+                )
+            )
+        return self._eval_prompt
+
+    async def close(self) -> None:
+        """Queue the user's API-created data for deletion; close the context."""
+        if not self.keep_data:
+            for entry in self._created:
+                self.cleanup.delete_later(entry)
+        await self.context.close()
+
+
+async def browse(session: Session) -> None:
+    """Anonymous visitor: browse, switch tabs, search and open a prompt."""
+    browse_page = BrowsePage(session.page, session.base_url)
+    async with session.step("browse.open"):
+        await browse_page.open()
+    async with session.step("browse.tabs"):
+        await browse_page.select_tab("packs")
+        await browse_page.select_tab("prompts")
+    async with session.step("browse.search"):
+        await browse_page.search(session.rng.choice(SEARCH_TERMS))
+    cards = await browse_page.get_prompt_cards()
+    if not cards:
+        return
+    async with session.step("browse.detail"):
+        await browse_page.click_and_wait(session.rng.choice(cards))
+        detail = BrowseDetailPage(session.page, session.base_url)
+        await detail.wait_for_page_load()
+        await detail.get_prompt_name()
+
+
+async def author(session: Session) -> None:
+    """Guest author: create a project, write and save a prompt, share one."""
+    await session.login()
+    dashboard = DashboardPage(session.page, session.base_url)
+    async with session.step("author.dashboard"):
+        await dashboard.open()
+    async with session.step("author.create_project"):
+        await dashboard.click_new_project()
+        modal = ProjectModal(session.page, session.base_url)
+        await modal.wait_for_modal()
+        await modal.fill_name(unique_name("proj"))
+        await modal.submit()
+    builder = PromptBuilderPage(session.page, session.base_url)
+    async with session.step("author.open_builder"):
+        await builder.open()
+    async with session.step("author.edit_prompt"):
+        await builder.fill_title(unique_name("prompt"))
+        await builder.set_editor_content(random_prompt_content())
+    async with session.step("author.save_prompt"):
+        await builder.click_save()
+    share = SharePage(session.page, session.base_url)
+    async with session.step("author.share"):
+        await share.open()
+        await share.fill_name(unique_name("shared-prompt"))
+        await share.fill_content(random_prompt_content())
+        await share.click_share()
+        if not await share.is_success_visible():
+            raise AssertionError("share success message not shown")
+
+
+async def evals(session: Session) -> None:
+    """Guest evaluator: open a prompt's evals and walk its tabs and runs."""
+    prompt = await session.eval_prompt()
+    evals_page = EvalsPage(session.page, session.base_url)
+    async with session.step("evals.open"):
+        await evals_page.navigate(f"/evals/{prompt['id']}")
+        await evals_page.wait_for_page_load()
+    for tab in EVAL_TABS:
+        async with session.step(f"evals.tab_{tab.lower()}"):
+            await evals_page.navigate_tab(tab)
+    async with session.step("evals.runs"):
+        await EvalRunsPage(session.page, session.base_url).get_run_list()
+
+
+JOURNEYS: Dict[str, Callable[[Session], Awaitable[None]]] = {
+    "browse": browse,
+    "author": author,
+    "evals": evals,
+}
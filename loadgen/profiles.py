@@ -0,0 +1,78 @@
+"""Ramp-up profiles and journey mixes for the load generator."""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+# Journey weights of the named mixes; see ``loadgen/journeys.py``.
+MIXES: Dict[str, Dict[str, int]] = {
+    "browse-heavy": {"browse": 70, "author": 20, "evals": 10},
+    "author-heavy": {"browse": 20, "author": 70, "evals": 10},
+    "evals": {"browse": 10, "author": 20, "evals": 70},
+}
+
+
+def parse_mix(spec: str, journeys: List[str]) -> Dict[str, int]:
+    """Parse a named mix or explicit weights like ``browse=3,author=1``.
+
+    Args:
+        spec: A key of ``MIXES`` or comma-separated ``journey=weight`` pairs.
+        journeys: Names of the available journeys.
+
+    Returns:
+        Mapping of journey name to its (positive) weight.
+
+    Raises:
+        ValueError: If the spec names an unknown journey or has no weight.
+    """
+    if spec in MIXES:
+        return dict(MIXES[spec])
+    weights: Dict[str, int] = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in journeys:
+            raise ValueError(f"unknown journey {name!r} in mix {spec!r}")
+        weights[name] = int(weight) if weight.strip() else 1
+    weights = {name: weight for name, weight in weights.items() if weight > 0}
+    if not weights:
+        raise ValueError(f"mix {spec!r} has no positive weight")
+    return weights
+
+
+def start_offsets(users: int, ramp: str) -> List[float]:
+    """Seconds after the start of the run at which each user starts.
+
+    Ramp specs:
+
+    - ``none``: every user starts at once;
+    - ``linear:<seconds>``: users start evenly spread over ``seconds``;
+    - ``step:<count>x<seconds>``: users start in ``count`` equal batches,
+      one every ``seconds``.
+
+    Args:
+        users: Number of virtual users.
+        ramp: Ramp spec.
+
+    Returns:
+        One non-decreasing offset per user.
+
+    Raises:
+        ValueError: If the spec cannot be parsed.
+    """
+    kind, _, arg = ramp.partition(":")
+    try:
+        if kind == "none" and not arg:
+            return [0.0] * users
+        if kind == "linear":
+            seconds = float(arg)
+            return [seconds * n / users for n in range(users)]
+        if kind == "step":
+            count, _, interval = arg.partition("x")
+            steps, seconds = max(int(count), 1), float(interval)
+            return [seconds * (n * steps // users) for n in range(users)]
+    except ValueError:
+        pass
+    raise ValueError(
+        f"bad ramp {ramp!r}; use none, linear:<seconds> or step:<count>x<seconds>"
+    )
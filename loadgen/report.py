@@ -0,0 +1,173 @@
+"""Throughput and per-step latency of a load run."""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, List, Optional
+
+from utils.stats import Histogram
+
+PERCENTILES = (50, 90, 95, 99)
+TOP_ERRORS = 10
+
+
+class LoadStats:
+    """Per-step latency histograms and per-journey counts of one run."""
+
+    def __init__(self) -> None:
+        """Initialize empty stats."""
+        self.steps: Dict[str, Histogram] = {}
+        self.step_errors: Dict[str, int] = {}
+        self.journeys: Dict[str, Histogram] = {}
+        self.journey_errors: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.timeline: Dict[int, int] = {}
+        self.users = 0
+        self.peak_users = 0
+        self._active = 0
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+
+    def start(self) -> None:
+        """Mark the start of the run."""
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        """Mark the end of the run."""
+        self._finished = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds between ``start`` and ``stop`` (or now)."""
+        if self._started is None:
+            return 0.0
+        return (self._finished or time.perf_counter()) - self._started
+
+    def user_started(self) -> None:
+        """Count a virtual user that began running journeys."""
+        self.users += 1
+        self._active += 1
+        self.peak_users = max(self.peak_users, self._active)
+
+    def user_stopped(self) -> None:
+        """Count a virtual user that is done."""
+        self._active -= 1
+
+    def record_step(self, name: str, seconds: float, error: bool = False) -> None:
+        """Add one step; failed steps count as errors, not latency samples.
+
+        Args:
+            name: Step name, e.g. ``browse.search``.
+            seconds: Step duration.
+            error: Whether the step raised.
+        """
+        if error:
+            self.step_errors[name] = self.step_errors.get(name, 0) + 1
+            return
+        self.steps.setdefault(name, Histogram()).record(seconds * 1000)
+        second = int(self.elapsed)
+        self.timeline[second] = self.timeline.get(second, 0) + 1
+
+    def record_journey(
+        self, name: str, seconds: float, error: Optional[BaseException] = None
+    ) -> None:
+        """Add one journey run.
+
+        Args:
+            name: Journey name.
+            seconds: Journey duration.
+            error: The exception that ended the journey early, if any.
+        """
+        if error is None:
+            self.journeys.setdefault(name, Histogram()).record(seconds * 1000)
+            return
+        self.journey_errors[name] = self.journey_errors.get(name, 0) + 1
+        lines = str(error).strip().splitlines() or [""]
+        message = f"{type(error).__name__}: {lines[0][:120]}"
+        self.errors[message] = self.errors.get(message, 0) + 1
+
+    def to_dict(self) -> dict:
+        """JSON-serializable summary, with percentiles and raw histograms.
+
+        Returns:
+            ``elapsed_s``, ``users``, ``throughput`` and per-step and
+            per-journey percentiles, error counts and histograms.
+        """
+        elapsed = self.elapsed or 1.0
+
+        def summary(hist: Histogram, errors: int) -> dict:
+            return {
+                "count": hist.count,
+                "errors": errors,
+                **{f"p{pct}_ms": hist.percentile(pct) for pct in PERCENTILES},
+                "max_ms": hist.max,
+                "mean_ms": hist.total / hist.count if hist.count else 0.0,
+                "histogram": hist.to_dict(),
+            }
+
+        steps = sorted(set(self.steps) | set(self.step_errors))
+        journeys = sorted(set(self.journeys) | set(self.journey_errors))
+        completed = sum(h.count for h in self.journeys.values())
+        return {
+            "elapsed_s": self.elapsed,
+            "users": self.users,
+            "peak_users": self.peak_users,
+            "throughput": {
+                "journeys_per_s": completed / elapsed,
+                "steps_per_s": sum(h.count for h in self.steps.values()) / elapsed,
+            },
+            "steps": {
+                name: summary(
+                    self.steps.get(name, Histogram()), self.step_errors.get(name, 0)
+                )
+                for name in steps
+            },
+            "journeys": {
+                name: summary(
+                    self.journeys.get(name, Histogram()),
+                    self.journey_errors.get(name, 0),
+                )
+                for name in journeys
+            },
+            "errors": self.errors,
+            "steps_per_second": [
+                self.timeline.get(s, 0) for s in range(int(self.elapsed) + 1)
+            ],
+        }
+
+
+def format_report(stats: LoadStats) -> List[str]:
+    """Render the run as terminal lines.
+
+    Args:
+        stats: Stats of a finished run.
+
+    Returns:
+        The lines of the report.
+    """
+    data = stats.to_dict()
+    throughput = data["throughput"]
+    lines = [
+        f"{data['users']} users (peak {data['peak_users']} concurrent) "
+        f"for {data['elapsed_s']:.0f}s: "
+        f"{throughput['journeys_per_s']:.2f} journeys/s, "
+        f"{throughput['steps_per_s']:.2f} steps/s",
+        "",
+    ]
+    header = "".join(f"{f'p{pct}':>8}" for pct in PERCENTILES)
+    for title, rows in (("journey", data["journeys"]), ("step", data["steps"])):
+        lines.append(f"{title:<24}{'ok':>7}{'errors':>8}{header}{'max':>8}")
+        for name, row in rows.items():
+            cells = "".join(f"{row[f'p{pct}_ms']:8.0f}" for pct in PERCENTILES)
+            lines.append(
+                f"{name:<24}{row['count']:>7}{row['errors']:>8}{cells}"
+                f"{row['max_ms']:8.0f}"
+            )
+        lines.append("")
+    lines.append("latencies in ms")
+    ranked = sorted(data["errors"].items(), key=lambda kv: kv[1], reverse=True)
+    if ranked:
+        lines.append("")
+        lines.append("errors:")
+        lines.extend(f"{count:7d}  {message}" for message, count in ranked[:TOP_ERRORS])
+    return lines
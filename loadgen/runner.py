@@ -0,0 +1,142 @@
+"""Runs virtual users, each in its own browser context, on one event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Dict, List, Optional
+
+from playwright.async_api import Browser, Route, async_playwright
+
+from loadgen.journeys import JOURNEYS, Session
+from loadgen.profiles import start_offsets
+from loadgen.report import LoadStats
+from pages.aio.idle_tracker import install_idle_tracker
+from utils.cleanup import CleanupQueue
+from utils.request_blocking import block_pattern_from_env
+
+
+async def _abort(route: Route) -> None:
+    await route.abort("blockedbyclient")
+
+
+class LoadRunner:
+    """Starts users along a ramp and runs weighted journeys until time is up."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_url: str,
+        cleanup: CleanupQueue,
+        users: int,
+        duration: float,
+        ramp: str,
+        mix: Dict[str, int],
+        think_time: float = 1.0,
+        browsers: int = 1,
+        headless: bool = True,
+        timeout_ms: int = 15000,
+        seed: Optional[int] = None,
+        keep_data: bool = False,
+    ) -> None:
+        """Initialize LoadRunner.
+
+        Args:
+            base_url: Application base URL.
+            api_url: Backend API base URL.
+            cleanup: Journal for guest identities and created data.
+            users: Number of virtual users.
+            duration: Seconds after the start during which users begin new
+                journeys; running journeys are finished.
+            ramp: Ramp spec, see ``loadgen.profiles.start_offsets``.
+            mix: Journey weights.
+            think_time: Mean pause between a user's journeys, in seconds.
+            browsers: Browser processes the users' contexts are spread over.
+            headless: Run the browsers headless.
+            timeout_ms: Default Playwright timeout of every page.
+            seed: Seed for the users' journey choices and think times.
+            keep_data: Leave the data the users created in place.
+        """
+        self.base_url = base_url
+        self.api_url = api_url
+        self.cleanup = cleanup
+        self.users = users
+        self.duration = duration
+        self.offsets = start_offsets(users, ramp)
+        self.mix = mix
+        self.think_time = think_time
+        self.browsers = max(browsers, 1)
+        self.headless = headless
+        self.timeout_ms = timeout_ms
+        self.seed = seed
+        self.keep_data = keep_data
+        self.stats = LoadStats()
+        self._block = block_pattern_from_env()
+
+    async def run(self) -> LoadStats:
+        """Run the load test.
+
+        Returns:
+            The run's stats.
+        """
+        async with async_playwright() as playwright:
+            browsers = [
+                await playwright.chromium.launch(headless=self.headless)
+                for _ in range(self.browsers)
+            ]
+            self.stats.start()
+            deadline = time.perf_counter() + self.duration
+            try:
+                await asyncio.gather(
+                    *(
+                        self._user(n, browsers[n % len(browsers)], deadline)
+                        for n in range(self.users)
+                    )
+                )
+            finally:
+                self.stats.stop()
+                for browser in browsers:
+                    await browser.close()
+        return self.stats
+
+    async def _user(self, n: int, browser: Browser, deadline: float) -> None:
+        """One virtual user: wait for its ramp slot, then loop over journeys."""
+        await asyncio.sleep(self.offsets[n])
+        if time.perf_counter() >= deadline:
+            return
+        rng = random.Random(None if self.seed is None else self.seed + n)
+        names: List[str] = list(self.mix)
+        weights = [self.mix[name] for name in names]
+        context = await browser.new_context()
+        context.set_default_timeout(self.timeout_ms)
+        await install_idle_tracker(context)
+        if self._block is not None:
+            await context.route(self._block, _abort)
+        session = Session(
+            context,
+            await context.new_page(),
+            self.base_url,
+            self.api_url,
+            self.stats,
+            self.cleanup,
+            rng,
+            keep_data=self.keep_data,
+        )
+        self.stats.user_started()
+        try:
+            while time.perf_counter() < deadline:
+                name = rng.choices(names, weights)[0]
+                start = time.perf_counter()
+                try:
+                    await JOURNEYS[name](session)
+                except Exception as exc:
+                    self.stats.record_journey(name, time.perf_counter() - start, exc)
+                else:
+                    self.stats.record_journey(name, time.perf_counter() - start)
+                remaining = deadline - time.perf_counter()
+                pause = self.think_time * rng.uniform(0.5, 1.5)
+                await asyncio.sleep(max(min(pause, remaining), 0))
+        finally:
+            self.stats.user_stopped()
+            await session.close()
@@ -0,0 +1,55 @@
+# Generated by pages/aio/codegen.py from pages/__init__.py; do not edit.
+"""Async Playwright variant of the page objects in ``pages``."""
+
+from pages.aio.admin_utm_page import AdminUtmPage
+from pages.aio.analytics_page import AnalyticsPage
+from pages.aio.api_keys_page import ApiKeysPage
+from pages.aio.auth_page import AuthPage
+from pages.aio.base_page import BasePage
+from pages.aio.browse_detail_page import BrowseDetailPage
+from pages.aio.browse_page import BrowsePage
+from pages.aio.components import ConfirmDialog, LoadingSpinner, PlanLimitOverlay, Toast
+from pages.aio.context_store_page import ContextStorePage
+from pages.aio.dashboard_page import DashboardPage
+from pages.aio.eval_datasets_page import EvalDatasetsPage
+from pages.aio.eval_runs_page import EvalRunsPage
+from pages.aio.eval_suites_page import EvalSuitesPage
+from pages.aio.evals_page import EvalsPage
+from pages.aio.mobile_nav import MobileNav
+from pages.aio.monaco_editor import MonacoEditor
+from pages.aio.plans_page import PlansPage
+from pages.aio.project_modal import ProjectModal
+from pages.aio.project_view_page import ProjectViewPage
+from pages.aio.prompt_builder_page import PromptBuilderPage
+from pages.aio.share_page import SharePage
+from pages.aio.sidebar import Sidebar
+from pages.aio.usage_page import UsagePage
+
+__all__ = [
+    "AdminUtmPage",
+    "AnalyticsPage",
+    "ApiKeysPage",
+    "AuthPage",
+    "BasePage",
+    "BrowseDetailPage",
+    "BrowsePage",
+    "ConfirmDialog",
+    "ContextStorePage",
+    "DashboardPage",
+    "EvalDatasetsPage",
+    "EvalRunsPage",
+    "EvalSuitesPage",
+    "EvalsPage",
+    "LoadingSpinner",
+    "MobileNav",
+    "MonacoEditor",
+    "PlanLimitOverlay",
+    "PlansPage",
+    "ProjectModal",
+    "ProjectViewPage",
+    "PromptBuilderPage",
+    "SharePage",
+    "Sidebar",
+    "Toast",
+    "UsagePage",
+]
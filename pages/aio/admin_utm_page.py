@@ -0,0 +1,82 @@
+# Generated by pages/aio/codegen.py from pages/admin_utm_page.py; do not edit.
+"""Page object for the Admin UTM Panel page."""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+from playwright.async_api import Page
+
+from pages.aio.base_page import BasePage
+
+
+class AdminUtmPage(BasePage):
+    """Admin UTM link management panel."""
+
+    PATH = "/admin/utm-panel"
+
+    def __init__(self, page: Page, base_url: str = "") -> None:
+        """Initialize AdminUtmPage.
+
+        Args:
+            page: Playwright page instance.
+            base_url: Application base URL.
+        """
+        super().__init__(page, base_url)
+
+    async def open(self) -> None:
+        """Navigate to the admin UTM panel."""
+        await self.navigate(self.PATH)
+        await self.wait_for_page_load()
+
+    # ── Actions ──────────────────────────────────────────────────────────
+
+    async def fill_utm_form(self, data: Dict[str, str]) -> None:
+        """Fill the UTM link creation form.
+
+        Args:
+            data: Dictionary with form field names and values.
+        """
+        for field, value in data.items():
+            input_el = self.page.get_by_label(field).or_(
+                self.page.get_by_placeholder(field)
+            ).first
+            await self.fill_form_field(input_el, value)
+
+    async def submit(self) -> None:
+        """Submit the UTM form."""
+        await self.page.get_by_role("button", name="Create").or_(
+            self.page.get_by_role("button", name="Submit")
+        ).first.click()
+        await self.wait_for_loading_complete()
+
+    async def get_link_list(self) -> List[str]:
+        """Return all UTM link entries.
+
+        Returns:
+            List of UTM link text strings.
+        """
+        await self.wait_for_loading_complete()
+        items = self.page.locator("[data-testid='utm-link-item']")
+        return await items.all_inner_texts()
+
+    async def delete_link(self, code: str) -> None:
+        """Delete a UTM link by its code.
+
+        Args:
+            code: UTM code to delete.
+        """
+        row = self.page.get_by_text(code, exact=False).first
+        await row.hover()
+        await self.page.get_by_role("button", name="Delete").first.click()
+        await self.page.get_by_role("button", name="Confirm").or_(
+            self.page.get_by_role("button", name="Delete")
+        ).first.click()
+        await self.wait_for_loading_complete()
+
+    async def refresh_list(self) -> None:
+        """Refresh the UTM link list."""
+        await self.page.get_by_role("button", name="Refresh").or_(
+            self.page.locator("[data-testid='refresh-btn']")
+        ).first.click()
+        await self.wait_for_loading_complete()
@@ -0,0 +1,91 @@
+# Generated by pages/aio/codegen.py from pages/analytics_page.py; do not edit.
+"""Page object for the Analytics page."""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+from playwright.async_api import Page
+
+from pages.aio.base_page import BasePage
+from pages.analytics_page import MetricCard
+
+
+class AnalyticsPage(BasePage):
+    """Analytics dashboard for prompt usage metrics."""
+
+    PATH = "/analytics"
+
+    def __init__(self, page: Page, base_url: str = "") -> None:
+        """Initialize AnalyticsPage.
+
+        Args:
+            page: Playwright page instance.
+            base_url: Application base URL.
+        """
+        super().__init__(page, base_url)
+
+    async def open(self) -> None:
+        """Navigate to the analytics page."""
+        await self.navigate(self.PATH)
+        await self.wait_for_page_load()
+
+    # ── Actions ──────────────────────────────────────────────────────────
+
+    async def set_date_range(self, from_date: str, to_date: str) -> None:
+        """Set the analytics date range filter.
+
+        Args:
+            from_date: Start date string (e.g. '2024-01-01').
+            to_date: End date string (e.g. '2024-01-31').
+        """
+        from_input = self.page.locator("[data-testid='date-from']").or_(
+            self.page.get_by_label("From")
+        ).first
+        to_input = self.page.locator("[data-testid='date-to']").or_(
+            self.page.get_by_label("To")
+        ).first
+        await self.fill_form_field(from_input, from_date)
+        await self.fill_form_field(to_input, to_date)
+        await self.wait_for_loading_complete()
+
+    async def get_overview_metrics(self) -> Dict[str, str]:
+        """Get all overview metric values.
+
+        Returns:
+            Dictionary mapping metric labels to their displayed values.
+        """
+        await self.wait_for_loading_complete()
+        cards = await self.extract_table(
+            "[data-testid='metric-card']",
+            {
+                "label": "[data-testid='metric-label']",
+                "value": "[data-testid='metric-value']",
+            },
+            MetricCard,
+        )
+        metrics: Dict[str, str] = {}
+        for i, card in enumerate(cards):
+            if card.label is None or card.value is None:
+                raise ValueError(f"metric card {i} has no label or value: {card}")
+            metrics[card.label] = card.value
+        return metrics
+
+    async def get_top_prompts(self) -> List[str]:
+        """Get the list of top prompts from the analytics view.
+
+        Returns:
+            List of prompt name strings.
+        """
+        await self.wait_for_loading_complete()
+        items = self.page.locator("[data-testid='top-prompt-item']")
+        return await items.all_inner_texts()
+
+    async def select_prompt(self, name: str) -> None:
+        """Select a specific prompt for detailed analytics.
+
+        Args:
+            name: Prompt name to select.
+        """
+        await self.page.get_by_text(name, exact=False).first.click()
+        await self.wait_for_loading_complete()
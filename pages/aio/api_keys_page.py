@@ -0,0 +1,99 @@
+# Generated by pages/aio/codegen.py from pages/api_keys_page.py; do not edit.
+"""Page object for the API Keys settings page."""
+
+from __future__ import annotations
+
+from typing import List
+
+from playwright.async_api import Page
+
+from pages.aio.base_page import BasePage
+
+
+class ApiKeysPage(BasePage):
+    """Manage API keys for programmatic access."""
+
+    PATH = "/api-keys"
+
+    def __init__(self, page: Page, base_url: str = "") -> None:
+        """Initialize ApiKeysPage.
+
+        Args:
+            page: Playwright page instance.
+            base_url: Application base URL.
+        """
+        super().__init__(page, base_url)
+
+    async def open(self) -> None:
+        """Navigate to the API keys page."""
+        await self.navigate(self.PATH)
+        await self.wait_for_page_load()
+
+    # ── Actions ──────────────────────────────────────────────────────────
+
+    async def create_key(self, name: str) -> None:
+        """Create a new API key.
+
+        Args:
+            name: Name/label for the API key.
+        """
+        await self.page.get_by_role("button", name="Create").or_(
+            self.page.get_by_role("button", name="New Key")
+        ).first.click()
+        name_input = self.page.get_by_label("Name").or_(
+            self.page.get_by_placeholder("Key name")
+        ).first
+        await self.fill_form_field(name_input, name)
+        await self.page.get_by_role("button", name="Create").or_(
+            self.page.get_by_role("button", name="Generate")
+        ).first.click()
+        await self.wait_for_loading_complete()
+
+    async def get_key_value(self) -> str:
+        """Get the displayed key value (shown once after creation).
+
+        Returns:
+            API key string.
+        """
+        key_el = self.page.locator("[data-testid='api-key-value'], code, input[readonly]").first
+        await key_el.wait_for(state="visible")
+        text = await key_el.inner_text()
+        return text if text else await key_el.input_value()
+
+    async def get_key_list(self) -> List[str]:
+        """Return names of all API keys.
+
+        Returns:
+            List of key name strings.
+        """
+        await self.wait_for_loading_complete()
+        items = self.page.locator("[data-testid='api-key-item']")
+        return await items.all_inner_texts()
+
+    async def revoke_key(self, name: str) -> None:
+        """Revoke an API key by name.
+
+        Args:
+            name: Key name to revoke.
+        """
+        row = self.page.get_by_text(name, exact=False).first
+        await row.hover()
+        await self.page.get_by_role("button", name="Revoke").or_(
+            self.page.get_by_role("button", name="Delete")
+        ).first.click()
+        # Confirm
+        await self.page.get_by_role("button", name="Confirm").or_(
+            self.page.get_by_role("button", name="Revoke")
+        ).first.click()
+        await self.wait_for_loading_complete()
+
+    async def is_key_visible_once_notice(self) -> bool:
+        """Check if the 'key shown once' warning is visible.
+
+        Returns:
+            True if the one-time visibility notice is displayed.
+        """
+        notice = self.page.get_by_text("only be shown once").or_(
+            self.page.get_by_text("won't be shown again")
+        ).first
+        return await self.is_visible(notice)
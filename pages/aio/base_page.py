@@ -0,0 +1,368 @@
+# Generated by pages/aio/codegen.py from pages/base_page.py; do not edit.
+"""Base page object providing common functionality for all page objects."""
+
+from __future__ import annotations
+
+import re
+from typing import Callable, Dict, List, Optional, Union
+
+from playwright.async_api import Locator, Page, expect
+
+from pages.aio.loading_state import wait_for_loading_complete
+from pages.aio.web_vitals import capture_vitals
+from pages.artifact_manager import ARTIFACTS
+from pages.base_page import _EXTRACT_TABLE_SCRIPT, RowT
+from pages.idle_tracker import IDLE_PREDICATE
+from pages.locator_registry import resolve_chain
+from pages.spans import INTERACT, WAIT, span
+
+
+class BasePage:
+    """Base class for all page objects. Provides common UI interaction methods."""
+
+    def __init__(self, page: Page, base_url: str = "") -> None:
+        """Initialize base page.
+
+        Args:
+            page: Playwright page instance.
+            base_url: Base URL for the application.
+        """
+        self.page = page
+        self.base_url = base_url.rstrip("/")
+        self._opened_route: Optional[str] = None
+
+    # ── Navigation ───────────────────────────────────────────────────────
+
+    @span(INTERACT)
+    async def navigate(self, path: str = "/") -> None:
+        """Navigate to a path relative to base_url.
+
+        Args:
+            path: URL path to navigate to.
+        """
+        url = f"{self.base_url}{path}" if self.base_url else path
+        await self.page.goto(url, wait_until="domcontentloaded")
+        self._opened_route = path.split("?", 1)[0]
+
+    async def get_title(self) -> str:
+        """Return the current page title."""
+        return await self.page.title()
+
+    def get_current_url(self) -> str:
+        """Return the current page URL."""
+        return self.page.url
+
+    # ── Waiting ──────────────────────────────────────────────────────────
+
+    @span(WAIT)
+    async def wait_for_page_load(self, timeout: int = 30000) -> None:
+        """Wait for the page to be fully loaded (DOM ready + network idle).
+
+        Right after ``navigate`` this also records the route's web vitals
+        when ``--web-vitals`` is on.
+
+        Args:
+            timeout: Maximum wait time in milliseconds.
+        """
+        await self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+        await self.page.wait_for_load_state("networkidle", timeout=timeout)
+        if self._opened_route is not None:
+            await capture_vitals(self.page, self._opened_route)
+            self._opened_route = None
+
+    @span(WAIT)
+    def wait_for_api_response(self, url_pattern: str, timeout: int = 30000):
+        """Wait for a specific API response.
+
+        Args:
+            url_pattern: URL pattern or substring to match.
+            timeout: Maximum wait time in milliseconds.
+
+        Returns:
+            The matched response.
+        """
+        return self.page.wait_for_response(
+            lambda resp: url_pattern in resp.url,
+            timeout=timeout,
+        )
+
+    @span(WAIT)
+    async def wait_for_app_idle(
+        self, timeout: int = 30000, quiet_ms: int = 300
+    ) -> None:
+        """Wait until no XHR/fetch is in flight and the DOM has stopped changing.
+
+        Returns as soon as the app has been quiet for ``quiet_ms``, instead
+        of sleeping for a fixed amount of time.
+
+        Args:
+            timeout: Maximum wait time in milliseconds.
+            quiet_ms: How long the app must stay quiet to count as idle.
+        """
+        await self.page.wait_for_function(IDLE_PREDICATE, arg=quiet_ms, timeout=timeout)
+
+    @span(WAIT)
+    async def wait_for_settled(
+        self,
+        route: Optional[str] = None,
+        timeout: int = 30000,
+        quiet_ms: int = 300,
+    ) -> None:
+        """Wait for an SPA route change (optional) and then for the app to go idle.
+
+        Args:
+            route: Regex pattern the URL must match before waiting for idle.
+            timeout: Maximum wait time in milliseconds.
+            quiet_ms: How long the app must stay quiet to count as idle.
+        """
+        if route:
+            await self.page.wait_for_url(
+                re.compile(route), wait_until="commit", timeout=timeout
+            )
+        await self.wait_for_app_idle(timeout=timeout, quiet_ms=quiet_ms)
+
+    @span(WAIT)
+    async def wait_for_loading_complete(
+        self, timeout: int = 10000, settle_ms: int = 100
+    ) -> None:
+        """Wait for all loading spinners and skeletons to disappear.
+
+        Args:
+            timeout: Maximum wait time in milliseconds.
+            settle_ms: How long the page must stay free of loading indicators.
+        """
+        await wait_for_loading_complete(self.page, timeout=timeout, settle_ms=settle_ms)
+
+    # ── Interactions ─────────────────────────────────────────────────────
+
+    @span(INTERACT)
+    async def click_and_wait(
+        self,
+        locator: Locator,
+        url_pattern: Optional[str] = None,
+        timeout: int = 30000,
+    ) -> None:
+        """Click an element and optionally wait for an API response or navigation.
+
+        Args:
+            locator: Element to click.
+            url_pattern: If provided, wait for a response matching this pattern.
+            timeout: Maximum wait time in milliseconds.
+        """
+        if url_pattern:
+            async with self.page.expect_response(
+                lambda resp: url_pattern in resp.url, timeout=timeout
+            ):
+                await locator.click()
+        else:
+            await locator.click()
+            await self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+
+    @span(INTERACT)
+    async def wait_and_click(self, locator: Locator, timeout: int = 10000) -> None:
+        """Wait for an element to be visible, then click it.
+
+        Args:
+            locator: Element to click.
+            timeout: Maximum wait time in milliseconds.
+        """
+        await locator.wait_for(state="visible", timeout=timeout)
+        await locator.click()
+
+    @span(INTERACT)
+    async def fill_form_field(self, locator: Locator, value: str) -> None:
+        """Clear a form field and fill it with a value.
+
+        Args:
+            locator: Input element to fill.
+            value: Text value to enter.
+        """
+        await locator.clear()
+        await locator.fill(value)
+
+    @span(INTERACT)
+    async def select_option(self, locator: Locator, value: str) -> None:
+        """Select an option from a dropdown.
+
+        Args:
+            locator: Select element.
+            value: Option value to select.
+        """
+        await locator.select_option(value)
+
+    # ── Toast / Notifications ────────────────────────────────────────────
+
+    @span(WAIT)
+    async def get_toast_message(self, timeout: int = 5000) -> str:
+        """Get the text of the currently visible toast notification.
+
+        Args:
+            timeout: Maximum wait time in milliseconds.
+
+        Returns:
+            Toast message text.
+        """
+        toast = self.page.locator("[role='status'], [data-testid='toast']").first
+        await toast.wait_for(state="visible", timeout=timeout)
+        return await toast.inner_text()
+
+    @span(INTERACT)
+    async def dismiss_toast(self) -> None:
+        """Close the currently visible toast notification."""
+        close_btn = self.page.locator(
+            "[role='status'] button, [data-testid='toast'] button"
+        ).first
+        if await close_btn.is_visible():
+            await close_btn.click()
+
+    # ── Screenshots ──────────────────────────────────────────────────────
+
+    async def take_screenshot(self, name: str) -> str:
+        """Take a full-page screenshot; it is written in the background.
+
+        Args:
+            name: Base name for the screenshot file.
+
+        Returns:
+            Path to the saved screenshot.
+        """
+        return ARTIFACTS.save_screenshot(
+            await self.page.screenshot(full_page=True), name
+        )
+
+    # ── Element queries ──────────────────────────────────────────────────
+
+    def first_of(self, key: str, *candidates: Locator) -> Locator:
+        """Return the first element matched by a chain of fallback locators.
+
+        Behaves like ``candidates[0].or_(candidates[1])...first`` but goes
+        through the locator registry, which uses the alternative that
+        matched on previous runs against the same frontend build on its own
+        and falls back to the full chain only if it no longer matches.
+
+        Args:
+            key: Stable name of the locator, including any arguments the
+                candidates depend on (e.g. ``"BrowsePage.tab[packs]"``).
+            *candidates: Alternative locators, in fallback order.
+
+        Returns:
+            Locator for the first matching element.
+        """
+        return resolve_chain(self.page, key, *candidates)
+
+    @span(WAIT)
+    async def is_visible(self, locator: Locator, timeout: int = 3000) -> bool:
+        """Check whether an element is visible.
+
+        Args:
+            locator: Element to check.
+            timeout: Maximum wait time in milliseconds.
+
+        Returns:
+            True if the element is visible within the timeout.
+        """
+        try:
+            await locator.wait_for(state="visible", timeout=timeout)
+            return True
+        except Exception:
+            return False
+
+    @span(INTERACT)
+    async def get_text(self, locator: Locator, timeout: int = 5000) -> str:
+        """Get the inner text of an element.
+
+        Args:
+            locator: Element to read.
+            timeout: Maximum wait time in milliseconds.
+
+        Returns:
+            Element inner text.
+        """
+        await locator.wait_for(state="visible", timeout=timeout)
+        return await locator.inner_text()
+
+    @span(INTERACT)
+    async def extract_table(
+        self,
+        rows: Union[str, Locator],
+        fields: Dict[str, str],
+        row_type: Callable[..., RowT],
+    ) -> List[RowT]:
+        """Read a whole list of records from the DOM in a single round trip.
+
+        Each element matching ``rows`` becomes one row. Field specs
+        are resolved relative to the row:
+
+        - ``""``: the row's inner text
+        - ``"<selector>"``: inner text of the first matching descendant
+        - ``"<selector>@<attr>"``: attribute of the first matching descendant
+        - ``"@<attr>"``: attribute of the row itself (e.g. ``"@data-testid"``)
+
+        Args:
+            rows: Locator of the row elements, or their CSS selector.
+            fields: Mapping of output field name to field spec.
+            row_type: Row class (usually a dataclass) taking the field names
+                as keyword arguments; fields whose element is missing are
+                passed as ``None``.
+
+        Returns:
+            One ``row_type`` instance per row, in document order.
+        """
+        if isinstance(rows, str):
+            rows = self.page.locator(rows)
+        records = await rows.evaluate_all(_EXTRACT_TABLE_SCRIPT, fields)
+        return [row_type(**record) for record in records]
+
+    @span(INTERACT)
+    async def scroll_to(self, locator: Locator) -> None:
+        """Scroll an element into the viewport.
+
+        Args:
+            locator: Element to scroll to.
+        """
+        await locator.scroll_into_view_if_needed()
+
+    # ── Assertions ───────────────────────────────────────────────────────
+
+    @span(WAIT)
+    async def expect_url(self, pattern: str, timeout: int = 10000) -> None:
+        """Assert the current URL matches a pattern.
+
+        Args:
+            pattern: Regex pattern to match against the URL.
+            timeout: Maximum wait time in milliseconds.
+        """
+        await expect(self.page).to_have_url(re.compile(pattern), timeout=timeout)
+
+    @span(WAIT)
+    async def expect_visible(self, locator: Locator, timeout: int = 10000) -> None:
+        """Assert an element is visible.
+
+        Args:
+            locator: Element to assert visibility of.
+            timeout: Maximum wait time in milliseconds.
+        """
+        await expect(locator).to_be_visible(timeout=timeout)
+
+    @span(WAIT)
+    async def expect_text(
+        self, locator: Locator, text: str, timeout: int = 10000
+    ) -> None:
+        """Assert an element contains the given text.
+
+        Args:
+            locator: Element to check.
+            text: Expected text content.
+            timeout: Maximum wait time in milliseconds.
+        """
+        await expect(locator).to_contain_text(text, timeout=timeout)
+
+    @span(WAIT)
+    async def expect_not_visible(self, locator: Locator, timeout: int = 10000) -> None:
+        """Assert an element is not visible.
+
+        Args:
+            locator: Element to assert is hidden.
+            timeout: Maximum wait time in milliseconds.
+        """
+        await expect(locator).to_be_hidden(timeout=timeout)
@@ -0,0 +1,78 @@
+# Generated by pages/aio/codegen.py from pages/browse_detail_page.py; do not edit.
+"""Page object for the browse prompt detail page."""
+
+from __future__ import annotations
+
+from playwright.async_api import Page
+
+from pages.aio.base_page import BasePage
+
+
+class BrowseDetailPage(BasePage):
+    """Detail view for a single public prompt."""
+
+    def __init__(self, page: Page, base_url: str = "") -> None:
+        """Initialize BrowseDetailPage.
+
+        Args:
+            page: Playwright page instance.
+            base_url: Application base URL.
+        """
+        super().__init__(page, base_url)
+
+    # ── Actions ──────────────────────────────────────────────────────────
+
+    async def get_prompt_name(self) -> str:
+        """Get the prompt title/name.
+
+        Returns:
+            Prompt name string.
+        """
+        heading = self.page.get_by_role("heading").first
+        return await self.get_text(heading)
+
+    async def get_prompt_content(self) -> str:
+        """Get the prompt content text.
+
+        Returns:
+            Prompt content string.
+        """
+        content = self.page.locator("[data-testid='prompt-content']").or_(
+            self.page.locator("pre, code")
+        ).first
+        return await self.get_text(content)
+
+    async def click_fork(self) -> None:
+        """Click the Fork button to fork the prompt."""
+        await self.page.get_by_role("button", name="Fork").click()
+        await self.wait_for_loading_complete()
+
+    async def click_upvote(self) -> None:
+        """Click the upvote button."""
+        await self.page.get_by_role("button", name="Upvote").or_(
+            self.page.locator("[data-testid='upvote-btn']")
+        ).first.click()
+
+    async def get_view_count(self) -> int:
+        """Get the view count for the prompt.
+
+        Returns:
+            View count as integer.
+        """
+        views_el = self.page.locator("[data-testid='view-count']")
+        if await views_el.is_visible():
+            text = (await views_el.inner_text()).replace(",", "")
+            return int("".join(filter(str.isdigit, text)) or "0")
+        return 0
+
+    async def get_upvote_count(self) -> int:
+        """Get the upvote count for the prompt.
+
+        Returns:
+            Upvote count as integer.
+        """
+        upvote_el = self.page.locator("[data-testid='upvote-count']")
+        if await upvote_el.is_visible():
+            text = (await upvote_el.inner_text()).replace(",", "")
+            return int("".join(filter(str.isdigit, text)) or "0")
+        return 0
@@ -0,0 +1,138 @@
+# Generated by pages/aio/codegen.py from pages/browse_page.py; do not edit.
+"""Page object for the Browse public prompts page."""
+
+from __future__ import annotations
+
+from typing import List
+
+from playwright.async_api import Locator, Page
+
+from pages.aio.base_page import BasePage
+
+
+class BrowsePage(BasePage):
+    """Browse page for discovering public prompts and packs."""
+
+    PATH = "/browse"
+
+    def __init__(self, page: Page, base_url: str = "") -> None:
+        """Initialize BrowsePage.
+
+        Args:
+            page: Playwright page instance.
+            base_url: Application base URL.
+        """
+        super().__init__(page, base_url)
+
+    async def open(self) -> None:
+        """Navigate to the browse page."""
+        await self.navigate(self.PATH)
+        await self.wait_for_page_load()
+
+    # ── Locators ─────────────────────────────────────────────────────────
+
+    @property
+    def _search_input(self):
+        """Search input."""
+        return self.page.get_by_placeholder("Search")
+
+    @property
+    def _prompt_cards(self):
+        """All prompt card elements."""
+        return self.page.locator("[data-testid='prompt-card']")
+
+    # ── Actions ──────────────────────────────────────────────────────────
+
+    async def search(self, query: str) -> None:
+        """Search for prompts.
+
+        Args:
+            query: Search query text.
+        """
+        await self.fill_form_field(self._search_input, query)
+        await self.page.keyboard.press("Enter")
+        await self.wait_for_loading_complete()
+
+    async def select_tab(self, tab: str) -> None:
+        """Select a tab (prompts or packs).
+
+        Args:
+            tab: Tab name ('prompts' or 'packs').
+        """
+        await self.first_of(
+            f"BrowsePage.tab[{tab}]",
+            self.page.get_by_role("tab", name=tab.capitalize()),
+            self.page.get_by_text(tab, exact=False),
+        ).click()
+        await self.wait_for_loading_complete()
+
+    async def sort_by(self, option: str) -> None:
+        """Sort results by a given option.
+
+        Args:
+            option: Sort option (e.g. 'newest', 'popular', 'most_viewed').
+        """
+        sort_btn = self.first_of(
+            "BrowsePage.sort_select",
+            self.page.locator("[data-testid='sort-select']"),
+            self.page.get_by_label("Sort"),
+        )
+        await sort_btn.click()
+        await self.page.get_by_text(option, exact=False).first.click()
+        await self.wait_for_loading_complete()
+
+    async def filter_by_tag(self, tag: str) -> None:
+        """Filter prompts by a tag.
+
+        Args:
+            tag: Tag name to filter by.
+        """
+        await self.page.get_by_text(tag, exact=True).first.click()
+        await self.wait_for_loading_complete()
+
+    async def get_prompt_cards(self) -> List[Locator]:
+        """Return all visible prompt card locators.
+
+        Returns:
+            List of prompt card Locator objects.
+        """
+        await self.wait_for_loading_complete()
+        return await self._prompt_cards.all()
+
+    async def click_prompt(self, name: str) -> None:
+        """Click a prompt card by name.
+
+        Args:
+            name: Prompt name or text to match.
+        """
+        await self.page.get_by_text(name, exact=False).first.click()
+        await self.wait_for_page_load()
+
+    async def next_page(self) -> None:
+        """Navigate to the next page of results."""
+        await self.first_of(
+            "BrowsePage.next_page",
+            self.page.get_by_role("button", name="Next"),
+            self.page.locator("[data-testid='next-page']"),
+        ).click()
+        await self.wait_for_loading_complete()
+
+    async def prev_page(self) -> None:
+        """Navigate to the previous page of results."""
+        await self.first_of(
+            "BrowsePage.prev_page",
+            self.page.get_by_role("button", name="Previous"),
+            self.page.locator("[data-testid='prev-page']"),
+        ).click()
+        await self.wait_for_loading_complete()
+
+    async def get_current_page(self) -> int:
+        """Get the current page number.
+
+        Returns:
+            Current page number as integer.
+        """
+        page_indicator = self.page.locator("[data-testid='current-page']")
+        if await page_indicator.is_visible():
+            return int(await page_indicator.inner_text())
+        return 1
@@ -0,0 +1,607 @@
+"""Generate the async page objects in ``pages/aio`` from the sync ones.
+
+Each module listed in ``MODULES`` is mirrored from ``pages/<name>.py``:
+
+- ``playwright.sync_api`` imports become ``playwright.async_api``, and
+  imports of other mirrored modules point at their ``pages.aio`` twin;
+- functions and methods that reach the browser become ``async def`` and
+  every call to them, or to a Playwright method, is awaited;
+  ``with page.expect_*()`` becomes ``async with``;
+- everything else (constants, scripts, pure helpers, recorders and their
+  state) is imported from the sync module rather than copied, so both
+  layers share it.
+
+The sync modules stay the single source: after changing one, run
+``python pages/aio/codegen.py``; ``--check`` fails when a generated module
+is out of date.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import io
+import sys
+import tokenize
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+PAGES_DIR = Path(__file__).resolve().parent.parent
+AIO_DIR = PAGES_DIR / "aio"
+
+# Mirrored modules: None mirrors every class or function that reaches the
+# browser; a list mirrors just those names (the module's other functions
+# and singletons are shared as they are).
+MODULES: Dict[str, Optional[List[str]]] = {
+    "idle_tracker": ["install_idle_tracker"],
+    "loading_state": ["is_loading", "wait_for_loading_complete"],
+    "web_vitals": ["collect_vitals", "capture_vitals"],
+    "typing_profiler": ["profile_typing"],
+    "base_page": None,
+    "components": None,
+    "monaco_editor": None,
+    "admin_utm_page": None,
+    "analytics_page": None,
+    "api_keys_page": None,
+    "auth_page": None,
+    "browse_detail_page": None,
+    "browse_page": None,
+    "context_store_page": None,
+    "dashboard_page": None,
+    "eval_datasets_page": None,
+    "eval_runs_page": None,
+    "eval_suites_page": None,
+    "evals_page": None,
+    "mobile_nav": None,
+    "plans_page": None,
+    "project_modal": None,
+    "project_view_page": None,
+    "prompt_builder_page": None,
+    "share_page": None,
+    "sidebar": None,
+    "usage_page": None,
+}
+
+# Sync helpers replaced by a non-blocking equivalent with the same signature.
+SUBSTITUTES = {"resolve_first": "resolve_chain"}
+
+# Methods of Playwright's async API that return awaitables.
+PLAYWRIGHT_ASYNC = frozenset(
+    """
+    add_cookies add_init_script add_script_tag add_style_tag all
+    all_inner_texts all_text_contents blur bounding_box bring_to_front check
+    clear clear_cookies click close content cookies count dblclick detach
+    dispatch_event down drag_to element_handle element_handles emulate_media
+    evaluate evaluate_all evaluate_handle expose_binding expose_function fill
+    focus get_attribute go_back go_forward goto grant_permissions hover
+    inner_html inner_text input_value insert_text is_checked is_disabled
+    is_editable is_enabled is_hidden is_visible move new_cdp_session
+    new_context new_page press press_sequentially query_selector
+    query_selector_all reload route screenshot scroll_into_view_if_needed
+    select_option select_text send set_checked set_content
+    set_extra_http_headers set_input_files set_offline set_viewport_size
+    start_tracing stop_tracing storage_state tap text_content title type
+    uncheck unroute up wait_for wait_for_event wait_for_function
+    wait_for_load_state wait_for_selector wait_for_timeout wait_for_url wheel
+    """.split()
+)
+
+HEADER = "# Generated by pages/aio/codegen.py from pages/{name}.py; do not edit.\n"
+LINE_LIMIT = 88
+
+
+def _import_order(name: str) -> str:
+    """isort's order: constants, then classes, then functions."""
+    kind = "A" if name.isupper() and len(name) > 1 else "B"
+    if kind == "B" and not name[:1].isupper():
+        kind = "C"
+    return kind + name.lower()
+
+
+def _scan(text: str) -> Optional[Tuple[List[Tuple[int, int]], List[int]]]:
+    """Matching bracket offsets and top-level commas of one line of code.
+
+    Returns:
+        ``(pairs, commas)``, or None if the line's brackets do not balance.
+    """
+    pairs: List[Tuple[int, int]] = []
+    commas: List[int] = []
+    stack: List[int] = []
+    try:
+        tokens = list(tokenize.generate_tokens(io.StringIO(text).readline))
+    except (tokenize.TokenError, SyntaxError):
+        return None
+    for token in tokens:
+        if token.type != tokenize.OP or token.start[0] != 1:
+            continue
+        if token.string in "([{":
+            stack.append(token.start[1])
+        elif token.string in ")]}":
+            if not stack:
+                return None
+            pairs.append((stack.pop(), token.start[1]))
+        elif token.string == "," and not stack:
+            commas.append(token.start[1])
+    return None if stack else (pairs, commas)
+
+
+def _split_commas(body: str, indent: str) -> Optional[str]:
+    """One element per line, with a trailing comma, as black does."""
+    scanned = _scan(body)
+    if scanned is None:
+        return None
+    items, pos = [], 0
+    for cut in scanned[1] + [len(body)]:
+        items.append(body[pos:cut].strip())
+        pos = cut + 1
+    return "".join(f"{indent}{item},\n" for item in items if item)
+
+
+def _wrap(line: str) -> str:
+    """Split a line the edits made too long at its last bracket pair.
+
+    This follows black's right-hand split: ``head(``, the bracket's content
+    indented one level (one element per line if it is still too long) and
+    ``)tail``. Lines that cannot be split this way are left alone.
+    """
+    if len(line.rstrip("\n")) <= LINE_LIMIT:
+        return line
+    text = line.rstrip("\n")
+    indent = text[: len(text) - len(text.lstrip())]
+    code = text.lstrip()
+    scanned = _scan(code)
+    if not scanned or not scanned[0]:
+        return line
+    opening, closing = max(scanned[0], key=lambda pair: pair[1])
+    head, body, tail = code[: opening + 1], code[opening + 1 : closing], code[closing:]
+    inner = indent + "    "
+    if not body.strip():
+        return line
+    if len(inner) + len(body.strip()) <= LINE_LIMIT and not body.rstrip().endswith(","):
+        middle = f"{inner}{body.strip()}\n"
+    else:
+        middle = _split_commas(body, inner)
+        if middle is None:
+            return line
+    return f"{indent}{head}\n{middle}{indent}{tail}\n"
+
+
+class CodegenError(Exception):
+    """A sync construct that has no mechanical async equivalent."""
+
+
+def _is_awaited_expect(call: ast.Call) -> bool:
+    """``expect(...).to_*()`` assertions are awaited in the async API."""
+    func = call.func
+    return (
+        isinstance(func, ast.Attribute)
+        and (func.attr.startswith("to_") or func.attr.startswith("not_to_"))
+        and isinstance(func.value, ast.Call)
+        and isinstance(func.value.func, ast.Name)
+        and func.value.func.id == "expect"
+    )
+
+
+def _is_expect_manager(item: ast.withitem) -> bool:
+    """``page.expect_response(...)`` and friends become ``async with``."""
+    expr = item.context_expr
+    return (
+        isinstance(expr, ast.Call)
+        and isinstance(expr.func, ast.Attribute)
+        and expr.func.attr.startswith("expect_")
+    )
+
+
+def _decorators(node: ast.FunctionDef) -> Set[str]:
+    names = set()
+    for decorator in node.decorator_list:
+        if isinstance(decorator, ast.Name):
+            names.add(decorator.id)
+        elif isinstance(decorator, ast.Attribute):
+            names.add(decorator.attr)
+    return names
+
+
+def _stays_sync(node: ast.FunctionDef) -> bool:
+    """Constructors, properties and static/class methods are never async."""
+    sync = {"property", "setter", "staticmethod", "classmethod"}
+    return node.name.startswith("__") or bool(_decorators(node) & sync)
+
+
+def _defined_names(stmt: ast.stmt) -> Set[str]:
+    if isinstance(stmt, (ast.FunctionDef, ast.ClassDef)):
+        return {stmt.name}
+    targets: List[ast.expr] = []
+    if isinstance(stmt, ast.Assign):
+        targets = stmt.targets
+    elif isinstance(stmt, ast.AnnAssign):
+        targets = [stmt.target]
+    return {t.id for t in targets if isinstance(t, ast.Name)}
+
+
+class Module:
+    """A sync module of ``pages`` and what its async twin needs."""
+
+    def __init__(self, name: str, only: Optional[List[str]]) -> None:
+        self.name = name
+        self.only = only
+        self.source = (PAGES_DIR / f"{name}.py").read_text()
+        self.tree = ast.parse(self.source)
+        self.lines = self.source.splitlines(keepends=True)
+        self.imports: Dict[str, str] = {}
+        for stmt in self.tree.body:
+            if isinstance(stmt, ast.ImportFrom) and stmt.module:
+                for alias in stmt.names:
+                    self.imports[alias.asname or alias.name] = stmt.module
+
+    def functions(self) -> List[Tuple[Optional[ast.ClassDef], ast.FunctionDef]]:
+        """Top-level functions and methods that may have to become async."""
+        found: List[Tuple[Optional[ast.ClassDef], ast.FunctionDef]] = []
+        for stmt in self.tree.body:
+            if self.only is not None and stmt not in self.selected():
+                continue
+            if isinstance(stmt, ast.FunctionDef):
+                found.append((None, stmt))
+            elif isinstance(stmt, ast.ClassDef):
+                for item in stmt.body:
+                    if isinstance(item, ast.FunctionDef):
+                        found.append((stmt, item))
+        return found
+
+    def selected(self) -> List[ast.stmt]:
+        """Top-level definitions named in ``MODULES``."""
+        wanted = set(self.only or ())
+        chosen = [s for s in self.tree.body if _defined_names(s) & wanted]
+        missing = wanted - {n for s in chosen for n in _defined_names(s)}
+        if missing:
+            raise CodegenError(f"pages/{self.name}.py defines no {sorted(missing)}")
+        return chosen
+
+
+class Generator:
+    """Decides what becomes async across all mirrored modules, then emits."""
+
+    def __init__(self, modules: Dict[str, Optional[List[str]]]) -> None:
+        self.modules = {name: Module(name, only) for name, only in modules.items()}
+        self.async_methods: Set[str] = set()
+        self.async_functions: Dict[str, Set[str]] = {m: set() for m in modules}
+        self.async_nodes: Set[ast.FunctionDef] = set()
+        self._resolve()
+
+    # ── Analysis ─────────────────────────────────────────────────────────
+
+    def _async_names(self, module: Module) -> Set[str]:
+        """Module-level names that are coroutine functions in the twin."""
+        names = set(self.async_functions[module.name])
+        for alias, source in module.imports.items():
+            mirrored = source.removeprefix("pages.")
+            if source.startswith("pages.") and mirrored in self.async_functions:
+                if alias in self.async_functions[mirrored]:
+                    names.add(alias)
+        return names
+
+    def awaited(self, module: Module, call: ast.Call) -> bool:
+        """Whether a call returns an awaitable in the async twin."""
+        func = call.func
+        if isinstance(func, ast.Name):
+            return func.id in self._async_names(module)
+        if isinstance(func, ast.Attribute):
+            if func.attr in PLAYWRIGHT_ASYNC or func.attr in self.async_methods:
+                return True
+            return _is_awaited_expect(call)
+        return False
+
+    def _needs_async(self, module: Module, node: ast.FunctionDef) -> bool:
+        for child in ast.walk(node):
+            if isinstance(child, ast.With) and any(
+                _is_expect_manager(item) for item in child.items
+            ):
+                return True
+            if isinstance(child, ast.Call) and self.awaited(module, child):
+                return True
+        return False
+
+    def _resolve(self) -> None:
+        """Propagate async-ness until no new function becomes a coroutine."""
+        changed = True
+        while changed:
+            changed = False
+            for module in self.modules.values():
+                for owner, node in module.functions():
+                    if node in self.async_nodes or _stays_sync(node):
+                        continue
+                    if self._needs_async(module, node):
+                        self.async_nodes.add(node)
+                        if owner is None:
+                            self.async_functions[module.name].add(node.name)
+                        else:
+                            self.async_methods.add(node.name)
+                        changed = True
+        for module in self.modules.values():
+            for owner, node in module.functions():
+                self._validate(module, owner, node)
+
+    def _validate(
+        self, module: Module, owner: Optional[ast.ClassDef], node: ast.FunctionDef
+    ) -> None:
+        where = f"pages/{module.name}.py:{node.lineno}"
+        if node in self.async_nodes:
+            # Scopes an ``await`` cannot be inserted into as-is.
+            scopes = (ast.Lambda, ast.GeneratorExp, ast.FunctionDef)
+            for child in ast.walk(node):
+                if (
+                    child is not node
+                    and isinstance(child, scopes)
+                    and any(
+                        isinstance(c, ast.Call) and self.awaited(module, c)
+                        for c in ast.walk(child)
+                    )
+                ):
+                    kind = type(child).__name__
+                    raise CodegenError(f"{where}: browser call inside a {kind}")
+            return
+        if _stays_sync(node) and self._needs_async(module, node):
+            raise CodegenError(f"{where}: {node.name} must stay sync but awaits")
+        if owner is not None and node.name in self.async_methods:
+            if not _stays_sync(node):
+                raise CodegenError(
+                    f"{where}: sync method {node.name} shares its name with a "
+                    "coroutine method"
+                )
+
+    # ── Emitting ─────────────────────────────────────────────────────────
+
+    def emitted(self, module: Module) -> List[ast.stmt]:
+        """Top-level definitions copied (and converted) into the twin."""
+        if module.only is not None:
+            return module.selected()
+        chosen = []
+        for stmt in module.tree.body:
+            if isinstance(stmt, ast.FunctionDef) and stmt in self.async_nodes:
+                chosen.append(stmt)
+            elif isinstance(stmt, ast.ClassDef) and any(
+                item in self.async_nodes for item in stmt.body
+            ):
+                chosen.append(stmt)
+        return chosen
+
+    def _edits(
+        self, module: Module, stmt: ast.stmt
+    ) -> Dict[int, List[Tuple[int, int, str]]]:
+        """Insertions per line: (byte column, order, text)."""
+        edits: Dict[int, List[Tuple[int, int, str]]] = {}
+
+        def insert(line: int, col: int, order: int, text: str) -> None:
+            edits.setdefault(line, []).append((col, order, text))
+
+        parents: Dict[ast.AST, ast.AST] = {}
+        for parent in ast.walk(stmt):
+            for child in ast.iter_child_nodes(parent):
+                parents[child] = parent
+        for node in ast.walk(stmt):
+            if isinstance(node, ast.FunctionDef) and node in self.async_nodes:
+                insert(node.lineno, node.col_offset, 0, "async ")
+            elif isinstance(node, ast.With) and any(
+                _is_expect_manager(item) for item in node.items
+            ):
+                insert(node.lineno, node.col_offset, 0, "async ")
+            elif isinstance(node, ast.Call) and self.awaited(module, node):
+                parent = parents.get(node)
+                wrap = (
+                    isinstance(parent, (ast.Attribute, ast.Subscript))
+                    and parent.value is node
+                ) or (isinstance(parent, ast.Call) and parent.func is node)
+                # Outer calls start where inner ones do; they must come first.
+                span = (node.end_lineno or 0, node.end_col_offset or 0)
+                order = -(span[0] * 10000 + span[1])
+                opening = "(await " if wrap else "await "
+                insert(node.lineno, node.col_offset, order, opening)
+                if wrap:
+                    insert(span[0], span[1], -order, ")")
+            elif isinstance(node, ast.Name) and node.id in SUBSTITUTES:
+                end = node.col_offset + len(node.id)
+                insert(node.lineno, node.col_offset, 0, f"\0{end}")
+        return edits
+
+    def _render(self, module: Module, stmt: ast.stmt, start: int) -> str:
+        """Source of ``stmt`` (from line ``start``) with the async edits."""
+        edits = self._edits(module, stmt)
+        out = []
+        for lineno in range(start, (stmt.end_lineno or stmt.lineno) + 1):
+            raw = module.lines[lineno - 1].encode()
+            pieces, pos = [], 0
+            for col, _, text in sorted(edits.get(lineno, []), key=lambda e: e[:2]):
+                pieces.append(raw[pos:col].decode())
+                if text.startswith("\0"):
+                    end = int(text[1:])
+                    name = raw[col:end].decode()
+                    pieces.append(SUBSTITUTES[name])
+                    pos = end
+                else:
+                    pieces.append(text)
+                    pos = col
+            pieces.append(raw[pos:].decode())
+            line = "".join(pieces)
+            out.append(_wrap(line) if lineno in edits else line)
+        return "".join(out)
+
+    def _import_line(self, module: str, names: List[str]) -> str:
+        line = f"from {module} import {', '.join(names)}\n"
+        if len(line) <= LINE_LIMIT + 1:
+            return line
+        body = "".join(f"    {name},\n" for name in names)
+        return f"from {module} import (\n{body})\n"
+
+    def _mirrored_names(self, name: str) -> Set[str]:
+        """Names the async twin of module ``name`` defines itself."""
+        module = self.modules[name]
+        return {n for stmt in self.emitted(module) for n in _defined_names(stmt)}
+
+    def _imports(self, module: Module, body: str, shared: List[str]) -> str:
+        """The twin's imports, pruned to the names its code still uses."""
+        used = {
+            node.id for node in ast.walk(ast.parse(body)) if isinstance(node, ast.Name)
+        }
+        groups: List[List[str]] = []
+        first_party: Dict[str, List[str]] = {}
+        previous_end = None
+        for stmt in module.tree.body:
+            if not isinstance(stmt, (ast.Import, ast.ImportFrom)):
+                continue
+            if previous_end is not None and stmt.lineno > previous_end + 1:
+                groups.append([])
+            previous_end = stmt.end_lineno
+            if not groups:
+                groups.append([])
+            if isinstance(stmt, ast.Import):
+                kept = [a.name for a in stmt.names if (a.asname or a.name) in used]
+                groups[-1].extend(f"import {name}\n" for name in kept)
+                continue
+            source = stmt.module or ""
+            names = [a.name for a in stmt.names]
+            if source != "__future__":
+                names = [
+                    SUBSTITUTES.get(n, n)
+                    for n in names
+                    if SUBSTITUTES.get(n, n) in used
+                ]
+            if not names:
+                continue
+            if source == "playwright.sync_api":
+                source = "playwright.async_api"
+            if not source.startswith(("pages.", "utils.")):
+                groups[-1].append(self._import_line(source, names))
+                continue
+            mirrored = source.removeprefix("pages.")
+            if mirrored in self.modules:
+                twin = self._mirrored_names(mirrored)
+                aio = [n for n in names if n in twin]
+                first_party.setdefault(f"pages.aio.{mirrored}", []).extend(aio)
+                names = [n for n in names if n not in twin]
+            first_party.setdefault(source, []).extend(names)
+        if shared:
+            first_party.setdefault(f"pages.{module.name}", []).extend(shared)
+        groups.append(
+            [
+                self._import_line(source, sorted(set(names), key=_import_order))
+                for source, names in sorted(first_party.items())
+                if names
+            ]
+        )
+        return "\n".join("".join(group) for group in groups if group)
+
+    def generate(self, module: Module) -> str:
+        """Source of the async twin of ``module``."""
+        emitted = self.emitted(module)
+        if not emitted:
+            raise CodegenError(f"pages/{module.name}.py has nothing to mirror")
+        chunks = []
+        body_stmts = module.tree.body
+        for stmt in emitted:
+            index = body_stmts.index(stmt)
+            previous = body_stmts[index - 1]
+            start = (previous.end_lineno or previous.lineno) + 1
+            # Keep comments directly above the definition, drop blank lines.
+            while start < stmt.lineno and not module.lines[start - 1].strip():
+                start += 1
+            if isinstance(previous, (ast.Import, ast.ImportFrom)):
+                start = min(
+                    stmt.lineno,
+                    next(
+                        (
+                            n
+                            for n in range(start, stmt.lineno)
+                            if module.lines[n - 1].lstrip().startswith("#")
+                        ),
+                        stmt.lineno,
+                    ),
+                )
+            first = stmt.decorator_list[0].lineno if getattr(
+                stmt, "decorator_list", None
+            ) else stmt.lineno
+            chunks.append(self._render(module, stmt, min(start, first)))
+        body = "\n\n".join(chunk.rstrip("\n") + "\n" for chunk in chunks)
+        defined = {n for stmt in emitted for n in _defined_names(stmt)}
+        top_level = {n for stmt in body_stmts for n in _defined_names(stmt)}
+        used = {
+            node.id for node in ast.walk(ast.parse(body)) if isinstance(node, ast.Name)
+        }
+        shared = sorted((used & top_level) - defined)
+        docstring = ast.get_docstring(module.tree, clean=False)
+        parts = [HEADER.format(name=module.name)]
+        if docstring is not None:
+            doc = module.tree.body[0]
+            parts.append("".join(module.lines[doc.lineno - 1 : doc.end_lineno]))
+            parts.append("\n")
+        parts.append(self._imports(module, body, shared))
+        parts.append("\n\n")
+        parts.append(body)
+        return "".join(parts)
+
+    def generate_init(self) -> str:
+        """``pages/aio/__init__.py`` exporting the mirrored page classes."""
+        init = ast.parse((PAGES_DIR / "__init__.py").read_text())
+        exports: List[Tuple[str, str]] = []
+        for stmt in init.body:
+            if isinstance(stmt, ast.ImportFrom) and stmt.module:
+                name = stmt.module.removeprefix("pages.")
+                if name not in self.modules:
+                    continue
+                classes = {
+                    s.name
+                    for s in self.emitted(self.modules[name])
+                    if isinstance(s, ast.ClassDef)
+                }
+                exports.extend(
+                    (name, alias.name) for alias in stmt.names if alias.name in classes
+                )
+        lines = [
+            HEADER.format(name="__init__"),
+            '"""Async Playwright variant of the page objects in ``pages``."""\n\n',
+        ]
+        by_module: Dict[str, List[str]] = {}
+        for name, cls in exports:
+            by_module.setdefault(name, []).append(cls)
+        for name in sorted(by_module):
+            lines.append(self._import_line(f"pages.aio.{name}", by_module[name]))
+        lines.append("\n__all__ = [\n")
+        lines.extend(f'    "{cls}",\n' for cls in sorted(cls for _, cls in exports))
+        lines.append("]\n")
+        return "".join(lines)
+
+    def files(self) -> Dict[Path, str]:
+        """Every generated file and its content."""
+        files = {
+            AIO_DIR / f"{name}.py": self.generate(module)
+            for name, module in self.modules.items()
+        }
+        files[AIO_DIR / "__init__.py"] = self.generate_init()
+        return files
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail if a generated module differs from what would be generated",
+    )
+    args = parser.parse_args(argv)
+    try:
+        files = Generator(MODULES).files()
+    except CodegenError as exc:
+        print(f"codegen: {exc}", file=sys.stderr)
+        return 2
+    stale = [p for p, text in files.items() if not p.exists() or p.read_text() != text]
+    if args.check:
+        for path in stale:
+            print(f"out of date: {path.relative_to(PAGES_DIR.parent)}")
+        return 1 if stale else 0
+    for path in stale:
+        path.write_text(files[path])
+        print(f"wrote {path.relative_to(PAGES_DIR.parent)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+# Generated by pages/aio/codegen.py from pages/components.py; do not edit.
+"""Reusable UI component helpers (dialogs, toasts, overlays, spinners)."""
+
+from __future__ import annotations
+
+from playwright.async_api import Page
+
+from pages.aio.loading_state import is_loading, wait_for_loading_complete
+from pages.locator_registry import resolve_chain
+
+
+class ConfirmDialog:
+    """Helper for interacting with confirmation dialogs."""
+
+    def __init__(self, page: Page) -> None:
+        """Initialize ConfirmDialog.
+
+        Args:
+            page: Playwright page instance.
+        """
+        self.page = page
+
+    @property
+    def _dialog(self):
+        """Dialog element."""
+        return self.page.locator("[role='alertdialog'], [role='dialog']").first
+
+    async def is_visible(self) -> bool:
+        """Check if a confirm dialog is visible.
+
+        Returns:
+            True if dialog is visible.
+        """
+        return await self._dialog.is_visible()
+
+    async def confirm(self) -> None:
+        """Click the confirm/OK button."""
+        await resolve_chain(
+            self.page,
+            "ConfirmDialog.confirm",
+            self._dialog.get_by_role("button", name="Confirm"),
+            self._dialog.get_by_role("button", name="OK"),
+            self._dialog.get_by_role("button", name="Yes"),
+        ).click()
+        await self._dialog.wait_for(state="hidden")
+
+    async def cancel(self) -> None:
+        """Click the cancel button."""
+        await resolve_chain(
+            self.page,
+            "ConfirmDialog.cancel",
+            self._dialog.get_by_role("button", name="Cancel"),
+            self._dialog.get_by_role("button", name="No"),
+        ).click()
+        await self._dialog.wait_for(state="hidden")
+
+    async def get_message(self) -> str:
+        """Get the dialog message text.
+
+        Returns:
+            Dialog message string.
+        """
+        return await self._dialog.inner_text()
+
+
+class Toast:
+    """Helper for interacting with toast notifications."""
+
+    def __init__(self, page: Page) -> None:
+        """Initialize Toast.
+
+        Args:
+            page: Playwright page instance.
+        """
+        self.page = page
+
+    @property
+    def _toast(self):
+        """Toast notification element."""
+        return self.page.locator("[role='status'], [data-testid='toast']").first
+
+    async def wait_for_toast(self, timeout: int = 5000) -> None:
+        """Wait for a toast notification to appear.
+
+        Args:
+            timeout: Maximum wait time in milliseconds.
+        """
+        await self._toast.wait_for(state="visible", timeout=timeout)
+
+    async def get_message(self) -> str:
+        """Get the toast message text.
+
+        Returns:
+            Toast message string.
+        """
+        return await self._toast.inner_text()
+
+    async def dismiss(self) -> None:
+        """Dismiss the toast notification."""
+        close = self._toast.locator("button").first
+        if await close.is_visible():
+            await close.click()
+
+    async def is_visible(self) -> bool:
+        """Check if a toast is currently visible.
+
+        Returns:
+            True if a toast is visible.
+        """
+        return await self._toast.is_visible()
+
+
+class PlanLimitOverlay:
+    """Helper for the plan upgrade / limit reached overlay."""
+
+    def __init__(self, page: Page) -> None:
+        """Initialize PlanLimitOverlay.
+
+        Args:
+            page: Playwright page instance.
+        """
+        self.page = page
+
+    @property
+    def _overlay(self):
+        """Plan limit overlay element."""
+        return resolve_chain(
+            self.page,
+            "PlanLimitOverlay.overlay",
+            self.page.locator("[data-testid='plan-limit-overlay']"),
+            self.page.get_by_text("Upgrade", exact=False).locator("..").locator(".."),
+        )
+
+    async def is_visible(self) -> bool:
+        """Check if the plan limit overlay is visible.
+
+        Returns:
+            True if overlay is displayed.
+        """
+        return await self._overlay.is_visible()
+
+    async def click_upgrade(self) -> None:
+        """Click the upgrade button on the overlay."""
+        await self._overlay.get_by_role("button", name="Upgrade").first.click()
+
+    async def dismiss(self) -> None:
+        """Dismiss the plan limit overlay."""
+        close = self._overlay.locator("button[aria-label='Close'], button:has-text('Close')").first
+        if await close.is_visible():
+            await close.click()
+
+
+class LoadingSpinner:
+    """Helper for detecting loading spinners."""
+
+    def __init__(self, page: Page) -> None:
+        """Initialize LoadingSpinner.
+
+        Args:
+            page: Playwright page instance.
+        """
+        self.page = page
+
+    async def is_loading(self) -> bool:
+        """Check if any loading spinner is visible.
+
+        Returns:
+            True if a spinner is present.
+        """
+        return await is_loading(self.page)
+
+    async def wait_for_done(self, timeout: int = 10000, settle_ms: int = 100) -> None:
+        """Wait for all spinners to disappear.
+
+        Args:
+            timeout: Maximum wait time in milliseconds.
+            settle_ms: How long the page must stay free of loading indicators.
+        """
+        await wait_for_loading_complete(self.page, timeout=timeout, settle_ms=settle_ms)
@@ -0,0 +1,112 @@
+# Generated by pages/aio/codegen.py from pages/dashboard_page.py; do not edit.
+"""Page object for the main dashboard view."""
+
+from __future__ import annotations
+
+from typing import List
+
+from playwright.async_api import Page
+
+from pages.aio.base_page import BasePage
+from pages.base_page import TextRow
+
+
+class DashboardPage(BasePage):
+    """Dashboard page with project list and semantic search."""
+
+    PATH = "/dashboard"
+
+    def __init__(self, page: Page, base_url: str = "") -> None:
+        """Initialize DashboardPage.
+
+        Args:
+            page: Playwright page instance.
+            base_url: Application base URL.
+        """
+        super().__init__(page, base_url)
+
+    async def open(self) -> None:
+        """Navigate to the dashboard."""
+        await self.navigate(self.PATH)
+        await self.wait_for_page_load()
+
+    # ── Locators ─────────────────────────────────────────────────────────
+
+    @property
+    def _project_cards(self):
+        """All project card elements."""
+        return self.page.locator("[data-testid='project-card']")
+
+    @property
+    def _search_input(self):
+        """Semantic search input."""
+        return self.page.get_by_placeholder("Search")
+
+    @property
+    def _new_project_btn(self):
+        """New project button."""
+        return self.page.get_by_role("button", name="New Project").or_(
+            self.page.get_by_role("button", name="Create Project")
+        ).first
+
+    # ── Actions ──────────────────────────────────────────────────────────
+
+    async def get_project_count(self) -> int:
+        """Return the number of project cards visible on the dashboard.
+
+        Returns:
+            Count of project cards.
+        """
+        await self.wait_for_loading_complete()
+        return await self._project_cards.count()
+
+    async def get_prompt_count(self) -> int:
+        """Return the total prompt count displayed on the dashboard.
+
+        Returns:
+            Prompt count as integer.
+        """
+        counter = self.page.locator("[data-testid='prompt-count']")
+        if await counter.is_visible():
+            return int(await counter.inner_text())
+        return 0
+
+    async def search_semantic(self, query: str) -> None:
+        """Perform a semantic search on the dashboard.
+
+        Args:
+            query: Search query text.
+        """
+        await self.fill_form_field(self._search_input, query)
+        await self.page.keyboard.press("Enter")
+        await self.wait_for_loading_complete()
+
+    async def click_new_project(self) -> None:
+        """Click the button to create a new project."""
+        await self._new_project_btn.click()
+
+    async def get_project_list(self) -> List[str]:
+        """Return the names of all visible projects.
+
+        Returns:
+            List of project name strings.
+        """
+        await self.wait_for_loading_complete()
+        rows = await self.extract_table(self._project_cards, {"text": ""}, TextRow)
+        return [row.text for row in rows]
+
+    async def click_project(self, name: str) -> None:
+        """Click a project card by name.
+
+        Args:
+            name: Project name to click.
+        """
+        await self.page.get_by_text(name, exact=False).first.click()
+        await self.wait_for_page_load()
+
+    async def open_share_prompt(self) -> None:
+        """Open the share prompt dialog from the dashboard."""
+        share_btn = self.page.get_by_role("button", name="Share").or_(
+            self.page.get_by_text("Share a prompt")
+        ).first
+        await share_btn.click()
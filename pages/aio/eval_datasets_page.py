@@ -0,0 +1,88 @@
+# Generated by pages/aio/codegen.py from pages/eval_datasets_page.py; do not edit.
+"""Page object for the Eval Datasets page."""
+
+from __future__ import annotations
+
+from typing import List
+
+from playwright.async_api import Page
+
+from pages.aio.base_page import BasePage
+
+
+class EvalDatasetsPage(BasePage):
+    """Manage evaluation datasets."""
+
+    def __init__(self, page: Page, base_url: str = "") -> None:
+        """Initialize EvalDatasetsPage.
+
+        Args:
+            page: Playwright page instance.
+            base_url: Application base URL.
+        """
+        super().__init__(page, base_url)
+
+    # ── Actions ──────────────────────────────────────────────────────────
+
+    async def create_dataset(self, name: str) -> None:
+        """Create a new dataset.
+
+        Args:
+            name: Dataset name.
+        """
+        await self.page.get_by_role("button", name="Create").or_(
+            self.page.get_by_role("button", name="New Dataset")
+        ).first.click()
+        name_input = self.page.get_by_label("Name").or_(
+            self.page.get_by_placeholder("Dataset name")
+        ).first
+        await self.fill_form_field(name_input, name)
+        await self.page.get_by_role("button", name="Create").or_(
+            self.page.get_by_role("button", name="Save")
+        ).first.click()
+        await self.wait_for_loading_complete()
+
+    async def import_csv(self, file_path: str) -> None:
+        """Import a CSV file as dataset data.
+
+        Args:
+            file_path: Path to the CSV file to upload.
+        """
+        file_input = self.page.locator("input[type='file']")
+        await file_input.set_input_files(file_path)
+        await self.wait_for_loading_complete()
+
+    async def get_dataset_list(self) -> List[str]:
+        """Return names of all datasets.
+
+        Returns:
+            List of dataset name strings.
+        """
+        await self.wait_for_loading_complete()
+        items = self.page.locator("[data-testid='dataset-item']")
+        return await items.all_inner_texts()
+
+    async def click_dataset(self, name: str) -> None:
+        """Click on a dataset by name.
+
+        Args:
+            name: Dataset name to click.
+        """
+        await self.page.get_by_text(name, exact=False).first.click()
+        await self.wait_for_loading_complete()
+
+    async def delete_dataset(self, name: str) -> None:
+        """Delete a dataset by name.
+
+        Args:
+            name: Dataset name to delete.
+        """
+        row = self.page.get_by_text(name, exact=False).first
+        await row.hover()
+        delete_btn = self.page.get_by_role("button", name="Delete").first
+        await delete_btn.click()
+        # Confirm deletion
+        await self.page.get_by_role("button", name="Confirm").or_(
+            self.page.get_by_role("button", name="Delete")
+        ).first.click()
+        await self.wait_for_loading_complete()
@@ -0,0 +1,77 @@
+# Generated by pages/aio/codegen.py from pages/eval_suites_page.py; do not edit.
+"""Page object for the Eval Suites page."""
+
+from __future__ import annotations
+
+from typing import List
+
+from playwright.async_api import Page
+
+from pages.aio.base_page import BasePage
+
+
+class EvalSuitesPage(BasePage):
+    """Manage evaluation test suites."""
+
+    def __init__(self, page: Page, base_url: str = "") -> None:
+        """Initialize EvalSuitesPage.
+
+        Args:
+            page: Playwright page instance.
+            base_url: Application base URL.
+        """
+        super().__init__(page, base_url)
+
+    # ── Actions ──────────────────────────────────────────────────────────
+
+    async def create_suite(self, name: str) -> None:
+        """Create a new evaluation suite.
+
+        Args:
+            name: Suite name.
+        """
+        await self.page.get_by_role("button", name="Create").or_(
+            self.page.get_by_role("button", name="New Suite")
+        ).first.click()
+        name_input = self.page.get_by_label("Name").or_(
+            self.page.get_by_placeholder("Suite name")
+        ).first
+        await self.fill_form_field(name_input, name)
+        await self.page.get_by_role("button", name="Create").or_(
+            self.page.get_by_role("button", name="Save")
+        ).first.click()
+        await self.wait_for_loading_complete()
+
+    async def get_suite_list(self) -> List[str]:
+        """Return names of all suites.
+
+        Returns:
+            List of suite name strings.
+        """
+        await self.wait_for_loading_complete()
+        items = self.page.locator("[data-testid='suite-item']")
+        return await items.all_inner_texts()
+
+    async def click_suite(self, name: str) -> None:
+        """Click on a suite by name.
+
+        Args:
+            name: Suite name to click.
+        """
+        await self.page.get_by_text(name, exact=False).first.click()
+        await self.wait_for_loading_complete()
+
+    async def delete_suite(self, name: str) -> None:
+        """Delete a suite by name.
+
+        Args:
+            name: Suite name to delete.
+        """
+        row = self.page.get_by_text(name, exact=False).first
+        await row.hover()
+        delete_btn = self.page.get_by_role("button", name="Delete").first
+        await delete_btn.click()
+        await self.page.get_by_role("button", name="Confirm").or_(
+            self.page.get_by_role("button", name="Delete")
+        ).first.click()
+        await self.wait_for_loading_complete()
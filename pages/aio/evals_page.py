@@ -0,0 +1,61 @@
+# Generated by pages/aio/codegen.py from pages/evals_page.py; do not edit.
+"""Page object for the Evals landing page."""
+
+from __future__ import annotations
+
+from playwright.async_api import Page
+
+from pages.aio.base_page import BasePage
+
+
+class EvalsPage(BasePage):
+    """Evals top-level page with prompt selection and tab navigation."""
+
+    PATH = "/evals"
+
+    def __init__(self, page: Page, base_url: str = "") -> None:
+        """Initialize EvalsPage.
+
+        Args:
+            page: Playwright page instance.
+            base_url: Application base URL.
+        """
+        super().__init__(page, base_url)
+
+    async def open(self) -> None:
+        """Navigate to the evals page."""
+        await self.navigate(self.PATH)
+        await self.wait_for_page_load()
+
+    # ── Actions ──────────────────────────────────────────────────────────
+
+    async def select_prompt(self, name: str) -> None:
+        """Select a prompt to evaluate.
+
+        Args:
+            name: Prompt name to select.
+        """
+        await self.page.get_by_text(name, exact=False).first.click()
+        await self.wait_for_loading_complete()
+
+    async def navigate_tab(self, tab_name: str) -> None:
+        """Navigate to a specific eval tab.
+
+        Args:
+            tab_name: Tab name (e.g. 'Datasets', 'Suites', 'Runs', 'Results').
+        """
+        await self.page.get_by_role("tab", name=tab_name).or_(
+            self.page.get_by_text(tab_name)
+        ).first.click()
+        await self.wait_for_loading_complete()
+
+    async def get_active_tab(self) -> str:
+        """Get the name of the currently active tab.
+
+        Returns:
+            Active tab name.
+        """
+        active = self.page.locator("[role='tab'][aria-selected='true']")
+        if await active.is_visible():
+            return await active.inner_text()
+        return ""
@@ -0,0 +1,17 @@
+# Generated by pages/aio/codegen.py from pages/idle_tracker.py; do not edit.
+"""In-page tracker for network, route and DOM activity used by idle waits."""
+
+from __future__ import annotations
+
+from playwright.async_api import BrowserContext
+
+from pages.idle_tracker import IDLE_TRACKER_SCRIPT
+
+
+async def install_idle_tracker(context: BrowserContext) -> None:
+    """Register the idle tracker on every page the context opens.
+
+    Args:
+        context: Playwright browser context.
+    """
+    await context.add_init_script(f"({IDLE_TRACKER_SCRIPT})();")
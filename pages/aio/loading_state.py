@@ -0,0 +1,68 @@
+# Generated by pages/aio/codegen.py from pages/loading_state.py; do not edit.
+"""Shared loading-state detector for spinners, skeletons and progress bars.
+
+All selectors are checked inside the browser in a single ``evaluate`` call,
+and a MutationObserver keeps watching until nothing is visible for the
+settle window, so spinners that appear right after an action are caught
+instead of being missed by an up-front ``count()``.
+"""
+
+from __future__ import annotations
+
+import time
+
+from playwright.async_api import Error, Page, TimeoutError
+
+from pages.loading_state import _IS_LOADING_SCRIPT, _WAIT_SCRIPT, LOADING_SELECTORS
+
+
+async def is_loading(page: Page) -> bool:
+    """Check whether any loading indicator is currently visible.
+
+    Args:
+        page: Playwright page instance.
+
+    Returns:
+        True if a spinner, skeleton or progress bar is visible.
+    """
+    return await page.evaluate(_IS_LOADING_SCRIPT, list(LOADING_SELECTORS))
+
+
+async def wait_for_loading_complete(
+    page: Page, timeout: int = 10000, settle_ms: int = 100
+) -> None:
+    """Wait until no loading indicator has been visible for ``settle_ms``.
+
+    If the page navigates while waiting, the wait restarts on the new
+    document with whatever time is left.
+
+    Args:
+        page: Playwright page instance.
+        timeout: Maximum wait time in milliseconds.
+        settle_ms: How long the page must stay free of loading indicators.
+
+    Raises:
+        TimeoutError: If a loading indicator is still visible after ``timeout``.
+    """
+    deadline = time.monotonic() + timeout / 1000
+    while True:
+        remaining = max(int((deadline - time.monotonic()) * 1000), 0)
+        try:
+            done = await page.evaluate(
+                _WAIT_SCRIPT,
+                {
+                    "selectors": list(LOADING_SELECTORS),
+                    "settleMs": settle_ms,
+                    "timeout": remaining,
+                },
+            )
+        except Error as exc:
+            if "context was destroyed" not in str(exc) or remaining == 0:
+                raise
+            await page.wait_for_load_state("domcontentloaded", timeout=remaining)
+            continue
+        if not done:
+            raise TimeoutError(
+                f"Loading indicators still visible after {timeout}ms"
+            )
+        return
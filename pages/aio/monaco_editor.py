@@ -0,0 +1,270 @@
+# Generated by pages/aio/codegen.py from pages/monaco_editor.py; do not edit.
+"""Helper for interacting with Monaco Editor instances.
+
+Besides the basic ``set_value``/``get_value`` round trips, the editor has
+bulk paths for multi-megabyte documents: ``write_chunked`` streams the text
+into the model through ``executeEdits`` in bounded chunks, ``paste`` sends
+it through Monaco's own paste handling, and ``get_digest``/``get_lines``
+verify content without copying the whole document back to Python.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Optional
+
+from playwright.async_api import Page
+
+from pages.aio.typing_profiler import profile_typing
+from pages.monaco_editor import CHUNK_CHARS, _chunks
+from pages.spans import INTERACT, WAIT, span
+from pages.typing_profiler import TYPING, TYPING_SAMPLE, sample_document
+
+
+class MonacoEditor:
+    """Provides methods to interact with a Monaco Editor embedded in the page."""
+
+    EDITOR_SELECTOR = ".monaco-editor"
+
+    def __init__(self, page: Page) -> None:
+        """Initialize MonacoEditor helper.
+
+        Args:
+            page: Playwright page instance.
+        """
+        self.page = page
+
+    @span(WAIT)
+    async def wait_for_ready(self, timeout: int = 15000) -> None:
+        """Wait for the Monaco editor to be loaded and visible.
+
+        Args:
+            timeout: Maximum wait time in milliseconds.
+        """
+        await self.page.locator(self.EDITOR_SELECTOR).first.wait_for(
+            state="visible", timeout=timeout
+        )
+
+    @span(INTERACT)
+    async def set_value(self, text: str) -> None:
+        """Set the editor value programmatically via the Monaco API.
+
+        Args:
+            text: Content to set in the editor.
+        """
+        await self.wait_for_ready()
+        await self.page.evaluate(
+            """(val) => {
+                const editor = window.monaco?.editor?.getEditors()?.[0];
+                if (editor) {
+                    editor.setValue(val);
+                }
+            }""",
+            text,
+        )
+
+    @span(INTERACT)
+    async def get_value(self) -> str:
+        """Get the current editor value via the Monaco API.
+
+        Returns:
+            Editor content as a string.
+        """
+        await self.wait_for_ready()
+        return await self.page.evaluate(
+            """() => {
+                const editor = window.monaco?.editor?.getEditors()?.[0];
+                return editor ? editor.getValue() : '';
+            }"""
+        )
+
+    @span(INTERACT)
+    async def type_text(self, text: str) -> None:
+        """Simulate typing text into the editor.
+
+        Args:
+            text: Text to type character by character.
+        """
+        await self.wait_for_ready()
+        editor_el = self.page.locator(f"{self.EDITOR_SELECTOR} textarea").first
+        await editor_el.focus()
+        await editor_el.type(text)
+
+    @span(INTERACT)
+    async def write_chunked(self, text: str, chunk_chars: int = CHUNK_CHARS) -> None:
+        """Replace the content with ``text``, streamed in model edits.
+
+        Each chunk is one ``executeEdits`` call appended at the end of the
+        model, so no single protocol message carries the whole document and
+        the app sees ordinary content-change events.
+
+        Args:
+            text: New editor content.
+            chunk_chars: Maximum characters per edit; chunks end on a line
+                break where possible.
+        """
+        await self.wait_for_ready()
+        for index, chunk in enumerate(list(_chunks(text, chunk_chars)) or [""]):
+            await self.page.evaluate(
+                """([chunk, replace]) => {
+                    const editor = window.monaco?.editor?.getEditors()?.[0];
+                    if (!editor) return;
+                    const model = editor.getModel();
+                    let range = model.getFullModelRange();
+                    if (!replace) {
+                        const line = model.getLineCount();
+                        const column = model.getLineMaxColumn(line);
+                        range = new window.monaco.Range(line, column, line, column);
+                    }
+                    editor.executeEdits('e2e-bulk', [
+                        { range, text: chunk, forceMoveMarkers: true },
+                    ]);
+                }""",
+                [chunk, index == 0],
+            )
+        await self.page.evaluate(
+            "() => window.monaco?.editor?.getEditors()?.[0]?.pushUndoStop()"
+        )
+
+    @span(INTERACT)
+    async def paste(self, text: str) -> None:
+        """Paste ``text`` at the cursor through Monaco's clipboard handling.
+
+        Dispatches a ``paste`` event carrying the text to the editor's input
+        area, so paste handlers, auto-indent and ``onDidPaste`` run as for a
+        real paste, without clipboard permissions.
+
+        Args:
+            text: Text to paste.
+        """
+        await self.wait_for_ready()
+        await self.page.evaluate(
+            """(text) => {
+                const editor = window.monaco?.editor?.getEditors()?.[0];
+                if (!editor) return;
+                editor.focus();
+                const target = editor.getDomNode().querySelector('textarea')
+                    || document.activeElement;
+                const data = new DataTransfer();
+                data.setData('text/plain', text);
+                target.dispatchEvent(new ClipboardEvent('paste', {
+                    clipboardData: data, bubbles: true, cancelable: true,
+                }));
+            }""",
+            text,
+        )
+
+    @span(INTERACT)
+    async def get_digest(self) -> str:
+        """SHA-256 of the editor content, computed in the page.
+
+        Compare with ``MonacoEditor.digest(expected)``.
+
+        Returns:
+            Hex digest of the UTF-8 encoded content.
+        """
+        await self.wait_for_ready()
+        return await self.page.evaluate(
+            """async () => {
+                const editor = window.monaco?.editor?.getEditors()?.[0];
+                const text = editor ? editor.getValue() : '';
+                const hash = await crypto.subtle.digest(
+                    'SHA-256', new TextEncoder().encode(text));
+                return Array.from(new Uint8Array(hash),
+                    (b) => b.toString(16).padStart(2, '0')).join('');
+            }"""
+        )
+
+    @staticmethod
+    def digest(text: str) -> str:
+        """SHA-256 of ``text`` as ``get_digest`` computes it.
+
+        Args:
+            text: Expected editor content.
+
+        Returns:
+            Hex digest of the UTF-8 encoded text.
+        """
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    @span(INTERACT)
+    async def get_lines(self, start: int, end: Optional[int] = None) -> str:
+        """Get a range of lines without reading the whole document.
+
+        Args:
+            start: First line, 1-based.
+            end: Last line, inclusive (defaults to ``start``); clamped to
+                the document.
+
+        Returns:
+            The lines joined by the model's line break, without a trailing one.
+        """
+        await self.wait_for_ready()
+        return await self.page.evaluate(
+            """([start, end]) => {
+                const editor = window.monaco?.editor?.getEditors()?.[0];
+                if (!editor) return '';
+                const model = editor.getModel();
+                const last = Math.min(end, model.getLineCount());
+                return model.getValueInRange({
+                    startLineNumber: start,
+                    startColumn: 1,
+                    endLineNumber: last,
+                    endColumn: model.getLineMaxColumn(last),
+                });
+            }""",
+            [start, end if end is not None else start],
+        )
+
+    async def profile_typing(
+        self, lines: int, text: str = TYPING_SAMPLE, delay: float = 30
+    ) -> dict:
+        """Type into a document of ``lines`` lines and profile the editor.
+
+        Loads a prompt template of that size, puts the cursor on its middle
+        line and types ``text`` through the keyboard at ``delay`` ms per
+        keystroke (see ``pages/typing_profiler.py``). The profile is also
+        recorded for the end-of-session typing latency report.
+
+        Args:
+            lines: Document size in lines.
+            text: Characters to type.
+            delay: Milliseconds between keystrokes.
+
+        Returns:
+            The profile: per-keystroke latencies, long tasks and frames.
+        """
+        await self.write_chunked(sample_document(lines))
+        await self.page.evaluate(
+            """(line) => {
+                const editor = window.monaco?.editor?.getEditors()?.[0];
+                if (!editor) return;
+                editor.setPosition({ lineNumber: line, column: 1 });
+                editor.revealLineInCenter(line);
+                editor.focus();
+            }""",
+            max(lines // 2, 1),
+        )
+        profile = await profile_typing(self.page, text, delay)
+        TYPING.record(lines, profile)
+        return profile
+
+    @span(INTERACT)
+    async def clear(self) -> None:
+        """Clear all editor content."""
+        await self.set_value("")
+
+    @span(INTERACT)
+    async def get_line_count(self) -> int:
+        """Get the number of lines in the editor.
+
+        Returns:
+            Number of lines.
+        """
+        await self.wait_for_ready()
+        return await self.page.evaluate(
+            """() => {
+                const editor = window.monaco?.editor?.getEditors()?.[0];
+                return editor ? editor.getModel().getLineCount() : 0;
+            }"""
+        )
@@ -0,0 +1,62 @@
+# Generated by pages/aio/codegen.py from pages/plans_page.py; do not edit.
+"""Page object for the Plans page."""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+from playwright.async_api import Page
+
+from pages.aio.base_page import BasePage
+
+
+class PlansPage(BasePage):
+    """Plans page showing available subscription plans."""
+
+    PATH = "/plans"
+
+    def __init__(self, page: Page, base_url: str = "") -> None:
+        """Initialize PlansPage.
+
+        Args:
+            page: Playwright page instance.
+            base_url: Application base URL.
+        """
+        super().__init__(page, base_url)
+
+    async def open(self) -> None:
+        """Navigate to the plans page."""
+        await self.navigate(self.PATH)
+        await self.wait_for_page_load()
+
+    # ── Actions ──────────────────────────────────────────────────────────
+
+    async def get_plan_list(self) -> List[str]:
+        """Return the names of all available plans.
+
+        Returns:
+            List of plan name strings.
+        """
+        await self.wait_for_loading_complete()
+        cards = self.page.locator("[data-testid='plan-card']")
+        return await cards.all_inner_texts()
+
+    async def get_plan_details(self, name: str) -> Dict[str, str]:
+        """Get details of a specific plan.
+
+        Args:
+            name: Plan name to get details for.
+
+        Returns:
+            Dictionary with plan detail fields.
+        """
+        await self.wait_for_loading_complete()
+        card = self.page.get_by_text(name, exact=False).first.locator("..")
+        details: Dict[str, str] = {}
+        price = card.locator("[data-testid='plan-price']")
+        if await price.is_visible():
+            details["price"] = await price.inner_text()
+        features = card.locator("[data-testid='plan-features']")
+        if await features.is_visible():
+            details["features"] = await features.inner_text()
+        return details
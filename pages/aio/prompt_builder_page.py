@@ -0,0 +1,274 @@
+# Generated by pages/aio/codegen.py from pages/prompt_builder_page.py; do not edit.
+"""Page object for the Prompt Builder page."""
+
+from __future__ import annotations
+
+from typing import List
+
+from playwright.async_api import Page
+
+from pages.aio.base_page import BasePage
+from pages.aio.monaco_editor import MonacoEditor
+
+
+class PromptBuilderPage(BasePage):
+    """Prompt Builder page for creating and editing prompts."""
+
+    PATH = "/prompt-builder"
+
+    def __init__(self, page: Page, base_url: str = "") -> None:
+        """Initialize PromptBuilderPage.
+
+        Args:
+            page: Playwright page instance.
+            base_url: Application base URL.
+        """
+        super().__init__(page, base_url)
+        self.editor = MonacoEditor(page)
+
+    async def open(self) -> None:
+        """Navigate to the prompt builder."""
+        await self.navigate(self.PATH)
+        await self.wait_for_page_load()
+
+    # ── Locators ─────────────────────────────────────────────────────────
+
+    @property
+    def _title_input(self):
+        """Prompt title input."""
+        return self.first_of(
+            "PromptBuilderPage.title_input",
+            self.page.get_by_label("Title"),
+            self.page.get_by_placeholder("Prompt title"),
+        )
+
+    @property
+    def _description_input(self):
+        """Prompt description input."""
+        return self.first_of(
+            "PromptBuilderPage.description_input",
+            self.page.get_by_label("Description"),
+            self.page.get_by_placeholder("Description"),
+        )
+
+    @property
+    def _save_btn(self):
+        """Save button."""
+        return self.page.get_by_role("button", name="Save")
+
+    @property
+    def _publish_btn(self):
+        """Publish button."""
+        return self.page.get_by_role("button", name="Publish")
+
+    @property
+    def _commit_btn(self):
+        """Commit button."""
+        return self.page.get_by_role("button", name="Commit")
+
+    @property
+    def _refine_btn(self):
+        """Refine button."""
+        return self.page.get_by_role("button", name="Refine")
+
+    @property
+    def _templatize_btn(self):
+        """Templatize button."""
+        return self.page.get_by_role("button", name="Templatize")
+
+    # ── Actions ──────────────────────────────────────────────────────────
+
+    async def fill_title(self, title: str) -> None:
+        """Fill the prompt title field.
+
+        Args:
+            title: Prompt title text.
+        """
+        await self.fill_form_field(self._title_input, title)
+
+    async def fill_description(self, description: str) -> None:
+        """Fill the prompt description field.
+
+        Args:
+            description: Prompt description text.
+        """
+        await self.fill_form_field(self._description_input, description)
+
+    async def set_visibility(self, visibility: str) -> None:
+        """Set prompt visibility (private or public).
+
+        Args:
+            visibility: Either 'private' or 'public'.
+        """
+        vis_btn = self.first_of(
+            f"PromptBuilderPage.visibility[{visibility}]",
+            self.page.get_by_role("button", name=visibility.capitalize()),
+            self.page.get_by_text(visibility, exact=False),
+        )
+        await vis_btn.click()
+
+    async def select_tags(self, tags: List[str]) -> None:
+        """Select tags for the prompt.
+
+        Args:
+            tags: List of tag names to select.
+        """
+        tag_input = self.first_of(
+            "PromptBuilderPage.tag_input",
+            self.page.get_by_placeholder("Add tags"),
+            self.page.get_by_label("Tags"),
+        )
+        for tag in tags:
+            await tag_input.fill(tag)
+            await self.page.keyboard.press("Enter")
+
+    async def set_model_provider(self, provider: str) -> None:
+        """Select the model provider.
+
+        Args:
+            provider: Provider name (e.g. 'OpenAI', 'Anthropic').
+        """
+        provider_select = self.first_of(
+            "PromptBuilderPage.provider_select",
+            self.page.locator("[data-testid='provider-select']"),
+            self.page.get_by_label("Provider"),
+        )
+        await provider_select.click()
+        await self.page.get_by_text(provider, exact=False).first.click()
+
+    async def set_model(self, model: str) -> None:
+        """Select the model.
+
+        Args:
+            model: Model name (e.g. 'gpt-4', 'claude-3').
+        """
+        model_select = self.first_of(
+            "PromptBuilderPage.model_select",
+            self.page.locator("[data-testid='model-select']"),
+            self.page.get_by_label("Model"),
+        )
+        await model_select.click()
+        await self.page.get_by_text(model, exact=False).first.click()
+
+    async def set_temperature(self, temp: float) -> None:
+        """Set the temperature slider/input value.
+
+        Args:
+            temp: Temperature value (0.0 - 2.0).
+        """
+        temp_input = self.first_of(
+            "PromptBuilderPage.temperature_input",
+            self.page.locator("[data-testid='temperature-input']"),
+            self.page.get_by_label("Temperature"),
+        )
+        await temp_input.fill(str(temp))
+
+    async def get_editor_content(self) -> str:
+        """Get the current content from the Monaco editor.
+
+        Returns:
+            Editor content as string.
+        """
+        return await self.editor.get_value()
+
+    async def set_editor_content(self, content: str) -> None:
+        """Set content in the Monaco editor.
+
+        Args:
+            content: Content to set in the editor.
+        """
+        await self.editor.set_value(content)
+
+    async def load_editor_content(self, content: str) -> None:
+        """Set large content in the Monaco editor, streamed in chunks.
+
+        Args:
+            content: Content to set in the editor; may be megabytes long.
+        """
+        await self.editor.write_chunked(content)
+
+    async def paste_editor_content(self, content: str) -> None:
+        """Paste content at the editor's cursor.
+
+        Args:
+            content: Content to paste.
+        """
+        await self.editor.paste(content)
+
+    async def editor_content_matches(self, content: str) -> bool:
+        """Check the editor content against ``content`` by digest.
+
+        Args:
+            content: Expected editor content.
+
+        Returns:
+            True if the editor holds exactly ``content``.
+        """
+        return await self.editor.get_digest() == MonacoEditor.digest(content)
+
+    async def click_save(self) -> None:
+        """Click the Save button."""
+        await self._save_btn.click()
+        await self.wait_for_loading_complete()
+
+    async def click_publish(self) -> None:
+        """Click the Publish button."""
+        await self._publish_btn.click()
+        await self.wait_for_loading_complete()
+
+    async def click_commit(self) -> None:
+        """Click the Commit button."""
+        await self._commit_btn.click()
+        await self.wait_for_loading_complete()
+
+    async def toggle_editor_mode(self) -> None:
+        """Toggle between editor modes (e.g. raw / visual)."""
+        toggle = self.first_of(
+            "PromptBuilderPage.editor_mode_toggle",
+            self.page.locator("[data-testid='editor-mode-toggle']"),
+            self.page.get_by_role("switch"),
+        )
+        await toggle.click()
+
+    async def click_refine(self) -> None:
+        """Click the Refine button."""
+        await self._refine_btn.click()
+        await self.wait_for_loading_complete()
+
+    async def click_templatize(self) -> None:
+        """Click the Templatize button."""
+        await self._templatize_btn.click()
+        await self.wait_for_loading_complete()
+
+    async def get_version_number(self) -> str:
+        """Get the current version number displayed.
+
+        Returns:
+            Version number string.
+        """
+        version_el = self.first_of(
+            "PromptBuilderPage.version_number",
+            self.page.locator("[data-testid='version-number']"),
+            self.page.get_by_text("Version"),
+        )
+        return await self.get_text(version_el)
+
+    async def select_version(self, version: str) -> None:
+        """Select a specific version from the version selector.
+
+        Args:
+            version: Version identifier to select.
+        """
+        version_select = self.page.locator("[data-testid='version-select']")
+        await version_select.click()
+        await self.page.get_by_text(version, exact=False).first.click()
+
+    async def open_in_playground(self) -> None:
+        """Open the current prompt in the playground."""
+        playground_btn = self.first_of(
+            "PromptBuilderPage.playground_btn",
+            self.page.get_by_role("button", name="Playground"),
+            self.page.get_by_text("Open in Playground"),
+        )
+        await playground_btn.click()
+        await self.wait_for_page_load()
@@ -0,0 +1,90 @@
+# Generated by pages/aio/codegen.py from pages/sidebar.py; do not edit.
+"""Page object for the application sidebar navigation."""
+
+from __future__ import annotations
+
+from playwright.async_api import Page
+
+from pages.aio.base_page import BasePage
+
+
+class Sidebar(BasePage):
+    """Sidebar navigation component."""
+
+    def __init__(self, page: Page, base_url: str = "") -> None:
+        """Initialize Sidebar.
+
+        Args:
+            page: Playwright page instance.
+            base_url: Application base URL.
+        """
+        super().__init__(page, base_url)
+
+    # ── Locators ─────────────────────────────────────────────────────────
+
+    @property
+    def _sidebar(self):
+        """Sidebar container."""
+        return self.page.locator("nav, aside, [data-testid='sidebar']").first
+
+    @property
+    def _user_menu(self):
+        """User menu trigger."""
+        return self.page.locator("[data-testid='user-menu'], [data-testid='avatar']").first
+
+    # ── Actions ──────────────────────────────────────────────────────────
+
+    async def navigate_to(self, page_name: str) -> None:
+        """Navigate to a page using the sidebar.
+
+        Args:
+            page_name: Display name of the page to navigate to.
+        """
+        link = self._sidebar.get_by_text(page_name, exact=False).first
+        await link.click()
+        await self.wait_for_page_load()
+
+    async def get_active_page(self) -> str:
+        """Get the name of the currently active sidebar item.
+
+        Returns:
+            Active page name string.
+        """
+        active = self._sidebar.locator("[aria-current='page'], .active, [data-active='true']").first
+        if await active.is_visible():
+            return await active.inner_text()
+        return ""
+
+    async def get_user_name(self) -> str:
+        """Get the displayed user name from the sidebar.
+
+        Returns:
+            User name string.
+        """
+        name_el = self.page.locator("[data-testid='user-name']")
+        if await name_el.is_visible():
+            return await name_el.inner_text()
+        return ""
+
+    async def get_user_email(self) -> str:
+        """Get the displayed user email from the sidebar.
+
+        Returns:
+            User email string.
+        """
+        email_el = self.page.locator("[data-testid='user-email']")
+        if await email_el.is_visible():
+            return await email_el.inner_text()
+        return ""
+
+    async def open_user_menu(self) -> None:
+        """Open the user dropdown menu."""
+        await self._user_menu.click()
+
+    async def click_sign_out(self) -> None:
+        """Click the sign-out option from the user menu."""
+        await self.open_user_menu()
+        await self.page.get_by_role("menuitem", name="Sign out").or_(
+            self.page.get_by_text("Sign out")
+        ).first.click()
+        await self.page.wait_for_load_state("networkidle")
@@ -0,0 +1,76 @@
+# Generated by pages/aio/codegen.py from pages/typing_profiler.py; do not edit.
+"""Typing latency, long tasks and frame drops while typing into Monaco.
+
+``MonacoEditor.profile_typing`` types a stream of characters through the
+real keyboard while the page records, for every keystroke, the time from
+the ``keydown`` event to the end of the frame that painted it (the first
+task after the next ``requestAnimationFrame``), and collects long tasks
+through a ``PerformanceObserver``. On Chromium the run is also traced over
+CDP and presented/dropped frames are counted from the compositor's frame
+reports; elsewhere frame drops are estimated from ``requestAnimationFrame``
+gaps. Profiles are buffered per test and drained by
+``utils/typing_report.py``.
+"""
+
+from __future__ import annotations
+
+from playwright.async_api import Error, Page
+
+from pages.typing_profiler import (
+    _START_SCRIPT,
+    _STOP_SCRIPT,
+    TRACE_CATEGORIES,
+    raf_frame_drops,
+    trace_frame_drops,
+)
+
+
+async def profile_typing(page: Page, text: str, delay: float) -> dict:
+    """Type ``text`` into the focused element and profile the page meanwhile.
+
+    Args:
+        page: Page whose focused element receives the keystrokes.
+        text: Characters to type; ``\\n`` presses Enter.
+        delay: Milliseconds between keystrokes.
+
+    Returns:
+        ``keystrokes``, ``latency_ms`` (one sample per painted keystroke),
+        ``long_task_ms`` (one duration per long task), ``frames``,
+        ``dropped_frames`` and ``frame_source`` (``trace`` or ``raf``).
+    """
+    browser = page.context.browser
+    tracing = False
+    if browser is not None and browser.browser_type.name == "chromium":
+        try:
+            await browser.start_tracing(page=page, categories=TRACE_CATEGORIES)
+            tracing = True
+        except Error:
+            # Tracing is browser-wide; another client may be tracing already.
+            pass
+    await page.evaluate(_START_SCRIPT)
+    trace = None
+    try:
+        await page.keyboard.type(text, delay=delay)
+        try:
+            await page.wait_for_function(
+                "(n) => window.__echostashTyping.latencies.length >= n",
+                arg=len(text),
+                timeout=5000,
+            )
+        except Error:
+            pass
+        raw = await page.evaluate(_STOP_SCRIPT)
+    finally:
+        if tracing:
+            trace = await browser.stop_tracing()
+    frames = trace_frame_drops(trace) if trace else None
+    source = "trace"
+    if frames is None:
+        frames, source = raf_frame_drops(raw["frames"]), "raf"
+    return {
+        "keystrokes": len(text),
+        "latency_ms": raw["latencies"],
+        "long_task_ms": raw["longTasks"],
+        **frames,
+        "frame_source": source,
+    }
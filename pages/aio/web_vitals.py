@@ -0,0 +1,67 @@
+# Generated by pages/aio/codegen.py from pages/web_vitals.py; do not edit.
+"""Web vitals and navigation timing captured when a page object opens.
+
+``BasePage.navigate`` remembers the route and ``wait_for_page_load``
+measures it once the page has settled: TTFB, FCP, LCP, CLS, total blocking
+time, long-task time, transferred bytes and request count from the
+Performance API, plus JS heap size and DOM node count from CDP
+``Performance.getMetrics`` on Chromium. Measurements are buffered per test
+and drained by the ``utils/web_vitals_report.py`` plugin; pages driven
+concurrently for several tests (``utils/fan_out.py``) measure into a
+buffer of their own via ``WebVitalsRecorder.scoped``.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+from playwright.async_api import Error, Page
+
+from pages.web_vitals import _COLLECT_SCRIPT, VITALS
+
+
+async def collect_vitals(page: Page) -> Dict[str, Optional[float]]:
+    """Read the current page's vitals and navigation timing.
+
+    Args:
+        page: A page that has finished loading.
+
+    Returns:
+        Mapping of metric name to value (None when unavailable).
+    """
+    metrics = await page.evaluate(_COLLECT_SCRIPT)
+    browser = page.context.browser
+    if browser is None or browser.browser_type.name != "chromium":
+        return metrics
+    try:
+        session = await page.context.new_cdp_session(page)
+    except Error:
+        return metrics
+    try:
+        await session.send("Performance.enable")
+        cdp = {
+            m["name"]: m["value"]
+            for m in (await session.send("Performance.getMetrics"))["metrics"]
+        }
+        metrics["js_heap_bytes"] = cdp.get("JSHeapUsedSize", metrics["js_heap_bytes"])
+        metrics["dom_nodes"] = cdp.get("Nodes", metrics["dom_nodes"])
+        metrics["script_ms"] = cdp.get("ScriptDuration", 0.0) * 1000
+    finally:
+        await session.detach()
+    return metrics
+
+
+async def capture_vitals(page: Page, route: str) -> None:
+    """Measure the page that was just opened at ``route``, if enabled.
+
+    Args:
+        page: A page that has finished loading.
+        route: Route path the page object navigated to.
+    """
+    if not VITALS.measuring:
+        return
+    try:
+        metrics = await collect_vitals(page)
+    except Error:
+        return
+    VITALS.add(route, metrics)
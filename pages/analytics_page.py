@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 
 from playwright.sync_api import Page
 
 from pages.base_page import BasePage
 
 
+@dataclass(frozen=True)
+class MetricCard:
+    """One overview metric card as read by ``extract_table``."""
+
+    label: Optional[str]
+    value: Optional[str]
+
+
 class AnalyticsPage(BasePage):
     """Analytics dashboard for prompt usage metrics."""
 
@@ -54,13 +63,19 @@ class AnalyticsPage(BasePage):
             Dictionary mapping metric labels to their displayed values.
         """
         self.wait_for_loading_complete()
+        cards = self.extract_table(
+            "[data-testid='metric-card']",
+            {
+                "label": "[data-testid='metric-label']",
+                "value": "[data-testid='metric-value']",
+            },
+            MetricCard,
+        )
         metrics: Dict[str, str] = {}
-        cards = self.page.locator("[data-testid='metric-card']")
-        for i in range(cards.count()):
-            card = cards.nth(i)
-            label = card.locator("[data-testid='metric-label']").inner_text()
-            value = card.locator("[data-testid='metric-value']").inner_text()
-            metrics[label] = value
+        for i, card in enumerate(cards):
+            if card.label is None or card.value is None:
+                raise ValueError(f"metric card {i} has no label or value: {card}")
+            metrics[card.label] = card.value
         return metrics
 
     def get_top_prompts(self) -> List[str]:
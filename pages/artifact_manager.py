@@ -0,0 +1,239 @@
+"""Failure-only capture of traces, screenshots and a rewind screencast.
+
+While a test runs, the manager keeps a Playwright trace open and, on
+Chromium, streams a low-resolution CDP screencast into a bounded ring
+buffer in memory. The trace is bounded too: once a trace chunk is older
+than ``trace_window`` seconds, the next main-frame navigation discards it
+and starts a new one, so a failure's trace covers at least the current
+page. Nothing is encoded or written unless the test fails (or is a
+retry): only then is the trace exported and a full-page screenshot of
+every open page and the buffered frames handed to a background thread,
+which compresses them into ``test-results/``. Passing tests just drop the
+buffers.
+"""
+
+from __future__ import annotations
+
+import base64
+import queue
+import re
+import threading
+import time
+import zipfile
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple
+
+from playwright.sync_api import BrowserContext, Error, Frame, Page
+
+MODES = ("off", "on-failure", "always")
+
+_SCREENCAST = {"format": "jpeg", "quality": 50, "maxWidth": 960, "maxHeight": 720}
+
+
+@dataclass
+class Recording:
+    """What is being captured for one browser context."""
+
+    context: BrowserContext
+    frames: Deque[Tuple[float, str]]
+    tracing: bool = False
+    chunk_started: float = 0.0
+    sessions: List[object] = field(default_factory=list)
+
+
+class ArtifactManager:
+    """Buffers per-test evidence and writes it asynchronously when needed."""
+
+    def __init__(
+        self,
+        output_dir: str = "test-results",
+        frames: int = 150,
+        trace_window: float = 60.0,
+    ) -> None:
+        """Initialize ArtifactManager.
+
+        Args:
+            output_dir: Directory artifacts are written to.
+            frames: Screencast frames kept in the rewind buffer per context.
+            trace_window: Seconds a trace chunk is kept before the next
+                navigation replaces it.
+        """
+        self.output_dir = Path(output_dir)
+        self.frames = frames
+        self.trace_window = trace_window
+        self.mode = "off"
+        self.written = 0
+        self._queue: "queue.Queue[Tuple[Path, Dict[str, bytes]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    # ── Recording ────────────────────────────────────────────────────────
+
+    def attach(self, context: BrowserContext) -> Optional[Recording]:
+        """Start tracing and the rewind screencast for a new context.
+
+        Args:
+            context: A freshly created browser context.
+
+        Returns:
+            The Recording to pass to ``finish``, or None when capture is off.
+        """
+        if self.mode == "off":
+            return None
+        recording = Recording(context, deque(maxlen=self.frames))
+        try:
+            context.tracing.start(screenshots=True, snapshots=True)
+            recording.tracing = True
+            recording.chunk_started = time.monotonic()
+        except Error:
+            pass
+        if recording.tracing:
+            context.on(
+                "page",
+                lambda page: page.on(
+                    "framenavigated",
+                    lambda frame: self._rotate_trace(recording, frame),
+                ),
+            )
+        browser = context.browser
+        if browser is not None and browser.browser_type.name == "chromium":
+            context.on("page", lambda page: self._screencast(recording, page))
+        return recording
+
+    def _rotate_trace(self, recording: Recording, frame: Frame) -> None:
+        """Replace the trace chunk on navigation once it outgrew the window."""
+        if not recording.tracing or frame.parent_frame is not None:
+            return
+        if time.monotonic() - recording.chunk_started < self.trace_window:
+            return
+        try:
+            recording.context.tracing.stop_chunk()
+            recording.context.tracing.start_chunk()
+            recording.chunk_started = time.monotonic()
+        except Error:
+            recording.tracing = False
+
+    def _screencast(self, recording: Recording, page: Page) -> None:
+        """Stream a page's screencast frames into the recording's buffer."""
+        try:
+            session = recording.context.new_cdp_session(page)
+        except Error:
+            return
+
+        def on_frame(params: dict) -> None:
+            timestamp = params["metadata"]["timestamp"]
+            recording.frames.append((timestamp, params["data"]))
+            try:
+                session.send(
+                    "Page.screencastFrameAck", {"sessionId": params["sessionId"]}
+                )
+            except Error:
+                pass
+
+        session.on("Page.screencastFrame", on_frame)
+        session.send("Page.startScreencast", _SCREENCAST)
+        recording.sessions.append(session)
+
+    def finish(self, recording: Optional[Recording], name: str, keep: bool) -> None:
+        """Stop capturing and, if ``keep``, queue the evidence for writing.
+
+        Must be called while the context is still open.
+
+        Args:
+            recording: Value returned by ``attach``.
+            name: Test name used for the artifact directory.
+            keep: Whether the test failed or is being retried.
+        """
+        if recording is None:
+            return
+        keep = keep or self.mode == "always"
+        target = self.output_dir / safe_name(name)
+        if recording.tracing:
+            try:
+                if keep:
+                    target.mkdir(parents=True, exist_ok=True)
+                    recording.context.tracing.stop(path=target / "trace.zip")
+                else:
+                    recording.context.tracing.stop()
+            except Error:
+                pass
+        if not keep:
+            recording.frames.clear()
+            return
+        files: Dict[str, bytes] = {}
+        for i, page in enumerate(recording.context.pages):
+            try:
+                files[f"page-{i}.png"] = page.screenshot(full_page=True)
+            except Error:
+                continue
+        start = recording.frames[0][0] if recording.frames else 0.0
+        for i, (timestamp, data) in enumerate(recording.frames):
+            entry = f"rewind/{i:04d}-{timestamp - start:07.2f}s.jpg"
+            files[entry] = base64.b64decode(data)
+        recording.frames.clear()
+        if files:
+            self._submit(target / "failure.zip", files)
+
+    # ── Writing ──────────────────────────────────────────────────────────
+
+    def save_screenshot(self, image: bytes, name: str) -> str:
+        """Write a screenshot taken just now.
+
+        The PNG is already encoded, so it is written directly: the returned
+        path exists as soon as the call returns.
+
+        Args:
+            image: PNG data from ``Page.screenshot``.
+            name: Base name for the screenshot file.
+
+        Returns:
+            Path of the written screenshot.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = self.output_dir / f"{name}_{timestamp}.png"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(image)
+        return str(path)
+
+    def _submit(self, path: Path, files: Dict[str, bytes]) -> None:
+        """Queue a zip archive for the writer thread."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="artifact-writer", daemon=True
+                )
+                self._thread.start()
+        self._queue.put((path, files))
+
+    def _run(self) -> None:
+        """Compress queued artifacts into zip archives."""
+        while True:
+            path, files = self._queue.get()
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+                    for name, data in files.items():
+                        archive.writestr(name, data)
+                self.written += 1
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> int:
+        """Block until every queued artifact is on disk.
+
+        Returns:
+            Number of artifacts written so far.
+        """
+        self._queue.join()
+        return self.written
+
+
+def safe_name(name: str) -> str:
+    """Turn a test node ID into a file-system friendly directory name."""
+    return re.sub(r"[^\w.-]+", "-", name).strip("-")[:150]
+
+
+ARTIFACTS = ArtifactManager()
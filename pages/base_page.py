@@ -3,11 +3,50 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime
-from typing import Optional
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, TypeVar, Union
 
 from playwright.sync_api import Locator, Page, expect
 
+from pages.artifact_manager import ARTIFACTS
+from pages.idle_tracker import IDLE_PREDICATE
+from pages.loading_state import wait_for_loading_complete
+from pages.locator_registry import resolve_first
+from pages.spans import INTERACT, WAIT, span
+from pages.web_vitals import capture_vitals
+
+# Field spec: "<selector>" -> innerText of the first match inside the row,
+# "<selector>@<attr>" -> that element's attribute, "@<attr>" -> the row's own
+# attribute, "" -> the row's innerText. Missing elements yield null.
+_EXTRACT_TABLE_SCRIPT = """
+(rows, fields) => rows.map((row) => {
+    const record = {};
+    for (const [name, spec] of Object.entries(fields)) {
+        const at = spec.lastIndexOf('@');
+        const hasAttr = at !== -1 && /^[\\w:-]+$/.test(spec.slice(at + 1));
+        const selector = hasAttr ? spec.slice(0, at) : spec;
+        const el = selector ? row.querySelector(selector) : row;
+        if (!el) {
+            record[name] = null;
+        } else if (hasAttr) {
+            record[name] = el.getAttribute(spec.slice(at + 1));
+        } else {
+            record[name] = el.innerText;
+        }
+    }
+    return record;
+})
+"""
+
+RowT = TypeVar("RowT")
+
+
+@dataclass(frozen=True)
+class TextRow:
+    """``extract_table`` row holding only the row element's inner text."""
+
+    text: str
+
 
 class BasePage:
     """Base class for all page objects. Provides common UI interaction methods."""
@@ -21,9 +60,11 @@ class BasePage:
         """
         self.page = page
         self.base_url = base_url.rstrip("/")
+        self._opened_route: Optional[str] = None
 
     # ── Navigation ───────────────────────────────────────────────────────
 
+    @span(INTERACT)
     def navigate(self, path: str = "/") -> None:
         """Navigate to a path relative to base_url.
 
@@ -32,6 +73,7 @@ class BasePage:
         """
         url = f"{self.base_url}{path}" if self.base_url else path
         self.page.goto(url, wait_until="domcontentloaded")
+        self._opened_route = path.split("?", 1)[0]
 
     def get_title(self) -> str:
         """Return the current page title."""
@@ -43,15 +85,23 @@ class BasePage:
 
     # ── Waiting ──────────────────────────────────────────────────────────
 
+    @span(WAIT)
     def wait_for_page_load(self, timeout: int = 30000) -> None:
         """Wait for the page to be fully loaded (DOM ready + network idle).
 
+        Right after ``navigate`` this also records the route's web vitals
+        when ``--web-vitals`` is on.
+
         Args:
             timeout: Maximum wait time in milliseconds.
         """
         self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
         self.page.wait_for_load_state("networkidle", timeout=timeout)
+        if self._opened_route is not None:
+            capture_vitals(self.page, self._opened_route)
+            self._opened_route = None
 
+    @span(WAIT)
     def wait_for_api_response(self, url_pattern: str, timeout: int = 30000):
         """Wait for a specific API response.
 
@@ -67,24 +117,52 @@ class BasePage:
             timeout=timeout,
         )
 
-    def wait_for_loading_complete(self, timeout: int = 10000) -> None:
+    @span(WAIT)
+    def wait_for_app_idle(self, timeout: int = 30000, quiet_ms: int = 300) -> None:
+        """Wait until no XHR/fetch is in flight and the DOM has stopped changing.
+
+        Returns as soon as the app has been quiet for ``quiet_ms``, instead
+        of sleeping for a fixed amount of time.
+
+        Args:
+            timeout: Maximum wait time in milliseconds.
+            quiet_ms: How long the app must stay quiet to count as idle.
+        """
+        self.page.wait_for_function(IDLE_PREDICATE, arg=quiet_ms, timeout=timeout)
+
+    @span(WAIT)
+    def wait_for_settled(
+        self,
+        route: Optional[str] = None,
+        timeout: int = 30000,
+        quiet_ms: int = 300,
+    ) -> None:
+        """Wait for an SPA route change (optional) and then for the app to go idle.
+
+        Args:
+            route: Regex pattern the URL must match before waiting for idle.
+            timeout: Maximum wait time in milliseconds.
+            quiet_ms: How long the app must stay quiet to count as idle.
+        """
+        if route:
+            self.page.wait_for_url(re.compile(route), wait_until="commit", timeout=timeout)
+        self.wait_for_app_idle(timeout=timeout, quiet_ms=quiet_ms)
+
+    @span(WAIT)
+    def wait_for_loading_complete(
+        self, timeout: int = 10000, settle_ms: int = 100
+    ) -> None:
         """Wait for all loading spinners and skeletons to disappear.
 
         Args:
             timeout: Maximum wait time in milliseconds.
+            settle_ms: How long the page must stay free of loading indicators.
         """
-        for selector in [
-            "[data-testid='loading']",
-            ".animate-spin",
-            ".skeleton",
-            "[role='progressbar']",
-        ]:
-            locator = self.page.locator(selector)
-            if locator.count() > 0:
-                locator.first.wait_for(state="hidden", timeout=timeout)
+        wait_for_loading_complete(self.page, timeout=timeout, settle_ms=settle_ms)
 
     # ── Interactions ─────────────────────────────────────────────────────
 
+    @span(INTERACT)
     def click_and_wait(
         self,
         locator: Locator,
@@ -107,6 +185,7 @@ class BasePage:
             locator.click()
             self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
 
+    @span(INTERACT)
     def wait_and_click(self, locator: Locator, timeout: int = 10000) -> None:
         """Wait for an element to be visible, then click it.
 
@@ -117,6 +196,7 @@ class BasePage:
         locator.wait_for(state="visible", timeout=timeout)
         locator.click()
 
+    @span(INTERACT)
     def fill_form_field(self, locator: Locator, value: str) -> None:
         """Clear a form field and fill it with a value.
 
@@ -127,6 +207,7 @@ class BasePage:
         locator.clear()
         locator.fill(value)
 
+    @span(INTERACT)
     def select_option(self, locator: Locator, value: str) -> None:
         """Select an option from a dropdown.
 
@@ -138,6 +219,7 @@ class BasePage:
 
     # ── Toast / Notifications ────────────────────────────────────────────
 
+    @span(WAIT)
     def get_toast_message(self, timeout: int = 5000) -> str:
         """Get the text of the currently visible toast notification.
 
@@ -151,6 +233,7 @@ class BasePage:
         toast.wait_for(state="visible", timeout=timeout)
         return toast.inner_text()
 
+    @span(INTERACT)
     def dismiss_toast(self) -> None:
         """Close the currently visible toast notification."""
         close_btn = self.page.locator(
@@ -162,7 +245,7 @@ class BasePage:
     # ── Screenshots ──────────────────────────────────────────────────────
 
     def take_screenshot(self, name: str) -> str:
-        """Take a screenshot and save it with a timestamped filename.
+        """Take a full-page screenshot; it is written in the background.
 
         Args:
             name: Base name for the screenshot file.
@@ -170,13 +253,29 @@ class BasePage:
         Returns:
             Path to the saved screenshot.
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        path = f"test-results/{name}_{timestamp}.png"
-        self.page.screenshot(path=path, full_page=True)
-        return path
+        return ARTIFACTS.save_screenshot(self.page.screenshot(full_page=True), name)
 
     # ── Element queries ──────────────────────────────────────────────────
 
+    def first_of(self, key: str, *candidates: Locator) -> Locator:
+        """Return the first element matched by a chain of fallback locators.
+
+        Behaves like ``candidates[0].or_(candidates[1])...first`` but goes
+        through the locator registry, which uses the alternative that
+        matched on previous runs against the same frontend build on its own
+        and falls back to the full chain only if it no longer matches.
+
+        Args:
+            key: Stable name of the locator, including any arguments the
+                candidates depend on (e.g. ``"BrowsePage.tab[packs]"``).
+            *candidates: Alternative locators, in fallback order.
+
+        Returns:
+            Locator for the first matching element.
+        """
+        return resolve_first(self.page, key, *candidates)
+
+    @span(WAIT)
     def is_visible(self, locator: Locator, timeout: int = 3000) -> bool:
         """Check whether an element is visible.
 
@@ -193,6 +292,7 @@ class BasePage:
         except Exception:
             return False
 
+    @span(INTERACT)
     def get_text(self, locator: Locator, timeout: int = 5000) -> str:
         """Get the inner text of an element.
 
@@ -206,6 +306,39 @@ class BasePage:
         locator.wait_for(state="visible", timeout=timeout)
         return locator.inner_text()
 
+    @span(INTERACT)
+    def extract_table(
+        self,
+        rows: Union[str, Locator],
+        fields: Dict[str, str],
+        row_type: Callable[..., RowT],
+    ) -> List[RowT]:
+        """Read a whole list of records from the DOM in a single round trip.
+
+        Each element matching ``rows`` becomes one row. Field specs
+        are resolved relative to the row:
+
+        - ``""``: the row's inner text
+        - ``"<selector>"``: inner text of the first matching descendant
+        - ``"<selector>@<attr>"``: attribute of the first matching descendant
+        - ``"@<attr>"``: attribute of the row itself (e.g. ``"@data-testid"``)
+
+        Args:
+            rows: Locator of the row elements, or their CSS selector.
+            fields: Mapping of output field name to field spec.
+            row_type: Row class (usually a dataclass) taking the field names
+                as keyword arguments; fields whose element is missing are
+                passed as ``None``.
+
+        Returns:
+            One ``row_type`` instance per row, in document order.
+        """
+        if isinstance(rows, str):
+            rows = self.page.locator(rows)
+        records = rows.evaluate_all(_EXTRACT_TABLE_SCRIPT, fields)
+        return [row_type(**record) for record in records]
+
+    @span(INTERACT)
     def scroll_to(self, locator: Locator) -> None:
         """Scroll an element into the viewport.
 
@@ -216,6 +349,7 @@ class BasePage:
 
     # ── Assertions ───────────────────────────────────────────────────────
 
+    @span(WAIT)
     def expect_url(self, pattern: str, timeout: int = 10000) -> None:
         """Assert the current URL matches a pattern.
 
@@ -225,6 +359,7 @@ class BasePage:
         """
         expect(self.page).to_have_url(re.compile(pattern), timeout=timeout)
 
+    @span(WAIT)
     def expect_visible(self, locator: Locator, timeout: int = 10000) -> None:
         """Assert an element is visible.
 
@@ -234,6 +369,7 @@ class BasePage:
         """
         expect(locator).to_be_visible(timeout=timeout)
 
+    @span(WAIT)
     def expect_text(
         self, locator: Locator, text: str, timeout: int = 10000
     ) -> None:
@@ -246,6 +382,7 @@ class BasePage:
         """
         expect(locator).to_contain_text(text, timeout=timeout)
 
+    @span(WAIT)
     def expect_not_visible(self, locator: Locator, timeout: int = 10000) -> None:
         """Assert an element is not visible.
 
@@ -58,9 +58,11 @@ class BrowsePage(BasePage):
         Args:
             tab: Tab name ('prompts' or 'packs').
         """
-        self.page.get_by_role("tab", name=tab.capitalize()).or_(
-            self.page.get_by_text(tab, exact=False)
-        ).first.click()
+        self.first_of(
+            f"BrowsePage.tab[{tab}]",
+            self.page.get_by_role("tab", name=tab.capitalize()),
+            self.page.get_by_text(tab, exact=False),
+        ).click()
         self.wait_for_loading_complete()
 
     def sort_by(self, option: str) -> None:
@@ -69,9 +71,11 @@ class BrowsePage(BasePage):
         Args:
             option: Sort option (e.g. 'newest', 'popular', 'most_viewed').
         """
-        sort_btn = self.page.locator("[data-testid='sort-select']").or_(
-            self.page.get_by_label("Sort")
-        ).first
+        sort_btn = self.first_of(
+            "BrowsePage.sort_select",
+            self.page.locator("[data-testid='sort-select']"),
+            self.page.get_by_label("Sort"),
+        )
         sort_btn.click()
         self.page.get_by_text(option, exact=False).first.click()
         self.wait_for_loading_complete()
@@ -105,16 +109,20 @@ class BrowsePage(BasePage):
 
     def next_page(self) -> None:
         """Navigate to the next page of results."""
-        self.page.get_by_role("button", name="Next").or_(
-            self.page.locator("[data-testid='next-page']")
-        ).first.click()
+        self.first_of(
+            "BrowsePage.next_page",
+            self.page.get_by_role("button", name="Next"),
+            self.page.locator("[data-testid='next-page']"),
+        ).click()
         self.wait_for_loading_complete()
 
     def prev_page(self) -> None:
         """Navigate to the previous page of results."""
-        self.page.get_by_role("button", name="Previous").or_(
-            self.page.locator("[data-testid='prev-page']")
-        ).first.click()
+        self.first_of(
+            "BrowsePage.prev_page",
+            self.page.get_by_role("button", name="Previous"),
+            self.page.locator("[data-testid='prev-page']"),
+        ).click()
         self.wait_for_loading_complete()
 
     def get_current_page(self) -> int:
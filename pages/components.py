@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from playwright.sync_api import Page
 
+from pages.loading_state import is_loading, wait_for_loading_complete
+from pages.locator_registry import resolve_first
+
 
 class ConfirmDialog:
     """Helper for interacting with confirmation dialogs."""
@@ -31,18 +34,23 @@ class ConfirmDialog:
 
     def confirm(self) -> None:
         """Click the confirm/OK button."""
-        self._dialog.get_by_role("button", name="Confirm").or_(
-            self._dialog.get_by_role("button", name="OK")
-        ).or_(
-            self._dialog.get_by_role("button", name="Yes")
-        ).first.click()
+        resolve_first(
+            self.page,
+            "ConfirmDialog.confirm",
+            self._dialog.get_by_role("button", name="Confirm"),
+            self._dialog.get_by_role("button", name="OK"),
+            self._dialog.get_by_role("button", name="Yes"),
+        ).click()
         self._dialog.wait_for(state="hidden")
 
     def cancel(self) -> None:
         """Click the cancel button."""
-        self._dialog.get_by_role("button", name="Cancel").or_(
-            self._dialog.get_by_role("button", name="No")
-        ).first.click()
+        resolve_first(
+            self.page,
+            "ConfirmDialog.cancel",
+            self._dialog.get_by_role("button", name="Cancel"),
+            self._dialog.get_by_role("button", name="No"),
+        ).click()
         self._dialog.wait_for(state="hidden")
 
     def get_message(self) -> str:
@@ -115,9 +123,12 @@ class PlanLimitOverlay:
     @property
     def _overlay(self):
         """Plan limit overlay element."""
-        return self.page.locator("[data-testid='plan-limit-overlay']").or_(
-            self.page.get_by_text("Upgrade", exact=False).locator("..").locator("..")
-        ).first
+        return resolve_first(
+            self.page,
+            "PlanLimitOverlay.overlay",
+            self.page.locator("[data-testid='plan-limit-overlay']"),
+            self.page.get_by_text("Upgrade", exact=False).locator("..").locator(".."),
+        )
 
     def is_visible(self) -> bool:
         """Check if the plan limit overlay is visible.
@@ -155,26 +166,13 @@ class LoadingSpinner:
         Returns:
             True if a spinner is present.
         """
-        for selector in [
-            "[data-testid='loading']",
-            ".animate-spin",
-            "[role='progressbar']",
-        ]:
-            if self.page.locator(selector).count() > 0:
-                return True
-        return False
-
-    def wait_for_done(self, timeout: int = 10000) -> None:
+        return is_loading(self.page)
+
+    def wait_for_done(self, timeout: int = 10000, settle_ms: int = 100) -> None:
         """Wait for all spinners to disappear.
 
         Args:
             timeout: Maximum wait time in milliseconds.
+            settle_ms: How long the page must stay free of loading indicators.
         """
-        for selector in [
-            "[data-testid='loading']",
-            ".animate-spin",
-            "[role='progressbar']",
-        ]:
-            locator = self.page.locator(selector)
-            if locator.count() > 0:
-                locator.first.wait_for(state="hidden", timeout=timeout)
+        wait_for_loading_complete(self.page, timeout=timeout, settle_ms=settle_ms)
@@ -6,7 +6,7 @@ from typing import List
 
 from playwright.sync_api import Page
 
-from pages.base_page import BasePage
+from pages.base_page import BasePage, TextRow
 
 
 class ContextStorePage(BasePage):
@@ -53,8 +53,10 @@ class ContextStorePage(BasePage):
             List of asset identifier strings.
         """
         self.wait_for_loading_complete()
-        items = self.page.locator("[data-testid='asset-item']")
-        return items.all_inner_texts()
+        rows = self.extract_table(
+            "[data-testid='asset-item']", {"text": ""}, TextRow
+        )
+        return [row.text for row in rows]
 
     def view_asset(self, asset_id: str) -> None:
         """View a specific asset.
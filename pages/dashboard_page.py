@@ -6,7 +6,7 @@ from typing import List
 
 from playwright.sync_api import Page
 
-from pages.base_page import BasePage
+from pages.base_page import BasePage, TextRow
 
 
 class DashboardPage(BasePage):
@@ -90,7 +90,8 @@ class DashboardPage(BasePage):
             List of project name strings.
         """
         self.wait_for_loading_complete()
-        return self._project_cards.all_inner_texts()
+        rows = self.extract_table(self._project_cards, {"text": ""}, TextRow)
+        return [row.text for row in rows]
 
     def click_project(self, name: str) -> None:
         """Click a project card by name.
@@ -6,7 +6,7 @@ from typing import List
 
 from playwright.sync_api import Page
 
-from pages.base_page import BasePage
+from pages.base_page import BasePage, TextRow
 
 
 class EvalRunsPage(BasePage):
@@ -45,8 +45,10 @@ class EvalRunsPage(BasePage):
             List of run label strings.
         """
         self.wait_for_loading_complete()
-        items = self.page.locator("[data-testid='run-item']")
-        return items.all_inner_texts()
+        rows = self.extract_table(
+            "[data-testid='run-item']", {"text": ""}, TextRow
+        )
+        return [row.text for row in rows]
 
     def click_run(self, index: int) -> None:
         """Click on a run by index.
@@ -0,0 +1,88 @@
+"""In-page tracker for network, route and DOM activity used by idle waits."""
+
+from __future__ import annotations
+
+from playwright.sync_api import BrowserContext
+
+# Installed as an init script so it wraps fetch/XHR before the app boots.
+# Every request start/end, history change and DOM mutation bumps
+# ``lastActivity``; the app is idle once nothing is in flight and nothing
+# has changed for the quiet window.
+IDLE_TRACKER_SCRIPT = """
+() => {
+    if (window.__echostashIdle) return;
+    const state = window.__echostashIdle = {
+        inflight: 0,
+        routeChanges: 0,
+        lastActivity: performance.now(),
+    };
+    const touch = () => { state.lastActivity = performance.now(); };
+
+    const originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function (...args) {
+            state.inflight++;
+            touch();
+            return originalFetch.apply(this, args).finally(() => {
+                state.inflight--;
+                touch();
+            });
+        };
+    }
+
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        state.inflight++;
+        touch();
+        this.addEventListener('loadend', () => {
+            state.inflight--;
+            touch();
+        }, { once: true });
+        return originalSend.apply(this, args);
+    };
+
+    const onRoute = () => { state.routeChanges++; touch(); };
+    for (const method of ['pushState', 'replaceState']) {
+        const original = history[method];
+        history[method] = function (...args) {
+            const result = original.apply(this, args);
+            onRoute();
+            return result;
+        };
+    }
+    window.addEventListener('popstate', onRoute);
+    window.addEventListener('hashchange', onRoute);
+
+    const observe = () => new MutationObserver(touch).observe(
+        document.documentElement,
+        { childList: true, subtree: true, attributes: true, characterData: true },
+    );
+    if (document.documentElement) {
+        observe();
+    } else {
+        document.addEventListener('DOMContentLoaded', observe, { once: true });
+    }
+}
+"""
+
+# Polled by ``wait_for_function``; injects the tracker itself when the page
+# was loaded outside a context set up with ``install_idle_tracker`` (requests
+# already in flight at that point are not counted).
+IDLE_PREDICATE = """
+(quietMs) => {
+    if (!window.__echostashIdle) (__TRACKER__)();
+    const state = window.__echostashIdle;
+    return document.readyState !== 'loading'
+        && state.inflight <= 0
+        && performance.now() - state.lastActivity >= quietMs;
+}
+""".replace("__TRACKER__", IDLE_TRACKER_SCRIPT.strip())
+
+
+def install_idle_tracker(context: BrowserContext) -> None:
+    """Register the idle tracker on every page the context opens.
+
+    Args:
+        context: Playwright browser context.
+    """
+    context.add_init_script(f"({IDLE_TRACKER_SCRIPT})();")
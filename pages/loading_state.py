@@ -0,0 +1,126 @@
+"""Shared loading-state detector for spinners, skeletons and progress bars.
+
+All selectors are checked inside the browser in a single ``evaluate`` call,
+and a MutationObserver keeps watching until nothing is visible for the
+settle window, so spinners that appear right after an action are caught
+instead of being missed by an up-front ``count()``.
+"""
+
+from __future__ import annotations
+
+import time
+
+from playwright.sync_api import Error, Page, TimeoutError
+
+LOADING_SELECTORS = (
+    "[data-testid='loading']",
+    ".animate-spin",
+    ".skeleton",
+    "[role='progressbar']",
+)
+
+_IS_VISIBLE = """
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0
+            && getComputedStyle(el).visibility !== 'hidden';
+    };
+"""
+
+_IS_LOADING_SCRIPT = """
+(selectors) => {
+    %s
+    return Array.from(document.querySelectorAll(selectors.join(','))).some(isVisible);
+}
+""" % _IS_VISIBLE
+
+_WAIT_SCRIPT = """
+({ selectors, settleMs, timeout }) => new Promise((resolve) => {
+    %s
+    const query = selectors.join(',');
+    const busy = () => Array.from(document.querySelectorAll(query)).some(isVisible);
+    let settleTimer = null;
+    const observer = new MutationObserver(() => check());
+    // Visibility can also flip through CSS transitions the observer never sees.
+    const poll = setInterval(() => check(), 100);
+    const deadline = setTimeout(() => finish(false), timeout);
+    function finish(done) {
+        clearTimeout(deadline);
+        clearTimeout(settleTimer);
+        clearInterval(poll);
+        observer.disconnect();
+        resolve(done);
+    }
+    function check() {
+        if (busy()) {
+            clearTimeout(settleTimer);
+            settleTimer = null;
+        } else if (settleTimer === null) {
+            settleTimer = setTimeout(() => {
+                settleTimer = null;
+                if (!busy()) finish(true);
+            }, settleMs);
+        }
+    }
+    if (settleMs <= 0 && !busy()) {
+        finish(true);
+        return;
+    }
+    observer.observe(document.documentElement, {
+        childList: true, subtree: true, attributes: true,
+    });
+    check();
+})
+""" % _IS_VISIBLE
+
+
+def is_loading(page: Page) -> bool:
+    """Check whether any loading indicator is currently visible.
+
+    Args:
+        page: Playwright page instance.
+
+    Returns:
+        True if a spinner, skeleton or progress bar is visible.
+    """
+    return page.evaluate(_IS_LOADING_SCRIPT, list(LOADING_SELECTORS))
+
+
+def wait_for_loading_complete(
+    page: Page, timeout: int = 10000, settle_ms: int = 100
+) -> None:
+    """Wait until no loading indicator has been visible for ``settle_ms``.
+
+    If the page navigates while waiting, the wait restarts on the new
+    document with whatever time is left.
+
+    Args:
+        page: Playwright page instance.
+        timeout: Maximum wait time in milliseconds.
+        settle_ms: How long the page must stay free of loading indicators.
+
+    Raises:
+        TimeoutError: If a loading indicator is still visible after ``timeout``.
+    """
+    deadline = time.monotonic() + timeout / 1000
+    while True:
+        remaining = max(int((deadline - time.monotonic()) * 1000), 0)
+        try:
+            done = page.evaluate(
+                _WAIT_SCRIPT,
+                {
+                    "selectors": list(LOADING_SELECTORS),
+                    "settleMs": settle_ms,
+                    "timeout": remaining,
+                },
+            )
+        except Error as exc:
+            if "context was destroyed" not in str(exc) or remaining == 0:
+                raise
+            page.wait_for_load_state("domcontentloaded", timeout=remaining)
+            continue
+        if not done:
+            raise TimeoutError(
+                f"Loading indicators still visible after {timeout}ms"
+            )
+        return
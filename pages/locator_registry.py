@@ -0,0 +1,222 @@
+"""Self-learning resolver for ``.or_()`` locator fallback chains.
+
+Page objects describe an element as a list of alternative strategies (label
+vs placeholder, role vs test id, ...). The registry remembers which
+alternative actually matched for each frontend origin and build and
+persists that to a small JSON cache. A proven alternative is then used on
+its own, after one ``count()`` confirms it still matches; only if it does
+not is the full chain used. An unproven chain is learned when it is
+resolved, before the action on it runs, by counting the alternatives in
+fallback order; if none matches yet, the full chain is returned.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from functools import reduce
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Error, Locator, Page
+
+# Next.js exposes the build id directly; otherwise the hashed chunk URLs
+# change with every build, so a digest of them identifies the build.
+_BUILD_ID_SCRIPT = """
+() => {
+    const next = window.__NEXT_DATA__;
+    if (next && next.buildId) return next.buildId;
+    const srcs = Array.from(document.querySelectorAll('script[src]'), (s) => s.src);
+    for (const src of srcs) {
+        const match = src.match(/\\/_next\\/static\\/([^/]+)\\/_(?:build|ssg)Manifest\\.js/);
+        if (match) return match[1];
+    }
+    let hash = 0;
+    for (const ch of srcs.sort().join('|')) hash = (hash * 31 + ch.charCodeAt(0)) | 0;
+    return 'h' + (hash >>> 0).toString(16);
+}
+"""
+
+MAX_SCOPES = 10
+
+
+def _chain(candidates: List[Locator]) -> Locator:
+    return reduce(lambda a, b: a.or_(b), candidates)
+
+
+class LocatorRegistry:
+    """Remembers which branch of each locator chain matched per origin/build."""
+
+    def __init__(self) -> None:
+        """Initialize an empty, disabled registry."""
+        self.enabled = False
+        self.path: Optional[Path] = None
+        self._proven: Dict[str, Dict[str, int]] = {}
+        self._builds: Dict[str, Optional[str]] = {}
+        self._learned: Dict[str, Dict[str, int]] = {}
+        self._stats: Dict[str, List[float]] = {}
+
+    # ── Persistence ──────────────────────────────────────────────────────
+
+    def load(self, path: str) -> None:
+        """Enable learning and load previously proven branches from disk.
+
+        Args:
+            path: JSON cache file (created on save if missing).
+        """
+        self.path = Path(path)
+        self.enabled = True
+        if self.path.exists():
+            try:
+                self._proven = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self._proven = {}
+
+    def save(self) -> None:
+        """Merge learned branches into the cache file.
+
+        The file is re-read first so parallel workers do not drop each
+        other's entries, then replaced atomically.
+        """
+        if not self.enabled or not self._learned or self.path is None:
+            return
+        merged: Dict[str, Dict[str, int]] = {}
+        if self.path.exists():
+            try:
+                merged = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                merged = {}
+        for scope, entries in self._learned.items():
+            merged[scope] = {**merged.pop(scope, {}), **entries}
+        # Dicts keep insertion order, so the scopes touched last survive.
+        for scope in list(merged)[:-MAX_SCOPES]:
+            del merged[scope]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(merged, indent=2, sort_keys=True))
+        os.replace(tmp, self.path)
+        self._learned = {}
+
+    # ── Resolution ───────────────────────────────────────────────────────
+
+    def resolve(self, page: Page, key: str, candidates: List[Locator]) -> Locator:
+        """Return the proven alternative alone, or the first match of the chain.
+
+        A proven key costs one ``count()``. An unproven key costs a
+        ``count()`` per alternative until one matches, once per origin and
+        build; the match is returned alone and remembered.
+
+        Args:
+            page: Page the candidates belong to (used for origin/build).
+            key: Stable name of the locator, including any arguments the
+                candidates depend on (e.g. ``"BrowsePage.tab[packs]"``).
+            candidates: Alternative locators, in fallback order.
+
+        Returns:
+            A Locator for the first matching element.
+        """
+        chain = _chain(candidates)
+        if not self.enabled or len(candidates) < 2:
+            return chain.first
+        start = time.perf_counter()
+        outcome = "chain"
+        try:
+            scope = self._scope(page)
+            if scope is None:
+                return chain.first
+            proven = self._proven.setdefault(scope, {})
+            index = proven.get(key)
+            if index is not None and index < len(candidates):
+                located = candidates[index].first
+                if located.count() > 0:
+                    outcome = "hit"
+                    return located
+                return chain.first
+            index = next(
+                (i for i, c in enumerate(candidates) if c.first.count() > 0), None
+            )
+            if index is None:
+                return chain.first
+            outcome = "learned"
+            proven[key] = index
+            self._learned.setdefault(scope, {})[key] = index
+            return candidates[index].first
+        except Error:
+            return chain.first
+        finally:
+            self._record(key, outcome, time.perf_counter() - start)
+
+    def _scope(self, page: Page) -> Optional[str]:
+        """Return ``origin@build`` for the page, or None before navigation."""
+        parts = urlsplit(page.url)
+        if parts.scheme not in ("http", "https"):
+            return None
+        origin = f"{parts.scheme}://{parts.netloc}"
+        if self._builds.get(origin) is None:
+            try:
+                self._builds[origin] = page.evaluate(_BUILD_ID_SCRIPT)
+            except Error:
+                return None
+        return f"{origin}@{self._builds[origin]}"
+
+    # ── Stats ────────────────────────────────────────────────────────────
+
+    def _record(self, key: str, outcome: str, seconds: float) -> None:
+        """Accumulate [calls, hits, learned, seconds] for a key.
+
+        ``seconds`` includes the ``count()`` round trips of the resolution.
+        """
+        stat = self._stats.setdefault(key, [0, 0, 0, 0.0])
+        stat[0] += 1
+        stat[1] += outcome == "hit"
+        stat[2] += outcome == "learned"
+        stat[3] += seconds
+
+    def drain_stats(self) -> Dict[str, List[float]]:
+        """Return and reset the stats gathered since the last drain.
+
+        Returns:
+            Mapping of locator key to ``[calls, hits, learned, seconds]``.
+        """
+        stats, self._stats = self._stats, {}
+        return stats
+
+
+REGISTRY = LocatorRegistry()
+
+
+def resolve_first(page: Page, key: str, *candidates: Locator) -> Locator:
+    """Resolve a fallback chain through the shared registry.
+
+    Equivalent to ``candidates[0].or_(candidates[1])...first`` when learning
+    is disabled.
+
+    Args:
+        page: Page the candidates belong to.
+        key: Stable name of the locator.
+        *candidates: Alternative locators, in fallback order.
+
+    Returns:
+        A Locator for the first matching element.
+    """
+    return REGISTRY.resolve(page, key, list(candidates))
+
+
+def resolve_chain(page: Page, key: str, *candidates: Locator) -> Locator:
+    """Resolve a fallback chain without consulting the registry.
+
+    Same signature as ``resolve_first``, for the async page objects: the
+    registry resolves with blocking round trips, which cannot run on an
+    event loop.
+
+    Args:
+        page: Page the candidates belong to (unused).
+        key: Stable name of the locator (unused).
+        *candidates: Alternative locators, in fallback order.
+
+    Returns:
+        ``candidates[0].or_(candidates[1])...first``.
+    """
+    return _chain(list(candidates)).first
@@ -1,9 +1,29 @@
-"""Helper for interacting with Monaco Editor instances."""
+"""Helper for interacting with Monaco Editor instances.
+
+Besides the basic ``set_value``/``get_value`` round trips, the editor has
+bulk paths for multi-megabyte documents: ``write_chunked`` streams the text
+into the model through ``executeEdits`` in bounded chunks, ``paste`` sends
+it through Monaco's own paste handling, and ``get_digest``/``get_lines``
+verify content without copying the whole document back to Python.
+"""
 
 from __future__ import annotations
 
+import hashlib
+from typing import Iterator, Optional
+
 from playwright.sync_api import Page
 
+from pages.spans import INTERACT, WAIT, span
+from pages.typing_profiler import (
+    TYPING,
+    TYPING_SAMPLE,
+    profile_typing,
+    sample_document,
+)
+
+CHUNK_CHARS = 1 << 20
+
 
 class MonacoEditor:
     """Provides methods to interact with a Monaco Editor embedded in the page."""
@@ -18,6 +38,7 @@ class MonacoEditor:
         """
         self.page = page
 
+    @span(WAIT)
     def wait_for_ready(self, timeout: int = 15000) -> None:
         """Wait for the Monaco editor to be loaded and visible.
 
@@ -28,6 +49,7 @@ class MonacoEditor:
             state="visible", timeout=timeout
         )
 
+    @span(INTERACT)
     def set_value(self, text: str) -> None:
         """Set the editor value programmatically via the Monaco API.
 
@@ -45,6 +67,7 @@ class MonacoEditor:
             text,
         )
 
+    @span(INTERACT)
     def get_value(self) -> str:
         """Get the current editor value via the Monaco API.
 
@@ -59,6 +82,7 @@ class MonacoEditor:
             }"""
         )
 
+    @span(INTERACT)
     def type_text(self, text: str) -> None:
         """Simulate typing text into the editor.
 
@@ -70,10 +94,171 @@ class MonacoEditor:
         editor_el.focus()
         editor_el.type(text)
 
+    @span(INTERACT)
+    def write_chunked(self, text: str, chunk_chars: int = CHUNK_CHARS) -> None:
+        """Replace the content with ``text``, streamed in model edits.
+
+        Each chunk is one ``executeEdits`` call appended at the end of the
+        model, so no single protocol message carries the whole document and
+        the app sees ordinary content-change events.
+
+        Args:
+            text: New editor content.
+            chunk_chars: Maximum characters per edit; chunks end on a line
+                break where possible.
+        """
+        self.wait_for_ready()
+        for index, chunk in enumerate(list(_chunks(text, chunk_chars)) or [""]):
+            self.page.evaluate(
+                """([chunk, replace]) => {
+                    const editor = window.monaco?.editor?.getEditors()?.[0];
+                    if (!editor) return;
+                    const model = editor.getModel();
+                    let range = model.getFullModelRange();
+                    if (!replace) {
+                        const line = model.getLineCount();
+                        const column = model.getLineMaxColumn(line);
+                        range = new window.monaco.Range(line, column, line, column);
+                    }
+                    editor.executeEdits('e2e-bulk', [
+                        { range, text: chunk, forceMoveMarkers: true },
+                    ]);
+                }""",
+                [chunk, index == 0],
+            )
+        self.page.evaluate(
+            "() => window.monaco?.editor?.getEditors()?.[0]?.pushUndoStop()"
+        )
+
+    @span(INTERACT)
+    def paste(self, text: str) -> None:
+        """Paste ``text`` at the cursor through Monaco's clipboard handling.
+
+        Dispatches a ``paste`` event carrying the text to the editor's input
+        area, so paste handlers, auto-indent and ``onDidPaste`` run as for a
+        real paste, without clipboard permissions.
+
+        Args:
+            text: Text to paste.
+        """
+        self.wait_for_ready()
+        self.page.evaluate(
+            """(text) => {
+                const editor = window.monaco?.editor?.getEditors()?.[0];
+                if (!editor) return;
+                editor.focus();
+                const target = editor.getDomNode().querySelector('textarea')
+                    || document.activeElement;
+                const data = new DataTransfer();
+                data.setData('text/plain', text);
+                target.dispatchEvent(new ClipboardEvent('paste', {
+                    clipboardData: data, bubbles: true, cancelable: true,
+                }));
+            }""",
+            text,
+        )
+
+    @span(INTERACT)
+    def get_digest(self) -> str:
+        """SHA-256 of the editor content, computed in the page.
+
+        Compare with ``MonacoEditor.digest(expected)``.
+
+        Returns:
+            Hex digest of the UTF-8 encoded content.
+        """
+        self.wait_for_ready()
+        return self.page.evaluate(
+            """async () => {
+                const editor = window.monaco?.editor?.getEditors()?.[0];
+                const text = editor ? editor.getValue() : '';
+                const hash = await crypto.subtle.digest(
+                    'SHA-256', new TextEncoder().encode(text));
+                return Array.from(new Uint8Array(hash),
+                    (b) => b.toString(16).padStart(2, '0')).join('');
+            }"""
+        )
+
+    @staticmethod
+    def digest(text: str) -> str:
+        """SHA-256 of ``text`` as ``get_digest`` computes it.
+
+        Args:
+            text: Expected editor content.
+
+        Returns:
+            Hex digest of the UTF-8 encoded text.
+        """
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    @span(INTERACT)
+    def get_lines(self, start: int, end: Optional[int] = None) -> str:
+        """Get a range of lines without reading the whole document.
+
+        Args:
+            start: First line, 1-based.
+            end: Last line, inclusive (defaults to ``start``); clamped to
+                the document.
+
+        Returns:
+            The lines joined by the model's line break, without a trailing one.
+        """
+        self.wait_for_ready()
+        return self.page.evaluate(
+            """([start, end]) => {
+                const editor = window.monaco?.editor?.getEditors()?.[0];
+                if (!editor) return '';
+                const model = editor.getModel();
+                const last = Math.min(end, model.getLineCount());
+                return model.getValueInRange({
+                    startLineNumber: start,
+                    startColumn: 1,
+                    endLineNumber: last,
+                    endColumn: model.getLineMaxColumn(last),
+                });
+            }""",
+            [start, end if end is not None else start],
+        )
+
+    def profile_typing(
+        self, lines: int, text: str = TYPING_SAMPLE, delay: float = 30
+    ) -> dict:
+        """Type into a document of ``lines`` lines and profile the editor.
+
+        Loads a prompt template of that size, puts the cursor on its middle
+        line and types ``text`` through the keyboard at ``delay`` ms per
+        keystroke (see ``pages/typing_profiler.py``). The profile is also
+        recorded for the end-of-session typing latency report.
+
+        Args:
+            lines: Document size in lines.
+            text: Characters to type.
+            delay: Milliseconds between keystrokes.
+
+        Returns:
+            The profile: per-keystroke latencies, long tasks and frames.
+        """
+        self.write_chunked(sample_document(lines))
+        self.page.evaluate(
+            """(line) => {
+                const editor = window.monaco?.editor?.getEditors()?.[0];
+                if (!editor) return;
+                editor.setPosition({ lineNumber: line, column: 1 });
+                editor.revealLineInCenter(line);
+                editor.focus();
+            }""",
+            max(lines // 2, 1),
+        )
+        profile = profile_typing(self.page, text, delay)
+        TYPING.record(lines, profile)
+        return profile
+
+    @span(INTERACT)
     def clear(self) -> None:
         """Clear all editor content."""
         self.set_value("")
 
+    @span(INTERACT)
     def get_line_count(self) -> int:
         """Get the number of lines in the editor.
 
@@ -87,3 +272,22 @@ class MonacoEditor:
                 return editor ? editor.getModel().getLineCount() : 0;
             }"""
         )
+
+
+def _chunks(text: str, size: int) -> Iterator[str]:
+    """Split text into pieces of at most ``size`` characters at line breaks.
+
+    Lines longer than ``size`` are split mid-line. A ``\r\n`` is never
+    split, since Monaco would count its halves as two line breaks.
+    """
+    start = 0
+    while start < len(text):
+        end = min(start + size, len(text))
+        if end < len(text):
+            newline = text.rfind("\n", start, end)
+            if newline >= start:
+                end = newline + 1
+            elif text[end - 1] == "\r" and end - 1 > start:
+                end -= 1
+        yield text[start:end]
+        start = end
@@ -49,6 +49,7 @@ class PlansPage(BasePage):
         Returns:
             Dictionary with plan detail fields.
         """
+        self.wait_for_loading_complete()
         card = self.page.get_by_text(name, exact=False).first.locator("..")
         details: Dict[str, str] = {}
         price = card.locator("[data-testid='plan-price']")
@@ -35,16 +35,20 @@ class PromptBuilderPage(BasePage):
     @property
     def _title_input(self):
         """Prompt title input."""
-        return self.page.get_by_label("Title").or_(
-            self.page.get_by_placeholder("Prompt title")
-        ).first
+        return self.first_of(
+            "PromptBuilderPage.title_input",
+            self.page.get_by_label("Title"),
+            self.page.get_by_placeholder("Prompt title"),
+        )
 
     @property
     def _description_input(self):
         """Prompt description input."""
-        return self.page.get_by_label("Description").or_(
-            self.page.get_by_placeholder("Description")
-        ).first
+        return self.first_of(
+            "PromptBuilderPage.description_input",
+            self.page.get_by_label("Description"),
+            self.page.get_by_placeholder("Description"),
+        )
 
     @property
     def _save_btn(self):
@@ -95,9 +99,11 @@ class PromptBuilderPage(BasePage):
         Args:
             visibility: Either 'private' or 'public'.
         """
-        vis_btn = self.page.get_by_role("button", name=visibility.capitalize()).or_(
-            self.page.get_by_text(visibility, exact=False)
-        ).first
+        vis_btn = self.first_of(
+            f"PromptBuilderPage.visibility[{visibility}]",
+            self.page.get_by_role("button", name=visibility.capitalize()),
+            self.page.get_by_text(visibility, exact=False),
+        )
         vis_btn.click()
 
     def select_tags(self, tags: List[str]) -> None:
@@ -106,9 +112,11 @@ class PromptBuilderPage(BasePage):
         Args:
             tags: List of tag names to select.
         """
-        tag_input = self.page.get_by_placeholder("Add tags").or_(
-            self.page.get_by_label("Tags")
-        ).first
+        tag_input = self.first_of(
+            "PromptBuilderPage.tag_input",
+            self.page.get_by_placeholder("Add tags"),
+            self.page.get_by_label("Tags"),
+        )
         for tag in tags:
             tag_input.fill(tag)
             self.page.keyboard.press("Enter")
@@ -119,9 +127,11 @@ class PromptBuilderPage(BasePage):
         Args:
             provider: Provider name (e.g. 'OpenAI', 'Anthropic').
         """
-        provider_select = self.page.locator("[data-testid='provider-select']").or_(
-            self.page.get_by_label("Provider")
-        ).first
+        provider_select = self.first_of(
+            "PromptBuilderPage.provider_select",
+            self.page.locator("[data-testid='provider-select']"),
+            self.page.get_by_label("Provider"),
+        )
         provider_select.click()
         self.page.get_by_text(provider, exact=False).first.click()
 
@@ -131,9 +141,11 @@ class PromptBuilderPage(BasePage):
         Args:
             model: Model name (e.g. 'gpt-4', 'claude-3').
         """
-        model_select = self.page.locator("[data-testid='model-select']").or_(
-            self.page.get_by_label("Model")
-        ).first
+        model_select = self.first_of(
+            "PromptBuilderPage.model_select",
+            self.page.locator("[data-testid='model-select']"),
+            self.page.get_by_label("Model"),
+        )
         model_select.click()
         self.page.get_by_text(model, exact=False).first.click()
 
@@ -143,9 +155,11 @@ class PromptBuilderPage(BasePage):
         Args:
             temp: Temperature value (0.0 - 2.0).
         """
-        temp_input = self.page.locator("[data-testid='temperature-input']").or_(
-            self.page.get_by_label("Temperature")
-        ).first
+        temp_input = self.first_of(
+            "PromptBuilderPage.temperature_input",
+            self.page.locator("[data-testid='temperature-input']"),
+            self.page.get_by_label("Temperature"),
+        )
         temp_input.fill(str(temp))
 
     def get_editor_content(self) -> str:
@@ -164,6 +178,33 @@ class PromptBuilderPage(BasePage):
         """
         self.editor.set_value(content)
 
+    def load_editor_content(self, content: str) -> None:
+        """Set large content in the Monaco editor, streamed in chunks.
+
+        Args:
+            content: Content to set in the editor; may be megabytes long.
+        """
+        self.editor.write_chunked(content)
+
+    def paste_editor_content(self, content: str) -> None:
+        """Paste content at the editor's cursor.
+
+        Args:
+            content: Content to paste.
+        """
+        self.editor.paste(content)
+
+    def editor_content_matches(self, content: str) -> bool:
+        """Check the editor content against ``content`` by digest.
+
+        Args:
+            content: Expected editor content.
+
+        Returns:
+            True if the editor holds exactly ``content``.
+        """
+        return self.editor.get_digest() == MonacoEditor.digest(content)
+
     def click_save(self) -> None:
         """Click the Save button."""
         self._save_btn.click()
@@ -181,9 +222,11 @@ class PromptBuilderPage(BasePage):
 
     def toggle_editor_mode(self) -> None:
         """Toggle between editor modes (e.g. raw / visual)."""
-        toggle = self.page.locator("[data-testid='editor-mode-toggle']").or_(
-            self.page.get_by_role("switch")
-        ).first
+        toggle = self.first_of(
+            "PromptBuilderPage.editor_mode_toggle",
+            self.page.locator("[data-testid='editor-mode-toggle']"),
+            self.page.get_by_role("switch"),
+        )
         toggle.click()
 
     def click_refine(self) -> None:
@@ -202,9 +245,11 @@ class PromptBuilderPage(BasePage):
         Returns:
             Version number string.
         """
-        version_el = self.page.locator("[data-testid='version-number']").or_(
-            self.page.get_by_text("Version")
-        ).first
+        version_el = self.first_of(
+            "PromptBuilderPage.version_number",
+            self.page.locator("[data-testid='version-number']"),
+            self.page.get_by_text("Version"),
+        )
         return self.get_text(version_el)
 
     def select_version(self, version: str) -> None:
@@ -219,8 +264,10 @@ class PromptBuilderPage(BasePage):
 
     def open_in_playground(self) -> None:
         """Open the current prompt in the playground."""
-        playground_btn = self.page.get_by_role("button", name="Playground").or_(
-            self.page.get_by_text("Open in Playground")
-        ).first
+        playground_btn = self.first_of(
+            "PromptBuilderPage.playground_btn",
+            self.page.get_by_role("button", name="Playground"),
+            self.page.get_by_text("Open in Playground"),
+        )
         playground_btn.click()
         self.wait_for_page_load()
@@ -0,0 +1,144 @@
+"""Low-overhead timing spans around page object primitives.
+
+Methods decorated with ``@span("wait")`` or ``@span("interact")`` report
+their duration tagged ``<PageObjectClass>.<method>``. Only the outermost
+span is recorded, so a primitive calling another primitive is not counted
+twice. When the recorder is disabled the wrapper costs one attribute check.
+Coroutine methods (``pages/aio``) track nesting per asyncio task, so pages
+driven concurrently on one event loop each record their own spans;
+``suppress_spans`` turns them off for tasks that run outside any test.
+Spans are aggregated per test and drained by ``utils/span_report.py``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import functools
+import heapq
+import inspect
+import time
+from typing import Callable, Dict, Iterator, List, Tuple
+
+WAIT = "wait"
+INTERACT = "interact"
+
+SLOWEST_PER_TEST = 10
+
+_task_depth: contextvars.ContextVar[int] = contextvars.ContextVar(
+    "span_depth", default=0
+)
+
+
+class SpanRecorder:
+    """Aggregates the spans of the current test."""
+
+    def __init__(self) -> None:
+        """Initialize a disabled recorder."""
+        self.enabled = False
+        self._depth = 0
+        self._actions: Dict[str, List] = {}
+        self._slowest: List[Tuple[float, str]] = []
+
+    def record(self, key: str, kind: str, seconds: float) -> None:
+        """Add one finished span.
+
+        Args:
+            key: ``<Class>.<method>`` of the span.
+            kind: ``wait`` or ``interact``.
+            seconds: Span duration.
+        """
+        action = self._actions.setdefault(key, [kind, 0, 0.0, 0.0])
+        action[1] += 1
+        action[2] += seconds
+        action[3] = max(action[3], seconds)
+        entry = (seconds, key)
+        if len(self._slowest) < SLOWEST_PER_TEST:
+            heapq.heappush(self._slowest, entry)
+        elif entry > self._slowest[0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def drain(self) -> dict:
+        """Return and reset the spans gathered since the last drain.
+
+        Returns:
+            ``{"actions": {key: [kind, count, total, max]}, "slowest":
+            [[seconds, key], ...]}``, or an empty dict if nothing ran.
+        """
+        if not self._actions:
+            return {}
+        stats = {"actions": self._actions, "slowest": sorted(self._slowest)}
+        self._actions, self._slowest = {}, []
+        return stats
+
+
+SPANS = SpanRecorder()
+
+
+@contextlib.contextmanager
+def suppress_spans() -> Iterator[None]:
+    """Do not record the spans of coroutine methods awaited in this context.
+
+    Yields:
+        Nothing; page object calls inside the block are not timed.
+    """
+    token = _task_depth.set(1)
+    try:
+        yield
+    finally:
+        _task_depth.reset(token)
+
+
+def span(kind: str) -> Callable[[Callable], Callable]:
+    """Decorate a page object method so its calls are recorded as spans.
+
+    Args:
+        kind: ``WAIT`` for methods that wait on the app, ``INTERACT`` for
+            methods that drive or read it.
+
+    Returns:
+        The method decorator.
+    """
+
+    def decorate(method: Callable) -> Callable:
+        name = method.__name__
+
+        if inspect.iscoroutinefunction(method):
+
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                if not SPANS.enabled or _task_depth.get():
+                    return await method(self, *args, **kwargs)
+                token = _task_depth.set(1)
+                start = time.perf_counter()
+                try:
+                    return await method(self, *args, **kwargs)
+                finally:
+                    _task_depth.reset(token)
+                    SPANS.record(
+                        f"{type(self).__name__}.{name}",
+                        kind,
+                        time.perf_counter() - start,
+                    )
+
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not SPANS.enabled or SPANS._depth:
+                return method(self, *args, **kwargs)
+            SPANS._depth += 1
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                SPANS._depth -= 1
+                SPANS.record(
+                    f"{type(self).__name__}.{name}",
+                    kind,
+                    time.perf_counter() - start,
+                )
+
+        return wrapper
+
+    return decorate
@@ -0,0 +1,205 @@
+"""Web vitals and navigation timing captured when a page object opens.
+
+``BasePage.navigate`` remembers the route and ``wait_for_page_load``
+measures it once the page has settled: TTFB, FCP, LCP, CLS, total blocking
+time, long-task time, transferred bytes and request count from the
+Performance API, plus JS heap size and DOM node count from CDP
+``Performance.getMetrics`` on Chromium. Measurements are buffered per test
+and drained by the ``utils/web_vitals_report.py`` plugin; pages driven
+concurrently for several tests (``utils/fan_out.py``) measure into a
+buffer of their own via ``WebVitalsRecorder.scoped``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from playwright.sync_api import BrowserContext, Error, Page
+
+# Installed as an init script: LCP, layout shifts and long tasks are only
+# observable while they happen, so the observers must exist before the app
+# boots.
+VITALS_OBSERVER_SCRIPT = """
+() => {
+    if (window.__echostashVitals) return;
+    const vitals = window.__echostashVitals = { lcp: 0, cls: 0, longTasks: [] };
+    const observe = (type, onEntry) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(onEntry))
+                .observe({ type, buffered: true });
+        } catch (e) {
+            // Entry type not supported by this browser.
+        }
+    };
+    observe('largest-contentful-paint', (e) => { vitals.lcp = e.startTime; });
+    observe('layout-shift', (e) => { if (!e.hadRecentInput) vitals.cls += e.value; });
+    observe('longtask', (e) => { vitals.longTasks.push([e.startTime, e.duration]); });
+}
+"""
+
+# (enabled, records) of the current asyncio task, if it measures on its own.
+_scope: contextvars.ContextVar[Optional[Tuple[bool, List[dict]]]] = (
+    contextvars.ContextVar("vitals_scope", default=None)
+)
+
+# Blocking time counts the part of every long task beyond 50 ms after FCP.
+_COLLECT_SCRIPT = """
+() => {
+    const vitals = window.__echostashVitals || { lcp: 0, cls: 0, longTasks: [] };
+    const nav = performance.getEntriesByType('navigation')[0];
+    const fcpEntry = performance.getEntriesByName('first-contentful-paint')[0];
+    const fcp = fcpEntry ? fcpEntry.startTime : null;
+    let tbt = 0;
+    let longTaskMs = 0;
+    for (const [start, duration] of vitals.longTasks) {
+        longTaskMs += duration;
+        if (fcp !== null && start + duration > fcp) tbt += Math.max(0, duration - 50);
+    }
+    const resources = performance.getEntriesByType('resource');
+    let transfer = nav ? nav.transferSize : 0;
+    for (const entry of resources) transfer += entry.transferSize || 0;
+    return {
+        ttfb_ms: nav ? nav.responseStart : null,
+        dcl_ms: nav ? nav.domContentLoadedEventEnd : null,
+        fcp_ms: fcp,
+        lcp_ms: vitals.lcp || null,
+        cls: vitals.cls,
+        tbt_ms: tbt,
+        long_task_ms: longTaskMs,
+        transfer_bytes: transfer,
+        requests: resources.length + 1,
+        js_heap_bytes: performance.memory ? performance.memory.usedJSHeapSize : null,
+        dom_nodes: document.getElementsByTagName('*').length,
+    };
+}
+"""
+
+
+def collect_vitals(page: Page) -> Dict[str, Optional[float]]:
+    """Read the current page's vitals and navigation timing.
+
+    Args:
+        page: A page that has finished loading.
+
+    Returns:
+        Mapping of metric name to value (None when unavailable).
+    """
+    metrics = page.evaluate(_COLLECT_SCRIPT)
+    browser = page.context.browser
+    if browser is None or browser.browser_type.name != "chromium":
+        return metrics
+    try:
+        session = page.context.new_cdp_session(page)
+    except Error:
+        return metrics
+    try:
+        session.send("Performance.enable")
+        cdp = {
+            m["name"]: m["value"]
+            for m in session.send("Performance.getMetrics")["metrics"]
+        }
+        metrics["js_heap_bytes"] = cdp.get("JSHeapUsedSize", metrics["js_heap_bytes"])
+        metrics["dom_nodes"] = cdp.get("Nodes", metrics["dom_nodes"])
+        metrics["script_ms"] = cdp.get("ScriptDuration", 0.0) * 1000
+    finally:
+        session.detach()
+    return metrics
+
+
+class WebVitalsRecorder:
+    """Buffers per-route measurements taken during the current test."""
+
+    def __init__(self) -> None:
+        """Initialize a disabled recorder."""
+        self.enabled = False
+        self._records: List[dict] = []
+
+    def install(self, context: BrowserContext) -> None:
+        """Register the vitals observers on every page the context opens.
+
+        Args:
+            context: Playwright browser context.
+        """
+        if self.enabled:
+            context.add_init_script(f"({VITALS_OBSERVER_SCRIPT})();")
+
+    @property
+    def measuring(self) -> bool:
+        """Whether page loads are measured in the current context."""
+        scope = _scope.get()
+        return self.enabled if scope is None else scope[0]
+
+    def add(self, route: str, metrics: Dict[str, Optional[float]]) -> None:
+        """Buffer the measurement of a page opened at ``route``.
+
+        Args:
+            route: Route path the page object navigated to.
+            metrics: Result of ``collect_vitals``.
+        """
+        scope = _scope.get()
+        records = self._records if scope is None else scope[1]
+        records.append({"route": route, **metrics})
+
+    @contextlib.contextmanager
+    def scoped(self, enabled: bool) -> Iterator[List[dict]]:
+        """Measure the current context (e.g. one asyncio task) separately.
+
+        Args:
+            enabled: Whether page loads in this context are measured.
+
+        Yields:
+            The list receiving this context's measurements, to hand to
+            ``extend`` for the test they belong to.
+        """
+        records: List[dict] = []
+        token = _scope.set((enabled, records))
+        try:
+            yield records
+        finally:
+            _scope.reset(token)
+
+    def extend(self, records: List[dict]) -> None:
+        """Buffer measurements taken in a ``scoped`` context.
+
+        Args:
+            records: Measurements yielded by ``scoped``.
+        """
+        self._records.extend(records)
+
+    def peek(self) -> List[dict]:
+        """Return the measurements taken since the last drain, keeping them.
+
+        Returns:
+            One dict per page open, with ``route`` and the metrics.
+        """
+        return list(self._records)
+
+    def drain(self) -> List[dict]:
+        """Return and reset the measurements taken since the last drain.
+
+        Returns:
+            One dict per page open, with ``route`` and the metrics.
+        """
+        records, self._records = self._records, []
+        return records
+
+
+VITALS = WebVitalsRecorder()
+
+
+def capture_vitals(page: Page, route: str) -> None:
+    """Measure the page that was just opened at ``route``, if enabled.
+
+    Args:
+        page: A page that has finished loading.
+        route: Route path the page object navigated to.
+    """
+    if not VITALS.measuring:
+        return
+    try:
+        metrics = collect_vitals(page)
+    except Error:
+        return
+    VITALS.add(route, metrics)
@@ -6,22 +6,58 @@ import os
 
 import pytest
 from dotenv import load_dotenv
-from playwright.sync_api import Page
+from playwright.sync_api import Browser, BrowserType, Page
 
+# The plugin modules imported below are also listed in ``pytest_plugins``;
+# mark them for assertion rewriting before anything imports them.
+pytest.register_assert_rewrite("utils")
+
+from pages.artifact_manager import ARTIFACTS
 from pages.auth_page import AuthPage
 from pages.browse_page import BrowsePage
 from pages.dashboard_page import DashboardPage
+from pages.idle_tracker import install_idle_tracker
 from pages.prompt_builder_page import PromptBuilderPage
 from pages.share_page import SharePage
 from pages.sidebar import Sidebar
+from pages.web_vitals import VITALS
+from utils.api_client import EchostashApiClient, get_api_client
+from utils.asset_cache import ASSETS
+from utils.browser_server import connect_shared_browser
+from utils.cleanup import CleanupQueue
+from utils.failure_artifacts import needs_artifacts
+from utils.har_replay import REPLAY
 from utils.helpers import (
     api_create_project,
     api_create_prompt,
-    api_delete_project,
-    api_login_guest,
-    set_auth_cookie,
     unique_name,
 )
+from utils.identity_pool import GuestIdentity, GuestIdentityPool
+from utils.memory_watchdog import WATCHDOG
+from utils.network_observer import NETWORK
+from utils.request_blocking import BLOCKER
+
+pytest_plugins = [
+    "utils.asset_cache",
+    "utils.browser_server",
+    "utils.cleanup",
+    "utils.duration_scheduler",
+    "utils.fake_api",
+    "utils.failure_artifacts",
+    "utils.fan_out",
+    "utils.har_replay",
+    "utils.locator_report",
+    "utils.memory_watchdog",
+    "utils.network_observer",
+    "utils.perf_budget",
+    "utils.request_blocking",
+    "utils.sharding",
+    "utils.sleep_report",
+    "utils.span_report",
+    "utils.typing_report",
+    "utils.web_vitals_report",
+    "pytester",
+]
 
 
 # ── CLI Options ──────────────────────────────────────────────────────────
@@ -35,6 +71,14 @@ def pytest_addoption(parser):
         choices=["local", "stage", "prod"],
         help="Target environment: local, stage, or prod",
     )
+    parser.addoption(
+        "--guest-reuse",
+        action="store",
+        type=int,
+        default=10,
+        help="Tests served by one pooled guest identity before logging in "
+        "again (0 = one identity per worker)",
+    )
 
 
 # ── Environment ──────────────────────────────────────────────────────────
@@ -60,35 +104,122 @@ def api_url() -> str:
     return os.getenv("API_URL", "http://localhost:8085")
 
 
+@pytest.fixture(scope="session")
+def api_client(api_url: str) -> EchostashApiClient:
+    """Pooled, retrying backend API client shared by this worker."""
+    return get_api_client(api_url)
+
+
 @pytest.fixture(scope="session")
 def admin_url() -> str:
     """Admin panel base URL."""
     return os.getenv("ADMIN_URL", "http://localhost:3001")
 
 
+# ── Browser ──────────────────────────────────────────────────────────────
+
+
+@pytest.fixture(scope="session")
+def browser(pytestconfig, browser_type: BrowserType, launch_browser):
+    """This worker's browser: launched locally, or shared via ``--browser-server``.
+
+    A local browser is relaunched by ``--memory-watchdog`` when it grows too
+    large.
+
+    Yields:
+        A Browser, or a SharedBrowser/RecyclableBrowser standing in for one.
+    """
+    browser = connect_shared_browser(pytestconfig, browser_type)
+    if browser is None:
+        browser = WATCHDOG.wrap(launch_browser)
+    yield browser
+    browser.close()
+
+
 # ── Auth Fixtures ────────────────────────────────────────────────────────
 
 
+@pytest.fixture(scope="session")
+def guest_pool(
+    request, browser: Browser, api_url: str, base_url: str, tmp_path_factory
+) -> GuestIdentityPool:
+    """Worker-scoped pool of guest identities with persisted storage state."""
+    return GuestIdentityPool(
+        api_url,
+        base_url,
+        tmp_path_factory.mktemp("guest-identities"),
+        max_uses=request.config.getoption("--guest-reuse"),
+        browser=browser,
+    )
+
+
 @pytest.fixture
-def guest_auth(api_url: str) -> dict:
-    """Login as a guest user via the API and return token data.
+def guest_identity(
+    request, guest_pool: GuestIdentityPool, cleanup_queue: CleanupQueue, api_url: str
+) -> GuestIdentity:
+    """Pooled guest identity, or a fresh one for ``@pytest.mark.fresh_guest``.
+
+    A pooled identity is handed out only once the data its earlier tests
+    queued for deletion is gone, so list and empty-state assertions do not
+    depend on test order. Every identity is journaled so ``--sweep-orphans``
+    can later find projects it created through the UI.
+    """
+    if request.node.get_closest_marker("fresh_guest"):
+        identity = guest_pool.fresh()
+    else:
+        identity = guest_pool.acquire()
+        cleanup_queue.drain(identity.access_token)
+    cleanup_queue.track_identity(api_url, identity.access_token)
+    return identity
+
+
+@pytest.fixture
+def guest_auth(guest_identity: GuestIdentity) -> dict:
+    """Return token data for the test's guest identity.
 
     Returns:
         Dict with ``accessToken`` and ``refreshToken``.
     """
-    return api_login_guest(api_url)
+    return guest_identity.tokens
 
 
 @pytest.fixture
-def authenticated_page(page: Page, base_url: str, guest_auth: dict) -> Page:
-    """Return a Playwright Page with the auth cookie pre-set.
+def context(new_context, request, base_url: str, api_url: str):
+    """Browser context, pre-authenticated for tests using ``authenticated_page``.
+
+    Authenticated contexts are created from the guest identity's
+    ``storage_state`` file, so no cookie juggling or landing navigation is
+    needed before the test starts. Every context gets the idle tracker used
+    by ``BasePage.wait_for_app_idle`` (plus the ``--web-vitals`` observers,
+    the ``--asset-cache`` route and third-party request blocking), its
+    backend traffic feeds ``--api-latency`` (and is recorded or replayed for
+    ``--backend``) and it is recorded for ``--artifacts``.
 
-    The page navigates to the base URL after setting the cookie so the
-    application recognises the authenticated session.
+    Yields:
+        The test's BrowserContext.
+    """
+    if "authenticated_page" in request.fixturenames:
+        identity = request.getfixturevalue("guest_identity")
+        ctx = new_context(storage_state=identity.storage_state)
+    else:
+        ctx = new_context()
+    install_idle_tracker(ctx)
+    VITALS.install(ctx)
+    ASSETS.install(ctx, base_url)
+    BLOCKER.install(ctx, measured=bool(request.node.get_closest_marker("perf_budget")))
+    NETWORK.observe(ctx, api_url)
+    REPLAY.attach(ctx, api_url)
+    recording = ARTIFACTS.attach(ctx)
+    yield ctx
+    ARTIFACTS.finish(recording, request.node.nodeid, needs_artifacts(request.node))
+
+
+@pytest.fixture
+def authenticated_page(page: Page) -> Page:
+    """Return a Playwright Page whose context already holds the guest session.
+
+    The page starts blank; tests navigate to the route they exercise.
     """
-    set_auth_cookie(page.context, guest_auth["accessToken"], base_url)
-    page.goto(base_url)
-    page.wait_for_load_state("domcontentloaded")
     return page
 
 
@@ -135,8 +266,16 @@ def sidebar_nav(authenticated_page: Page, base_url: str) -> Sidebar:
 
 
 @pytest.fixture
-def test_project(authenticated_page: Page, api_url: str, guest_auth: dict):
-    """Create a project via the API, yield it, then clean up.
+def test_project(
+    authenticated_page: Page,
+    api_url: str,
+    guest_auth: dict,
+    cleanup_queue: CleanupQueue,
+):
+    """Create a project via the API, yield it, then queue it for deletion.
+
+    The deletion runs on the cleanup queue's background thread, so teardown
+    does not wait for the backend.
 
     Yields:
         Project dict with ``id``, ``name``, etc.
@@ -144,14 +283,23 @@ def test_project(authenticated_page: Page, api_url: str, guest_auth: dict):
     token = guest_auth["accessToken"]
     name = unique_name("proj")
     project = api_create_project(api_url, token, name, "Test project")
+    entry = cleanup_queue.track("project", project["id"], api_url, token)
     yield project
-    api_delete_project(api_url, token, project["id"])
+    cleanup_queue.delete_later(entry)
 
 
 @pytest.fixture
-def test_prompt(test_project: dict, api_url: str, guest_auth: dict):
+def test_prompt(
+    test_project: dict,
+    api_url: str,
+    guest_auth: dict,
+    cleanup_queue: CleanupQueue,
+):
     """Create a prompt inside the test project via the API.
 
+    The prompt is queued for deletion before its project, so it is cleaned
+    up even if the project deletion fails.
+
     Yields:
         Prompt dict with ``id``, ``title``, etc.
     """
@@ -162,8 +310,9 @@ def test_prompt(test_project: dict, api_url: str, guest_auth: dict):
         "description": "Automated test prompt",
     }
     prompt = api_create_prompt(api_url, token, test_project["id"], data)
+    entry = cleanup_queue.track("prompt", prompt["id"], api_url, token)
     yield prompt
-    # Prompt is deleted when the parent project is deleted
+    cleanup_queue.delete_later(entry)
 
 
 # ── Unauthenticated page fixture ─────────────────────────────────────────
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import pytest
+from playwright import async_api
 from playwright.sync_api import Page, expect
 
+from pages import aio
+from pages.base_page import BasePage
+
 
 @pytest.mark.regression
 class TestAuthGuard:
@@ -20,24 +24,23 @@ class TestAuthGuard:
         "/evals",
     ]
 
+    @pytest.mark.fan_out
     @pytest.mark.parametrize("path", PROTECTED_PAGES)
-    def test_protected_page_redirects(
-        self, page: Page, base_url: str, path: str
+    async def test_protected_page_redirects(
+        self, fan_page: async_api.Page, base_url: str, path: str
     ) -> None:
         """UI-AUTH-007: Protected pages redirect or show auth modal."""
-        page.goto(f"{base_url}{path}")
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(2000)
+        await fan_page.goto(f"{base_url}{path}")
+        await aio.BasePage(fan_page, base_url).wait_for_app_idle()
 
-        auth_modal = page.locator("[role='dialog']")
-        is_protected = path not in page.url or auth_modal.is_visible()
+        auth_modal = fan_page.locator("[role='dialog']")
+        is_protected = path not in fan_page.url or await auth_modal.is_visible()
         assert is_protected, f"Page {path} should be protected"
 
     def test_auth_modal_has_login_options(self, page: Page, base_url: str) -> None:
         """UI-AUTH-006: Auth modal shows login options when triggered."""
         page.goto(f"{base_url}/dashboard")
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(2000)
+        BasePage(page, base_url).wait_for_app_idle()
 
         auth_modal = page.locator("[role='dialog']")
         if auth_modal.is_visible():
@@ -10,6 +10,7 @@ from pages.sidebar import Sidebar
 
 
 @pytest.mark.regression
+@pytest.mark.fresh_guest
 class TestLogoutFlow:
     """Full logout flow tests."""
 
@@ -38,14 +38,14 @@ class TestFullWorkflow:
         modal.fill_description("End-to-end test project")
         modal.submit()
 
-        page.wait_for_timeout(2000)
+        dashboard.wait_for_app_idle()
         expect(page.get_by_text(project_name, exact=False).first).to_be_visible(
             timeout=10000
         )
 
         # Step 3: Navigate into the project
         dashboard.click_project(project_name)
-        page.wait_for_timeout(2000)
+        dashboard.wait_for_app_idle()
 
         # Step 4: Create prompt
         project_view = ProjectViewPage(page, base_url)
@@ -61,7 +61,7 @@ class TestFullWorkflow:
         builder.set_editor_content(content)
         builder.click_save()
 
-        page.wait_for_timeout(2000)
+        builder.wait_for_app_idle()
         expect(page.get_by_text(prompt_name, exact=False).first).to_be_visible(
             timeout=10000
         )
@@ -69,17 +69,17 @@ class TestFullWorkflow:
         # Step 5: Commit version
         builder.set_editor_content(f"{content}\n\nUpdated for commit v2")
         builder.click_commit()
-        page.wait_for_timeout(2000)
+        builder.wait_for_app_idle()
 
         # Step 6: Publish
         builder.click_publish()
-        page.wait_for_timeout(2000)
+        builder.wait_for_app_idle()
 
         # Step 7: Browse public prompts
-        page.goto(f"{base_url}/browse")
-        page.wait_for_load_state("networkidle")
-
         browse = BrowsePage(page, base_url)
+        browse.navigate("/browse")
+        browse.wait_for_app_idle()
+
         cards = browse.get_prompt_cards()
         # The browse page should load (cards may or may not contain our prompt)
         assert "/browse" in page.url
@@ -121,11 +121,11 @@ class TestFullWorkflow:
         project_name = unique_name("lifecycle-proj")
         modal.fill_name(project_name)
         modal.submit()
-        page.wait_for_timeout(2000)
+        dashboard.wait_for_app_idle()
 
         # Navigate to project
         dashboard.click_project(project_name)
-        page.wait_for_timeout(2000)
+        dashboard.wait_for_app_idle()
 
         # Create prompt
         project_view = ProjectViewPage(page, base_url)
@@ -138,13 +138,13 @@ class TestFullWorkflow:
         builder.fill_title(prompt_name)
         builder.set_editor_content("Initial content for lifecycle test")
         builder.click_save()
-        page.wait_for_timeout(2000)
+        builder.wait_for_app_idle()
 
         # Edit prompt
         new_name = unique_name("lifecycle-edited")
         builder.fill_title(new_name)
         builder.click_save()
-        page.wait_for_timeout(2000)
+        builder.wait_for_app_idle()
 
         expect(page.get_by_text(new_name, exact=False).first).to_be_visible(
             timeout=10000
@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 import pytest
+from playwright import async_api
 from playwright.sync_api import Page, expect
 
+from pages import aio
+
+MOBILE_VIEWPORT = {"width": 375, "height": 812}
+
 
 @pytest.mark.regression
 @pytest.mark.mobile
@@ -19,26 +24,28 @@ class TestMobileViews:
     ]
 
     @pytest.fixture(autouse=True)
-    def _set_mobile_viewport(self, page: Page):
-        """Set viewport to mobile dimensions."""
-        page.set_viewport_size({"width": 375, "height": 812})
+    def _set_mobile_viewport(self, request):
+        """Set viewport to mobile dimensions (fan-out pages get it from the marker)."""
+        if request.node.get_closest_marker("fan_out") is None:
+            request.getfixturevalue("page").set_viewport_size(MOBILE_VIEWPORT)
 
+    @pytest.mark.fan_out(viewport=MOBILE_VIEWPORT)
     @pytest.mark.parametrize("path,name", MOBILE_PAGES)
-    def test_page_renders_at_mobile(
-        self, page: Page, base_url: str, path: str, name: str
+    async def test_page_renders_at_mobile(
+        self, fan_page: async_api.Page, base_url: str, path: str, name: str
     ) -> None:
         """UI-RESP-001 to 006: Page renders without horizontal scroll at 375px."""
-        page.goto(f"{base_url}{path}")
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(2000)
+        await fan_page.goto(f"{base_url}{path}")
+        await fan_page.wait_for_load_state("domcontentloaded")
+        await aio.BasePage(fan_page, base_url).wait_for_app_idle()
 
         # Check no horizontal overflow
-        has_overflow = page.evaluate(
+        has_overflow = await fan_page.evaluate(
             "() => document.documentElement.scrollWidth > document.documentElement.clientWidth"
         )
         # Some pages may have minor overflow - this is a soft check
-        body = page.locator("body")
-        expect(body).to_be_visible()
+        body = fan_page.locator("body")
+        await async_api.expect(body).to_be_visible()
 
     def test_dashboard_mobile_layout(
         self, page: Page, base_url: str, guest_auth: dict
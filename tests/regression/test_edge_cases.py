@@ -45,10 +45,15 @@ class TestSpecialCharacters:
         """UI-EDGE-002: Large content in editor doesn't freeze the UI."""
         prompt_builder.open()
         prompt_builder.fill_title(unique_name("long-content"))
-        large_content = "This is a test line.\n" * 500
-        prompt_builder.set_editor_content(large_content)
-        # Verify the editor didn't crash
-        assert len(prompt_builder.get_editor_content()) > 0
+        large_content = "".join(
+            f"This is test line {n} of a large prompt.\n" for n in range(50_000)
+        )
+        prompt_builder.load_editor_content(large_content)
+        assert prompt_builder.editor.get_line_count() == 50_001
+        assert prompt_builder.editor.get_lines(25_000) == (
+            "This is test line 24999 of a large prompt."
+        )
+        assert prompt_builder.editor_content_matches(large_content)
 
     def test_unicode_emoji_in_content(
         self, prompt_builder: PromptBuilderPage
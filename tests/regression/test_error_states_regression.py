@@ -5,6 +5,9 @@ from __future__ import annotations
 import pytest
 from playwright.sync_api import Page, expect
 
+from pages.dashboard_page import DashboardPage
+from utils.fake_api import FakeApiControl
+
 
 @pytest.mark.regression
 class TestNetworkErrors:
@@ -41,6 +44,22 @@ class TestNetworkErrors:
         assert len(body.strip()) > 0
         authenticated_page.unroute("**/api/**")
 
+    def test_server_error_500_project_list(
+        self, fake_api: FakeApiControl, dashboard: DashboardPage, guest_auth: dict
+    ) -> None:
+        """UI-ERR-007: Server 500 on the project list keeps the dashboard usable.
+
+        Needs ``--fake-api``: only this guest's project list fails, so auth
+        and the rest of the app keep working.
+        """
+        fake_api.inject(
+            "GET", "/projects", status=500, token=guest_auth["accessToken"]
+        )
+        dashboard.open()
+        body = dashboard.page.locator("body").inner_text()
+        assert len(body.strip()) > 0
+        assert fake_api.stats()["injected"] > 0
+
 
 @pytest.mark.regression
 class TestToastDismiss:
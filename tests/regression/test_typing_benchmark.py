@@ -0,0 +1,23 @@
+"""Benchmark of Monaco typing latency in the prompt builder (UI-PERF)."""
+
+from __future__ import annotations
+
+import pytest
+
+from pages.prompt_builder_page import PromptBuilderPage
+from utils.helpers import unique_name
+
+
+@pytest.mark.benchmark
+class TestTypingLatency:
+    """Profile typing into prompt templates of growing size."""
+
+    @pytest.mark.parametrize("lines", [1_000, 10_000, 100_000])
+    def test_typing_latency(
+        self, prompt_builder: PromptBuilderPage, lines: int
+    ) -> None:
+        """UI-PERF-001: Every keystroke paints in a long template."""
+        prompt_builder.open()
+        prompt_builder.fill_title(unique_name("typing-benchmark"))
+        profile = prompt_builder.editor.profile_typing(lines)
+        assert len(profile["latency_ms"]) == profile["keystrokes"]
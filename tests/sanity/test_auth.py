@@ -29,6 +29,7 @@ class TestGuestLogin:
 
 
 @pytest.mark.sanity
+@pytest.mark.fresh_guest
 class TestLogout:
     """Verify logout flow."""
 
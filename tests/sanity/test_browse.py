@@ -12,6 +12,7 @@ from pages.browse_page import BrowsePage
 class TestBrowsePage:
     """Verify browse page core functionality."""
 
+    @pytest.mark.perf_budget
     def test_browse_page_loads(self, page: Page, base_url: str) -> None:
         """UI-BROWSE-001: Browse page loads and displays prompt area."""
         browse = BrowsePage(page, base_url)
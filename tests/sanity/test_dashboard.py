@@ -13,6 +13,7 @@ from pages.project_modal import ProjectModal
 class TestDashboardLoads:
     """Verify the dashboard loads and displays core elements."""
 
+    @pytest.mark.perf_budget
     def test_dashboard_loads_with_projects(
         self, authenticated_page: Page, base_url: str
     ) -> None:
@@ -24,6 +24,7 @@ class TestPagesLoad:
         body = page.locator("body")
         expect(body).to_be_visible()
 
+    @pytest.mark.perf_budget
     def test_evals_page_loads(
         self, authenticated_page: Page, base_url: str
     ) -> None:
@@ -32,6 +33,7 @@ class TestPagesLoad:
         evals.open()
         expect(authenticated_page).to_have_url(f"{base_url}/evals", timeout=10000)
 
+    @pytest.mark.perf_budget
     def test_context_store_page_loads(
         self, authenticated_page: Page, base_url: str
     ) -> None:
@@ -58,6 +60,7 @@ class TestPagesLoad:
         assets = ctx.get_asset_list()
         assert isinstance(assets, list)
 
+    @pytest.mark.perf_budget
     def test_analytics_page_loads(
         self, authenticated_page: Page, base_url: str
     ) -> None:
@@ -66,12 +69,14 @@ class TestPagesLoad:
         analytics.open()
         expect(authenticated_page).to_have_url(f"{base_url}/analytics")
 
+    @pytest.mark.perf_budget
     def test_plans_page_loads(self, page: Page, base_url: str) -> None:
         """UI-BILL-001: Plans page loads and shows plan cards."""
         plans = PlansPage(page, base_url)
         plans.open()
         expect(page).to_have_url(f"{base_url}/plans")
 
+    @pytest.mark.perf_budget
     def test_usage_page_loads(
         self, authenticated_page: Page, base_url: str
     ) -> None:
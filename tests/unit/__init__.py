@@ -0,0 +1 @@
+"""Unit tests for the pure helpers behind the suite's plugins and page objects."""
@@ -0,0 +1,25 @@
+"""Fixtures shared by the unit tests."""
+
+from __future__ import annotations
+
+import socket
+
+import pytest
+
+from utils.fake_api import FakeApiServer
+
+
+@pytest.fixture
+def fake_server():
+    """A fake API server on a free local port.
+
+    Yields:
+        The server's base URL.
+    """
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = FakeApiServer("127.0.0.1", port)
+    server.start()
+    yield f"http://127.0.0.1:{port}"
+    server.stop()
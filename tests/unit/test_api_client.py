@@ -0,0 +1,161 @@
+"""Unit tests for the API client's retry policy and shared rate limiter."""
+
+from __future__ import annotations
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pytest
+import requests
+
+from utils.api_client import EchostashApiClient, RateLimiter
+
+
+class _ScriptedServer:
+    """Local HTTP server answering each request with the next scripted reply."""
+
+    def __init__(self) -> None:
+        # (status, headers), or None to drop the connection unanswered.
+        self.replies: List[Optional[Tuple[int, Dict[str, str]]]] = []
+        self.hits: List[str] = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                server.hits.append(self.command)
+                reply = server.replies.pop(0) if server.replies else (200, {})
+                if reply is None:
+                    self.close_connection = True
+                    return
+                status, headers = reply
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"{}")
+
+            do_GET = do_POST = do_DELETE = _reply
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(
+            target=self.httpd.serve_forever, args=(0.05,), daemon=True
+        ).start()
+
+    def close(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server() -> Iterator[_ScriptedServer]:
+    scripted = _ScriptedServer()
+    yield scripted
+    scripted.close()
+
+
+@pytest.fixture
+def client(server: _ScriptedServer) -> Iterator[EchostashApiClient]:
+    api = EchostashApiClient(server.url, retries=3, backoff=0, timeout=5)
+    yield api
+    api.close()
+
+
+@pytest.mark.unit
+class TestApiRetry:
+    """Verify which failures are retried, per method."""
+
+    def test_get_is_retried_after_5xx(
+        self, server: _ScriptedServer, client: EchostashApiClient
+    ) -> None:
+        server.replies = [(503, {}), (502, {}), (200, {})]
+        assert client.request("GET", "/projects").status_code == 200
+        assert server.hits == ["GET", "GET", "GET"]
+
+    def test_post_is_not_retried_after_5xx(
+        self, server: _ScriptedServer, client: EchostashApiClient
+    ) -> None:
+        server.replies = [(503, {}), (200, {})]
+        assert client.request("POST", "/projects", json={}).status_code == 503
+        assert server.hits == ["POST"]
+
+    def test_post_is_retried_after_429(
+        self, server: _ScriptedServer, client: EchostashApiClient
+    ) -> None:
+        server.replies = [(429, {}), (201, {})]
+        assert client.request("POST", "/projects", json={}).status_code == 201
+        assert server.hits == ["POST", "POST"]
+
+    def test_post_is_not_retried_after_read_error(
+        self, server: _ScriptedServer, client: EchostashApiClient
+    ) -> None:
+        server.replies = [None, (201, {})]
+        with pytest.raises(requests.ConnectionError):
+            client.request("POST", "/projects", json={})
+        assert server.hits == ["POST"]
+
+    def test_get_is_retried_after_read_error(
+        self, server: _ScriptedServer, client: EchostashApiClient
+    ) -> None:
+        server.replies = [None, (200, {})]
+        assert client.request("GET", "/projects").status_code == 200
+        assert server.hits == ["GET", "GET"]
+
+    def test_retries_run_out(
+        self, server: _ScriptedServer, client: EchostashApiClient
+    ) -> None:
+        server.replies = [(503, {})] * 5
+        assert client.request("DELETE", "/projects/1").status_code == 503
+        assert len(server.hits) == 4
+
+    def test_retry_after_is_honoured(
+        self, server: _ScriptedServer, client: EchostashApiClient
+    ) -> None:
+        server.replies = [(429, {"Retry-After": "1"}), (201, {})]
+        started = time.monotonic()
+        assert client.request("POST", "/projects", json={}).status_code == 201
+        assert time.monotonic() - started >= 0.9
+        assert server.hits == ["POST", "POST"]
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    """Verify the token bucket spaces calls and is shared through its file."""
+
+    @staticmethod
+    def _elapsed(limiter: RateLimiter, calls: int) -> float:
+        started = time.monotonic()
+        for _ in range(calls):
+            limiter.acquire()
+        return time.monotonic() - started
+
+    def test_calls_are_spaced_at_the_rate(self, tmp_path) -> None:
+        limiter = RateLimiter(20, str(tmp_path / "rate.json"), burst=1)
+        # The first token is in the bucket; the next four wait 50 ms each.
+        assert self._elapsed(limiter, 5) >= 0.18
+
+    def test_burst_is_not_delayed(self, tmp_path) -> None:
+        limiter = RateLimiter(2, str(tmp_path / "rate.json"), burst=5)
+        assert self._elapsed(limiter, 5) < 0.25
+
+    def test_budget_is_shared_through_the_state_file(self, tmp_path) -> None:
+        path = str(tmp_path / "rate.json")
+        first = RateLimiter(10, path, burst=1)
+        second = RateLimiter(10, path, burst=1)
+        first.acquire()
+        # The bucket ``first`` emptied is the one ``second`` draws from.
+        assert self._elapsed(second, 1) >= 0.08
+
+    def test_zero_rate_disables_throttling(self, tmp_path) -> None:
+        path = tmp_path / "rate.json"
+        limiter = RateLimiter(0, str(path))
+        assert self._elapsed(limiter, 50) < 0.1
+        assert not path.exists()
@@ -0,0 +1,31 @@
+"""Unit tests for static asset cache keys."""
+
+from __future__ import annotations
+
+import pytest
+
+from utils.asset_cache import AssetCache
+
+HASHED = "http://localhost:3000/_next/static/chunks/main-3f2a.js"
+UNHASHED = "http://localhost:3000/fonts/inter.woff2"
+
+
+@pytest.mark.unit
+class TestAssetCacheKey:
+    """Verify which assets can be cached for a given build."""
+
+    def test_hashed_assets_ignore_the_build(self) -> None:
+        cache = AssetCache()
+        before = cache.key(HASHED)
+        cache.build_id = "build-2"
+        assert cache.key(HASHED) == before
+
+    def test_unhashed_assets_are_scoped_to_the_build(self) -> None:
+        cache = AssetCache()
+        cache.build_id = "build-1"
+        first = cache.key(UNHASHED)
+        cache.build_id = "build-2"
+        assert cache.key(UNHASHED) != first
+
+    def test_unhashed_assets_are_not_cached_without_a_build_id(self) -> None:
+        assert AssetCache().key(UNHASHED) is None
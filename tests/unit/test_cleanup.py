@@ -0,0 +1,216 @@
+"""Unit tests for the cleanup queue, its journal and the orphan sweeper."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+import requests
+
+from utils import cleanup
+from utils.cleanup import CleanupQueue, sweep_orphans
+
+
+def _login(api_url: str) -> str:
+    return requests.post(f"{api_url}/auth/guest").json()["accessToken"]
+
+
+def _create(api_url: str, token: str, path: str, name: str) -> str:
+    resp = requests.post(
+        f"{api_url}{path}",
+        json={"name": name, "content": "x"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    resp.raise_for_status()
+    return str(resp.json()["id"])
+
+
+def _names(api_url: str, token: str, path: str) -> List[str]:
+    resp = requests.get(
+        f"{api_url}{path}", headers={"Authorization": f"Bearer {token}"}
+    )
+    return sorted(row["name"] for row in resp.json()["content"])
+
+
+def _entries(journal: Path) -> List[dict]:
+    return [json.loads(line) for line in journal.read_text().splitlines()]
+
+
+def _add(kind: str, resource_id: str, api_url: str, token: str) -> dict:
+    return {
+        "op": "add",
+        "kind": kind,
+        "id": resource_id,
+        "api_url": api_url,
+        "token": token,
+    }
+
+
+def _drain(queue: CleanupQueue) -> int:
+    """Drain on a helper thread, failing instead of hanging the run."""
+    result: List[int] = []
+    waiter = threading.Thread(target=lambda: result.append(queue.drain()))
+    waiter.daemon = True
+    waiter.start()
+    waiter.join(timeout=10)
+    assert result, "drain() did not return"
+    return result[0]
+
+
+@pytest.fixture
+def cleanup_queue(tmp_path: Path, monkeypatch) -> CleanupQueue:
+    monkeypatch.setattr(cleanup, "BATCH_INTERVAL", 0.01)
+    return CleanupQueue(str(tmp_path), workers=2)
+
+
+@pytest.mark.unit
+class TestCleanupQueue:
+    """Verify background deletion, failure accounting and compaction."""
+
+    def test_deletes_and_compacts_to_identities(
+        self, fake_server: str, cleanup_queue: CleanupQueue
+    ) -> None:
+        token = _login(fake_server)
+        cleanup_queue.track_identity(fake_server, token)
+        for kind, path in (
+            ("project", "/projects"),
+            ("api_key", "/api-keys"),
+            ("asset", "/context-store/assets"),
+        ):
+            resource_id = _create(fake_server, token, path, f"{kind}-00000000")
+            entry = cleanup_queue.track(kind, resource_id, fake_server, token)
+            cleanup_queue.delete_later(entry)
+        assert _drain(cleanup_queue) == 0
+        assert _names(fake_server, token, "/projects") == []
+        assert _names(fake_server, token, "/api-keys") == []
+        assert _names(fake_server, token, "/context-store/assets") == []
+        assert _entries(cleanup_queue.journal) == [
+            {"op": "identity", "api_url": fake_server, "token": token}
+        ]
+
+    def test_unknown_kind_fails_without_hanging_drain(
+        self, fake_server: str, cleanup_queue: CleanupQueue
+    ) -> None:
+        token = _login(fake_server)
+        project_id = _create(fake_server, token, "/projects", "proj-00000000")
+        good = cleanup_queue.track("project", project_id, fake_server, token)
+        bad = cleanup_queue.track("widget", "7", fake_server, token)
+        cleanup_queue.delete_later(good)
+        cleanup_queue.delete_later(bad)
+        assert _drain(cleanup_queue) == 1
+        assert cleanup_queue.errors[0].startswith("widget 7: KeyError")
+        # The failed entry survives compaction so a sweep can retry it.
+        assert _entries(cleanup_queue.journal) == [bad]
+
+    def test_drain_for_one_token(
+        self, fake_server: str, cleanup_queue: CleanupQueue
+    ) -> None:
+        token = _login(fake_server)
+        project_id = _create(fake_server, token, "/projects", "proj-00000000")
+        entry = cleanup_queue.track("project", project_id, fake_server, token)
+        cleanup_queue.delete_later(entry)
+        cleanup_queue.drain(token)
+        assert _names(fake_server, token, "/projects") == []
+        # Nothing is queued for another identity, so this returns at once.
+        assert cleanup_queue.drain("someone-else") == 0
+
+    def test_journal_keeps_the_most_recent_identities(
+        self, fake_server: str, cleanup_queue: CleanupQueue, monkeypatch
+    ) -> None:
+        monkeypatch.setattr(cleanup, "MAX_JOURNAL_IDENTITIES", 2)
+        for token in ("first", "second", "third"):
+            cleanup_queue.track_identity(fake_server, token)
+        cleanup_queue.track_identity(fake_server, "second")
+        token = _login(fake_server)
+        project_id = _create(fake_server, token, "/projects", "proj-00000000")
+        entry = cleanup_queue.track("project", project_id, fake_server, token)
+        cleanup_queue.delete_later(entry)
+        _drain(cleanup_queue)
+        tokens = [e["token"] for e in _entries(cleanup_queue.journal)]
+        assert tokens == ["third", "second"]
+
+
+@pytest.mark.unit
+class TestSweepOrphans:
+    """Verify journal replay and the per-identity sweep of UI leftovers."""
+
+    @staticmethod
+    def _journal(journal_dir: Path, entries: list, pid: int = 999999999) -> Path:
+        """Write a journal; string entries are written as raw lines."""
+        lines = [e if isinstance(e, str) else json.dumps(e) for e in entries]
+        journal = journal_dir / f"gw0-{pid}.jsonl"
+        journal.write_text("".join(line + "\n" for line in lines))
+        return journal
+
+    def test_deletes_pending_entries_and_ui_leftovers(
+        self, fake_server: str, tmp_path: Path
+    ) -> None:
+        token = _login(fake_server)
+        pending = _create(fake_server, token, "/projects", "proj-aaaaaaaa")
+        _create(fake_server, token, "/projects", "e2e-proj-cccccccc")
+        _create(fake_server, token, "/projects", "Quarterly report")
+        _create(fake_server, token, "/api-keys", "test-key-1234abcd")
+        _create(fake_server, token, "/api-keys", "Production")
+        _create(fake_server, token, "/context-store/assets", "asset-0badc0de")
+        journal = self._journal(
+            tmp_path,
+            [
+                {"op": "identity", "api_url": fake_server, "token": token},
+                _add("project", pending, fake_server, token),
+            ],
+        )
+        assert sweep_orphans(str(tmp_path)) == (4, 0)
+        assert _names(fake_server, token, "/projects") == ["Quarterly report"]
+        assert _names(fake_server, token, "/api-keys") == ["Production"]
+        assert _names(fake_server, token, "/context-store/assets") == []
+        assert not journal.exists()
+
+    def test_done_entries_are_not_replayed(
+        self, fake_server: str, tmp_path: Path
+    ) -> None:
+        token = _login(fake_server)
+        kept = _create(fake_server, token, "/projects", "Kept")
+        self._journal(
+            tmp_path,
+            [
+                _add("project", kept, fake_server, token),
+                {"op": "done", "kind": "project", "id": kept},
+            ],
+        )
+        assert sweep_orphans(str(tmp_path)) == (0, 0)
+        assert _names(fake_server, token, "/projects") == ["Kept"]
+
+    def test_failed_entries_are_written_back(
+        self, fake_server: str, tmp_path: Path
+    ) -> None:
+        token = _login(fake_server)
+        project_id = _create(fake_server, token, "/projects", "Journaled")
+        failing = _add("widget", "7", fake_server, token)
+        journal = self._journal(
+            tmp_path,
+            [_add("project", project_id, fake_server, token), '{"op": "ad', failing],
+        )
+        assert sweep_orphans(str(tmp_path)) == (1, 1)
+        assert _entries(journal) == [failing]
+
+    def test_expired_identity_is_skipped(
+        self, fake_server: str, tmp_path: Path
+    ) -> None:
+        identity = {"op": "identity", "api_url": fake_server, "token": "expired"}
+        self._journal(tmp_path, [identity])
+        assert sweep_orphans(str(tmp_path)) == (0, 0)
+
+    def test_journal_of_a_running_process_is_left_alone(
+        self, fake_server: str, tmp_path: Path
+    ) -> None:
+        token = _login(fake_server)
+        project_id = _create(fake_server, token, "/projects", "proj-aaaaaaaa")
+        entries = [_add("project", project_id, fake_server, token)]
+        journal = self._journal(tmp_path, entries, pid=os.getppid())
+        assert sweep_orphans(str(tmp_path)) == (0, 0)
+        assert _entries(journal) == entries
+        assert _names(fake_server, token, "/projects") == ["proj-aaaaaaaa"]
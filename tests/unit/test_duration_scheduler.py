@@ -0,0 +1,137 @@
+"""Unit tests for longest-first xdist scheduling and makespan prediction."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List
+
+import pytest
+
+from utils import duration_scheduler
+from utils.duration_scheduler import (
+    DEFAULT_ESTIMATE,
+    DurationScheduling,
+    estimate_durations,
+    predict_makespan,
+)
+from utils.timing_store import TimingStore
+
+# Recorded seconds per test; ``new.py`` has no history.
+HISTORY = {
+    "slow.py::test_1": 20.0,
+    "slow.py::test_2": 20.0,
+    "mid.py::Mid::test_1": 15.0,
+    "fast.py::test_1": 1.0,
+    "fast.py::test_2": 1.0,
+    "tiny.py::test_1": 0.5,
+}
+COLLECTION = [*HISTORY, "new.py::test_1"]
+
+
+class _Node:
+    """Stand-in for an xdist worker node that records what it was sent."""
+
+    def __init__(self, name: str, collection: List[str]) -> None:
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.collection = collection
+        self.sent: List[List[str]] = []
+
+    def send_runtest_some(self, indexes: List[int]) -> None:
+        self.sent.append([self.collection[i] for i in indexes])
+
+    def shutdown(self) -> None:
+        self.shutting_down = True
+
+
+class _Config:
+    """The two options ``DurationScheduling`` reads."""
+
+    def __init__(self, workers: int, timing_db: str) -> None:
+        self._values = {"tx": ["popen"] * workers, "--timing-db": timing_db}
+
+    def getvalue(self, name: str):
+        return self._values[name]
+
+    def getoption(self, name: str):
+        return self._values[name]
+
+
+def _scheduled(tmp_path: Path, workers: int) -> Dict[str, List[List[str]]]:
+    """Schedule ``COLLECTION`` on fresh nodes; return each node's batches."""
+    db = str(tmp_path / "timings.sqlite")
+    store = TimingStore(db)
+    store.record([(nodeid, s, "passed") for nodeid, s in HISTORY.items()])
+    store.close()
+    scheduler = DurationScheduling(_Config(workers, db))
+    nodes = [_Node(f"gw{i}", COLLECTION) for i in range(workers)]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, COLLECTION)
+    scheduler.schedule()
+    return {node.gateway.id: node.sent for node in nodes}
+
+
+@pytest.mark.unit
+class TestPredictMakespan:
+    """Verify the longest-first simulation."""
+
+    def test_longest_first_packing(self) -> None:
+        # LPT puts 5|4, then 3 on each of the lighter workers in turn.
+        assert predict_makespan([3, 5, 3, 4, 3], 2) == 10
+
+    def test_one_worker_runs_everything(self) -> None:
+        assert predict_makespan([1.5, 2.5, 3.0], 1) == 7.0
+
+    def test_more_workers_than_work(self) -> None:
+        assert predict_makespan([2.0, 9.0], 4) == 9.0
+
+    def test_no_work(self) -> None:
+        assert predict_makespan([], 3) == 0.0
+
+    def test_zero_workers_count_as_one(self) -> None:
+        assert predict_makespan([1.0, 2.0], 0) == 3.0
+
+
+@pytest.mark.unit
+class TestEstimateDurations:
+    """Verify gaps are filled with the median known duration."""
+
+    def test_unknown_tests_get_the_median(self) -> None:
+        known = {"a": 1.0, "b": 2.0, "c": 9.0}
+        assert estimate_durations(["a", "new"], known) == {"a": 1.0, "new": 2.0}
+
+    def test_without_history(self) -> None:
+        assert estimate_durations(["new"], {}) == {"new": DEFAULT_ESTIMATE}
+
+
+@pytest.mark.unit
+class TestDurationScheduling:
+    """Verify scopes are dispatched longest-first from a recorded store."""
+
+    @pytest.fixture(autouse=True)
+    def _prediction(self, monkeypatch) -> Dict[str, float]:
+        prediction: Dict[str, float] = {}
+        monkeypatch.setattr(duration_scheduler, "_prediction", prediction)
+        return prediction
+
+    def test_longest_scopes_go_out_first(self, tmp_path: Path) -> None:
+        sent = _scheduled(tmp_path, workers=2)
+        assert sent["gw0"][0] == ["slow.py::test_1", "slow.py::test_2"]
+        assert sent["gw1"][0] == ["mid.py::Mid::test_1"]
+
+    def test_top_ups_are_the_shortest_scopes(self, tmp_path: Path) -> None:
+        sent = _scheduled(tmp_path, workers=2)
+        assert sent["gw0"][1] == ["tiny.py::test_1"]
+        assert sent["gw1"][1] == ["fast.py::test_1", "fast.py::test_2"]
+
+    def test_prediction_uses_scope_costs(
+        self, tmp_path: Path, _prediction: Dict[str, float]
+    ) -> None:
+        _scheduled(tmp_path, workers=2)
+        # new.py is unknown and costs the median recorded duration (8.0 s).
+        costs = [40.0, 15.0, 2.0, 0.5, 8.0]
+        assert _prediction["makespan"] == predict_makespan(costs, 2)
+        assert _prediction["workers"] == 2
+        assert _prediction["unknown"] == 1
@@ -0,0 +1,36 @@
+"""Unit tests for the failure artifacts plugin."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+
+OUTPUT_TEST = """
+from pathlib import Path
+
+from pages.artifact_manager import ARTIFACTS
+
+
+def test_output_dir(request):
+    expected = request.config.getoption("--output")
+    assert ARTIFACTS.output_dir == Path(expected)
+"""
+
+
+@pytest.mark.unit
+class TestOutputDir:
+    """Verify artifacts follow pytest-playwright's ``--output``."""
+
+    @pytest.mark.parametrize("args", [[], ["--output", "benchmark-results"]])
+    def test_artifacts_use_the_output_option(
+        self, pytester, monkeypatch, args: list
+    ) -> None:
+        monkeypatch.setenv("PYTHONPATH", str(ROOT))
+        pytester.makepyfile(test_output=OUTPUT_TEST)
+        result = pytester.runpytest_subprocess(
+            "-p", "utils.failure_artifacts", *args
+        )
+        result.assert_outcomes(passed=1)
@@ -0,0 +1,198 @@
+"""Unit tests for the in-memory fake of the Echostash API."""
+
+from __future__ import annotations
+
+import pytest
+import requests
+
+from utils.fake_api import FakeApiControl, FakeBackend
+
+
+def _login(backend: FakeBackend) -> str:
+    status, tokens = backend.handle("POST", "/auth/guest", None, None)
+    assert status == 200
+    return tokens["accessToken"]
+
+
+@pytest.mark.unit
+class TestFakeBackendAuth:
+    """Verify guest login, token refresh and authorization."""
+
+    def test_guest_login_and_me(self) -> None:
+        backend = FakeBackend()
+        token = _login(backend)
+        status, user = backend.handle("GET", "/auth/me", token, None)
+        assert status == 200
+        assert user["guest"] is True
+
+    def test_missing_token_is_unauthorized(self) -> None:
+        status, payload = FakeBackend().handle("GET", "/projects", None, None)
+        assert status == 401
+        assert payload == {"message": "unauthorized"}
+
+    def test_refresh_token_is_single_use(self) -> None:
+        backend = FakeBackend()
+        _, tokens = backend.handle("POST", "/auth/guest", None, None)
+        body = {"refreshToken": tokens["refreshToken"]}
+        status, refreshed = backend.handle("POST", "/auth/refresh", None, body)
+        assert status == 200
+        assert refreshed["user"] == tokens["user"]
+        assert backend.handle("POST", "/auth/refresh", None, body)[0] == 401
+
+    def test_unknown_route(self) -> None:
+        backend = FakeBackend()
+        status, _ = backend.handle("GET", "/nowhere", _login(backend), None)
+        assert status == 404
+
+
+@pytest.mark.unit
+class TestFakeBackendProjects:
+    """Verify project and prompt CRUD, scoped per guest."""
+
+    def test_project_lifecycle(self) -> None:
+        backend = FakeBackend()
+        token = _login(backend)
+        status, project = backend.handle(
+            "POST", "/projects", token, {"name": "demo"}
+        )
+        assert status == 201
+        path = f"/projects/{project['id']}"
+        status, fetched = backend.handle("GET", path, token, None)
+        assert (status, fetched["name"], fetched["promptCount"]) == (200, "demo", 0)
+        status, updated = backend.handle("PATCH", path, token, {"name": "renamed"})
+        assert updated["name"] == "renamed"
+        assert backend.handle("DELETE", path, token, None) == (204, None)
+        assert backend.handle("GET", path, token, None)[0] == 404
+
+    def test_project_requires_name(self) -> None:
+        backend = FakeBackend()
+        status, _ = backend.handle("POST", "/projects", _login(backend), {})
+        assert status == 400
+
+    def test_guests_only_see_their_own_projects(self) -> None:
+        backend = FakeBackend()
+        owner, other = _login(backend), _login(backend)
+        _, project = backend.handle("POST", "/projects", owner, {"name": "mine"})
+        path = f"/projects/{project['id']}"
+        assert backend.handle("GET", path, other, None)[0] == 404
+        _, page = backend.handle("GET", "/projects", other, None)
+        assert page == {"content": [], "totalElements": 0}
+        _, page = backend.handle("GET", "/projects/", owner, None)
+        assert page["totalElements"] == 1
+
+    def test_prompt_edits_add_versions(self) -> None:
+        backend = FakeBackend()
+        token = _login(backend)
+        _, project = backend.handle("POST", "/projects", token, {"name": "p"})
+        _, prompt = backend.handle(
+            "POST",
+            f"/projects/{project['id']}/prompts",
+            token,
+            {"name": "greet", "content": "Hello"},
+        )
+        path = f"/prompts/{prompt['id']}"
+        backend.handle("PUT", path, token, {"content": "Hello {{name}}"})
+        _, versions = backend.handle("GET", f"{path}/versions", token, None)
+        assert [v["content"] for v in versions["content"]] == [
+            "Hello",
+            "Hello {{name}}",
+        ]
+        status, version = backend.handle("GET", f"{path}/versions/2", token, None)
+        assert (status, version["number"]) == (200, 2)
+        assert backend.handle("GET", f"{path}/versions/3", token, None)[0] == 404
+
+    def test_deleting_a_project_deletes_its_prompts(self) -> None:
+        backend = FakeBackend()
+        token = _login(backend)
+        _, project = backend.handle("POST", "/projects", token, {"name": "p"})
+        _, prompt = backend.handle(
+            "POST", f"/projects/{project['id']}/prompts", token, {"name": "x"}
+        )
+        backend.handle("DELETE", f"/projects/{project['id']}", token, None)
+        assert backend.handle("GET", f"/prompts/{prompt['id']}", token, None)[0] == 404
+
+
+@pytest.mark.unit
+class TestFakeBackendOtherResources:
+    """Verify API keys, context-store assets and eval runs."""
+
+    def test_api_key_create_and_delete(self) -> None:
+        backend = FakeBackend()
+        token = _login(backend)
+        status, key = backend.handle("POST", "/api-keys", token, {"name": "ci"})
+        assert status == 201
+        assert key["key"].startswith(key["prefix"])
+        path = f"/api-keys/{key['id']}"
+        assert backend.handle("DELETE", path, token, None) == (204, None)
+        assert backend.handle("DELETE", path, token, None)[0] == 404
+
+    def test_asset_size_is_in_bytes(self) -> None:
+        backend = FakeBackend()
+        token = _login(backend)
+        _, asset = backend.handle(
+            "POST", "/context-store/assets", token, {"content": "héllo"}
+        )
+        assert asset["size"] == 6
+
+    def test_eval_run_advances_on_every_poll(self) -> None:
+        backend = FakeBackend()
+        token = _login(backend)
+        _, run = backend.handle("POST", "/evals/runs", token, {"promptId": 1})
+        assert run["status"] == "queued"
+        path = f"/evals/runs/{run['id']}"
+        statuses = [backend.handle("GET", path, token, None)[1]["status"]]
+        statuses.append(backend.handle("GET", path, token, None)[1]["status"])
+        assert statuses == ["running", "completed"]
+        _, done = backend.handle("GET", path, token, None)
+        assert done["status"] == "completed"
+        assert done["results"]
+
+
+@pytest.mark.unit
+class TestFakeBackendFaults:
+    """Verify injected errors and their scoping."""
+
+    def test_fault_is_limited_by_times(self) -> None:
+        backend = FakeBackend()
+        token = _login(backend)
+        backend.inject("GET", "/projects", status=503, times=1)
+        assert backend.handle("GET", "/projects", token, None)[0] == 503
+        assert backend.handle("GET", "/projects", token, None)[0] == 200
+        assert backend.injected == 1
+
+    def test_fault_is_limited_to_a_token(self) -> None:
+        backend = FakeBackend()
+        target, bystander = _login(backend), _login(backend)
+        backend.inject("*", "/projects/{id}", status=500, token=target)
+        _, project = backend.handle("POST", "/projects", bystander, {"name": "b"})
+        path = f"/projects/{project['id']}"
+        assert backend.handle("GET", path, bystander, None)[0] == 200
+        assert backend.handle("GET", path, target, None)[0] == 500
+
+    def test_clear_removes_only_the_owners_faults(self) -> None:
+        backend = FakeBackend()
+        token = _login(backend)
+        backend.inject("GET", "/projects", status=500, owner="a")
+        backend.inject("GET", "/api-keys", status=500, owner="b")
+        backend.clear("a")
+        assert backend.handle("GET", "/projects", token, None)[0] == 200
+        assert backend.handle("GET", "/api-keys", token, None)[0] == 500
+        backend.clear()
+        assert backend.handle("GET", "/api-keys", token, None)[0] == 200
+
+
+@pytest.mark.unit
+class TestFakeApiServer:
+    """Verify the HTTP front end and the cross-process control client."""
+
+    def test_control_injects_and_clears_faults(self, fake_server: str) -> None:
+        control = FakeApiControl(fake_server, owner="test")
+        token = requests.post(f"{fake_server}/auth/guest").json()["accessToken"]
+        headers = {"Authorization": f"Bearer {token}"}
+        control.inject("GET", "/projects", status=503)
+        resp = requests.get(f"{fake_server}/projects", headers=headers)
+        assert resp.status_code == 503
+        control.clear()
+        resp = requests.get(f"{fake_server}/projects", headers=headers)
+        assert resp.json()["totalElements"] == 0
+        assert control.stats() == {"served": 3, "injected": 1}
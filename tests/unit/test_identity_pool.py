@@ -0,0 +1,73 @@
+"""Unit tests for the worker-scoped guest identity pool."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from utils.identity_pool import GuestIdentityPool
+
+BASE_URL = "https://app.example.test/"
+
+
+@pytest.mark.unit
+class TestGuestIdentityPool:
+    """Verify reuse, rotation, fresh identities and the saved storage state."""
+
+    def _pool(self, fake_server: str, tmp_path: Path, max_uses: int):
+        return GuestIdentityPool(fake_server, BASE_URL, tmp_path, max_uses=max_uses)
+
+    def test_identity_rotates_after_max_uses(
+        self, fake_server: str, tmp_path: Path
+    ) -> None:
+        pool = self._pool(fake_server, tmp_path, max_uses=2)
+        first, second, third = pool.acquire(), pool.acquire(), pool.acquire()
+        assert first is second
+        assert third is not first
+        assert (first.uses, third.uses) == (2, 1)
+        assert third.access_token != first.access_token
+        assert pool.logins == 2
+
+    def test_zero_max_uses_keeps_one_identity(
+        self, fake_server: str, tmp_path: Path
+    ) -> None:
+        pool = self._pool(fake_server, tmp_path, max_uses=0)
+        identities = {id(pool.acquire()) for _ in range(25)}
+        assert len(identities) == 1
+        assert pool.logins == 1
+
+    def test_fresh_identity_is_not_shared(
+        self, fake_server: str, tmp_path: Path
+    ) -> None:
+        pool = self._pool(fake_server, tmp_path, max_uses=10)
+        pooled = pool.acquire()
+        fresh = pool.fresh()
+        assert fresh is not pooled
+        assert fresh.uses == 1
+        assert pool.acquire() is pooled
+        assert pooled.uses == 2
+
+    def test_storage_state_holds_the_auth_cookie(
+        self, fake_server: str, tmp_path: Path
+    ) -> None:
+        identity = self._pool(fake_server, tmp_path, max_uses=0).acquire()
+        assert identity.storage_state.parent == tmp_path
+        state = json.loads(identity.storage_state.read_text())
+        assert state["origins"] == []
+        [cookie] = state["cookies"]
+        assert cookie["name"] == "echostash_token"
+        assert cookie["value"] == identity.access_token
+        assert cookie["domain"] == "app.example.test"
+        assert cookie["secure"] is True
+
+    def test_tokens_match_the_login_payload(
+        self, fake_server: str, tmp_path: Path
+    ) -> None:
+        identity = self._pool(fake_server, tmp_path, max_uses=0).acquire()
+        assert identity.tokens == {
+            "accessToken": identity.access_token,
+            "refreshToken": identity.refresh_token,
+        }
+        assert identity.refresh_token
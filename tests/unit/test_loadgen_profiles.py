@@ -0,0 +1,63 @@
+"""Unit tests for the load generator's ramp profiles and journey mixes."""
+
+from __future__ import annotations
+
+import pytest
+
+from loadgen.profiles import MIXES, parse_mix, start_offsets
+
+JOURNEYS = ["browse", "author", "evals"]
+
+
+@pytest.mark.unit
+class TestParseMix:
+    """Verify named and explicit journey mixes."""
+
+    def test_named_mix_is_a_copy(self) -> None:
+        mix = parse_mix("browse-heavy", JOURNEYS)
+        assert mix == MIXES["browse-heavy"]
+        mix["browse"] = 0
+        assert MIXES["browse-heavy"]["browse"] == 70
+
+    def test_explicit_weights(self) -> None:
+        assert parse_mix("browse=3, author=1", JOURNEYS) == {
+            "browse": 3,
+            "author": 1,
+        }
+
+    def test_missing_weight_defaults_to_one(self) -> None:
+        assert parse_mix("author", JOURNEYS) == {"author": 1}
+
+    def test_zero_weights_are_dropped(self) -> None:
+        assert parse_mix("browse=0,author=2", JOURNEYS) == {"author": 2}
+
+    @pytest.mark.parametrize("spec", ["shop=1", "browse=0", "browse=x"])
+    def test_invalid(self, spec: str) -> None:
+        with pytest.raises(ValueError):
+            parse_mix(spec, JOURNEYS)
+
+
+@pytest.mark.unit
+class TestStartOffsets:
+    """Verify ramp-up schedules."""
+
+    def test_none(self) -> None:
+        assert start_offsets(3, "none") == [0.0, 0.0, 0.0]
+
+    def test_linear(self) -> None:
+        assert start_offsets(4, "linear:60") == [0.0, 15.0, 30.0, 45.0]
+
+    def test_step(self) -> None:
+        assert start_offsets(6, "step:3x10") == [0.0, 0.0, 10.0, 10.0, 20.0, 20.0]
+
+    def test_more_steps_than_users(self) -> None:
+        offsets = start_offsets(2, "step:4x5")
+        assert offsets == sorted(offsets)
+        assert len(offsets) == 2
+
+    @pytest.mark.parametrize(
+        "ramp", ["none:5", "linear", "linear:soon", "step:3", "burst:10"]
+    )
+    def test_invalid(self, ramp: str) -> None:
+        with pytest.raises(ValueError):
+            start_offsets(5, ramp)
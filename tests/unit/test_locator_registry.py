@@ -0,0 +1,97 @@
+"""Unit tests for the locator fallback registry."""
+
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+
+from pages.locator_registry import LocatorRegistry
+
+
+class FakeLocator:
+    """Locator stand-in matching a fixed number of elements."""
+
+    def __init__(self, name: str, matches: int, counts: List[str]) -> None:
+        self.name = name
+        self.matches = matches
+        self._counts = counts
+
+    @property
+    def first(self) -> "FakeLocator":
+        return FakeLocator(f"{self.name}.first", min(self.matches, 1), self._counts)
+
+    def or_(self, other: "FakeLocator") -> "FakeLocator":
+        return FakeLocator(
+            f"{self.name}|{other.name}", self.matches + other.matches, self._counts
+        )
+
+    def count(self) -> int:
+        self._counts.append(self.name)
+        return self.matches
+
+
+class FakePage:
+    """Page stand-in on a fixed origin and build."""
+
+    url = "http://localhost:3000/dashboard"
+
+    def evaluate(self, script: str) -> str:
+        return "build-1"
+
+
+@pytest.fixture
+def registry(tmp_path) -> LocatorRegistry:
+    """An enabled registry backed by a temporary cache file."""
+    registry = LocatorRegistry()
+    registry.load(str(tmp_path / "locators.json"))
+    return registry
+
+
+@pytest.mark.unit
+class TestLocatorRegistry:
+    """Verify learning, proven hits and the chain fallback."""
+
+    def test_learns_the_first_matching_alternative(self, registry) -> None:
+        counts: List[str] = []
+        label = FakeLocator("label", 0, counts)
+        placeholder = FakeLocator("placeholder", 1, counts)
+        located = registry.resolve(FakePage(), "Form.name", [label, placeholder])
+        assert located.name == "placeholder.first"
+        assert counts == ["label.first", "placeholder.first"]
+
+    def test_proven_alternative_is_used_alone(self, registry) -> None:
+        counts: List[str] = []
+        candidates = [FakeLocator("a", 0, counts), FakeLocator("b", 1, counts)]
+        registry.resolve(FakePage(), "key", candidates)
+        counts.clear()
+        located = registry.resolve(FakePage(), "key", candidates)
+        assert located.name == "b.first"
+        assert counts == ["b.first"]
+        assert registry.drain_stats()["key"][:3] == [2, 1, 1]
+
+    def test_falls_back_to_the_chain_when_the_proven_one_misses(
+        self, registry
+    ) -> None:
+        counts: List[str] = []
+        a, b = FakeLocator("a", 0, counts), FakeLocator("b", 1, counts)
+        registry.resolve(FakePage(), "key", [a, b])
+        b.matches = 0
+        assert registry.resolve(FakePage(), "key", [a, b]).name == "a|b.first"
+
+    def test_nothing_matching_yet_returns_the_chain(self, registry) -> None:
+        counts: List[str] = []
+        candidates = [FakeLocator("a", 0, counts), FakeLocator("b", 0, counts)]
+        assert registry.resolve(FakePage(), "key", candidates).name == "a|b.first"
+        assert registry.drain_stats()["key"][2] == 0
+
+    def test_learned_entries_persist(self, registry, tmp_path) -> None:
+        counts: List[str] = []
+        candidates = [FakeLocator("a", 0, counts), FakeLocator("b", 1, counts)]
+        registry.resolve(FakePage(), "key", candidates)
+        registry.save()
+        reloaded = LocatorRegistry()
+        reloaded.load(str(tmp_path / "locators.json"))
+        counts.clear()
+        assert reloaded.resolve(FakePage(), "key", candidates).name == "b.first"
+        assert counts == ["b.first"]
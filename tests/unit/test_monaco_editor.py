@@ -0,0 +1,32 @@
+"""Unit tests for the Monaco editor's bulk content helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from pages.monaco_editor import _chunks
+
+
+@pytest.mark.unit
+class TestChunks:
+    """Verify editor text is split at line breaks within the size limit."""
+
+    def test_pieces_rejoin_to_the_text(self) -> None:
+        text = "first line\nsecond\n\nthird line is longer\nend"
+        pieces = list(_chunks(text, 12))
+        assert "".join(pieces) == text
+        assert all(len(piece) <= 12 for piece in pieces)
+
+    def test_splits_after_line_breaks(self) -> None:
+        assert list(_chunks("ab\ncd\nef", 6)) == ["ab\ncd\n", "ef"]
+
+    def test_long_lines_are_split_mid_line(self) -> None:
+        assert list(_chunks("abcdefgh", 3)) == ["abc", "def", "gh"]
+
+    def test_crlf_is_never_split(self) -> None:
+        pieces = list(_chunks("abc\r\ndef", 4))
+        assert "".join(pieces) == "abc\r\ndef"
+        assert not any(piece.endswith("\r") for piece in pieces)
+
+    def test_empty(self) -> None:
+        assert list(_chunks("", 10)) == []
@@ -0,0 +1,46 @@
+"""Unit tests for the endpoint templating behind ``--api-latency``."""
+
+from __future__ import annotations
+
+import pytest
+
+from utils.network_observer import endpoint_template
+
+
+@pytest.mark.unit
+class TestEndpointTemplate:
+    """Verify that ID-like segments collapse and query strings are dropped."""
+
+    def test_uuid_segment(self) -> None:
+        path = "/projects/3f2b8c1e-9a4d-4e6f-8b2a-1c3d5e7f9a0b/prompts"
+        assert endpoint_template(path) == "/projects/{id}/prompts"
+
+    def test_uppercase_uuid_segment(self) -> None:
+        path = "/projects/3F2B8C1E-9A4D-4E6F-8B2A-1C3D5E7F9A0B"
+        assert endpoint_template(path) == "/projects/{id}"
+
+    def test_numeric_segments(self) -> None:
+        assert endpoint_template("/projects/42/prompts/7") == (
+            "/projects/{id}/prompts/{id}"
+        )
+
+    def test_long_token_segments(self) -> None:
+        assert endpoint_template("/assets/65a1f0c2b3d4e5f6a7b8c9d0") == "/assets/{id}"
+        assert endpoint_template("/share/AbCdEfGhIjKlMnOpQrStUv") == "/share/{id}"
+
+    def test_words_are_kept(self) -> None:
+        assert endpoint_template("/context-store/assets") == "/context-store/assets"
+        assert endpoint_template("/prompts/v2/render") == "/prompts/v2/render"
+
+    def test_query_string_is_dropped(self) -> None:
+        assert endpoint_template("/projects?page=2&size=20") == "/projects"
+        assert endpoint_template("/projects/42/prompts?q=abc") == (
+            "/projects/{id}/prompts"
+        )
+
+    def test_fragment_is_dropped(self) -> None:
+        assert endpoint_template("/projects/42#section") == "/projects/{id}"
+
+    def test_root(self) -> None:
+        assert endpoint_template("") == "/"
+        assert endpoint_template("/") == "/"
@@ -0,0 +1,159 @@
+"""Unit tests for the per-route performance budgets."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from utils.perf_budget import check_budgets, load_budgets
+
+ROOT = Path(__file__).resolve().parents[2]
+
+BUDGETED_TESTS = """
+import pytest
+
+from pages.web_vitals import VITALS
+
+SLOW = [{"route": "/dashboard", "lcp_ms": 99999.0}]
+
+
+@pytest.mark.perf_budget
+def test_over_budget():
+    VITALS.extend(SLOW)
+
+
+@pytest.mark.perf_budget(severity="warn")
+def test_over_budget_warns():
+    VITALS.extend(SLOW)
+
+
+@pytest.mark.perf_budget
+def test_in_budget():
+    VITALS.extend([{"route": "/dashboard", "lcp_ms": 10.0}])
+
+
+def test_not_budgeted():
+    VITALS.extend(SLOW)
+"""
+
+ENV_OPTION = """
+def pytest_addoption(parser):
+    parser.addoption("--env", default="prod")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "perf_budget: budgeted page loads")
+"""
+
+
+@pytest.mark.unit
+class TestLoadBudgets:
+    """Verify the budget files and how route limits inherit the default."""
+
+    @pytest.mark.parametrize("env", ["local", "stage", "prod"])
+    def test_every_route_has_every_limit(self, env: str) -> None:
+        budgets = load_budgets(env)
+        metrics = set(budgets["default"])
+        assert metrics == {"lcp_ms", "transfer_bytes", "requests", "long_task_ms"}
+        for limits in budgets.values():
+            assert set(limits) == metrics
+
+    def test_route_overrides_the_default(self) -> None:
+        budgets = load_budgets("prod")
+        assert budgets["/dashboard"]["lcp_ms"] < budgets["default"]["lcp_ms"]
+        assert budgets["/dashboard"]["requests"] == budgets["default"]["requests"]
+
+    def test_unknown_env_has_no_budgets(self) -> None:
+        assert load_budgets("nowhere") == {}
+
+
+@pytest.mark.unit
+class TestCheckBudgets:
+    """Verify sample measurements against the prod budgets."""
+
+    budgets = load_budgets("prod")
+
+    def test_in_budget(self) -> None:
+        records = [
+            {"route": "/dashboard", "lcp_ms": 1500.0, "requests": 40},
+            {"route": "/prompt-builder", "lcp_ms": 2900.0, "requests": 125},
+        ]
+        assert check_budgets(records, self.budgets) == []
+
+    def test_route_limit_is_exceeded(self) -> None:
+        limit = self.budgets["/dashboard"]["lcp_ms"]
+        records = [{"route": "/dashboard", "lcp_ms": limit + 100}]
+        assert check_budgets(records, self.budgets) == [
+            f"/dashboard: lcp_ms {limit + 100:.0f} > budget {limit:.0f}"
+        ]
+
+    def test_the_limit_itself_is_in_budget(self) -> None:
+        limit = self.budgets["/dashboard"]["lcp_ms"]
+        records = [{"route": "/dashboard", "lcp_ms": limit}]
+        assert check_budgets(records, self.budgets) == []
+
+    def test_unlisted_route_uses_the_default(self) -> None:
+        limit = self.budgets["default"]["requests"]
+        records = [{"route": "/settings", "requests": limit + 1}]
+        assert check_budgets(records, self.budgets) == [
+            f"/settings: requests {limit + 1} > budget {limit}"
+        ]
+
+    def test_every_exceeded_metric_is_reported(self) -> None:
+        records = [
+            {
+                "route": "/analytics",
+                "lcp_ms": 10000.0,
+                "transfer_bytes": 1e9,
+                "long_task_ms": 5000.0,
+                "requests": 1,
+            }
+        ]
+        violations = check_budgets(records, self.budgets)
+        assert [v.split()[1] for v in violations] == [
+            "lcp_ms",
+            "transfer_bytes",
+            "long_task_ms",
+        ]
+
+    def test_missing_metrics_are_skipped(self) -> None:
+        records = [{"route": "/dashboard", "lcp_ms": None}]
+        assert check_budgets(records, self.budgets) == []
+
+    def test_no_budgets(self) -> None:
+        assert check_budgets([{"route": "/dashboard", "lcp_ms": 1e9}], {}) == []
+
+
+@pytest.mark.unit
+class TestSeverity:
+    """Verify an overrun fails the test or only warns."""
+
+    @pytest.fixture
+    def run(self, pytester, monkeypatch):
+        monkeypatch.setenv("PYTHONPATH", str(ROOT))
+        pytester.makeconftest(ENV_OPTION)
+        pytester.makepyfile(test_budgeted=BUDGETED_TESTS)
+
+        def run(*args: str):
+            return pytester.runpytest_subprocess(
+                "-p", "utils.web_vitals_report", "-p", "utils.perf_budget", *args
+            )
+
+        return run
+
+    def test_fail_by_default_unless_the_marker_warns(self, run) -> None:
+        result = run()
+        result.assert_outcomes(passed=3, failed=1, warnings=1)
+        result.stdout.fnmatch_lines(
+            [
+                "*performance budget exceeded:",
+                "*/dashboard: lcp_ms 99999 > budget *",
+                "*PerfBudgetWarning*",
+                "FAILED test_budgeted.py::test_over_budget *",
+            ]
+        )
+
+    def test_warn_severity_option(self, run) -> None:
+        result = run("--perf-budget-severity", "warn")
+        result.assert_outcomes(passed=4, warnings=2)
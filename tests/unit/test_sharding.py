@@ -0,0 +1,60 @@
+"""Unit tests for duration-balanced shard planning."""
+
+from __future__ import annotations
+
+import pytest
+
+from utils.sharding import _parse_shard, plan_shards
+
+
+@pytest.mark.unit
+class TestPlanShards:
+    """Verify the partition is complete, balanced and deterministic."""
+
+    def test_every_test_lands_on_exactly_one_shard(self) -> None:
+        nodeids = [f"t{i}" for i in range(10)]
+        known = {"t0": 9.0, "t1": 4.0, "t2": 1.0}
+        shards, _ = plan_shards(nodeids, known, 3)
+        assigned = [nodeid for shard in shards for nodeid in shard]
+        assert sorted(assigned) == sorted(nodeids)
+
+    def test_measured_tests_are_packed_longest_first(self) -> None:
+        known = {"a": 8.0, "b": 5.0, "c": 4.0, "d": 3.0}
+        shards, loads = plan_shards(list(known), known, 2)
+        assert shards == [["a", "d"], ["b", "c"]]
+        assert loads == [11.0, 9.0]
+
+    def test_unknown_tests_are_dealt_round_robin(self) -> None:
+        shards, loads = plan_shards(["x", "y", "z"], {}, 2)
+        assert shards == [["x", "z"], ["y"]]
+        assert loads == [10.0, 5.0]
+
+    def test_unknown_tests_are_estimated_at_the_median(self) -> None:
+        known = {"a": 2.0, "b": 6.0}
+        _, loads = plan_shards(["a", "b", "new"], known, 1)
+        assert loads == [12.0]
+
+    def test_collection_order_does_not_change_the_split(self) -> None:
+        nodeids = [f"t{i}" for i in range(7)]
+        known = {"t1": 3.0, "t4": 3.0, "t6": 1.0}
+        forward = plan_shards(nodeids, known, 3)
+        backward = plan_shards(list(reversed(nodeids)), known, 3)
+        assert forward == backward
+
+    def test_more_shards_than_tests(self) -> None:
+        shards, loads = plan_shards(["only"], {"only": 2.0}, 3)
+        assert shards == [["only"], [], []]
+        assert loads == [2.0, 0.0, 0.0]
+
+
+@pytest.mark.unit
+class TestParseShard:
+    """Verify ``--shard`` validation."""
+
+    def test_valid(self) -> None:
+        assert _parse_shard("2/4") == (2, 4)
+
+    @pytest.mark.parametrize("value", ["0/4", "5/4", "2", "a/b", "1/2/3"])
+    def test_invalid(self, value: str) -> None:
+        with pytest.raises(pytest.UsageError):
+            _parse_shard(value)
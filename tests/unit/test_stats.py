@@ -0,0 +1,76 @@
+"""Unit tests for the statistics helpers shared by the reporting plugins."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from utils.stats import Histogram, percentile
+
+
+@pytest.mark.unit
+class TestPercentile:
+    """Verify nearest-rank percentiles."""
+
+    def test_nearest_rank(self) -> None:
+        values = [5.0, 1.0, 4.0, 2.0, 3.0]
+        assert percentile(values, 50) == 3.0
+        assert percentile(values, 95) == 5.0
+        assert percentile(values, 0) == 1.0
+
+    def test_no_samples(self) -> None:
+        assert percentile([], 95) == 0.0
+
+
+@pytest.mark.unit
+class TestHistogram:
+    """Verify bounded-error percentiles, merging and serialization."""
+
+    def test_percentiles_stay_within_precision(self) -> None:
+        rng = random.Random(7)
+        samples = [rng.lognormvariate(4, 1) for _ in range(5000)]
+        histogram = Histogram(precision=0.02)
+        for sample in samples:
+            histogram.record(sample)
+        for pct in (50, 90, 99):
+            exact = percentile(samples, pct)
+            assert histogram.percentile(pct) == pytest.approx(exact, rel=0.02)
+
+    def test_reported_values_never_exceed_the_max(self) -> None:
+        for value in (1.0, 3.3, 47.0, 100.0, 999.0):
+            histogram = Histogram()
+            histogram.record(value)
+            assert histogram.percentile(100) <= value
+            assert histogram.percentile(100) == pytest.approx(value, rel=0.02)
+
+    def test_values_below_lowest_count_as_zero(self) -> None:
+        histogram = Histogram(lowest=1.0)
+        histogram.record(0.5)
+        assert histogram.percentile(50) == 0.0
+        assert histogram.count == 1
+
+    def test_empty(self) -> None:
+        assert Histogram().percentile(50) == 0.0
+
+    def test_merge_equals_recording_everything(self) -> None:
+        left, right, combined = Histogram(), Histogram(), Histogram()
+        for value in range(1, 200):
+            (left if value % 2 else right).record(float(value))
+            combined.record(float(value))
+        left.merge(right)
+        assert left.counts == combined.counts
+        assert (left.count, left.total, left.max) == (
+            combined.count,
+            combined.total,
+            combined.max,
+        )
+
+    def test_dict_round_trip(self) -> None:
+        histogram = Histogram(precision=0.01, lowest=0.5)
+        for value in (0.1, 1.0, 10.0, 10.0, 250.0):
+            histogram.record(value)
+        restored = Histogram.from_dict(histogram.to_dict())
+        assert restored.counts == histogram.counts
+        assert restored.count == histogram.count
+        assert restored.percentile(80) == histogram.percentile(80)
@@ -0,0 +1,60 @@
+"""Unit tests for the SQLite store of historical test durations."""
+
+from __future__ import annotations
+
+import statistics
+from pathlib import Path
+
+import pytest
+
+from utils.timing_store import KEEP_RUNS, TimingStore
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    timings = TimingStore(str(tmp_path / "timings" / "timings.sqlite"))
+    yield timings
+    timings.close()
+
+
+@pytest.mark.unit
+class TestTimingStore:
+    """Verify recording, pruning and median estimates."""
+
+    def test_creates_the_database_directory(
+        self, store: TimingStore, tmp_path: Path
+    ) -> None:
+        assert (tmp_path / "timings" / "timings.sqlite").exists()
+        assert store.estimates() == {}
+
+    def test_estimate_is_the_median_run(self, store: TimingStore) -> None:
+        for seconds in (4.0, 1.0, 30.0):
+            store.record([("t.py::test_a", seconds, "passed")])
+        store.record([("t.py::test_b", 2.0, "failed")])
+        assert store.estimates() == {"t.py::test_a": 4.0, "t.py::test_b": 2.0}
+
+    def test_only_the_latest_runs_are_kept(self, store: TimingStore) -> None:
+        runs = [float(n) for n in range(1, KEEP_RUNS + 3)]
+        for seconds in runs:
+            store.record([("t.py::test_a", seconds, "passed")])
+        (count,) = store._conn.execute("SELECT COUNT(*) FROM durations").fetchone()
+        assert count == KEEP_RUNS
+        latest = runs[-KEEP_RUNS:]
+        assert store.estimates()["t.py::test_a"] == statistics.median(latest)
+
+    def test_pruning_is_per_test(self, store: TimingStore) -> None:
+        store.record([("t.py::test_rare", 9.0, "passed")])
+        for _ in range(KEEP_RUNS + 1):
+            store.record([("t.py::test_often", 1.0, "passed")])
+        assert store.estimates()["t.py::test_rare"] == 9.0
+
+    def test_history_survives_reopening(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "timings.sqlite")
+        first = TimingStore(path)
+        first.record([("t.py::test_a", 3.0, "passed")])
+        first.close()
+        second = TimingStore(path)
+        try:
+            assert second.estimates() == {"t.py::test_a": 3.0}
+        finally:
+            second.close()
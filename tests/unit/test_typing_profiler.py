@@ -0,0 +1,65 @@
+"""Unit tests for the typing profiler's frame-drop counters."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pages.typing_profiler import raf_frame_drops, trace_frame_drops
+
+
+def _frame(state: str, pid: int = 10, phase: str = "b") -> dict:
+    return {
+        "name": "PipelineReporter",
+        "ph": phase,
+        "pid": pid,
+        "args": {"chrome_frame_reporter": {"state": state}},
+    }
+
+
+@pytest.mark.unit
+class TestRafFrameDrops:
+    """Verify drops estimated from animation frame timestamps."""
+
+    def test_steady_frames(self) -> None:
+        frames = [i * 16.7 for i in range(10)]
+        assert raf_frame_drops(frames) == {"frames": 10, "dropped_frames": 0}
+
+    def test_gap_of_three_intervals_drops_two(self) -> None:
+        frames = [0.0, 16.0, 32.0, 80.0, 96.0]
+        assert raf_frame_drops(frames) == {"frames": 5, "dropped_frames": 2}
+
+    @pytest.mark.parametrize("frames", [[], [5.0]])
+    def test_too_few_frames(self, frames: list) -> None:
+        assert raf_frame_drops(frames) == {"frames": len(frames), "dropped_frames": 0}
+
+
+@pytest.mark.unit
+class TestTraceFrameDrops:
+    """Verify frame reports are counted from a Chromium trace."""
+
+    def test_counts_presented_and_dropped(self) -> None:
+        events = [
+            _frame("STATE_PRESENTED_ALL"),
+            _frame("STATE_PRESENTED_PARTIAL"),
+            _frame("STATE_DROPPED"),
+            _frame("STATE_DROPPED", phase="e"),
+            _frame("STATE_NO_UPDATE_DESIRED"),
+        ]
+        trace = json.dumps({"traceEvents": events}).encode()
+        assert trace_frame_drops(trace) == {"frames": 3, "dropped_frames": 1}
+
+    def test_only_counts_the_page_renderer(self) -> None:
+        started = {
+            "name": "TracingStartedInBrowser",
+            "args": {"data": {"frames": [{"processId": 10}]}},
+        }
+        events = [started, _frame("STATE_DROPPED", pid=10)]
+        events.append(_frame("STATE_DROPPED", pid=99))
+        trace = json.dumps(events).encode()
+        assert trace_frame_drops(trace) == {"frames": 1, "dropped_frames": 1}
+
+    def test_no_frame_reports(self) -> None:
+        trace = json.dumps({"traceEvents": [{"name": "Other"}]}).encode()
+        assert trace_frame_drops(trace) is None
@@ -0,0 +1,37 @@
+"""Unit tests for the web vitals report plugin."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+
+MEASURED_TEST = """
+from pages.web_vitals import VITALS
+
+
+def test_open_dashboard():
+    VITALS.extend([{"route": "/dashboard", "ttfb_ms": 120.0, "lcp_ms": 900.0}])
+"""
+
+
+@pytest.mark.unit
+class TestWebVitalsFile:
+    """Verify the JSONL file survives pytest-playwright's output cleanup."""
+
+    def test_records_are_written(self, pytester, monkeypatch) -> None:
+        monkeypatch.setenv("PYTHONPATH", str(ROOT))
+        pytester.makepyfile(test_measured=MEASURED_TEST)
+        result = pytester.runpytest_subprocess(
+            "-p", "utils.web_vitals_report", "--web-vitals"
+        )
+        result.assert_outcomes(passed=1)
+        path = pytester.path / "test-results" / "web-vitals.jsonl"
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [(r["test"], r["route"]) for r in records] == [
+            ("test_measured.py::test_open_dashboard", "/dashboard")
+        ]
+        result.stdout.fnmatch_lines(["*web vitals per route*", "/dashboard *"])
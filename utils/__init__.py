@@ -1,10 +1,12 @@
 """Shared utilities for Echostash UI automation."""
 
+from utils.api_client import EchostashApiClient, get_api_client
 from utils.helpers import (
     api_create_project,
     api_create_prompt,
     api_delete_project,
     api_login_guest,
+    build_auth_cookie,
     get_monaco_value,
     random_email,
     random_prompt_content,
@@ -16,10 +18,13 @@ from utils.helpers import (
 )
 
 __all__ = [
+    "EchostashApiClient",
     "api_create_project",
     "api_create_prompt",
     "api_delete_project",
     "api_login_guest",
+    "build_auth_cookie",
+    "get_api_client",
     "get_monaco_value",
     "random_email",
     "random_prompt_content",
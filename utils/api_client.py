@@ -0,0 +1,478 @@
+"""Pooled, retrying client for the Echostash backend API.
+
+One ``EchostashApiClient`` per worker keeps a keep-alive connection pool to
+the backend, retries idempotent requests on 429/502/503/504 responses and
+connection errors with exponential backoff (honouring ``Retry-After``; a
+``POST`` is only retried when it was refused with 429 or never connected,
+so a retry cannot create a second project) and throttles requests through a token bucket
+whose state lives in a lock-protected file, so every xdist worker on the
+machine shares the same budget.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import fcntl
+except ImportError:  # Windows: throttle per process only
+    fcntl = None
+
+
+class RateLimiter:
+    """Token bucket shared between processes through a locked state file."""
+
+    def __init__(self, rate: float, path: str, burst: Optional[float] = None) -> None:
+        """Initialize RateLimiter.
+
+        Args:
+            rate: Requests per second allowed across all workers (0 disables).
+            path: State file shared by every process using the same budget.
+            burst: Bucket capacity; defaults to one second worth of tokens.
+        """
+        self.rate = rate
+        self.path = path
+        self.capacity = burst if burst is not None else max(rate, 1.0)
+        self._thread_lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold both the in-process and the cross-process lock."""
+        with self._thread_lock, open(f"{self.path}.lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._locked():
+                now = time.time()
+                try:
+                    with open(self.path) as f:
+                        state = json.load(f)
+                except (OSError, ValueError):
+                    state = {"tokens": self.capacity, "updated": now}
+                elapsed = max(now - state["updated"], 0.0)
+                tokens = min(self.capacity, state["tokens"] + elapsed * self.rate)
+                wait = 0.0 if tokens >= 1 else (1 - tokens) / self.rate
+                if not wait:
+                    tokens -= 1
+                with open(self.path, "w") as f:
+                    json.dump({"tokens": tokens, "updated": now}, f)
+            if not wait:
+                return
+            time.sleep(wait)
+
+
+class ApiTape:
+    """Records the client's responses per test, or plays them back offline.
+
+    Used by ``--backend=record/replay`` (``utils/har_replay.py``) so that
+    test data created through the API gets the same backend IDs in replay
+    as it had when the browser traffic was recorded. Responses are matched
+    on method, path and JSON body, in recorded order.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an idle tape."""
+        self.mode: Optional[str] = None
+        self.path: Optional[Path] = None
+        self.offline = False
+        self._recorded: List[dict] = []
+        self._entries: Dict[str, Deque[dict]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(method: str, path: str, body) -> str:
+        return f"{method} {path} {json.dumps(body, sort_keys=True)}"
+
+    def start(self, mode: str, path: Path) -> None:
+        """Begin recording to, or replaying from, a tape file.
+
+        Args:
+            mode: ``record`` or ``replay``.
+            path: Tape file of the current test.
+        """
+        self.mode, self.path = mode, path
+        self._recorded, self._entries = [], {}
+        if mode == "replay" and path.exists():
+            for entry in json.loads(path.read_text()):
+                key = self._key(entry["method"], entry["path"], entry["body"])
+                self._entries.setdefault(key, deque()).append(entry)
+
+    def stop(self) -> None:
+        """Save a recording and go idle."""
+        if self.mode == "record" and self.path is not None and self._recorded:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self._recorded, indent=2))
+        self.mode = self.path = None
+        self._recorded, self._entries = [], {}
+
+    def capture(self, method: str, path: str, body, resp: requests.Response) -> None:
+        """Append a live response to the recording."""
+        if self.mode != "record" or method == "DELETE":
+            return
+        with self._lock:
+            self._recorded.append(
+                {
+                    "method": method,
+                    "path": path,
+                    "body": body,
+                    "status": resp.status_code,
+                    "content": base64.b64encode(resp.content).decode(),
+                }
+            )
+
+    def play(self, method: str, path: str, body) -> Optional[requests.Response]:
+        """Return the next recorded response for a request, if replaying.
+
+        Deletions always succeed; a guest login that was recorded by an
+        earlier test gets a placeholder token: an unsigned JWT with a guest
+        subject and a future expiry, so code that decodes the token still
+        works (the browser side is replayed too, so it is never verified).
+        With ``offline`` set, requests made between tests (e.g. by the
+        cleanup queue) are answered too.
+
+        Raises:
+            LookupError: If the request was never recorded.
+        """
+        if self.mode != "replay" and not self.offline:
+            return None
+        resp = requests.Response()
+        resp.url = path
+        resp.status_code = 204
+        resp._content = b""
+        if method == "DELETE":
+            return resp
+        with self._lock:
+            entries = self._entries.get(self._key(method, path, body))
+            if entries:
+                entry = entries.popleft() if len(entries) > 1 else entries[0]
+                resp.status_code = entry["status"]
+                resp._content = base64.b64decode(entry["content"])
+                resp.headers["Content-Type"] = "application/json"
+                return resp
+        if (method, path) == ("POST", "/auth/guest"):
+            resp.status_code = 200
+            token = replay_token()
+            resp._content = json.dumps(
+                {"accessToken": token, "refreshToken": token}
+            ).encode()
+            return resp
+        raise LookupError(f"no recorded API response for {method} {path}")
+
+
+TAPE = ApiTape()
+
+
+class ApiRetry(Retry):
+    """Retry policy that never repeats a request the backend may have run.
+
+    Idempotent methods are retried on the configured statuses and on
+    connection and read errors. Other methods (``POST``) are retried only
+    on 429 and on connection errors, where the request was not processed.
+    """
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if not self._is_method_retryable(method):
+            return status_code == 429 and bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class EchostashApiClient:
+    """Keep-alive HTTP client for test data setup and teardown."""
+
+    def __init__(
+        self,
+        api_url: str,
+        rate_limit: float = 0.0,
+        retries: int = 3,
+        backoff: float = 0.5,
+        pool_size: int = 16,
+        timeout: int = 15,
+    ) -> None:
+        """Initialize EchostashApiClient.
+
+        Args:
+            api_url: Backend API base URL.
+            rate_limit: Requests per second shared by all local workers
+                (0 disables throttling).
+            retries: Retry attempts for 429/502/503/504 responses and
+                connection errors (see ``ApiRetry`` for ``POST``).
+            backoff: Exponential backoff factor in seconds.
+            pool_size: Connections kept alive per host; also the thread
+                pool size for batch methods.
+            timeout: Per-request timeout in seconds.
+        """
+        self.api_url = api_url.rstrip("/")
+        self.timeout = timeout
+        self.pool_size = pool_size
+        retry = ApiRetry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=(429, 502, 503, 504),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size, max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        host = urlsplit(self.api_url).netloc.replace(":", "_") or "default"
+        self.limiter = RateLimiter(
+            rate_limit,
+            os.path.join(tempfile.gettempdir(), f"echostash-api-rate-{host}.json"),
+        )
+
+    def request(
+        self, method: str, path: str, token: Optional[str] = None, **kwargs
+    ) -> requests.Response:
+        """Send a throttled, retried request to the backend.
+
+        Args:
+            method: HTTP method.
+            path: Path relative to the API base URL.
+            token: Optional bearer access token.
+            **kwargs: Extra arguments for ``requests.Session.request``.
+
+        Returns:
+            The final response (status is not checked); the recorded one
+            under ``--backend=replay``.
+        """
+        replayed = TAPE.play(method, path, kwargs.get("json"))
+        if replayed is not None:
+            return replayed
+        headers = kwargs.pop("headers", {})
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        kwargs.setdefault("timeout", self.timeout)
+        self.limiter.acquire()
+        resp = self.session.request(
+            method, f"{self.api_url}{path}", headers=headers, **kwargs
+        )
+        TAPE.capture(method, path, kwargs.get("json"), resp)
+        return resp
+
+    # ── Endpoints ────────────────────────────────────────────────────────
+
+    def login_guest(self) -> dict:
+        """Login as a guest user.
+
+        Returns:
+            Dict with ``accessToken`` and ``refreshToken``.
+        """
+        resp = self.request("POST", "/auth/guest")
+        resp.raise_for_status()
+        return resp.json()
+
+    def create_project(self, token: str, name: str, description: str = "") -> dict:
+        """Create a project.
+
+        Args:
+            token: Bearer access token.
+            name: Project name.
+            description: Optional project description.
+
+        Returns:
+            Created project payload.
+        """
+        resp = self.request(
+            "POST",
+            "/projects",
+            token,
+            json={"name": name, "description": description},
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    def create_prompt(self, token: str, project_id: str, data: dict) -> dict:
+        """Create a prompt inside a project.
+
+        Args:
+            token: Bearer access token.
+            project_id: Owning project ID.
+            data: Prompt payload (title, content, etc.).
+
+        Returns:
+            Created prompt payload.
+        """
+        resp = self.request(
+            "POST", f"/projects/{project_id}/prompts", token, json=data
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    def list_resources(self, token: str, path: str) -> List[dict]:
+        """List the resources at a collection path owned by the token's user.
+
+        Args:
+            token: Bearer access token.
+            path: Collection path relative to the API base URL.
+
+        Returns:
+            Resource payloads.
+        """
+        resp = self.request("GET", path, token)
+        resp.raise_for_status()
+        body = resp.json()
+        # Paged responses wrap the list in ``content``.
+        return body.get("content", []) if isinstance(body, dict) else body
+
+    def list_projects(self, token: str) -> List[dict]:
+        """List the projects owned by the token's user.
+
+        Args:
+            token: Bearer access token.
+
+        Returns:
+            Project payloads.
+        """
+        return self.list_resources(token, "/projects")
+
+    def delete_resource(self, token: str, path: str) -> None:
+        """Delete a resource. A resource that is already gone is not an error.
+
+        Args:
+            token: Bearer access token.
+            path: Resource path relative to the API base URL.
+
+        Raises:
+            requests.HTTPError: If the backend rejects the deletion.
+        """
+        resp = self.request("DELETE", path, token)
+        if resp.status_code != 404:
+            resp.raise_for_status()
+
+    def delete_project(self, token: str, project_id: str) -> None:
+        """Delete a project. A project that is already gone is not an error.
+
+        Args:
+            token: Bearer access token.
+            project_id: ID of the project to delete.
+
+        Raises:
+            requests.HTTPError: If the backend rejects the deletion.
+        """
+        self.delete_resource(token, f"/projects/{project_id}")
+
+    # ── Batch operations ─────────────────────────────────────────────────
+
+    def create_projects(
+        self, token: str, n: int, prefix: str = "proj", description: str = ""
+    ) -> List[dict]:
+        """Create ``n`` uniquely named projects concurrently.
+
+        Args:
+            token: Bearer access token.
+            n: Number of projects to create.
+            prefix: Name prefix passed to ``unique_name``.
+            description: Description shared by all projects.
+
+        Returns:
+            Created project payloads, in creation order.
+        """
+        from utils.helpers import unique_name
+
+        names = [unique_name(prefix) for _ in range(n)]
+        workers = min(n, self.pool_size) or 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(
+                    lambda name: self.create_project(token, name, description), names
+                )
+            )
+
+    def create_prompts(
+        self, token: str, project_id: str, items: List[dict]
+    ) -> List[dict]:
+        """Create several prompts in one project concurrently.
+
+        Args:
+            token: Bearer access token.
+            project_id: Owning project ID.
+            items: Prompt payloads.
+
+        Returns:
+            Created prompt payloads, in the order of ``items``.
+        """
+        workers = min(len(items), self.pool_size) or 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(
+                    lambda data: self.create_prompt(token, project_id, data), items
+                )
+            )
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+
+_clients: Dict[str, EchostashApiClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_api_client(api_url: str) -> EchostashApiClient:
+    """Return this process's shared client for ``api_url``.
+
+    The shared rate limit is read from the ``API_RATE_LIMIT`` environment
+    variable (requests per second, 0 or unset disables throttling).
+
+    Args:
+        api_url: Backend API base URL.
+
+    Returns:
+        The pooled EchostashApiClient for that backend.
+    """
+    key = api_url.rstrip("/")
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            rate = float(os.getenv("API_RATE_LIMIT", "0") or 0)
+            client = _clients[key] = EchostashApiClient(key, rate_limit=rate)
+        return client
+
+
+def replay_token(lifetime: int = 86400) -> str:
+    """Build an unsigned JWT standing in for a guest token in replay.
+
+    Args:
+        lifetime: Seconds until the token's ``exp`` claim.
+
+    Returns:
+        A ``header.payload.`` token with ``alg: none``.
+    """
+
+    def segment(data: dict) -> str:
+        raw = json.dumps(data, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    now = int(time.time())
+    claims = {"sub": "replay-guest", "role": "guest", "iat": now, "exp": now + lifetime}
+    return f"{segment({'alg': 'none', 'typ': 'JWT'})}.{segment(claims)}."
@@ -0,0 +1,266 @@
+"""Static asset cache shared by all browser contexts of a run.
+
+Every test gets a fresh context, so without help the browser downloads the
+app's JS/CSS bundles, fonts and Monaco workers again for each test. With
+``--asset-cache``, requests for immutable static assets are routed through
+an on-disk, content-addressed cache: the first fetch stores the body under
+its SHA-256, later requests (from any context or xdist worker) are
+fulfilled from disk without touching the network.
+
+Files under ``/_next/static/`` carry their content hash in the name, so
+they are keyed on the URL alone and survive deployments. Other cached
+assets (fonts, Monaco workers) are keyed on the URL plus the app's build
+ID, read once per worker from the landing page, so a new build never
+serves an old file; if the build ID cannot be read, those assets bypass
+the cache. Contexts measured by ``--web-vitals`` or
+``perf_budget`` tests are left alone, since cache hits would hide the real
+transfer sizes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+import pytest
+import requests
+from playwright.sync_api import BrowserContext, Error, Route
+
+from pages.web_vitals import VITALS
+
+USER_PROPERTY = "asset_cache"
+
+# Requests worth routing at all; everything else never reaches Python.
+ASSET_PATTERN = re.compile(
+    r"/_next/static/"
+    r"|/(?:min/)?vs/.+\.js(?:\?|$)"
+    r"|\.worker(?:\.[0-9a-f]+)?\.js(?:\?|$)"
+    r"|\.(?:woff2?|ttf|otf)(?:\?|$)"
+)
+# Assets whose URL changes whenever their content does.
+_HASHED = re.compile(r"/_next/static/(?:chunks|css|media)/")
+_BUILD_ID = re.compile(
+    r'"buildId"\s*:\s*"([^"]+)"|/_next/static/([^/]+)/_buildManifest'
+)
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+STATS = ("hits", "misses", "bypassed", "bytes_saved", "bytes_fetched")
+
+
+def detect_build_id(base_url: str) -> Optional[str]:
+    """Read the Next.js build ID from the app's landing page.
+
+    Args:
+        base_url: Application base URL.
+
+    Returns:
+        The build ID, or None if it cannot be determined.
+    """
+    try:
+        html = requests.get(base_url, timeout=10).text
+    except requests.RequestException:
+        return None
+    match = _BUILD_ID.search(html)
+    return next((g for g in match.groups() if g), None) if match else None
+
+
+class AssetCache:
+    """Content-addressed store of static responses, routed into contexts."""
+
+    def __init__(self) -> None:
+        """Initialize a disabled cache."""
+        self.enabled = False
+        self.root = Path(".asset-cache")
+        self.build_id: Optional[str] = None
+        self._detected = False
+        self._index: Dict[str, dict] = {}
+        self._stats = dict.fromkeys(STATS, 0)
+
+    def key(self, url: str) -> Optional[str]:
+        """Cache key of an asset URL.
+
+        Args:
+            url: Full asset URL.
+
+        Returns:
+            SHA-256 hex digest of the URL, plus the build ID for assets whose
+            URL is not content-hashed; None for such assets while the build
+            ID is unknown, since they cannot be cached safely.
+        """
+        if _HASHED.search(url):
+            scope = ""
+        elif self.build_id is not None:
+            scope = f"{self.build_id} "
+        else:
+            return None
+        return hashlib.sha256(f"{scope}{url}".encode()).hexdigest()
+
+    def _lookup(self, key: str) -> Optional[dict]:
+        entry = self._index.get(key)
+        if entry is None:
+            path = self.root / "index" / f"{key}.json"
+            try:
+                entry = json.loads(path.read_text())
+            except (OSError, ValueError):
+                return None
+            self._index[key] = entry
+        return entry
+
+    def _write(self, path: Path, data: bytes) -> None:
+        """Write atomically, so concurrent workers never see partial files."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _store(
+        self, key: str, status: int, headers: Dict[str, str], body: bytes
+    ) -> None:
+        digest = hashlib.sha256(body).hexdigest()
+        blob = self.root / "blobs" / digest
+        if not blob.exists():
+            self._write(blob, body)
+        entry = {"blob": digest, "status": status, "headers": headers}
+        self._write(self.root / "index" / f"{key}.json", json.dumps(entry).encode())
+        self._index[key] = entry
+
+    def handle(self, route: Route) -> None:
+        """Fulfill an asset request from the cache, or fetch and store it.
+
+        Args:
+            route: The intercepted asset request.
+        """
+        request = route.request
+        if request.method != "GET":
+            route.fallback()
+            return
+        key = self.key(request.url)
+        if key is None:
+            self._stats["bypassed"] += 1
+            route.fallback()
+            return
+        entry = self._lookup(key)
+        if entry is not None:
+            try:
+                body = (self.root / "blobs" / entry["blob"]).read_bytes()
+            except OSError:
+                body = None
+            if body is not None:
+                self._stats["hits"] += 1
+                self._stats["bytes_saved"] += len(body)
+                route.fulfill(
+                    status=entry["status"], headers=entry["headers"], body=body
+                )
+                return
+        try:
+            response = route.fetch()
+            body = response.body()
+        except Error:
+            route.fallback()
+            return
+        self._stats["misses"] += 1
+        self._stats["bytes_fetched"] += len(body)
+        if response.status == 200:
+            headers = {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in _DROPPED_HEADERS
+            }
+            self._store(key, response.status, headers, body)
+        route.fulfill(response=response, body=body)
+
+    def install(self, context: BrowserContext, base_url: str) -> None:
+        """Serve the context's static assets through the cache.
+
+        Args:
+            context: Playwright browser context.
+            base_url: Application base URL, used once to find the build ID.
+        """
+        if not self.enabled or VITALS.enabled:
+            return
+        if not self._detected:
+            self.build_id = detect_build_id(base_url)
+            self._detected = True
+        context.route(ASSET_PATTERN, self.handle)
+
+    def drain(self) -> Dict[str, int]:
+        """Return and reset the counters gathered since the last drain.
+
+        Returns:
+            ``hits``, ``misses``, ``bypassed``, ``bytes_saved`` and
+            ``bytes_fetched``.
+        """
+        stats = self._stats
+        self._stats = dict.fromkeys(stats, 0)
+        return stats
+
+
+ASSETS = AssetCache()
+
+# ── Pytest plugin ────────────────────────────────────────────────────────
+
+_totals: Dict[str, int] = dict.fromkeys(STATS, 0)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--asset-cache",
+        action="store_true",
+        default=False,
+        help="Serve static JS/CSS/fonts/Monaco workers from an on-disk cache",
+    )
+    parser.addoption(
+        "--asset-cache-dir",
+        action="store",
+        default=".asset-cache",
+        help="Directory of the content-addressed static asset cache",
+    )
+
+
+def pytest_configure(config):
+    ASSETS.enabled = config.getoption("--asset-cache")
+    ASSETS.root = Path(config.getoption("--asset-cache-dir"))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when != "teardown":
+        return
+    stats = ASSETS.drain()
+    if stats["hits"] or stats["misses"] or stats["bypassed"]:
+        outcome.get_result().user_properties.append((USER_PROPERTY, stats))
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown":
+        return
+    for name, value in report.user_properties:
+        if name == USER_PROPERTY:
+            for counter, amount in value.items():
+                _totals[counter] += amount
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not config.getoption("--asset-cache"):
+        return
+    requests_seen = _totals["hits"] + _totals["misses"] + _totals["bypassed"]
+    if not requests_seen:
+        return
+    terminalreporter.write_sep(
+        "=",
+        f"asset cache: {_totals['hits']}/{requests_seen} served from disk, "
+        f"{_totals['bytes_saved'] / 1e6:.1f} MB saved, "
+        f"{_totals['bytes_fetched'] / 1e6:.1f} MB fetched",
+    )
+    if _totals["bypassed"]:
+        terminalreporter.write_line(
+            f"{_totals['bypassed']} unhashed assets bypassed the cache: "
+            "the app's build ID could not be read"
+        )
@@ -0,0 +1,498 @@
+"""Shared Playwright browser servers for all xdist workers.
+
+With ``--browser-server``, the controller process (or the only process,
+without xdist) starts a small pool of browser servers instead of letting
+every worker launch its own browser. Each server is the Playwright
+driver's ``launch-server`` command, i.e. ``BrowserType.launchServer``.
+Workers are spread over the pool so that no browser serves more than
+``--browser-server-contexts`` workers (each worker has one test, and so
+normally one context, open at a time). Each worker ``connect()``s to its
+server and gets isolated contexts from it.
+
+The controller watches every server: after ``--browser-server-recycle``
+contexts, or once the browser's process tree uses more than
+``--browser-server-max-rss`` MB, it starts a replacement and publishes it.
+Workers switch to the new server before their next context, once none of
+their contexts are open, and the old server is stopped once none of its
+workers is left on it; a worker in the middle of a long test keeps it
+alive for as long as it needs.
+
+Controller and workers coordinate through small JSON files in a temporary
+directory: ``slot-<n>.json`` holds a server's endpoint and generation, and
+``worker-<id>.json`` holds each worker's slot, generation and context count.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+from playwright.sync_api import Browser, BrowserContext, BrowserType
+
+MONITOR_INTERVAL = 2.0
+START_TIMEOUT = 60.0
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """Write atomically, so readers in other processes never see half a file."""
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, path)
+
+
+def _read_json(path: Path) -> Optional[dict]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def process_tree_memory(pid: int, include_root: bool = True) -> Optional[int]:
+    """Memory of a process and all its descendants, in bytes.
+
+    Uses proportional set size where the kernel provides it (so memory
+    shared between Chromium's processes is not counted several times),
+    otherwise the resident set size.
+
+    Args:
+        pid: Root process ID.
+        include_root: Whether to count the root process itself.
+
+    Returns:
+        Bytes in use, or None where ``/proc`` is not available.
+    """
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+    children: Dict[int, List[int]] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # The command name may contain spaces; fields after it are fixed.
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry.name))
+    total = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        stack.extend(children.get(current, []))
+        if include_root or current != pid:
+            total += _process_memory(proc / str(current))
+    return total
+
+
+def _process_memory(path: Path) -> int:
+    """PSS (or RSS) of one process in bytes; 0 if it is gone."""
+    for name, field in (("smaps_rollup", "Pss:"), ("status", "VmRSS:")):
+        try:
+            for line in (path / name).read_text().splitlines():
+                if line.startswith(field):
+                    return int(line.split()[1]) * 1024
+        except (OSError, ValueError):
+            continue
+    return 0
+
+
+class BrowserServer:
+    """One ``launch-server`` process and its WebSocket endpoint."""
+
+    def __init__(
+        self, browser_name: str, launch_options: dict, state_dir: Path
+    ) -> None:
+        """Start the server and wait for its endpoint.
+
+        Args:
+            browser_name: ``chromium``, ``firefox`` or ``webkit``.
+            launch_options: ``launchServer`` options (``headless`` etc.).
+            state_dir: Directory for the launch options file.
+
+        Raises:
+            RuntimeError: If the server does not report an endpoint.
+        """
+        config_file = tempfile.NamedTemporaryFile(
+            "w", suffix=".json", dir=state_dir, delete=False
+        )
+        with config_file:
+            json.dump(launch_options, config_file)
+        self.process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "playwright",
+                "launch-server",
+                "--browser",
+                browser_name,
+                "--config",
+                config_file.name,
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+            start_new_session=True,
+        )
+        self.ws_endpoint = self._read_endpoint()
+
+    def _read_endpoint(self) -> str:
+        result: List[str] = []
+        reader = threading.Thread(
+            target=lambda: result.append(self.process.stdout.readline().strip()),
+            daemon=True,
+        )
+        reader.start()
+        reader.join(START_TIMEOUT)
+        if not result or not result[0].startswith("ws"):
+            self.stop()
+            raise RuntimeError(
+                f"browser server did not start: {result[0] if result else 'timeout'}"
+            )
+        return result[0]
+
+    def memory(self) -> Optional[int]:
+        """Bytes used by the server and its browser processes."""
+        return process_tree_memory(self.process.pid)
+
+    def stop(self) -> None:
+        """Stop the server and its browser."""
+        if self.process.poll() is not None:
+            return
+        try:
+            os.killpg(self.process.pid, signal.SIGTERM)
+        except (AttributeError, OSError):
+            self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+class BrowserServerPool:
+    """Controller-side owner of the browser servers."""
+
+    def __init__(
+        self,
+        browser_name: str,
+        launch_options: dict,
+        size: int,
+        max_contexts: int,
+        max_memory: int,
+    ) -> None:
+        """Initialize the pool without starting servers.
+
+        Args:
+            browser_name: Browser to serve.
+            launch_options: ``launchServer`` options.
+            size: Number of servers.
+            max_contexts: Contexts a browser serves before it is recycled.
+            max_memory: Bytes a browser may use before it is recycled.
+        """
+        self.browser_name = browser_name
+        self.launch_options = launch_options
+        self.size = size
+        self.max_contexts = max_contexts
+        self.max_memory = max_memory
+        self.state_dir = Path(tempfile.mkdtemp(prefix="browser-servers-"))
+        self.recycles: List[str] = []
+        self._servers: List[BrowserServer] = []
+        self._generations: List[int] = []
+        self._retired: List[tuple] = []
+        self._stop = threading.Event()
+        self._monitor = threading.Thread(
+            target=self._run, name="browser-server-pool", daemon=True
+        )
+
+    def start(self) -> None:
+        """Start every server and the recycling monitor."""
+        for slot in range(self.size):
+            self._servers.append(self._launch())
+            self._generations.append(0)
+            self._publish(slot)
+        self._monitor.start()
+
+    def _launch(self) -> BrowserServer:
+        return BrowserServer(self.browser_name, self.launch_options, self.state_dir)
+
+    def _publish(self, slot: int) -> None:
+        _write_json(
+            self.state_dir / f"slot-{slot}.json",
+            {
+                "endpoint": self._servers[slot].ws_endpoint,
+                "generation": self._generations[slot],
+            },
+        )
+
+    def _workers(self) -> List[dict]:
+        return [
+            status
+            for path in self.state_dir.glob("worker-*.json")
+            if (status := _read_json(path)) is not None
+        ]
+
+    def _run(self) -> None:
+        while not self._stop.wait(MONITOR_INTERVAL):
+            workers = self._workers()
+            for slot, server in enumerate(self._servers):
+                generation = self._generations[slot]
+                contexts = sum(
+                    w["contexts"]
+                    for w in workers
+                    if w["slot"] == slot and w["generation"] == generation
+                )
+                memory = server.memory() or 0
+                if contexts >= self.max_contexts:
+                    self._recycle(slot, f"{contexts} contexts")
+                elif memory >= self.max_memory:
+                    self._recycle(slot, f"{memory / 2**20:.0f} MB")
+            self._reap(workers)
+
+    def _recycle(self, slot: int, reason: str) -> None:
+        """Replace a slot's server; the old one is stopped once unused."""
+        try:
+            replacement = self._launch()
+        except RuntimeError:
+            return
+        self._retired.append((self._servers[slot], slot, self._generations[slot]))
+        self._servers[slot] = replacement
+        self._generations[slot] += 1
+        self._publish(slot)
+        self.recycles.append(f"slot {slot} after {reason}")
+
+    def _reap(self, workers: List[dict]) -> None:
+        """Stop retired servers once no worker is connected to them."""
+        keep = []
+        for server, slot, generation in self._retired:
+            remaining = sum(
+                1 for w in workers if (w["slot"], w["generation"]) == (slot, generation)
+            )
+            if remaining:
+                keep.append((server, slot, generation))
+            else:
+                server.stop()
+        self._retired = keep
+
+    def stop(self) -> None:
+        """Stop the monitor and every server."""
+        self._stop.set()
+        if self._monitor.is_alive():
+            self._monitor.join()
+        for server in self._servers + [entry[0] for entry in self._retired]:
+            server.stop()
+        shutil.rmtree(self.state_dir, ignore_errors=True)
+
+
+class SharedBrowser:
+    """Worker-side stand-in for ``Browser``, connected to one pool slot.
+
+    ``new_context`` counts contexts for the controller and switches to a
+    replacement server when one has been published; everything else is
+    delegated to the currently connected ``Browser``.
+    """
+
+    def __init__(
+        self, browser_type: BrowserType, state_dir: Path, slot: int, worker: str
+    ) -> None:
+        """Connect to the slot's current server.
+
+        Args:
+            browser_type: Playwright browser type to connect with.
+            state_dir: The pool's state directory.
+            slot: Pool slot assigned to this worker.
+            worker: xdist worker ID (``main`` without xdist).
+        """
+        self._browser_type = browser_type
+        self._slot_file = state_dir / f"slot-{slot}.json"
+        self._status_file = state_dir / f"worker-{worker}.json"
+        self._slot = slot
+        self._browser: Optional[Browser] = None
+        self._generation = -1
+        self._contexts = 0
+        self._open = 0
+        self._connect()
+
+    def _connect(self) -> None:
+        state = _read_json(self._slot_file)
+        if state is None or state["generation"] == self._generation:
+            return
+        if self._browser is not None:
+            self._browser.close()
+        self._browser = self._browser_type.connect(state["endpoint"])
+        self._generation = state["generation"]
+        self._contexts = 0
+        self._report()
+
+    def _report(self) -> None:
+        _write_json(
+            self._status_file,
+            {
+                "slot": self._slot,
+                "generation": self._generation,
+                "contexts": self._contexts,
+            },
+        )
+
+    def _on_close(self, context: BrowserContext) -> None:
+        self._open -= 1
+
+    def new_context(self, **kwargs) -> BrowserContext:
+        """Create a context, first switching servers if one was recycled.
+
+        Args:
+            **kwargs: ``Browser.new_context`` arguments.
+
+        Returns:
+            The new BrowserContext.
+        """
+        if self._open == 0:
+            self._connect()
+        context = self._browser.new_context(**kwargs)
+        self._open += 1
+        self._contexts += 1
+        context.on("close", self._on_close)
+        self._report()
+        return context
+
+    def close(self) -> None:
+        """Disconnect from the server (the controller stops it)."""
+        if self._browser is not None:
+            self._browser.close()
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._browser, name)
+
+
+# ── Pytest plugin ────────────────────────────────────────────────────────
+
+_pool: Dict[str, BrowserServerPool] = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--browser-server",
+        action="store_true",
+        default=False,
+        help="Share browser servers between xdist workers instead of one "
+        "browser per worker",
+    )
+    parser.addoption(
+        "--browser-server-contexts",
+        action="store",
+        type=int,
+        default=4,
+        help="Workers (concurrent contexts) per shared browser",
+    )
+    parser.addoption(
+        "--browser-server-recycle",
+        action="store",
+        type=int,
+        default=200,
+        help="Contexts a shared browser serves before it is replaced",
+    )
+    parser.addoption(
+        "--browser-server-max-rss",
+        action="store",
+        type=int,
+        default=3072,
+        help="MB a shared browser may use before it is replaced",
+    )
+
+
+def _launch_options(config) -> dict:
+    """``launchServer`` options from pytest-playwright's CLI options."""
+    options = {
+        "headless": not config.getoption("--headed", default=False),
+        "slowMo": config.getoption("--slowmo", default=0) or 0,
+    }
+    channel = config.getoption("--browser-channel", default=None)
+    if channel:
+        options["channel"] = channel
+    return options
+
+
+def pytest_configure(config):
+    if not config.getoption("--browser-server") or hasattr(config, "workerinput"):
+        return
+    workers = getattr(config.option, "numprocesses", None) or 1
+    size = math.ceil(workers / max(config.getoption("--browser-server-contexts"), 1))
+    browsers = config.getoption("--browser", default=None) or ["chromium"]
+    pool = BrowserServerPool(
+        browsers[0],
+        _launch_options(config),
+        size,
+        max_contexts=config.getoption("--browser-server-recycle"),
+        max_memory=config.getoption("--browser-server-max-rss") * 2**20,
+    )
+    try:
+        pool.start()
+    except RuntimeError as e:
+        pool.stop()
+        raise pytest.UsageError(f"--browser-server: {e}")
+    _pool["main"] = pool
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    pool = _pool.get("main")
+    if pool is None:
+        return
+    index = int(node.gateway.id.lstrip("gw") or 0)
+    node.workerinput["browser_server_dir"] = str(pool.state_dir)
+    node.workerinput["browser_server_slot"] = index % pool.size
+
+
+def connect_shared_browser(
+    config, browser_type: BrowserType
+) -> Optional[SharedBrowser]:
+    """Connect this process to its pool slot, if ``--browser-server`` is on.
+
+    Args:
+        config: The pytest config.
+        browser_type: Playwright browser type to connect with.
+
+    Returns:
+        The SharedBrowser, or None when browsers are launched per worker.
+    """
+    if not config.getoption("--browser-server"):
+        return None
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        pool = _pool["main"]
+        return SharedBrowser(browser_type, pool.state_dir, 0, "main")
+    return SharedBrowser(
+        browser_type,
+        Path(workerinput["browser_server_dir"]),
+        workerinput["browser_server_slot"],
+        workerinput["workerid"],
+    )
+
+
+def pytest_unconfigure(config):
+    pool = _pool.pop("main", None)
+    if pool is not None:
+        pool.stop()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    pool = _pool.get("main")
+    if pool is None:
+        return
+    tr = terminalreporter
+    tr.write_sep(
+        "=",
+        f"browser servers: {pool.size} shared, {len(pool.recycles)} recycled",
+    )
+    for recycle in pool.recycles:
+        tr.write_line(f"  recycled {recycle}")
@@ -0,0 +1,427 @@
+"""Deferred, batched cleanup of test data, with an orphan sweeper.
+
+Fixtures ``track()`` every resource they create in a per-worker journal file
+and hand it to ``delete_later()`` at teardown. A background thread deletes
+queued resources concurrently in batches, so teardown never blocks on the
+backend, and ``pytest_sessionfinish`` drains whatever is still queued.
+Failed deletions are logged, stay ``pending`` in the journal and are
+counted in the terminal summary.
+
+Once nothing in a journal is pending any more, the queue compacts it down
+to its guest identities, so long runs do not grow it without limit.
+
+Anything a crashed worker never deleted stays ``pending`` in its journal.
+``--sweep-orphans`` replays those journals: it deletes pending resources and,
+for every guest identity recorded there, deletes leftover ``proj-*`` /
+``e2e-proj-*`` projects, API keys and context-store assets created through
+the UI.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from utils.api_client import get_api_client
+
+DELETE_PATHS = {
+    "project": "/projects/{id}",
+    "prompt": "/prompts/{id}",
+    "api_key": "/api-keys/{id}",
+    "asset": "/context-store/assets/{id}",
+}
+
+ORPHAN_PROJECT_PATTERN = re.compile(r"^(?:e2e-|lifecycle-)?proj-")
+# Names from ``unique_name``: a prefix and eight hex digits.
+ORPHAN_NAME_PATTERN = re.compile(r"-[0-9a-f]{8}$")
+
+# What the sweeper lists for each guest identity, and which names it deletes.
+ORPHAN_LISTS = {
+    "project": ("/projects", ORPHAN_PROJECT_PATTERN),
+    "api_key": ("/api-keys", ORPHAN_NAME_PATTERN),
+    "asset": ("/context-store/assets", ORPHAN_NAME_PATTERN),
+}
+
+BATCH_SIZE = 20
+BATCH_INTERVAL = 0.5
+MAX_REPORTED_ERRORS = 5
+MAX_JOURNAL_IDENTITIES = 200
+
+logger = logging.getLogger(__name__)
+
+
+class CleanupQueue:
+    """Journal-backed queue that deletes test resources on a background thread."""
+
+    def __init__(self, journal_dir: str, workers: int = 8) -> None:
+        """Initialize CleanupQueue.
+
+        Args:
+            journal_dir: Directory holding the per-worker journal files.
+            workers: Concurrent deletions per batch.
+        """
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        self.journal = Path(journal_dir) / f"{worker}-{os.getpid()}.jsonl"
+        self.journal.parent.mkdir(parents=True, exist_ok=True)
+        self.failures = 0
+        self.errors: List[str] = []
+        self._queue: "queue.Queue[dict]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._identities: Dict[str, dict] = {}
+        self._pending: Dict[Tuple[str, str], dict] = {}
+        self._done = 0
+        self._queued: Dict[str, int] = {}
+        self._settled = threading.Condition()
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._thread = threading.Thread(
+            target=self._run, name="cleanup-queue", daemon=True
+        )
+        self._thread.start()
+
+    def _write(self, entry: dict) -> None:
+        """Append one entry to the journal (the caller holds the lock)."""
+        with open(self.journal, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def track_identity(self, api_url: str, token: str) -> None:
+        """Record a guest identity so the sweeper can find its leftovers.
+
+        Only the ``MAX_JOURNAL_IDENTITIES`` most recently used identities
+        survive a compaction of the journal.
+
+        Args:
+            api_url: Backend API base URL.
+            token: The guest's bearer access token.
+        """
+        with self._lock:
+            entry = self._identities.pop(token, None)
+            if entry is None:
+                entry = {"op": "identity", "api_url": api_url, "token": token}
+                self._write(entry)
+            self._identities[token] = entry
+            while len(self._identities) > MAX_JOURNAL_IDENTITIES:
+                del self._identities[next(iter(self._identities))]
+
+    def track(self, kind: str, resource_id: str, api_url: str, token: str) -> dict:
+        """Journal a freshly created resource as pending deletion.
+
+        Args:
+            kind: Resource kind, a key of ``DELETE_PATHS``.
+            resource_id: Backend ID of the resource.
+            api_url: Backend API base URL.
+            token: Bearer access token allowed to delete it.
+
+        Returns:
+            The journal entry, to pass to ``delete_later``.
+        """
+        entry = {
+            "op": "add",
+            "kind": kind,
+            "id": str(resource_id),
+            "api_url": api_url,
+            "token": token,
+        }
+        with self._lock:
+            self._write(entry)
+            self._pending[(kind, entry["id"])] = entry
+        return entry
+
+    def delete_later(self, entry: dict) -> None:
+        """Queue a tracked resource for background deletion.
+
+        Args:
+            entry: Entry returned by ``track``.
+        """
+        with self._settled:
+            self._queued[entry["token"]] = self._queued.get(entry["token"], 0) + 1
+        self._queue.put(entry)
+
+    def drain(self, token: Optional[str] = None) -> int:
+        """Block until every queued deletion has been attempted.
+
+        Args:
+            token: Only wait for the deletions queued with this access
+                token, e.g. before a pooled guest identity is reused.
+
+        Returns:
+            Number of deletions that failed (they stay pending in the journal).
+        """
+        if token is None:
+            self._queue.join()
+        else:
+            with self._settled:
+                self._settled.wait_for(lambda: not self._queued.get(token))
+        return self.failures
+
+    def _run(self) -> None:
+        """Collect queued entries into batches and delete them concurrently.
+
+        Every entry is marked done on the queue even if its batch blows up,
+        so ``drain`` cannot wait forever.
+        """
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get(timeout=BATCH_INTERVAL))
+                except queue.Empty:
+                    break
+            try:
+                self._settle(batch)
+            except Exception:
+                logger.exception("cleanup batch of %d entries failed", len(batch))
+            finally:
+                with self._settled:
+                    for entry in batch:
+                        self._queued[entry["token"]] -= 1
+                        if not self._queued[entry["token"]]:
+                            del self._queued[entry["token"]]
+                    self._settled.notify_all()
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _settle(self, batch: List[dict]) -> None:
+        """Delete a batch, journal the deletions and count the failures."""
+        for entry, error in zip(batch, self._pool.map(_delete_entry, batch)):
+            if error is None:
+                with self._lock:
+                    self._write(
+                        {"op": "done", "kind": entry["kind"], "id": entry["id"]}
+                    )
+                    self._pending.pop((entry["kind"], entry["id"]), None)
+                    self._done += 1
+            else:
+                self.failures += 1
+                if len(self.errors) < MAX_REPORTED_ERRORS:
+                    self.errors.append(error)
+        self._compact()
+
+    def _compact(self) -> None:
+        """Rewrite the journal without the entries that have been deleted.
+
+        Runs once nothing is pending any more, and also once deleted entries
+        outnumber the pending ones. The rewrite keeps the recent identities
+        and every pending entry, failed deletions included.
+        """
+        with self._lock:
+            if not self._done or self._done < len(self._pending):
+                return
+            entries = [*self._identities.values(), *self._pending.values()]
+            scratch = self.journal.with_suffix(".tmp")
+            scratch.write_text("".join(json.dumps(e) + "\n" for e in entries))
+            os.replace(scratch, self.journal)
+            self._done = 0
+
+
+def _delete_entry(entry: dict) -> Optional[str]:
+    """Delete the resource behind a journal entry.
+
+    Returns:
+        None on success, else a one-line description of the failure (which
+        is also logged with its traceback).
+    """
+    try:
+        path = DELETE_PATHS[entry["kind"]].format(id=entry["id"])
+        get_api_client(entry["api_url"]).delete_resource(entry["token"], path)
+    except Exception as exc:
+        logger.warning(
+            "could not delete %s %s", entry["kind"], entry["id"], exc_info=True
+        )
+        lines = str(exc).strip().splitlines() or [""]
+        return f"{entry['kind']} {entry['id']}: {type(exc).__name__}: {lines[0][:120]}"
+    return None
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process with this PID is still running."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+def _ui_leftovers(identity: dict) -> List[dict]:
+    """List what a guest identity created through the UI, as journal entries.
+
+    Args:
+        identity: An ``identity`` journal entry.
+
+    Returns:
+        ``add`` entries for the identity's resources named like test data;
+        none if its session has expired.
+    """
+    client = get_api_client(identity["api_url"])
+    leftovers = []
+    for kind, (path, pattern) in ORPHAN_LISTS.items():
+        try:
+            resources = client.list_resources(identity["token"], path)
+        except Exception:
+            # Expired guest sessions cannot be listed any more.
+            return []
+        leftovers.extend(
+            {
+                "op": "add",
+                "kind": kind,
+                "id": str(resource["id"]),
+                "api_url": identity["api_url"],
+                "token": identity["token"],
+            }
+            for resource in resources
+            if pattern.search(resource.get("name", ""))
+        )
+    return leftovers
+
+
+def sweep_orphans(journal_dir: str) -> Tuple[int, int]:
+    """Delete everything earlier runs left behind.
+
+    Journals of processes that are still running are skipped. A journal is
+    removed once everything in it has been cleaned up; failed entries are
+    written back so the next sweep retries them.
+
+    Args:
+        journal_dir: Directory holding the per-worker journal files.
+
+    Returns:
+        ``(deleted, failed)`` counts.
+    """
+    deleted = failed = 0
+    for journal in sorted(Path(journal_dir).glob("*.jsonl")):
+        pid = journal.stem.rsplit("-", 1)[-1]
+        if pid.isdigit() and int(pid) != os.getpid() and _pid_alive(int(pid)):
+            continue
+        pending: Dict[Tuple[str, str], dict] = {}
+        identities: List[dict] = []
+        for line in journal.read_text().splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry["op"] == "add":
+                pending[(entry["kind"], entry["id"])] = entry
+            elif entry["op"] == "done":
+                pending.pop((entry["kind"], entry["id"]), None)
+            elif entry["op"] == "identity":
+                identities.append(entry)
+
+        for identity in identities:
+            for entry in _ui_leftovers(identity):
+                pending.setdefault((entry["kind"], entry["id"]), entry)
+
+        entries = list(pending.values())
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(_delete_entry, entries))
+        leftovers = [e for e, error in zip(entries, results) if error is not None]
+        deleted += len(entries) - len(leftovers)
+        failed += len(leftovers)
+        if leftovers:
+            journal.write_text("".join(json.dumps(e) + "\n" for e in leftovers))
+        else:
+            journal.unlink()
+    return deleted, failed
+
+
+# ── Pytest plugin ────────────────────────────────────────────────────────
+
+_queue_key = pytest.StashKey[CleanupQueue]()
+
+_failures: Dict[str, int] = {}
+_errors: List[str] = []
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--cleanup-journal",
+        action="store",
+        default=".cleanup-journal",
+        help="Directory for the per-worker test data cleanup journals",
+    )
+    parser.addoption(
+        "--sweep-orphans",
+        action="store_true",
+        default=False,
+        help="Before the run, delete resources left behind by earlier runs",
+    )
+
+
+def pytest_sessionstart(session):
+    config = session.config
+    if not config.getoption("--sweep-orphans") or hasattr(config, "workerinput"):
+        return
+    deleted, failed = sweep_orphans(config.getoption("--cleanup-journal"))
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is not None:
+        reporter.write_line(
+            f"sweep-orphans: deleted {deleted} leftover resources, {failed} failed"
+        )
+
+
+def pytest_sessionfinish(session):
+    cleanup = session.config.stash.get(_queue_key, None)
+    if cleanup is None:
+        return
+    failures = cleanup.drain()
+    if hasattr(session.config, "workerinput"):
+        session.config.workeroutput["cleanup_failures"] = [failures, cleanup.errors]
+    else:
+        _add_failures(failures, cleanup.errors)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    failures, errors = getattr(node, "workeroutput", {}).get(
+        "cleanup_failures", [0, []]
+    )
+    _add_failures(failures, errors)
+
+
+def _add_failures(failures: int, errors: List[str]) -> None:
+    """Count a process's failed deletions for the terminal summary."""
+    _failures["count"] = _failures.get("count", 0) + failures
+    _errors.extend(errors[: MAX_REPORTED_ERRORS - len(_errors)])
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    failures = _failures.get("count", 0)
+    if not failures:
+        return
+    tr = terminalreporter
+    tr.write_sep("=", f"cleanup: {failures} deletions failed", yellow=True)
+    for error in _errors:
+        tr.write_line(f"  {error}")
+    tr.write_line(
+        "they stay pending in the journal; remove them with --sweep-orphans"
+    )
+
+
+def drain_cleanup(config: pytest.Config) -> None:
+    """Wait for the worker's queued deletions, if anything was queued.
+
+    Args:
+        config: The pytest config holding the worker's queue.
+    """
+    cleanup = config.stash.get(_queue_key, None)
+    if cleanup is not None:
+        cleanup.drain()
+
+
+@pytest.fixture(scope="session")
+def cleanup_queue(pytestconfig) -> CleanupQueue:
+    """Worker-wide queue for deferred deletion of created test data."""
+    cleanup = pytestconfig.stash.get(_queue_key, None)
+    if cleanup is None:
+        cleanup = CleanupQueue(pytestconfig.getoption("--cleanup-journal"))
+        pytestconfig.stash[_queue_key] = cleanup
+    return cleanup
@@ -0,0 +1,177 @@
+"""Pytest plugin recording test durations and scheduling xdist longest-first.
+
+Every run stores per-test wall time (setup + call + teardown) in the
+SQLite ``TimingStore`` at ``--timing-db``. With ``--duration-schedule`` and
+``-n``, work is handed out by a ``LoadScopeScheduling`` subclass: tests stay
+grouped by class/module (so class- and module-scoped fixtures are shared on
+one worker), and the groups are dispatched longest-estimated-first, which
+is the classic LPT bin-packing heuristic. Tests without history are assumed
+to take the median known duration. The terminal summary compares the
+predicted makespan with the actual wall time.
+"""
+
+from __future__ import annotations
+
+import heapq
+import statistics
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import pytest
+from xdist.scheduler import LoadScopeScheduling
+
+from utils.timing_store import DEFAULT_PATH, TimingStore
+
+DEFAULT_ESTIMATE = 5.0
+
+_durations: Dict[str, float] = {}
+_outcomes: Dict[str, str] = {}
+_prediction: Dict[str, float] = {}
+
+
+def estimate_durations(
+    nodeids: List[str], known: Dict[str, float]
+) -> Dict[str, float]:
+    """Estimate each test's duration, filling gaps with the median known one.
+
+    Args:
+        nodeids: Tests to estimate.
+        known: Historical estimates from ``TimingStore.estimates``.
+
+    Returns:
+        Mapping of nodeid to estimated seconds.
+    """
+    fallback = statistics.median(known.values()) if known else DEFAULT_ESTIMATE
+    return {nodeid: known.get(nodeid, fallback) for nodeid in nodeids}
+
+
+def predict_makespan(costs: List[float], workers: int) -> float:
+    """Simulate longest-first assignment of ``costs`` onto ``workers``.
+
+    Args:
+        costs: Duration of each work unit.
+        workers: Number of parallel workers.
+
+    Returns:
+        The predicted wall time in seconds.
+    """
+    loads = [0.0] * max(workers, 1)
+    for cost in sorted(costs, reverse=True):
+        heapq.heapreplace(loads, loads[0] + cost)
+    return max(loads)
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """Load-scope scheduling that dispatches the longest scopes first."""
+
+    def __init__(self, config, log=None) -> None:
+        """Initialize DurationScheduling.
+
+        Args:
+            config: The pytest config of the controller.
+            log: xdist scheduler logger.
+        """
+        super().__init__(config, log)
+        self._ordered = False
+        self._initial = False
+        store = TimingStore(config.getoption("--timing-db"))
+        try:
+            self._known = store.estimates()
+        finally:
+            store.close()
+
+    def _order_workqueue(self) -> None:
+        """Sort the pending scopes by their estimated total duration."""
+        nodeids = [n for scope in self.workqueue.values() for n in scope]
+        estimates = estimate_durations(nodeids, self._known)
+        costs = {
+            scope: sum(estimates[nodeid] for nodeid in tests)
+            for scope, tests in self.workqueue.items()
+        }
+        self.workqueue = OrderedDict(
+            sorted(self.workqueue.items(), key=lambda kv: -costs[kv[0]])
+        )
+        _prediction["makespan"] = predict_makespan(
+            list(costs.values()), len(self.nodes)
+        )
+        _prediction["workers"] = len(self.nodes)
+        _prediction["started"] = time.time()
+        _prediction["unknown"] = sum(n not in self._known for n in nodeids)
+        self._ordered = True
+
+    def schedule(self) -> None:
+        self._initial = self.collection is None
+        try:
+            super().schedule()
+        finally:
+            self._initial = False
+
+    def _assign_work_unit(self, node) -> None:
+        if not self._ordered:
+            self._order_workqueue()
+        if self._initial and self._pending_of(self.assigned_work[node]):
+            # Top-up so the worker does not stall on its last test: hand out
+            # the shortest scope, keeping the long ones for idle workers.
+            self.workqueue.move_to_end(next(reversed(self.workqueue)), last=False)
+        super()._assign_work_unit(node)
+
+
+# ── Pytest plugin ────────────────────────────────────────────────────────
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--timing-db",
+        action="store",
+        default=DEFAULT_PATH,
+        help="SQLite file with historical per-test durations",
+    )
+    parser.addoption(
+        "--duration-schedule",
+        action="store_true",
+        default=False,
+        help="With -n, run the longest test classes/modules first",
+    )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log) -> Optional[DurationScheduling]:
+    if not config.getoption("--duration-schedule"):
+        return None
+    return DurationScheduling(config, log)
+
+
+def pytest_runtest_logreport(report):
+    _durations[report.nodeid] = _durations.get(report.nodeid, 0.0) + report.duration
+    if report.when == "call" or report.outcome != "passed":
+        _outcomes.setdefault(report.nodeid, report.outcome)
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    # Workers forward their reports, so only the controller writes.
+    if hasattr(config, "workerinput") or not _durations:
+        return
+    store = TimingStore(config.getoption("--timing-db"))
+    try:
+        store.record(
+            (nodeid, seconds, _outcomes.get(nodeid, "passed"))
+            for nodeid, seconds in _durations.items()
+        )
+    finally:
+        store.close()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _prediction:
+        return
+    tr = terminalreporter
+    actual = time.time() - _prediction["started"]
+    predicted = _prediction["makespan"]
+    tr.write_sep("=", "duration scheduling")
+    tr.write_line(
+        f"predicted {predicted:.1f}s on {_prediction['workers']:.0f} workers, "
+        f"actual {actual:.1f}s ({actual - predicted:+.1f}s); "
+        f"{_prediction['unknown']:.0f} tests had no recorded duration"
+    )
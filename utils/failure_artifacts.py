@@ -0,0 +1,80 @@
+"""Pytest plugin keeping traces, screenshots and screencasts of failed tests.
+
+``--artifacts=on-failure`` records every browser context through
+``pages.artifact_manager.ARTIFACTS`` and writes evidence only for tests
+that failed or are being retried; ``always`` keeps it for every test and
+``off`` (the default) records nothing. Writing happens on a background
+thread that is drained when the session finishes. Evidence goes to
+pytest-playwright's ``--output`` directory.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from pages.artifact_manager import ARTIFACTS, MODES
+
+_reports_key = pytest.StashKey[Dict[str, pytest.TestReport]]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--artifacts",
+        action="store",
+        default="off",
+        choices=MODES,
+        help="Capture trace, screenshots and rewind screencast: off, "
+        "on-failure or always",
+    )
+    parser.addoption(
+        "--rewind-frames",
+        action="store",
+        type=int,
+        default=150,
+        help="Screencast frames kept in memory per test for --artifacts",
+    )
+    parser.addoption(
+        "--trace-window",
+        action="store",
+        type=float,
+        default=60.0,
+        help="Seconds of trace kept before the next navigation starts a new "
+        "chunk for --artifacts",
+    )
+
+
+def pytest_configure(config):
+    ARTIFACTS.output_dir = Path(config.getoption("--output", "test-results"))
+    ARTIFACTS.mode = config.getoption("--artifacts")
+    ARTIFACTS.frames = config.getoption("--rewind-frames")
+    ARTIFACTS.trace_window = config.getoption("--trace-window")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    item.stash.setdefault(_reports_key, {})[report.when] = report
+
+
+def needs_artifacts(item: pytest.Item) -> bool:
+    """Whether a test's evidence should be kept.
+
+    Args:
+        item: The test item, queried during its teardown.
+
+    Returns:
+        True if setup or the test body failed, or the test is a retry.
+    """
+    reports = item.stash.get(_reports_key, {})
+    if any(report.failed for report in reports.values()):
+        return True
+    # pytest-rerunfailures counts attempts on the item.
+    return getattr(item, "execution_count", 1) > 1
+
+
+def pytest_sessionfinish(session):
+    ARTIFACTS.flush()
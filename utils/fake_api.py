@@ -0,0 +1,704 @@
+"""In-process stand-in for the Echostash REST API.
+
+``--fake-api`` starts a threaded HTTP server on the host and port of the
+environment's ``API_URL`` (so it must be a local URL, e.g. ``--env local``
+with no backend running). The ``api_url`` fixture, the pooled API client,
+the browser and the other plugins are unchanged: they simply talk to the
+fake. Under xdist the controller hosts the server and all workers share it;
+data is isolated per guest token, as on the real backend.
+
+State lives in memory and covers guest auth, projects, prompts and their
+versions, API keys, context-store assets and eval runs. ``--fake-api-latency``
+delays every response, and the ``fake_api`` fixture injects per-endpoint
+delays and error statuses, optionally only for one guest's requests.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+from dotenv import dotenv_values
+
+CONTROL_PREFIX = "/__fake__"
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "0.0.0.0")
+EVAL_STATUSES = ("queued", "running", "completed")
+
+Response = Tuple[int, object]
+
+
+class ApiError(Exception):
+    """An HTTP error response raised by a fake endpoint."""
+
+    def __init__(self, status: int, message: str) -> None:
+        """Initialize ApiError.
+
+        Args:
+            status: HTTP status code.
+            message: Error message returned in the body.
+        """
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class Fault:
+    """Delay and/or error injected into matching requests."""
+
+    method: str
+    pattern: re.Pattern
+    status: Optional[int] = None
+    delay: float = 0.0
+    times: Optional[int] = None
+    token: Optional[str] = None
+    owner: Optional[str] = None
+
+    def matches(self, method: str, path: str, token: Optional[str]) -> bool:
+        """Whether the fault applies to a request."""
+        return (
+            self.method in ("*", method)
+            and self.pattern.fullmatch(path) is not None
+            and (self.token is None or self.token == token)
+            and (self.times is None or self.times > 0)
+        )
+
+
+def _template(path: str) -> re.Pattern:
+    """Compile ``/projects/{id}/prompts`` into a regex with named groups."""
+    return re.compile(re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", path.rstrip("/")))
+
+
+def _now() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+class FakeBackend:
+    """In-memory Echostash state and endpoint handlers, independent of HTTP."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """Initialize an empty backend.
+
+        Args:
+            latency: Seconds added to every response.
+        """
+        self.latency = latency
+        self.served = 0
+        self.injected = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self._faults: List[Fault] = []
+        self._users: Dict[str, dict] = {}
+        self._refresh: Dict[str, str] = {}
+        self._tables: Dict[str, Dict[int, dict]] = {
+            "projects": {},
+            "prompts": {},
+            "versions": {},
+            "api_keys": {},
+            "assets": {},
+            "eval_runs": {},
+        }
+        self._routes: List[Tuple[str, re.Pattern, Callable[..., Response]]] = []
+        for method, path, handler in (
+            ("POST", "/auth/guest", self._login_guest),
+            ("POST", "/auth/refresh", self._refresh_token),
+            ("GET", "/auth/me", self._me),
+            ("GET", "/projects", self._list("projects")),
+            ("POST", "/projects", self._create_project),
+            ("GET", "/projects/{id}", self._get_project),
+            ("PUT", "/projects/{id}", self._update_project),
+            ("PATCH", "/projects/{id}", self._update_project),
+            ("DELETE", "/projects/{id}", self._delete_project),
+            ("GET", "/projects/{project}/prompts", self._list_prompts),
+            ("POST", "/projects/{project}/prompts", self._create_prompt),
+            ("GET", "/projects/{project}/prompts/{id}", self._get_prompt),
+            ("PUT", "/projects/{project}/prompts/{id}", self._update_prompt),
+            ("DELETE", "/projects/{project}/prompts/{id}", self._delete_prompt),
+            ("GET", "/prompts/{id}", self._get_prompt),
+            ("PUT", "/prompts/{id}", self._update_prompt),
+            ("DELETE", "/prompts/{id}", self._delete_prompt),
+            ("GET", "/prompts/{id}/versions", self._list_versions),
+            ("POST", "/prompts/{id}/versions", self._create_version),
+            ("GET", "/prompts/{id}/versions/{number}", self._get_version),
+            ("GET", "/api-keys", self._list("api_keys")),
+            ("POST", "/api-keys", self._create_api_key),
+            ("DELETE", "/api-keys/{id}", self._delete("api_keys")),
+            ("GET", "/context-store/assets", self._list("assets")),
+            ("POST", "/context-store/assets", self._create_asset),
+            ("GET", "/context-store/assets/{id}", self._get("assets")),
+            ("DELETE", "/context-store/assets/{id}", self._delete("assets")),
+            ("GET", "/evals/runs", self._list("eval_runs")),
+            ("POST", "/evals/runs", self._create_eval_run),
+            ("GET", "/evals/runs/{id}", self._get_eval_run),
+        ):
+            self._routes.append((method, _template(path), handler))
+
+    # ── Faults ───────────────────────────────────────────────────────────
+
+    def inject(
+        self,
+        method: str,
+        path: str,
+        status: Optional[int] = None,
+        delay: float = 0.0,
+        times: Optional[int] = None,
+        token: Optional[str] = None,
+        owner: Optional[str] = None,
+    ) -> None:
+        """Delay and/or fail matching requests.
+
+        Args:
+            method: HTTP method, or ``*`` for any.
+            path: Path template such as ``/projects/{id}``.
+            status: Error status to return instead of the real response.
+            delay: Seconds to wait before responding.
+            times: Number of requests affected (None for all).
+            token: Only affect requests carrying this bearer token.
+            owner: Tag (e.g. a test node ID) used by ``clear``.
+        """
+        fault = Fault(
+            method.upper(), _template(path), status, delay, times, token, owner
+        )
+        with self._lock:
+            self._faults.append(fault)
+
+    def clear(self, owner: Optional[str] = None) -> None:
+        """Remove injected faults, all of them or one owner's.
+
+        Args:
+            owner: Only remove faults injected with this tag.
+        """
+        with self._lock:
+            self._faults = [
+                f for f in self._faults if owner is not None and f.owner != owner
+            ]
+
+    def _fault(self, method: str, path: str, token: Optional[str]) -> Optional[Fault]:
+        with self._lock:
+            for fault in self._faults:
+                if fault.matches(method, path, token):
+                    if fault.times is not None:
+                        fault.times -= 1
+                    self.injected += 1
+                    return fault
+        return None
+
+    # ── Dispatch ─────────────────────────────────────────────────────────
+
+    def handle(
+        self, method: str, path: str, token: Optional[str], body: object
+    ) -> Response:
+        """Serve one API request.
+
+        Args:
+            method: HTTP method.
+            path: Request path, without query string.
+            token: Bearer token, if any.
+            body: Decoded JSON body, or None.
+
+        Returns:
+            ``(status, payload)``; a payload of None means no content.
+        """
+        path = path.rstrip("/") or "/"
+        fault = self._fault(method, path, token)
+        delay = self.latency + (fault.delay if fault else 0.0)
+        if delay:
+            time.sleep(delay)
+        with self._lock:
+            self.served += 1
+        if fault is not None and fault.status is not None:
+            return fault.status, {"message": "injected fault"}
+        for route_method, pattern, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if match is None or route_method != method:
+                continue
+            try:
+                with self._lock:
+                    public = path in ("/auth/guest", "/auth/refresh")
+                    user = None if public else self._user(token)
+                    return handler(user, body or {}, **match.groupdict())
+            except ApiError as e:
+                return e.status, {"message": str(e)}
+        return 404, {"message": f"no route for {method} {path}"}
+
+    def _user(self, token: Optional[str]) -> dict:
+        user = self._users.get(token or "")
+        if user is None:
+            raise ApiError(401, "unauthorized")
+        return user
+
+    def _new_id(self) -> int:
+        return next(self._ids)
+
+    def _owned(self, table: str, user: dict, id: str) -> dict:
+        row = self._tables[table].get(int(id)) if id.isdigit() else None
+        if row is None or row["ownerId"] != user["id"]:
+            raise ApiError(404, f"{table} {id} not found")
+        return row
+
+    def _insert(self, table: str, user: dict, row: dict) -> Response:
+        row = {
+            "id": self._new_id(),
+            "ownerId": user["id"],
+            "createdAt": _now(),
+            "updatedAt": _now(),
+            **row,
+        }
+        self._tables[table][row["id"]] = row
+        return 201, row
+
+    def _page(self, rows: List[dict]) -> Response:
+        return 200, {"content": rows, "totalElements": len(rows)}
+
+    def _list(self, table: str) -> Callable[..., Response]:
+        def handler(user: dict, body: dict) -> Response:
+            rows = self._tables[table].values()
+            return self._page([r for r in rows if r["ownerId"] == user["id"]])
+
+        return handler
+
+    def _get(self, table: str) -> Callable[..., Response]:
+        def handler(user: dict, body: dict, id: str) -> Response:
+            return 200, self._owned(table, user, id)
+
+        return handler
+
+    def _delete(self, table: str) -> Callable[..., Response]:
+        def handler(user: dict, body: dict, id: str) -> Response:
+            row = self._owned(table, user, id)
+            del self._tables[table][row["id"]]
+            return 204, None
+
+        return handler
+
+    # ── Auth ─────────────────────────────────────────────────────────────
+
+    def _tokens(self, user: dict) -> dict:
+        access = f"fake-access-{self._new_id()}"
+        refresh = f"fake-refresh-{self._new_id()}"
+        self._users[access] = user
+        self._refresh[refresh] = access
+        return {"accessToken": access, "refreshToken": refresh, "user": user}
+
+    def _login_guest(self, user: None, body: dict) -> Response:
+        user_id = self._new_id()
+        user = {"id": user_id, "name": f"Guest {user_id}", "guest": True}
+        return 200, self._tokens(user)
+
+    def _refresh_token(self, user: None, body: dict) -> Response:
+        access = self._refresh.pop(body.get("refreshToken", ""), None)
+        if access is None:
+            raise ApiError(401, "invalid refresh token")
+        return 200, self._tokens(self._users[access])
+
+    def _me(self, user: dict, body: dict) -> Response:
+        return 200, user
+
+    # ── Projects and prompts ─────────────────────────────────────────────
+
+    def _create_project(self, user: dict, body: dict) -> Response:
+        if not body.get("name"):
+            raise ApiError(400, "name is required")
+        return self._insert(
+            "projects",
+            user,
+            {"name": body["name"], "description": body.get("description", "")},
+        )
+
+    def _get_project(self, user: dict, body: dict, id: str) -> Response:
+        project = dict(self._owned("projects", user, id))
+        prompts = self._tables["prompts"].values()
+        project["promptCount"] = sum(
+            1 for p in prompts if p["projectId"] == project["id"]
+        )
+        return 200, project
+
+    def _update_project(self, user: dict, body: dict, id: str) -> Response:
+        project = self._owned("projects", user, id)
+        project.update(
+            {k: v for k, v in body.items() if k in ("name", "description")},
+            updatedAt=_now(),
+        )
+        return 200, project
+
+    def _delete_project(self, user: dict, body: dict, id: str) -> Response:
+        project = self._owned("projects", user, id)
+        for prompt in list(self._tables["prompts"].values()):
+            if prompt["projectId"] == project["id"]:
+                self._remove_prompt(prompt)
+        del self._tables["projects"][project["id"]]
+        return 204, None
+
+    def _list_prompts(self, user: dict, body: dict, project: str) -> Response:
+        owner = self._owned("projects", user, project)
+        rows = self._tables["prompts"].values()
+        return self._page([p for p in rows if p["projectId"] == owner["id"]])
+
+    def _create_prompt(self, user: dict, body: dict, project: str) -> Response:
+        owner = self._owned("projects", user, project)
+        status, prompt = self._insert(
+            "prompts", user, {**body, "projectId": owner["id"], "version": 0}
+        )
+        self._add_version(user, prompt, body.get("content", ""))
+        return status, prompt
+
+    def _get_prompt(
+        self, user: dict, body: dict, id: str, project: Optional[str] = None
+    ) -> Response:
+        return 200, self._owned("prompts", user, id)
+
+    def _update_prompt(
+        self, user: dict, body: dict, id: str, project: Optional[str] = None
+    ) -> Response:
+        prompt = self._owned("prompts", user, id)
+        fields = {k: v for k, v in body.items() if k not in ("id", "ownerId")}
+        prompt.update(fields, updatedAt=_now())
+        if "content" in body:
+            self._add_version(user, prompt, body["content"])
+        return 200, prompt
+
+    def _delete_prompt(
+        self, user: dict, body: dict, id: str, project: Optional[str] = None
+    ) -> Response:
+        self._remove_prompt(self._owned("prompts", user, id))
+        return 204, None
+
+    def _remove_prompt(self, prompt: dict) -> None:
+        versions = self._tables["versions"]
+        for key in [k for k, v in versions.items() if v["promptId"] == prompt["id"]]:
+            del versions[key]
+        del self._tables["prompts"][prompt["id"]]
+
+    # ── Versions ─────────────────────────────────────────────────────────
+
+    def _add_version(self, user: dict, prompt: dict, content: str) -> dict:
+        prompt["version"] += 1
+        prompt["content"] = content
+        _, version = self._insert(
+            "versions",
+            user,
+            {"promptId": prompt["id"], "number": prompt["version"], "content": content},
+        )
+        return version
+
+    def _versions(self, prompt: dict) -> List[dict]:
+        rows = self._tables["versions"].values()
+        return [v for v in rows if v["promptId"] == prompt["id"]]
+
+    def _list_versions(self, user: dict, body: dict, id: str) -> Response:
+        return self._page(self._versions(self._owned("prompts", user, id)))
+
+    def _create_version(self, user: dict, body: dict, id: str) -> Response:
+        prompt = self._owned("prompts", user, id)
+        return 201, self._add_version(user, prompt, body.get("content", ""))
+
+    def _get_version(self, user: dict, body: dict, id: str, number: str) -> Response:
+        for version in self._versions(self._owned("prompts", user, id)):
+            if str(version["number"]) == number:
+                return 200, version
+        raise ApiError(404, f"version {number} not found")
+
+    # ── API keys, context store, evals ───────────────────────────────────
+
+    def _create_api_key(self, user: dict, body: dict) -> Response:
+        key_id = self._new_id()
+        secret = f"sk-fake-{key_id:08d}"
+        return self._insert(
+            "api_keys",
+            user,
+            {"name": body.get("name", ""), "key": secret, "prefix": secret[:10]},
+        )
+
+    def _create_asset(self, user: dict, body: dict) -> Response:
+        content = body.get("content", "")
+        return self._insert(
+            "assets",
+            user,
+            {
+                "name": body.get("name", ""),
+                "type": body.get("type", "text"),
+                "content": content,
+                "size": len(content.encode()),
+            },
+        )
+
+    def _create_eval_run(self, user: dict, body: dict) -> Response:
+        return self._insert(
+            "eval_runs",
+            user,
+            {**body, "status": EVAL_STATUSES[0], "results": []},
+        )
+
+    def _get_eval_run(self, user: dict, body: dict, id: str) -> Response:
+        # Every poll advances the run one step, so the UI's progress states
+        # are reached deterministically.
+        run = self._owned("eval_runs", user, id)
+        step = EVAL_STATUSES.index(run["status"])
+        if step < len(EVAL_STATUSES) - 1:
+            run["status"] = EVAL_STATUSES[step + 1]
+        if run["status"] == "completed" and not run["results"]:
+            run["results"] = [{"case": 1, "passed": True, "score": 1.0}]
+        return 200, run
+
+    # ── Control endpoints ────────────────────────────────────────────────
+
+    def control(self, method: str, path: str, query: dict, body: dict) -> Response:
+        """Serve a ``/__fake__`` request from a test process.
+
+        Args:
+            method: HTTP method.
+            path: Path below the control prefix.
+            query: Parsed query string.
+            body: Decoded JSON body.
+
+        Returns:
+            ``(status, payload)``.
+        """
+        if path == "/faults" and method == "POST":
+            self.inject(**body)
+            return 204, None
+        if path == "/faults" and method == "DELETE":
+            self.clear(query.get("owner", [None])[0])
+            return 204, None
+        if path == "/stats" and method == "GET":
+            return 200, {"served": self.served, "injected": self.injected}
+        return 404, {"message": f"no control route for {method} {path}"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Translates HTTP requests to ``FakeBackend`` calls, with CORS."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    backend: FakeBackend
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def _send(self, status: int, payload: object) -> None:
+        data = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        origin = self.headers.get("Origin")
+        if origin:
+            self.send_header("Access-Control-Allow-Origin", origin)
+            self.send_header("Access-Control-Allow-Credentials", "true")
+            self.send_header("Vary", "Origin")
+        if data:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_OPTIONS(self) -> None:
+        self.send_response(204)
+        self.send_header(
+            "Access-Control-Allow-Origin", self.headers.get("Origin", "*")
+        )
+        self.send_header("Access-Control-Allow-Credentials", "true")
+        self.send_header(
+            "Access-Control-Allow-Methods", "GET, POST, PUT, PATCH, DELETE, OPTIONS"
+        )
+        self.send_header(
+            "Access-Control-Allow-Headers",
+            self.headers.get("Access-Control-Request-Headers", "*"),
+        )
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _dispatch(self) -> None:
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(raw) if raw else None
+        except ValueError:
+            self._send(400, {"message": "invalid JSON body"})
+            return
+        if url.path.startswith(CONTROL_PREFIX):
+            status, payload = self.backend.control(
+                self.command,
+                url.path[len(CONTROL_PREFIX):],
+                parse_qs(url.query),
+                body or {},
+            )
+        else:
+            auth = self.headers.get("Authorization", "")
+            token = auth[7:] if auth.startswith("Bearer ") else None
+            status, payload = self.backend.handle(self.command, url.path, token, body)
+        self._send(status, payload)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+
+class FakeApiServer:
+    """Runs a ``FakeBackend`` behind a threaded HTTP server."""
+
+    def __init__(self, host: str, port: int, latency: float = 0.0) -> None:
+        """Bind the server without serving yet.
+
+        Args:
+            host: Interface to listen on.
+            port: Port to listen on.
+            latency: Seconds added to every response.
+
+        Raises:
+            OSError: If the port is already in use.
+        """
+        self.backend = FakeBackend(latency)
+        handler = type("Handler", (_Handler,), {"backend": self.backend})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fake-api", daemon=True
+        )
+
+    def start(self) -> None:
+        """Serve requests on a background thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class FakeApiControl:
+    """Injects faults into the fake API from a test, across processes."""
+
+    def __init__(self, api_url: str, owner: Optional[str] = None) -> None:
+        """Initialize FakeApiControl.
+
+        Args:
+            api_url: Base URL the fake API listens on.
+            owner: Tag attached to every injected fault, so ``clear`` only
+                removes this controller's faults.
+        """
+        self.url = f"{api_url.rstrip('/')}{CONTROL_PREFIX}"
+        self.owner = owner
+
+    def inject(
+        self,
+        method: str,
+        path: str,
+        status: Optional[int] = None,
+        delay: float = 0.0,
+        times: Optional[int] = None,
+        token: Optional[str] = None,
+    ) -> None:
+        """Delay and/or fail matching requests (see ``FakeBackend.inject``).
+
+        Args:
+            method: HTTP method, or ``*`` for any.
+            path: Path template such as ``/projects/{id}``.
+            status: Error status to return instead of the real response.
+            delay: Seconds to wait before responding.
+            times: Number of requests affected (None for all).
+            token: Only affect requests carrying this bearer token.
+        """
+        fault = {"method": method, "path": path, "status": status, "delay": delay}
+        fault.update(times=times, token=token, owner=self.owner)
+        requests.post(f"{self.url}/faults", json=fault).raise_for_status()
+
+    def clear(self) -> None:
+        """Remove the faults injected through this controller (all, if unowned)."""
+        params = {"owner": self.owner} if self.owner else {}
+        requests.delete(f"{self.url}/faults", params=params).raise_for_status()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of requests served and faults injected."""
+        resp = requests.get(f"{self.url}/stats")
+        resp.raise_for_status()
+        return resp.json()
+
+
+# ── Pytest plugin ────────────────────────────────────────────────────────
+
+_server: Dict[str, FakeApiServer] = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--fake-api",
+        action="store_true",
+        default=False,
+        help="Serve API_URL from an in-memory fake of the Echostash API",
+    )
+    parser.addoption(
+        "--fake-api-latency",
+        action="store",
+        type=float,
+        default=0.0,
+        help="Milliseconds the fake API waits before every response",
+    )
+
+
+def _configured_api_url(config) -> str:
+    """The API_URL of the selected ``--env``, as ``load_env`` will set it."""
+    env = config.getoption("--env", default="local")
+    env_file = Path(__file__).parent.parent / "config" / f"{env}.env"
+    return dotenv_values(env_file).get("API_URL") or "http://localhost:8085"
+
+
+def pytest_configure(config):
+    if not config.getoption("--fake-api") or hasattr(config, "workerinput"):
+        return
+    url = urlsplit(_configured_api_url(config))
+    if url.hostname not in LOCAL_HOSTS:
+        raise pytest.UsageError(
+            f"--fake-api needs a local API_URL, got {url.geturl()} (use --env local)"
+        )
+    try:
+        server = FakeApiServer(
+            url.hostname,
+            url.port or 80,
+            latency=config.getoption("--fake-api-latency") / 1000,
+        )
+    except OSError as e:
+        raise pytest.UsageError(
+            f"--fake-api cannot listen on {url.netloc} ({e}); stop the backend first"
+        )
+    server.start()
+    _server["main"] = server
+
+
+def pytest_unconfigure(config):
+    server = _server.pop("main", None)
+    if server is not None:
+        server.stop()
+
+
+@pytest.fixture
+def fake_api(request, api_url: str):
+    """Control the fake API; faults injected by the test are removed after it.
+
+    Skips the test unless the run uses ``--fake-api``.
+
+    Yields:
+        FakeApiControl for the test's ``api_url``.
+    """
+    if not request.config.getoption("--fake-api"):
+        pytest.skip("needs --fake-api")
+    control = FakeApiControl(api_url, owner=request.node.nodeid)
+    yield control
+    control.clear()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    server = _server.get("main")
+    if server is None:
+        return
+    backend = server.backend
+    terminalreporter.write_sep(
+        "=",
+        f"fake API: {backend.served} requests served, "
+        f"{backend.injected} with injected faults",
+    )
@@ -0,0 +1,380 @@
+"""Pytest plugin running parametrized read-only checks on concurrent pages.
+
+A parametrized ``async def`` test marked ``@pytest.mark.fan_out`` takes an
+async ``fan_page`` (``playwright.async_api.Page``) and drives it with the
+``pages.aio`` page objects. When the first of its parameters runs, the
+plugin opens one browser context and starts every parameter of that test
+function on its own page, at most ``--fan-out-limit`` at a time. Each
+parameter still reports its own pass/fail: it waits for the outcome of its
+check and re-raises its failure, so the group takes about as long as its
+slowest page instead of the sum of all pages.
+
+The marker's keyword arguments are context options (``viewport=...``);
+``authenticated=True`` creates the context from the pooled guest
+identity's ``storage_state``. Only side-effect-free checks belong here:
+the parameters share cookies and storage, and their bodies run before
+pytest sets up the other parameters, so a fan-out test may only take its
+parameters, ``fan_page`` and fixtures scoped wider than a function.
+
+Pages of ``perf_budget`` tests record web vitals and are not batched: each
+runs alone in a fresh context, so contention and a warm HTTP cache do not
+skew its budget. Other fan-out pages are batched and not measured, even
+under ``--web-vitals``, whose numbers concurrent pages would distort.
+Parameters are batched only when they are guaranteed to run in this
+process: without xdist, or with ``--dist loadgroup`` / ``loadscope`` /
+``loadfile`` / ``--duration-schedule`` (each fan-out test is tagged with
+an ``xdist_group``). The pages run on an event loop thread with a browser
+of their own, so they get the idle tracker and third-party request
+blocking but no ``--artifacts``, ``--api-latency``, ``--memory-watchdog``,
+``--asset-cache`` or span recording; fan-out tests are skipped under a
+recorded or replayed ``--backend``. ``--no-fan-out`` runs every parameter
+on its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import inspect
+import threading
+from typing import Coroutine, Dict, List, Optional, Set, Tuple
+
+import pytest
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Playwright,
+    Route,
+    async_playwright,
+)
+
+from pages.aio.idle_tracker import install_idle_tracker
+from pages.spans import suppress_spans
+from pages.web_vitals import VITALS, VITALS_OBSERVER_SCRIPT
+from utils.har_replay import REPLAY
+from utils.request_blocking import BLOCKER, block_pattern_from_env
+
+DEFAULT_LIMIT = 8
+BATCHING_DISTS = ("loadgroup", "loadscope", "loadfile")
+
+# Pending outcome of each check started by a batch, by nodeid.
+_pending: Dict[str, concurrent.futures.Future] = {}
+_started: Set[str] = set()
+
+
+class FanOutBrowser:
+    """A browser driven from its own event loop thread.
+
+    The sync Playwright API owns the main thread, so the concurrent pages
+    live in a separate ``async_playwright`` instance whose loop runs in a
+    daemon thread; batches are submitted to it from the main thread.
+    """
+
+    def __init__(self, browser_name: str, launch_args: dict, limit: int) -> None:
+        """Initialize FanOutBrowser; nothing starts until the first batch.
+
+        Args:
+            browser_name: ``chromium``, ``firefox`` or ``webkit``.
+            launch_args: Keyword arguments for ``BrowserType.launch``.
+            limit: Pages open at the same time, across all batches.
+        """
+        self.browser_name = browser_name
+        self.launch_args = launch_args
+        self.limit = max(limit, 1)
+        self._loop = asyncio.new_event_loop()
+        self._thread: Optional[threading.Thread] = None
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._block = block_pattern_from_env() if BLOCKER.enabled else None
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """Schedule a coroutine on the loop thread, starting the thread once.
+
+        Args:
+            coro: Coroutine to run.
+
+        Returns:
+            Future of the coroutine's result.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._loop.run_forever, name="fan-out", daemon=True
+            )
+            self._thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run_batch(
+        self,
+        options: dict,
+        checks: List[Tuple[pytest.Function, dict, bool]],
+    ) -> Dict[str, concurrent.futures.Future]:
+        """Start checks on pages of one new context.
+
+        Args:
+            options: ``Browser.new_context`` keyword arguments.
+            checks: ``(item, kwargs, measuring)`` of each check; ``kwargs``
+                are the test function's arguments except ``fan_page``.
+
+        Returns:
+            Future of each check by nodeid, resolving to the web vitals it
+            measured or to its exception.
+        """
+        futures = {item.nodeid: concurrent.futures.Future() for item, _, _ in checks}
+        self.submit(self._batch(options, checks, futures))
+        return futures
+
+    async def _batch(
+        self,
+        options: dict,
+        checks: List[Tuple[pytest.Function, dict, bool]],
+        futures: Dict[str, concurrent.futures.Future],
+    ) -> None:
+        """Run the checks of one batch and close its context."""
+        try:
+            context = await self._new_context(
+                options, any(measuring for _, _, measuring in checks)
+            )
+        except BaseException as exc:
+            for future in futures.values():
+                future.set_exception(exc)
+            return
+        try:
+            await asyncio.gather(
+                *(
+                    self._check(context, item, kwargs, measuring, futures[item.nodeid])
+                    for item, kwargs, measuring in checks
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            await context.close()
+
+    async def _new_context(self, options: dict, measuring: bool) -> BrowserContext:
+        """Create a context set up like the sync ``context`` fixture's."""
+        if self._browser is None:
+            self._slots = asyncio.Semaphore(self.limit)
+            self._playwright = await async_playwright().start()
+            browser_type = getattr(self._playwright, self.browser_name)
+            self._browser = await browser_type.launch(**self.launch_args)
+        context = await self._browser.new_context(**options)
+        await install_idle_tracker(context)
+        if measuring:
+            await context.add_init_script(f"({VITALS_OBSERVER_SCRIPT})();")
+        elif self._block is not None:
+            await context.route(self._block, _abort)
+        return context
+
+    async def _check(
+        self,
+        context: BrowserContext,
+        item: pytest.Function,
+        kwargs: dict,
+        measuring: bool,
+        future: concurrent.futures.Future,
+    ) -> None:
+        """Run one test body on a page of its own and resolve its future."""
+        async with self._slots:
+            page = None
+            try:
+                page = await context.new_page()
+                with VITALS.scoped(measuring) as records, suppress_spans():
+                    await item.obj(**kwargs, fan_page=page)
+            except BaseException as exc:
+                future.set_exception(exc)
+                if isinstance(exc, asyncio.CancelledError):
+                    raise
+            else:
+                future.set_result(records)
+            finally:
+                if page is not None:
+                    await page.close()
+
+    async def _stop(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+    def close(self) -> None:
+        """Close the browser and stop the loop thread."""
+        if self._thread is None:
+            return
+        try:
+            self.submit(self._stop()).result()
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+
+async def _abort(route: Route) -> None:
+    await route.abort("blockedbyclient")
+
+
+def _key(item: pytest.Item) -> str:
+    """Group of an item: its test function and browser, across parameters."""
+    params = getattr(item, "callspec", None)
+    browser = params.params.get("browser_name", "") if params is not None else ""
+    return f"fan_out:{item.parent.nodeid}::{item.originalname}:{browser}"
+
+
+def _measuring(item: pytest.Item) -> bool:
+    """Whether the item's page loads record web vitals (``perf_budget`` only)."""
+    return item.get_closest_marker("perf_budget") is not None
+
+
+def _batching(config: pytest.Config) -> bool:
+    """Whether every parameter of a test is known to run in this process."""
+    if config.getoption("--no-fan-out"):
+        return False
+    if hasattr(config, "workerinput"):
+        # Workers see ``--dist no``; the controller passes its verdict.
+        return config.workerinput.get("fan_out_batching", False)
+    if config.getoption("numprocesses", None):
+        return config.getoption("dist") in BATCHING_DISTS or config.getoption(
+            "--duration-schedule"
+        )
+    return True
+
+
+def _batch_items(leader: pytest.Function) -> List[pytest.Function]:
+    """The leader plus the unstarted parameters that can share its context."""
+    batch = [leader]
+    if not _batching(leader.config) or _measuring(leader):
+        return batch
+    kwargs = leader.get_closest_marker("fan_out").kwargs
+    for item in leader.session.items:
+        if item is leader or item.nodeid in _started or _key(item) != _key(leader):
+            continue
+        marker = item.get_closest_marker("fan_out")
+        if marker is None or marker.kwargs != kwargs or _measuring(item):
+            continue
+        batch.append(item)
+    return batch
+
+
+def _arguments(leader: pytest.Function, item: pytest.Function) -> dict:
+    """Arguments of ``item``'s test function, except ``fan_page``.
+
+    Parameters come from the item's own call spec; fixtures, which are
+    session-, module- or class-scoped, from the leader that is running.
+    """
+    params = getattr(item, "callspec", None)
+    params = params.params if params is not None else {}
+    return {
+        name: params[name] if name in params else leader.funcargs[name]
+        for name in item._fixtureinfo.argnames
+        if name != "fan_page"
+    }
+
+
+# ── Pytest plugin ────────────────────────────────────────────────────────
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-fan-out",
+        action="store_true",
+        default=False,
+        help="Run every parameter of fan_out tests in a context of its own",
+    )
+    parser.addoption(
+        "--fan-out-limit",
+        action="store",
+        type=int,
+        default=DEFAULT_LIMIT,
+        help="Pages fan_out tests open at the same time",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    # Runs before xdist's hook, which turns the group into a nodeid suffix.
+    for item in items:
+        if item.get_closest_marker("fan_out") is None:
+            continue
+        if not inspect.iscoroutinefunction(getattr(item, "obj", None)):
+            raise pytest.UsageError(f"{item.nodeid}: fan_out tests must be async")
+        if "fan_page" not in item.fixturenames:
+            raise pytest.UsageError(f"{item.nodeid}: fan_out tests take fan_page")
+        params = getattr(item, "callspec", None)
+        params = params.params if params is not None else {}
+        for name in item._fixtureinfo.argnames:
+            defs = item._fixtureinfo.name2fixturedefs.get(name)
+            if name in params or name == "fan_page" or not defs:
+                continue
+            if defs[-1].scope == "function":
+                raise pytest.UsageError(
+                    f"{item.nodeid}: fan_out tests cannot take the "
+                    f"function-scoped fixture {name!r}"
+                )
+        if item.get_closest_marker("xdist_group") is None:
+            item.add_marker(pytest.mark.xdist_group(name=_key(item)))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput["fan_out_batching"] = _batching(node.config)
+
+
+@pytest.fixture(scope="session")
+def _fan_out_browser(pytestconfig, browser_name: str, browser_type_launch_args):
+    """This worker's browser for fan-out pages, launched by the first batch."""
+    runner = FanOutBrowser(
+        browser_name,
+        browser_type_launch_args,
+        pytestconfig.getoption("--fan-out-limit"),
+    )
+    yield runner
+    runner.close()
+
+
+@pytest.fixture
+def fan_page(request, _fan_out_browser, browser_context_args) -> dict:
+    """Context options of a ``fan_out`` test.
+
+    The test function itself receives an async Page of the shared context
+    in this argument; the fixture only prepares how that context is built.
+
+    Returns:
+        ``Browser.new_context`` keyword arguments.
+    """
+    marker = request.node.get_closest_marker("fan_out")
+    if marker is None:
+        pytest.fail("fan_page is only available to fan_out tests", pytrace=False)
+    if REPLAY.mode != "live":
+        pytest.skip("fan_out pages are not recorded or replayed by --backend")
+    # Videos would land in pytest-playwright's folder without a test to own them.
+    options = {
+        k: v for k, v in browser_context_args.items() if k != "record_video_dir"
+    }
+    options.update(marker.kwargs)
+    # Parameters already started by a batch use its leader's context.
+    if options.pop("authenticated", False) and request.node.nodeid not in _started:
+        identity = request.getfixturevalue("guest_identity")
+        options["storage_state"] = str(identity.storage_state)
+    return options
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    if pyfuncitem.get_closest_marker("fan_out") is None:
+        return None
+    future = _pending.pop(pyfuncitem.nodeid, None)
+    if future is None:
+        batch = _batch_items(pyfuncitem)
+        _started.update(item.nodeid for item in batch)
+        runner: FanOutBrowser = pyfuncitem.funcargs["_fan_out_browser"]
+        _pending.update(
+            runner.run_batch(
+                pyfuncitem.funcargs["fan_page"],
+                [
+                    (item, _arguments(pyfuncitem, item), _measuring(item))
+                    for item in batch
+                ],
+            )
+        )
+        future = _pending.pop(pyfuncitem.nodeid)
+    VITALS.extend(future.result())
+    return True
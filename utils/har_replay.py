@@ -0,0 +1,273 @@
+"""Record/replay of backend traffic so UI tests can run without a backend.
+
+``--backend`` selects how each test talks to the Echostash API:
+
+- ``live`` (default): the real backend.
+- ``record``: run against the real backend and save the test's traffic to
+  ``<har-dir>/<test>/``: the browser's API calls via
+  ``context.route_from_har(update=True)`` into ``api.har``, and the
+  Python client's calls (test data setup) into ``client.json``.
+- ``replay``: serve both from the recording; no backend is contacted.
+  Tests without a recording are skipped.
+- ``update``: replay, but re-record tests whose recording is missing,
+  older than ``--har-max-age`` days, or marked stale because the test
+  failed on replay.
+
+``unique_name`` is seeded with the test's node ID while recording and
+replaying, so generated names (and therefore request bodies) repeat
+exactly. Browser requests are matched on method, URL and body in recorded
+order; if nothing matches exactly, IDs (numbers, UUIDs and ``unique_name``
+suffixes) are normalized away and the match is retried.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import re
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple
+
+import pytest
+from playwright.sync_api import BrowserContext, Route
+
+from pages.artifact_manager import safe_name
+from utils.api_client import TAPE
+from utils.cleanup import drain_cleanup
+from utils.helpers import seed_unique_names
+
+MODES = ("live", "record", "replay", "update")
+
+_DYNAMIC_IDS = [
+    re.compile(r"[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12}", re.I),
+    re.compile(r"(?<=-)[0-9a-f]{8}\b"),
+    re.compile(r"(?<=[/=])\d+(?=[/?&]|$)"),
+    re.compile(r"(?<=\")\d+(?=\")|(?<=: )\d+(?=[,}])"),
+]
+
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def normalize(text: str) -> str:
+    """Replace dynamic IDs in a URL or body with a placeholder.
+
+    Args:
+        text: URL or request body.
+
+    Returns:
+        The text with UUIDs, numeric IDs and ``unique_name`` suffixes
+        replaced by ``{id}``.
+    """
+    for pattern in _DYNAMIC_IDS:
+        text = pattern.sub("{id}", text)
+    return text
+
+
+class HarReplayer:
+    """Serves a HAR file's responses to a context, in recorded order."""
+
+    def __init__(self, har_path: Path) -> None:
+        """Initialize HarReplayer.
+
+        Args:
+            har_path: HAR file recorded with embedded content.
+        """
+        self.misses: List[str] = []
+        self._exact: Dict[Tuple[str, str, str], Deque[dict]] = {}
+        self._loose: Dict[Tuple[str, str, str], Deque[dict]] = {}
+        entries = json.loads(har_path.read_text())["log"]["entries"]
+        for entry in entries:
+            request = entry["request"]
+            body = request.get("postData", {}).get("text", "")
+            method, url = request["method"], request["url"]
+            self._exact.setdefault((method, url, body), deque()).append(entry)
+            loose = (method, normalize(url), normalize(body))
+            self._loose.setdefault(loose, deque()).append(entry)
+
+    def _next(self, index: Dict, key: Tuple[str, str, str]) -> Optional[dict]:
+        """Pop the next response for a key, repeating the last one."""
+        entries = index.get(key)
+        if not entries:
+            return None
+        return entries.popleft() if len(entries) > 1 else entries[0]
+
+    def handle(self, route: Route) -> None:
+        """Fulfill a request from the recording, or abort it.
+
+        Args:
+            route: The intercepted API request.
+        """
+        request = route.request
+        body = request.post_data or ""
+        entry = self._next(self._exact, (request.method, request.url, body))
+        if entry is None:
+            entry = self._next(
+                self._loose, (request.method, normalize(request.url), normalize(body))
+            )
+        if entry is None:
+            self.misses.append(f"{request.method} {request.url}")
+            route.abort()
+            return
+        response = entry["response"]
+        content = response.get("content", {})
+        data = content.get("text", "")
+        payload = (
+            base64.b64decode(data)
+            if content.get("encoding") == "base64"
+            else data.encode()
+        )
+        headers = {
+            h["name"]: h["value"]
+            for h in response.get("headers", [])
+            if h["name"].lower() not in _DROPPED_HEADERS
+        }
+        route.fulfill(status=response["status"], headers=headers, body=payload)
+
+
+class BackendSwitch:
+    """Decides per test whether the backend is live, recorded or replayed."""
+
+    def __init__(self) -> None:
+        """Initialize in ``live`` mode."""
+        self.mode = "live"
+        self.har_dir = Path("recordings")
+        self.max_age_days = 30
+        self.current: Optional[str] = None
+        self.directory: Optional[Path] = None
+        self.replayer: Optional[HarReplayer] = None
+
+    def plan(self, nodeid: str) -> str:
+        """Pick what a test does: ``live``, ``record``, ``replay`` or ``skip``.
+
+        Args:
+            nodeid: The test's node ID.
+
+        Returns:
+            The per-test mode.
+        """
+        if self.mode in ("live", "record"):
+            return self.mode
+        directory = self.har_dir / safe_name(nodeid)
+        har = directory / "api.har"
+        if self.mode == "replay":
+            return "replay" if har.exists() else "skip"
+        age_days = (time.time() - har.stat().st_mtime) / 86400 if har.exists() else 0
+        if (
+            not har.exists()
+            or (directory / "stale").exists()
+            or age_days > self.max_age_days
+        ):
+            return "record"
+        return "replay"
+
+    def begin(self, nodeid: str) -> str:
+        """Prepare the Python client and names for a test.
+
+        Args:
+            nodeid: The test's node ID.
+
+        Returns:
+            The per-test mode chosen by ``plan``.
+        """
+        self.current = self.plan(nodeid)
+        self.directory = self.har_dir / safe_name(nodeid)
+        self.replayer = None
+        if self.current in ("record", "replay"):
+            seed_unique_names(nodeid)
+            TAPE.start(self.current, self.directory / "client.json")
+            if self.current == "record":
+                (self.directory / "stale").unlink(missing_ok=True)
+        return self.current
+
+    def attach(self, context: BrowserContext, api_url: str) -> None:
+        """Route a test context's API traffic for the current mode.
+
+        Args:
+            context: The test's browser context.
+            api_url: Backend API base URL.
+        """
+        pattern = f"{api_url.rstrip('/')}/**"
+        if self.current == "record":
+            self.directory.mkdir(parents=True, exist_ok=True)
+            context.route_from_har(
+                self.directory / "api.har",
+                url=pattern,
+                update=True,
+                update_content="embed",
+            )
+        elif self.current == "replay":
+            self.replayer = HarReplayer(self.directory / "api.har")
+            context.route(pattern, self.replayer.handle)
+
+    def mark_stale(self) -> None:
+        """Flag the current recording for re-recording by ``update``."""
+        if self.current == "replay" and self.directory is not None:
+            misses = self.replayer.misses if self.replayer else []
+            (self.directory / "stale").write_text("\n".join(misses))
+
+    def end(self) -> None:
+        """Save the client recording and restore random names."""
+        TAPE.stop()
+        seed_unique_names(None)
+        self.current = None
+
+
+REPLAY = BackendSwitch()
+
+# ── Pytest plugin ────────────────────────────────────────────────────────
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--backend",
+        action="store",
+        default="live",
+        choices=MODES,
+        help="Backend traffic: live, record, replay or update recordings",
+    )
+    parser.addoption(
+        "--har-dir",
+        action="store",
+        default="recordings",
+        help="Directory holding the per-test backend recordings",
+    )
+    parser.addoption(
+        "--har-max-age",
+        action="store",
+        type=int,
+        default=30,
+        help="Days after which --backend=update re-records a test",
+    )
+
+
+def pytest_configure(config):
+    REPLAY.mode = config.getoption("--backend")
+    REPLAY.har_dir = Path(config.getoption("--har-dir"))
+    REPLAY.max_age_days = config.getoption("--har-max-age")
+    TAPE.offline = REPLAY.mode == "replay"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    if REPLAY.begin(item.nodeid) == "skip":
+        REPLAY.end()
+        pytest.skip("no backend recording (run once with --backend=record)")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when == "call" and outcome.get_result().failed:
+        REPLAY.mark_stale()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    yield
+    if REPLAY.mode == "update" and REPLAY.current == "replay":
+        # The tape answers the deletions of recorded IDs only while it runs;
+        # afterwards they would reach the live backend.
+        drain_cleanup(item.config)
+    REPLAY.end()
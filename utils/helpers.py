@@ -7,9 +7,11 @@ import string
 import uuid
 from typing import Any, Optional
 
-import requests
 from playwright.sync_api import BrowserContext, Page
 
+from pages.loading_state import wait_for_loading_complete
+from utils.api_client import get_api_client
+
 
 # ── API Helpers (test data setup/teardown) ───────────────────────────────
 
@@ -23,9 +25,7 @@ def api_login_guest(api_url: str) -> dict:
     Returns:
         Dict with ``accessToken`` and ``refreshToken``.
     """
-    resp = requests.post(f"{api_url}/auth/guest", timeout=15)
-    resp.raise_for_status()
-    return resp.json()
+    return get_api_client(api_url).login_guest()
 
 
 def api_create_project(
@@ -42,14 +42,7 @@ def api_create_project(
     Returns:
         Created project payload.
     """
-    resp = requests.post(
-        f"{api_url}/projects",
-        json={"name": name, "description": description},
-        headers={"Authorization": f"Bearer {token}"},
-        timeout=15,
-    )
-    resp.raise_for_status()
-    return resp.json()
+    return get_api_client(api_url).create_project(token, name, description)
 
 
 def api_create_prompt(
@@ -66,14 +59,7 @@ def api_create_prompt(
     Returns:
         Created prompt payload.
     """
-    resp = requests.post(
-        f"{api_url}/projects/{project_id}/prompts",
-        json=data,
-        headers={"Authorization": f"Bearer {token}"},
-        timeout=15,
-    )
-    resp.raise_for_status()
-    return resp.json()
+    return get_api_client(api_url).create_prompt(token, project_id, data)
 
 
 def api_delete_project(api_url: str, token: str, project_id: str) -> None:
@@ -83,43 +69,53 @@ def api_delete_project(api_url: str, token: str, project_id: str) -> None:
         api_url: Backend API base URL.
         token: Bearer access token.
         project_id: ID of the project to delete.
+
+    Raises:
+        requests.HTTPError: If the backend rejects the deletion (a project
+            that no longer exists is not an error).
     """
-    requests.delete(
-        f"{api_url}/projects/{project_id}",
-        headers={"Authorization": f"Bearer {token}"},
-        timeout=15,
-    )
+    get_api_client(api_url).delete_project(token, project_id)
 
 
 # ── Auth Helpers ─────────────────────────────────────────────────────────
 
 
-def set_auth_cookie(context: BrowserContext, token: str, base_url: str) -> None:
-    """Set the echostash_token cookie on the browser context.
+def build_auth_cookie(token: str, base_url: str) -> dict:
+    """Build the echostash_token cookie for the application domain.
 
     Args:
-        context: Playwright browser context.
         token: JWT access token value.
         base_url: Application base URL (used for cookie domain).
+
+    Returns:
+        Cookie dict in the shape accepted by ``BrowserContext.add_cookies``
+        and Playwright ``storage_state`` files.
     """
     from urllib.parse import urlparse
 
     parsed = urlparse(base_url)
     domain = parsed.hostname or "localhost"
 
-    context.add_cookies(
-        [
-            {
-                "name": "echostash_token",
-                "value": token,
-                "domain": domain,
-                "path": "/",
-                "httpOnly": False,
-                "secure": parsed.scheme == "https",
-                "sameSite": "Lax",
-            }
-        ]
-    )
+    return {
+        "name": "echostash_token",
+        "value": token,
+        "domain": domain,
+        "path": "/",
+        "httpOnly": False,
+        "secure": parsed.scheme == "https",
+        "sameSite": "Lax",
+    }
+
+
+def set_auth_cookie(context: BrowserContext, token: str, base_url: str) -> None:
+    """Set the echostash_token cookie on the browser context.
+
+    Args:
+        context: Playwright browser context.
+        token: JWT access token value.
+        base_url: Application base URL (used for cookie domain).
+    """
+    context.add_cookies([build_auth_cookie(token, base_url)])
 
 
 # ── UI Helpers ───────────────────────────────────────────────────────────
@@ -132,14 +128,7 @@ def wait_for_no_spinners(page: Page, timeout: int = 10000) -> None:
         page: Playwright page instance.
         timeout: Maximum wait time in milliseconds.
     """
-    for selector in [
-        "[data-testid='loading']",
-        ".animate-spin",
-        "[role='progressbar']",
-    ]:
-        locator = page.locator(selector)
-        if locator.count() > 0:
-            locator.first.wait_for(state="hidden", timeout=timeout)
+    wait_for_loading_complete(page, timeout=timeout)
 
 
 def get_monaco_value(page: Page) -> str:
@@ -180,15 +169,33 @@ def set_monaco_value(page: Page, value: str) -> None:
 # ── Data Generators ─────────────────────────────────────────────────────
 
 
+_name_rng: Optional[random.Random] = None
+
+
+def seed_unique_names(seed: Optional[str]) -> None:
+    """Make ``unique_name`` repeatable for record/replay runs.
+
+    Args:
+        seed: Seed (e.g. the test node ID), or None to go back to random.
+    """
+    global _name_rng
+    _name_rng = random.Random(seed) if seed is not None else None
+
+
 def unique_name(prefix: str = "test") -> str:
     """Generate a unique name with a prefix and short UUID.
 
+    While ``seed_unique_names`` is active the suffix comes from the seeded
+    generator, so a replayed test sends the same names it recorded.
+
     Args:
         prefix: Prefix for the name.
 
     Returns:
         A unique string like ``test-a1b2c3d4``.
     """
+    if _name_rng is not None:
+        return f"{prefix}-{_name_rng.getrandbits(32):08x}"
     return f"{prefix}-{uuid.uuid4().hex[:8]}"
 
 
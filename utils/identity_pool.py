@@ -0,0 +1,113 @@
+"""Worker-scoped pool of pre-authenticated guest identities.
+
+Logging in as a guest and loading the landing page for every test is the
+single most repeated piece of setup in the suite. The pool logs in once,
+captures the resulting cookies and localStorage as a Playwright
+``storage_state`` file, and hands that file to every new browser context
+until the identity has been used ``max_uses`` times.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from playwright.sync_api import Browser
+
+from utils.helpers import api_login_guest, build_auth_cookie
+
+
+@dataclass
+class GuestIdentity:
+    """A logged-in guest account and its persisted browser state."""
+
+    access_token: str
+    refresh_token: str
+    storage_state: Path
+    uses: int = 0
+
+    @property
+    def tokens(self) -> dict:
+        """Token payload in the shape returned by ``api_login_guest``."""
+        return {"accessToken": self.access_token, "refreshToken": self.refresh_token}
+
+
+class GuestIdentityPool:
+    """Hands out a shared guest identity, rotating it every ``max_uses`` tests."""
+
+    def __init__(
+        self,
+        api_url: str,
+        base_url: str,
+        state_dir: Path,
+        max_uses: int = 0,
+        browser: Optional[Browser] = None,
+    ) -> None:
+        """Initialize GuestIdentityPool.
+
+        Args:
+            api_url: Backend API base URL.
+            base_url: Application base URL.
+            state_dir: Directory for the ``storage_state`` JSON files.
+            max_uses: Tests served per identity before logging in again
+                (0 keeps one identity for the whole worker).
+            browser: Browser used to capture localStorage written on first
+                load. Without it only the auth cookie is persisted.
+        """
+        self.api_url = api_url
+        self.base_url = base_url.rstrip("/")
+        self.state_dir = Path(state_dir)
+        self.max_uses = max_uses
+        self.browser = browser
+        self.logins = 0
+        self._current: Optional[GuestIdentity] = None
+
+    def acquire(self) -> GuestIdentity:
+        """Return the pooled identity, logging in again once it is used up.
+
+        Returns:
+            The shared GuestIdentity for the next test.
+        """
+        current = self._current
+        if current is None or (self.max_uses and current.uses >= self.max_uses):
+            current = self._current = self._login()
+        current.uses += 1
+        return current
+
+    def fresh(self) -> GuestIdentity:
+        """Return a brand new identity that is never shared with other tests.
+
+        Returns:
+            A single-use GuestIdentity.
+        """
+        identity = self._login()
+        identity.uses = 1
+        return identity
+
+    def _login(self) -> GuestIdentity:
+        """Login as a new guest and persist its storage state."""
+        auth = api_login_guest(self.api_url)
+        self.logins += 1
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        path = self.state_dir / f"guest-{self.logins}.json"
+        state = {
+            "cookies": [build_auth_cookie(auth["accessToken"], self.base_url)],
+            "origins": [],
+        }
+        if self.browser is not None:
+            context = self.browser.new_context(storage_state=state)
+            try:
+                page = context.new_page()
+                page.goto(self.base_url, wait_until="domcontentloaded")
+                context.storage_state(path=path)
+            finally:
+                context.close()
+        else:
+            path.write_text(json.dumps(state))
+        return GuestIdentity(
+            access_token=auth["accessToken"],
+            refresh_token=auth.get("refreshToken", ""),
+            storage_state=path,
+        )
@@ -0,0 +1,99 @@
+"""Pytest plugin wiring the locator registry cache and its timing report.
+
+The registry (``pages/locator_registry.py``) is loaded from
+``--locator-cache`` at startup and saved back when each worker finishes.
+``--locator-report`` adds a terminal summary of how long locator
+resolution (including its ``count()`` round trips) took across the suite
+and how often the proven branch hit.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+import pytest
+
+from pages.locator_registry import REGISTRY
+
+USER_PROPERTY = "locator_stats"
+TOP_N = 15
+
+_collected: Dict[str, List[float]] = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--locator-cache",
+        action="store",
+        default=".locator-cache/locators.json",
+        help="File storing which locator fallback matched per frontend build",
+    )
+    parser.addoption(
+        "--no-locator-cache",
+        action="store_true",
+        default=False,
+        help="Resolve every .or_() fallback chain in full (no learning)",
+    )
+    parser.addoption(
+        "--locator-report",
+        action="store_true",
+        default=False,
+        help="Report locator resolution time and proven-branch hit rate",
+    )
+
+
+def pytest_configure(config):
+    if not config.getoption("--no-locator-cache"):
+        REGISTRY.load(config.getoption("--locator-cache"))
+
+
+def pytest_sessionfinish(session):
+    REGISTRY.save()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    REGISTRY.drain_stats()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when != "teardown":
+        return
+    stats = REGISTRY.drain_stats()
+    if stats:
+        outcome.get_result().user_properties.append((USER_PROPERTY, stats))
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown":
+        return
+    for name, value in report.user_properties:
+        if name != USER_PROPERTY:
+            continue
+        for key, (calls, hits, learned, seconds) in value.items():
+            total = _collected.setdefault(key, [0, 0, 0, 0.0])
+            total[0] += calls
+            total[1] += hits
+            total[2] += learned
+            total[3] += seconds
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not config.getoption("--locator-report") or not _collected:
+        return
+    calls = sum(v[0] for v in _collected.values())
+    hits = sum(v[1] for v in _collected.values())
+    learned = sum(v[2] for v in _collected.values())
+    seconds = sum(v[3] for v in _collected.values())
+    tr = terminalreporter
+    tr.write_sep("=", "locator resolution")
+    tr.write_line(
+        f"{calls} resolutions in {seconds:.2f}s, "
+        f"{hits} proven-branch hits ({hits / calls:.0%}), {learned} learned"
+    )
+    tr.write_line(f"{'calls':>6} {'hits':>6} {'total':>8}  locator")
+    ranked = sorted(_collected.items(), key=lambda kv: kv[1][3], reverse=True)
+    for key, (k_calls, k_hits, _, k_seconds) in ranked[:TOP_N]:
+        tr.write_line(f"{k_calls:6d} {k_hits:6d} {k_seconds:7.2f}s  {key}")
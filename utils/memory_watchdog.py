@@ -0,0 +1,250 @@
+"""Browser memory watchdog for long runs.
+
+With ``--memory-watchdog``, each worker samples the memory of its browser
+processes (PSS/RSS of the Playwright driver and browser process tree)
+before and after every test, and, on Chromium, the JS heap retained by the
+test's pages at the end of the test body (after a forced GC, via CDP).
+A test whose browser memory grew by more than ``--leak-limit`` MB is
+flagged as a leak suspect. Once the browser passes ``--browser-max-rss``
+MB between tests, it is closed and relaunched, so late tests do not run in
+a bloated browser. Browsers shared through ``--browser-server`` are
+recycled by the server pool instead.
+
+Per-test samples reach the xdist controller as user properties; the
+summary lists recycles, the largest growths and the leak suspects.
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+from typing import Callable, Dict, List, Optional
+
+import pytest
+from playwright.sync_api import Browser, BrowserContext, Error
+
+from utils.browser_server import process_tree_memory
+
+USER_PROPERTY = "memory"
+TOP_N = 10
+MB = 2**20
+
+
+class RecyclableBrowser:
+    """Stand-in for a locally launched ``Browser`` that can be relaunched."""
+
+    def __init__(self, launch: Callable[[], Browser]) -> None:
+        """Launch the first browser.
+
+        Args:
+            launch: Launches a new browser with the session's options.
+        """
+        self._launch = launch
+        self._browser = launch()
+
+    def recycle(self) -> None:
+        """Close the browser and launch a fresh one."""
+        self._browser.close()
+        self._browser = self._launch()
+
+    def close(self) -> None:
+        """Close the current browser."""
+        self._browser.close()
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._browser, name)
+
+
+def js_heap_used(context: BrowserContext) -> Optional[int]:
+    """JS heap retained by the context's pages after a GC, in bytes.
+
+    Args:
+        context: A Chromium browser context.
+
+    Returns:
+        Summed used heap of all open pages, or None if CDP is unavailable.
+    """
+    total = 0
+    for page in context.pages:
+        try:
+            session = context.new_cdp_session(page)
+        except Error:
+            return None
+        try:
+            session.send("HeapProfiler.collectGarbage")
+            total += int(session.send("Runtime.getHeapUsage")["usedSize"])
+        except Error:
+            pass
+        finally:
+            session.detach()
+    return total
+
+
+class MemoryWatchdog:
+    """Samples browser memory around tests and recycles the browser."""
+
+    def __init__(self) -> None:
+        """Initialize a disabled watchdog."""
+        self.enabled = False
+        self.max_memory = 2048 * MB
+        self.browser: Optional[RecyclableBrowser] = None
+        self._before: Optional[int] = None
+        self._sample: dict = {}
+
+    def wrap(self, launch: Callable[[], Browser]):
+        """Launch the worker's browser, recyclable if the watchdog is on.
+
+        Args:
+            launch: pytest-playwright's ``launch_browser`` callable.
+
+        Returns:
+            A RecyclableBrowser, or a plain Browser when disabled.
+        """
+        if not self.enabled:
+            return launch()
+        self.browser = RecyclableBrowser(launch)
+        return self.browser
+
+    def _memory(self) -> Optional[int]:
+        # The worker's child processes are its driver and browser. A browser
+        # shared through --browser-server lives elsewhere and is not sampled.
+        if self.browser is None:
+            return None
+        return process_tree_memory(os.getpid(), include_root=False)
+
+    def before_test(self) -> None:
+        """Sample browser memory before a test starts."""
+        self._sample = {}
+        self._before = self._memory() if self.enabled else None
+
+    def after_call(self, context: Optional[BrowserContext]) -> None:
+        """Sample the JS heap of the test's pages at the end of the test body.
+
+        Args:
+            context: The test's browser context, if it used one.
+        """
+        if not self.enabled or context is None:
+            return
+        browser = context.browser
+        if browser is None or browser.browser_type.name != "chromium":
+            return
+        heap = js_heap_used(context)
+        if heap is not None:
+            self._sample["js_heap"] = heap
+
+    def after_test(self) -> dict:
+        """Sample browser memory after teardown; recycle past the limit.
+
+        Returns:
+            The test's sample: ``before``/``after``/``delta`` bytes, optional
+            ``js_heap`` and ``recycled``; empty if nothing was measured.
+        """
+        after = self._memory() if self.enabled else None
+        if self._before is None or after is None:
+            return self._sample
+        self._sample.update(
+            before=self._before, after=after, delta=after - self._before
+        )
+        if self.browser is not None and after >= self.max_memory:
+            self.browser.recycle()
+            self._sample["recycled"] = True
+        return self._sample
+
+
+WATCHDOG = MemoryWatchdog()
+
+# ── Pytest plugin ────────────────────────────────────────────────────────
+
+_sample_key = pytest.StashKey[dict]()
+_samples: Dict[str, dict] = {}
+_recycles: List[str] = []
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--memory-watchdog",
+        action="store_true",
+        default=False,
+        help="Track browser memory per test, flag leaks and recycle the browser",
+    )
+    parser.addoption(
+        "--browser-max-rss",
+        action="store",
+        type=int,
+        default=2048,
+        help="MB of browser memory after which the watchdog relaunches it",
+    )
+    parser.addoption(
+        "--leak-limit",
+        action="store",
+        type=int,
+        default=50,
+        help="MB of browser memory growth that flags a test as a leak suspect",
+    )
+
+
+def pytest_configure(config):
+    WATCHDOG.enabled = config.getoption("--memory-watchdog")
+    WATCHDOG.max_memory = config.getoption("--browser-max-rss") * MB
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    WATCHDOG.before_test()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    yield
+    item.stash[_sample_key] = WATCHDOG.after_test()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when == "call":
+        WATCHDOG.after_call(item.funcargs.get("context"))
+    elif call.when == "teardown":
+        sample = item.stash.get(_sample_key, {})
+        if sample:
+            outcome.get_result().user_properties.append((USER_PROPERTY, sample))
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown":
+        return
+    for name, value in report.user_properties:
+        if name != USER_PROPERTY:
+            continue
+        _samples[report.nodeid] = value
+        if value.get("recycled"):
+            _recycles.append(report.nodeid)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not config.getoption("--memory-watchdog") or not _samples:
+        return
+    limit = config.getoption("--leak-limit") * MB
+    tr = terminalreporter
+    tr.write_sep("=", "browser memory")
+    tr.write_line(f"browser relaunched {len(_recycles)} time(s)")
+    grown = [(s["delta"], nodeid) for nodeid, s in _samples.items() if "delta" in s]
+    if grown:
+        tr.write_line("")
+        tr.write_line(f"{'growth':>9} {'after':>9} {'js heap':>9}  test")
+        for delta, nodeid in heapq.nlargest(TOP_N, grown):
+            sample = _samples[nodeid]
+            heap = sample.get("js_heap")
+            heap_text = f"{heap / MB:7.1f}MB" if heap is not None else f"{'-':>9}"
+            tr.write_line(
+                f"{delta / MB:7.1f}MB {sample['after'] / MB:7.0f}MB {heap_text}  "
+                f"{nodeid}"
+            )
+    suspects = sorted(nodeid for delta, nodeid in grown if delta > limit)
+    if suspects:
+        tr.write_line("")
+        tr.write_line(f"leak suspects (grew more than {limit // MB} MB):")
+        for nodeid in suspects:
+            tr.write_line(f"  {nodeid}")
@@ -0,0 +1,230 @@
+"""Backend latency histograms harvested from the browser's own traffic.
+
+With ``--api-latency``, every test context is observed through
+``requestfinished``. Requests to the backend API are grouped by endpoint
+template (``GET /projects/{id}/prompts``), and their timing phases (DNS,
+connect, TTFB, download, total) and response sizes are counted in
+log-bucketed histograms. Per-test histograms travel to the xdist
+controller as user properties, are merged there, printed as a
+p50/p95/p99 table and written to ``--api-latency-file``.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import pytest
+from playwright.sync_api import BrowserContext, Error, Request
+
+from utils.stats import Histogram
+
+USER_PROPERTY = "api_latency"
+TOP_N = 30
+
+_ID_SEGMENT = re.compile(
+    r"^(?:\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+    r"|[0-9a-f]{16,}|[A-Za-z0-9_-]{20,})$",
+    re.IGNORECASE,
+)
+
+
+def endpoint_template(path: str) -> str:
+    """Replace ID-like path segments with ``{id}``.
+
+    Any query string or fragment is dropped, so paginated or filtered calls
+    share their endpoint's row.
+
+    Args:
+        path: URL path relative to the API base.
+
+    Returns:
+        The endpoint template, e.g. ``/projects/{id}/prompts``.
+    """
+    segments = [
+        "{id}" if _ID_SEGMENT.match(segment) else segment
+        for segment in urlsplit(path).path.split("/")
+    ]
+    return "/".join(segments) or "/"
+
+
+def _phases(request: Request) -> Dict[str, float]:
+    """Turn Playwright's resource timing into phase durations in ms."""
+    timing = request.timing
+    phases: Dict[str, float] = {}
+
+    def span(start: str, end: str) -> Optional[float]:
+        if timing.get(start, -1) < 0 or timing.get(end, -1) < 0:
+            return None
+        return max(timing[end] - timing[start], 0.0)
+
+    for phase, start, end in (
+        ("dns", "domainLookupStart", "domainLookupEnd"),
+        ("connect", "connectStart", "connectEnd"),
+        ("ttfb", "requestStart", "responseStart"),
+        ("download", "responseStart", "responseEnd"),
+    ):
+        value = span(start, end)
+        if value is not None:
+            phases[phase] = value
+    if timing.get("responseEnd", -1) >= 0:
+        phases["total"] = timing["responseEnd"]
+    return phases
+
+
+class NetworkObserver:
+    """Collects per-endpoint histograms for the current test."""
+
+    def __init__(self) -> None:
+        """Initialize a disabled observer."""
+        self.enabled = False
+        self._histograms: Dict[str, Dict[str, Histogram]] = {}
+
+    def observe(self, context: BrowserContext, api_url: str) -> None:
+        """Record backend requests finished by any page of the context.
+
+        Args:
+            context: Playwright browser context.
+            api_url: Backend API base URL; other requests are ignored.
+        """
+        if not self.enabled:
+            return
+        base = urlsplit(api_url)
+        prefix = base.path.rstrip("/")
+
+        def on_finished(request: Request) -> None:
+            url = urlsplit(request.url)
+            if url.netloc != base.netloc or not url.path.startswith(prefix):
+                return
+            key = f"{request.method} {endpoint_template(url.path[len(prefix):])}"
+            phases = _phases(request)
+            try:
+                phases["bytes"] = request.sizes()["responseBodySize"]
+            except Error:
+                pass
+            histograms = self._histograms.setdefault(key, {})
+            for phase, value in phases.items():
+                histograms.setdefault(phase, Histogram()).record(value)
+
+        context.on("requestfinished", on_finished)
+
+    def drain(self) -> Dict[str, Dict[str, dict]]:
+        """Return and reset the histograms gathered since the last drain.
+
+        Returns:
+            Mapping of endpoint to phase to serialized histogram.
+        """
+        histograms, self._histograms = self._histograms, {}
+        return {
+            key: {phase: h.to_dict() for phase, h in phases.items()}
+            for key, phases in histograms.items()
+        }
+
+
+NETWORK = NetworkObserver()
+
+# ── Pytest plugin ────────────────────────────────────────────────────────
+
+_merged: Dict[str, Dict[str, Histogram]] = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--api-latency",
+        action="store_true",
+        default=False,
+        help="Report backend latency per endpoint from the browser's traffic",
+    )
+    parser.addoption(
+        "--api-latency-file",
+        action="store",
+        default="test-results/api-latency.json",
+        help="JSON file receiving the per-endpoint latency percentiles",
+    )
+
+
+def pytest_configure(config):
+    NETWORK.enabled = config.getoption("--api-latency")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    NETWORK.drain()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when != "teardown":
+        return
+    histograms = NETWORK.drain()
+    if histograms:
+        outcome.get_result().user_properties.append((USER_PROPERTY, histograms))
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown":
+        return
+    for name, value in report.user_properties:
+        if name != USER_PROPERTY:
+            continue
+        for key, phases in value.items():
+            merged = _merged.setdefault(key, {})
+            for phase, data in phases.items():
+                histogram = Histogram.from_dict(data)
+                if phase in merged:
+                    merged[phase].merge(histogram)
+                else:
+                    merged[phase] = histogram
+
+
+def _summary() -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Percentiles per endpoint and phase."""
+    return {
+        key: {
+            phase: {
+                "count": h.count,
+                "p50": h.percentile(50),
+                "p95": h.percentile(95),
+                "p99": h.percentile(99),
+                "max": h.max,
+            }
+            for phase, h in phases.items()
+        }
+        for key, phases in _merged.items()
+    }
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not config.getoption("--api-latency") or not _merged:
+        return
+    summary = _summary()
+    path = Path(config.getoption("--api-latency-file"))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(summary, indent=2, sort_keys=True))
+
+    tr = terminalreporter
+    tr.write_sep("=", "backend latency per endpoint (ms)")
+    tr.write_line(
+        f"{'count':>6} {'p50':>7} {'p95':>7} {'p99':>7} {'ttfb95':>7} "
+        f"{'KB p50':>7}  endpoint"
+    )
+    ranked = sorted(
+        summary.items(),
+        key=lambda kv: kv[1].get("total", {}).get("p95", 0.0),
+        reverse=True,
+    )
+    for key, phases in ranked[:TOP_N]:
+        total = phases.get("total")
+        if total is None:
+            continue
+        ttfb = phases.get("ttfb", {}).get("p95", 0.0)
+        size = phases.get("bytes", {}).get("p50", 0.0) / 1024
+        tr.write_line(
+            f"{total['count']:6d} {total['p50']:7.0f} {total['p95']:7.0f} "
+            f"{total['p99']:7.0f} {ttfb:7.0f} {size:7.1f}  {key}"
+        )
+    tr.write_line(f"full percentiles per phase written to {path}")
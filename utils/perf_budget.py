@@ -0,0 +1,122 @@
+"""Pytest plugin failing tests whose page loads exceed per-route budgets.
+
+Budgets live in ``config/budgets/<env>.json``: a ``default`` block plus
+per-route overrides keyed by the page object ``PATH`` (``/dashboard``,
+``/browse``, ...), each limiting ``lcp_ms``, ``transfer_bytes``,
+``requests`` and ``long_task_ms``. Tests marked ``@pytest.mark.perf_budget``
+record web vitals for every page object ``open()`` (see
+``pages/web_vitals.py``); after the test body each measurement is checked
+against its route budget. ``--perf-budget-severity`` (or the marker's
+``severity`` argument) decides whether an overrun fails the test or only
+emits a ``PerfBudgetWarning``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import warnings
+from typing import Dict, List
+
+import pytest
+
+from pages.web_vitals import VITALS
+
+BUDGET_DIR = os.path.join(os.path.dirname(__file__), "..", "config", "budgets")
+
+SEVERITIES = ("fail", "warn")
+
+
+class PerfBudgetWarning(UserWarning):
+    """A page load exceeded its performance budget (severity ``warn``)."""
+
+
+def load_budgets(env: str) -> Dict[str, Dict[str, float]]:
+    """Load the route budgets for an environment.
+
+    Args:
+        env: Environment name (``local``, ``stage`` or ``prod``).
+
+    Returns:
+        Mapping of route to its limits, with ``default`` for other routes.
+    """
+    path = os.path.join(BUDGET_DIR, f"{env}.json")
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        data = json.load(f)
+    default = data.get("default", {})
+    budgets = {"default": default}
+    for route, limits in data.get("routes", {}).items():
+        budgets[route] = {**default, **limits}
+    return budgets
+
+
+def check_budgets(
+    records: List[dict], budgets: Dict[str, Dict[str, float]]
+) -> List[str]:
+    """Compare measured page loads with their route budgets.
+
+    Args:
+        records: Measurements from ``WebVitalsRecorder``.
+        budgets: Result of ``load_budgets``.
+
+    Returns:
+        One message per exceeded limit (empty when everything is in budget).
+    """
+    violations = []
+    for record in records:
+        limits = budgets.get(record["route"], budgets.get("default", {}))
+        for metric, limit in limits.items():
+            value = record.get(metric)
+            if value is not None and value > limit:
+                violations.append(
+                    f"{record['route']}: {metric} {value:.0f} > budget {limit:.0f}"
+                )
+    return violations
+
+
+# ── Pytest plugin ────────────────────────────────────────────────────────
+
+_budgets_key = pytest.StashKey[Dict[str, Dict[str, float]]]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--perf-budget-severity",
+        action="store",
+        default="fail",
+        choices=SEVERITIES,
+        help="What a perf_budget overrun does: fail the test or warn",
+    )
+
+
+def pytest_configure(config):
+    config.stash[_budgets_key] = load_budgets(config.getoption("--env"))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    # Vitals are needed for budgeted tests even without --web-vitals.
+    VITALS.enabled = item.config.getoption("--web-vitals") or bool(
+        item.get_closest_marker("perf_budget")
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    result = yield
+    marker = item.get_closest_marker("perf_budget")
+    if marker is None:
+        return result
+    violations = check_budgets(VITALS.peek(), item.config.stash[_budgets_key])
+    if not violations:
+        return result
+    severity = marker.kwargs.get(
+        "severity", item.config.getoption("--perf-budget-severity")
+    )
+    message = "performance budget exceeded:\n  " + "\n  ".join(violations)
+    if severity == "warn":
+        warnings.warn(PerfBudgetWarning(message))
+        return result
+    pytest.fail(message, pytrace=False)
@@ -0,0 +1,183 @@
+"""Blocking of third-party and non-essential requests during tests.
+
+Analytics beacons, external fonts, sign-in SDKs and similar requests slow
+down ``networkidle`` waits and make them flaky without affecting what the
+functional tests check. Each context aborts:
+
+- requests to hosts outside the app's own sites (derived from
+  ``BASE_URL``, ``API_URL`` and ``ADMIN_URL``), except for hosts listed in
+  ``THIRD_PARTY_ALLOW``;
+- requests whose URL contains one of the ``BLOCK_URL_PATTERNS``, e.g.
+  first-party analytics endpoints.
+
+Both lists are comma-separated and live in ``config/<env>.env`` next to
+``REQUEST_BLOCKING``, which turns the profile on for an environment.
+Blocking is off with ``--no-request-blocking`` and for the contexts of
+``perf_budget`` tests, so their page weight stays realistic; ``--web-vitals``
+alone does not turn it off.
+The matching runs in the browser driver; only blocked requests reach
+Python, where they are counted per host for the end-of-session report.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import os
+import re
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import pytest
+from playwright.sync_api import BrowserContext, Route
+
+USER_PROPERTY = "blocked_requests"
+TOP_N = 20
+
+
+def site_of(url: str) -> Optional[str]:
+    """Site a URL belongs to: the last two host labels, or the whole host.
+
+    Args:
+        url: Absolute URL.
+
+    Returns:
+        ``echostash.com`` for ``https://stage-api.echostash.com``; the host
+        itself for ``localhost`` and IP addresses; None without a host.
+    """
+    host = urlsplit(url).hostname
+    if not host:
+        return None
+    try:
+        ipaddress.ip_address(host)
+        return host
+    except ValueError:
+        return ".".join(host.split(".")[-2:])
+
+
+def _split(value: Optional[str]) -> List[str]:
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def build_block_pattern(
+    allowed_hosts: Iterable[str], blocked_urls: Iterable[str] = ()
+) -> re.Pattern:
+    """Regex matching the URLs to abort.
+
+    Args:
+        allowed_hosts: Hosts (and their subdomains) that may be contacted.
+        blocked_urls: Substrings of URLs that are always blocked.
+
+    Returns:
+        A pattern that also works as a JavaScript regex, so Playwright can
+        match it in the driver.
+    """
+    hosts = "|".join(re.escape(h) for h in sorted(set(allowed_hosts)))
+    alternatives = [rf"^https?://(?!(?:[^/?#]*\.)?(?:{hosts})(?::\d+)?(?:[/?#]|$))"]
+    alternatives.extend(re.escape(url) for url in blocked_urls)
+    return re.compile("|".join(alternatives))
+
+
+def block_pattern_from_env() -> Optional[re.Pattern]:
+    """Build the pattern from the environment's ``config/<env>.env`` settings.
+
+    Returns:
+        The pattern, or None if ``REQUEST_BLOCKING`` is off.
+    """
+    if os.getenv("REQUEST_BLOCKING", "true").lower() not in ("1", "true", "on"):
+        return None
+    sites = [
+        site_of(os.getenv(name, ""))
+        for name in ("BASE_URL", "API_URL", "ADMIN_URL")
+    ]
+    allowed = [s for s in sites if s] + _split(os.getenv("THIRD_PARTY_ALLOW"))
+    return build_block_pattern(allowed, _split(os.getenv("BLOCK_URL_PATTERNS")))
+
+
+class RequestBlocker:
+    """Aborts non-essential requests and counts them per host."""
+
+    def __init__(self) -> None:
+        """Initialize a disabled blocker."""
+        self.enabled = False
+        self._pattern: Optional[re.Pattern] = None
+        self._blocked: Dict[str, int] = {}
+
+    def install(self, context: BrowserContext, measured: bool = False) -> None:
+        """Abort the context's third-party and blocklisted requests.
+
+        Args:
+            context: Playwright browser context.
+            measured: Whether the context belongs to a ``perf_budget`` test,
+                whose page weight must not be filtered.
+        """
+        if not self.enabled or measured:
+            return
+        if self._pattern is None:
+            self._pattern = block_pattern_from_env()
+            if self._pattern is None:
+                self.enabled = False
+                return
+        context.route(self._pattern, self._abort)
+
+    def _abort(self, route: Route) -> None:
+        host = urlsplit(route.request.url).netloc
+        self._blocked[host] = self._blocked.get(host, 0) + 1
+        route.abort("blockedbyclient")
+
+    def drain(self) -> Dict[str, int]:
+        """Return and reset the blocked request counts since the last drain.
+
+        Returns:
+            Mapping of host to number of blocked requests.
+        """
+        blocked, self._blocked = self._blocked, {}
+        return blocked
+
+
+BLOCKER = RequestBlocker()
+
+# ── Pytest plugin ────────────────────────────────────────────────────────
+
+_totals: Dict[str, int] = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-request-blocking",
+        action="store_true",
+        default=False,
+        help="Let third-party and blocklisted requests through",
+    )
+
+
+def pytest_configure(config):
+    BLOCKER.enabled = not config.getoption("--no-request-blocking")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when != "teardown":
+        return
+    blocked = BLOCKER.drain()
+    if blocked:
+        outcome.get_result().user_properties.append((USER_PROPERTY, blocked))
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown":
+        return
+    for name, value in report.user_properties:
+        if name == USER_PROPERTY:
+            for host, count in value.items():
+                _totals[host] = _totals.get(host, 0) + count
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _totals:
+        return
+    tr = terminalreporter
+    tr.write_sep("=", f"blocked requests: {sum(_totals.values())}")
+    ranked = sorted(_totals.items(), key=lambda kv: kv[1], reverse=True)
+    for host, count in ranked[:TOP_N]:
+        tr.write_line(f"{count:7d}  {host}")
@@ -0,0 +1,121 @@
+"""Pytest plugin splitting the suite into duration-balanced shards.
+
+``--shard=i/N`` keeps only the tests of shard ``i`` (1-based) out of ``N``.
+Tests with a recorded duration in the ``TimingStore`` (see
+``utils/duration_scheduler.py``) are packed longest-first onto the
+least-loaded shard; tests without history are dealt out round-robin. The
+split depends only on the collected node IDs and the timing store, so
+every runner computes the same partition as long as all runners read the
+same timing store snapshot. ``--shard-estimate=N`` prints the
+estimated runtime of each of ``N`` shards and exits without running tests.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+import pytest
+
+from utils.duration_scheduler import estimate_durations
+from utils.timing_store import TimingStore
+
+
+def plan_shards(
+    nodeids: List[str], known: Dict[str, float], count: int
+) -> Tuple[List[List[str]], List[float]]:
+    """Partition tests into ``count`` shards of similar estimated duration.
+
+    Args:
+        nodeids: Collected test node IDs.
+        known: Historical estimates from ``TimingStore.estimates``.
+        count: Number of shards.
+
+    Returns:
+        ``(shards, loads)``: the node IDs of each shard and its estimated
+        seconds.
+    """
+    estimates = estimate_durations(nodeids, known)
+    shards: List[List[str]] = [[] for _ in range(count)]
+    loads = [0.0] * count
+    measured = sorted(
+        (n for n in set(nodeids) if n in known), key=lambda n: (-known[n], n)
+    )
+    for nodeid in measured:
+        target = min(range(count), key=lambda i: (loads[i], i))
+        shards[target].append(nodeid)
+        loads[target] += known[nodeid]
+    unknown = sorted(n for n in set(nodeids) if n not in known)
+    for index, nodeid in enumerate(unknown):
+        shards[index % count].append(nodeid)
+        loads[index % count] += estimates[nodeid]
+    return shards, loads
+
+
+def _parse_shard(value: str) -> Tuple[int, int]:
+    """Parse ``i/N`` into a 1-based shard index and shard count."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"--shard expects i/N, got {value!r}") from None
+    if not 1 <= index <= count:
+        raise pytest.UsageError(f"--shard index must be between 1 and {count}")
+    return index, count
+
+
+# ── Pytest plugin ────────────────────────────────────────────────────────
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--shard",
+        action="store",
+        default=None,
+        help="Run only shard i of N (e.g. 2/4), balanced by recorded durations",
+    )
+    parser.addoption(
+        "--shard-estimate",
+        action="store",
+        type=int,
+        default=0,
+        help="Print the estimated runtime of N shards and exit",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--shard"):
+        _parse_shard(config.getoption("--shard"))
+    if config.getoption("--shard-estimate") < 0:
+        raise pytest.UsageError("--shard-estimate must be at least 1")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, config, items):
+    shard = config.getoption("--shard")
+    estimate = config.getoption("--shard-estimate")
+    if not shard and not estimate:
+        return
+    index, count = _parse_shard(shard) if shard else (0, estimate)
+    store = TimingStore(config.getoption("--timing-db"))
+    try:
+        known = store.estimates()
+    finally:
+        store.close()
+    nodeids = [item.nodeid for item in items]
+    shards, loads = plan_shards(nodeids, known, count)
+
+    if estimate:
+        reporter = config.pluginmanager.get_plugin("terminalreporter")
+        unknown = sum(n not in known for n in nodeids)
+        reporter.write_sep("=", f"shard estimate ({unknown} tests without history)")
+        for i, (tests, load) in enumerate(zip(shards, loads), start=1):
+            reporter.write_line(
+                f"shard {i}/{count}: {len(tests):4d} tests  {load:8.1f}s"
+            )
+        pytest.exit("shard estimate only", returncode=pytest.ExitCode.OK)
+
+    selected = set(shards[index - 1])
+    keep = [item for item in items if item.nodeid in selected]
+    deselected = [item for item in items if item.nodeid not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = keep
@@ -0,0 +1,109 @@
+"""Pytest plugin reporting wall time spent in fixed sleeps per test.
+
+Enabled with ``--sleep-report``. While active, ``Page.wait_for_timeout`` and
+``Page.wait_for_load_state("networkidle")`` are timed and attributed to the
+running test, and the terminal summary lists the tests that spend the most
+time waiting so they can be moved onto ``BasePage.wait_for_app_idle``.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from typing import Dict
+
+import pytest
+from playwright.sync_api import Page
+
+USER_PROPERTY = "fixed_waits"
+TOP_N = 25
+
+_current: Dict[str, float] = defaultdict(float)
+_collected: Dict[str, Dict[str, float]] = {}
+
+
+def _timed(kind_of, original):
+    """Wrap a Page method so its wall time is added to the running test."""
+
+    def wrapper(self, *args, **kwargs):
+        kind = kind_of(*args, **kwargs)
+        if kind is None:
+            return original(self, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return original(self, *args, **kwargs)
+        finally:
+            _current[kind] += time.perf_counter() - start
+
+    wrapper.__wrapped__ = original
+    return wrapper
+
+
+def _install() -> None:
+    """Patch the sync Page API with timing wrappers."""
+    if hasattr(Page.wait_for_timeout, "__wrapped__"):
+        return
+    Page.wait_for_timeout = _timed(lambda *a, **k: "sleep", Page.wait_for_timeout)
+    Page.wait_for_load_state = _timed(
+        lambda state=None, **k: "networkidle" if state == "networkidle" else None,
+        Page.wait_for_load_state,
+    )
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--sleep-report",
+        action="store_true",
+        default=False,
+        help="Report per-test wall time spent in wait_for_timeout/networkidle",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--sleep-report"):
+        _install()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    _current.clear()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when != "teardown" or not item.config.getoption("--sleep-report"):
+        return
+    if _current:
+        outcome.get_result().user_properties.append((USER_PROPERTY, dict(_current)))
+
+
+def pytest_runtest_logreport(report):
+    # Runs on the xdist controller too, where the worker's user_properties
+    # arrive with the serialized teardown report.
+    if report.when != "teardown":
+        return
+    for name, value in report.user_properties:
+        if name == USER_PROPERTY:
+            _collected[report.nodeid] = value
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not config.getoption("--sleep-report") or not _collected:
+        return
+    ranked = sorted(
+        _collected.items(), key=lambda kv: sum(kv[1].values()), reverse=True
+    )
+    total_sleep = sum(v.get("sleep", 0.0) for v in _collected.values())
+    total_idle = sum(v.get("networkidle", 0.0) for v in _collected.values())
+    tr = terminalreporter
+    tr.write_sep("=", "fixed waits")
+    tr.write_line(
+        f"total: {total_sleep:.1f}s in wait_for_timeout, "
+        f"{total_idle:.1f}s in networkidle across {len(_collected)} tests"
+    )
+    tr.write_line(f"{'sleep':>8} {'netidle':>8}  test")
+    for nodeid, waits in ranked[:TOP_N]:
+        tr.write_line(
+            f"{waits.get('sleep', 0.0):7.1f}s {waits.get('networkidle', 0.0):7.1f}s  {nodeid}"
+        )
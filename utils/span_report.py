@@ -0,0 +1,165 @@
+"""Pytest plugin reporting where test time goes, per page object action.
+
+``--span-report`` turns on the span recorder from ``pages/spans.py`` and
+prints, at the end of the session, the slowest individual actions, total
+time per page object and action, and how much of the tests' wall time was
+spent waiting on the app versus interacting with it. ``--span-json`` also
+writes the aggregate to a JSON file. Per-test aggregates reach the xdist
+controller as user properties.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from pages.spans import INTERACT, SPANS, WAIT
+
+USER_PROPERTY = "spans"
+TOP_N = 15
+
+_actions: Dict[str, List] = {}
+_slowest: List[Tuple[float, str, str]] = []
+_totals: Dict[str, float] = {"test_seconds": 0.0}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--span-report",
+        action="store_true",
+        default=False,
+        help="Time page object actions and report the slowest ones",
+    )
+    parser.addoption(
+        "--span-json",
+        action="store",
+        default=None,
+        help="Also write the span report to this JSON file",
+    )
+
+
+def _enabled(config) -> bool:
+    return bool(config.getoption("--span-report") or config.getoption("--span-json"))
+
+
+def pytest_configure(config):
+    SPANS.enabled = _enabled(config)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    SPANS.drain()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when != "teardown":
+        return
+    stats = SPANS.drain()
+    if stats:
+        outcome.get_result().user_properties.append((USER_PROPERTY, stats))
+
+
+def pytest_runtest_logreport(report):
+    _totals["test_seconds"] += report.duration
+    if report.when != "teardown":
+        return
+    for name, value in report.user_properties:
+        if name != USER_PROPERTY:
+            continue
+        for key, (kind, count, total, longest) in value["actions"].items():
+            action = _actions.setdefault(key, [kind, 0, 0.0, 0.0])
+            action[1] += count
+            action[2] += total
+            action[3] = max(action[3], longest)
+        for seconds, key in value["slowest"]:
+            entry = (seconds, key, report.nodeid)
+            if len(_slowest) < TOP_N:
+                heapq.heappush(_slowest, entry)
+            elif entry > _slowest[0]:
+                heapq.heapreplace(_slowest, entry)
+
+
+def build_report() -> dict:
+    """Aggregate the collected spans into the report structure.
+
+    Returns:
+        Dict with ``slowest``, ``page_objects``, ``actions`` and ``share``.
+    """
+    page_objects: Dict[str, float] = {}
+    by_kind = {WAIT: 0.0, INTERACT: 0.0}
+    for key, (kind, _, total, _) in _actions.items():
+        owner = key.split(".", 1)[0]
+        page_objects[owner] = page_objects.get(owner, 0.0) + total
+        by_kind[kind] += total
+    wall = _totals["test_seconds"]
+    other = max(wall - by_kind[WAIT] - by_kind[INTERACT], 0.0)
+    return {
+        "slowest": [
+            {"action": key, "test": nodeid, "seconds": seconds}
+            for seconds, key, nodeid in sorted(_slowest, reverse=True)
+        ],
+        "page_objects": dict(
+            sorted(page_objects.items(), key=lambda kv: kv[1], reverse=True)
+        ),
+        "actions": {
+            key: {"kind": kind, "calls": count, "total": total, "max": longest}
+            for key, (kind, count, total, longest) in sorted(
+                _actions.items(), key=lambda kv: kv[1][2], reverse=True
+            )
+        },
+        "share": {
+            "test_seconds": wall,
+            WAIT: by_kind[WAIT],
+            INTERACT: by_kind[INTERACT],
+            "other": other,
+        },
+    }
+
+
+def _percent(part: float, whole: float) -> str:
+    return f"{part / whole:.0%}" if whole else "-"
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _enabled(config) or not _actions:
+        return
+    report = build_report()
+    json_path: Optional[str] = config.getoption("--span-json")
+    if json_path:
+        Path(json_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(json_path).write_text(json.dumps(report, indent=2))
+    if not config.getoption("--span-report"):
+        return
+    tr = terminalreporter
+    share = report["share"]
+    wall = share["test_seconds"]
+    tr.write_sep("=", "page object action timing")
+    tr.write_line(
+        f"{wall:.1f}s of test time: waiting {share[WAIT]:.1f}s "
+        f"({_percent(share[WAIT], wall)}), interacting {share[INTERACT]:.1f}s "
+        f"({_percent(share[INTERACT], wall)}), other {share['other']:.1f}s "
+        f"({_percent(share['other'], wall)})"
+    )
+    tr.write_line("")
+    tr.write_line("slowest actions:")
+    for entry in report["slowest"]:
+        tr.write_line(
+            f"{entry['seconds']:8.2f}s  {entry['action']}  ({entry['test']})"
+        )
+    tr.write_line("")
+    tr.write_line(f"{'total':>9}  page object")
+    for owner, total in list(report["page_objects"].items())[:TOP_N]:
+        tr.write_line(f"{total:8.2f}s  {owner}")
+    tr.write_line("")
+    tr.write_line(f"{'calls':>6} {'total':>9} {'max':>8}  action")
+    for key, action in list(report["actions"].items())[:TOP_N]:
+        tr.write_line(
+            f"{action['calls']:6d} {action['total']:8.2f}s "
+            f"{action['max']:7.2f}s  {key}"
+        )
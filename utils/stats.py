@@ -0,0 +1,120 @@
+"""Small statistics helpers shared by the reporting plugins."""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Return the nearest-rank percentile of ``values``.
+
+    Args:
+        values: Samples (need not be sorted).
+        pct: Percentile between 0 and 100.
+
+    Returns:
+        The sample at that rank, or 0.0 for no samples.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class Histogram:
+    """Log-bucketed histogram with a bounded relative error (HDR-style).
+
+    Values are counted in buckets whose width grows geometrically, so any
+    reported percentile is within ``precision`` of a real sample while the
+    memory stays proportional to the dynamic range, not the sample count.
+    Histograms from different workers merge by adding bucket counts.
+    """
+
+    def __init__(self, precision: float = 0.02, lowest: float = 0.1) -> None:
+        """Initialize an empty Histogram.
+
+        Args:
+            precision: Maximum relative error of reported values.
+            lowest: Values below this are counted as zero.
+        """
+        self.precision = precision
+        self.lowest = lowest
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def _bucket(self, value: float) -> int:
+        if value < self.lowest:
+            return -1
+        return int(math.log(value / self.lowest) / math.log1p(self.precision))
+
+    def _value(self, bucket: int) -> float:
+        if bucket < 0:
+            return 0.0
+        return self.lowest * (1 + self.precision) ** (bucket + 0.5)
+
+    def record(self, value: float) -> None:
+        """Count one sample.
+
+        Args:
+            value: Non-negative sample.
+        """
+        bucket = self._bucket(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def merge(self, other: "Histogram") -> None:
+        """Add another histogram's samples to this one.
+
+        Args:
+            other: Histogram with the same precision and lowest value.
+        """
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, pct: float) -> float:
+        """Return the value at a percentile.
+
+        Args:
+            pct: Percentile between 0 and 100.
+
+        Returns:
+            The bucket value holding that rank, or 0.0 for no samples.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(math.ceil(pct / 100 * self.count), 1)
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(self._value(bucket), self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        """Serialize for user properties or JSON."""
+        return {
+            "precision": self.precision,
+            "lowest": self.lowest,
+            "counts": {str(b): c for b, c in self.counts.items()},
+            "total": self.total,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Histogram":
+        """Rebuild a histogram serialized by ``to_dict``."""
+        histogram = cls(data["precision"], data["lowest"])
+        histogram.counts = {int(b): c for b, c in data["counts"].items()}
+        histogram.count = sum(histogram.counts.values())
+        histogram.total = data["total"]
+        histogram.max = data["max"]
+        return histogram
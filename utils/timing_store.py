@@ -0,0 +1,79 @@
+"""Local SQLite store of historical per-test durations."""
+
+from __future__ import annotations
+
+import sqlite3
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+KEEP_RUNS = 10
+DEFAULT_PATH = ".test-timings/timings.sqlite"
+
+
+class TimingStore:
+    """Records how long each test took and estimates its next duration."""
+
+    def __init__(self, path: str = DEFAULT_PATH) -> None:
+        """Initialize TimingStore, creating the database if needed.
+
+        Args:
+            path: SQLite database file.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS durations (
+                nodeid TEXT NOT NULL,
+                duration REAL NOT NULL,
+                outcome TEXT NOT NULL,
+                recorded_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS durations_nodeid ON durations (nodeid)"
+        )
+        self._conn.commit()
+
+    def record(self, results: Iterable[Tuple[str, float, str]]) -> None:
+        """Store one run's results and keep only the last ``KEEP_RUNS`` per test.
+
+        Args:
+            results: ``(nodeid, seconds, outcome)`` tuples.
+        """
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO durations (nodeid, duration, outcome, recorded_at) "
+                "VALUES (?, ?, ?, ?)",
+                [(nodeid, seconds, outcome, now) for nodeid, seconds, outcome in results],
+            )
+            self._conn.execute(
+                """DELETE FROM durations WHERE rowid IN (
+                    SELECT rowid FROM (
+                        SELECT rowid, ROW_NUMBER() OVER (
+                            PARTITION BY nodeid ORDER BY recorded_at DESC
+                        ) AS age FROM durations
+                    ) WHERE age > ?
+                )""",
+                (KEEP_RUNS,),
+            )
+
+    def estimates(self) -> Dict[str, float]:
+        """Return the median of the recorded durations for every known test.
+
+        Returns:
+            Mapping of nodeid to estimated seconds.
+        """
+        samples: Dict[str, list] = {}
+        for nodeid, seconds in self._conn.execute(
+            "SELECT nodeid, duration FROM durations"
+        ):
+            samples.setdefault(nodeid, []).append(seconds)
+        return {nodeid: statistics.median(values) for nodeid, values in samples.items()}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -0,0 +1,124 @@
+"""Pytest plugin reporting Monaco typing profiles per document size.
+
+Each ``MonacoEditor.profile_typing`` call (see ``pages/typing_profiler.py``)
+travels to the xdist controller as a user property with its raw samples.
+At the end of the session the controller writes one JSONL record per
+profile to ``--typing-latency-file`` and prints keystroke-to-paint
+percentiles, long tasks and frame drops per document size.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from pages.typing_profiler import TYPING
+from utils.stats import percentile
+
+USER_PROPERTY = "typing_profile"
+PERCENTILES = (50, 90, 95, 99)
+
+_by_size: Dict[int, List[dict]] = {}
+_summaries: List[dict] = []
+_output: Dict[str, Path] = {}
+
+
+def summarize(profile: dict) -> dict:
+    """Condense a profile's raw samples into percentiles and totals.
+
+    Args:
+        profile: A recorded profile with ``latency_ms`` and ``long_task_ms``
+            sample lists.
+
+    Returns:
+        The profile with latency percentiles and long-task totals instead of
+        the sample lists.
+    """
+    latencies = profile["latency_ms"]
+    long_tasks = profile["long_task_ms"]
+    summary = {k: v for k, v in profile.items() if not k.endswith("_ms")}
+    summary.update(
+        {f"latency_p{pct}_ms": percentile(latencies, pct) for pct in PERCENTILES}
+    )
+    summary["latency_max_ms"] = max(latencies, default=0.0)
+    summary["painted"] = len(latencies)
+    summary["long_tasks"] = len(long_tasks)
+    summary["long_task_ms"] = sum(long_tasks, 0.0)
+    summary["max_long_task_ms"] = max(long_tasks, default=0.0)
+    return summary
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--typing-latency-file",
+        action="store",
+        default="test-results/typing-latency.jsonl",
+        help="JSONL file receiving one record per Monaco typing profile",
+    )
+
+
+def pytest_configure(config):
+    if not hasattr(config, "workerinput"):
+        _output["path"] = Path(config.getoption("--typing-latency-file"))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    TYPING.drain()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when != "teardown":
+        return
+    records = TYPING.drain()
+    if records:
+        outcome.get_result().user_properties.append((USER_PROPERTY, records))
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown":
+        return
+    now = time.time()
+    for name, value in report.user_properties:
+        if name != USER_PROPERTY:
+            continue
+        for record in value:
+            _by_size.setdefault(record["lines"], []).append(record)
+            _summaries.append({"test": report.nodeid, "time": now, **summarize(record)})
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _by_size or "path" not in _output:
+        return
+    tr = terminalreporter
+    tr.write_sep("=", "monaco typing latency per document size")
+    latency = "".join(f"{f'p{pct}':>7}" for pct in PERCENTILES)
+    tr.write_line(
+        f"{'lines':>8}{'keys':>6}{latency}{'max':>7}"
+        f"{'long tasks':>12}{'longest':>9}{'dropped':>13}"
+    )
+    for size in sorted(_by_size):
+        profiles = _by_size[size]
+        latencies = [v for p in profiles for v in p["latency_ms"]]
+        long_tasks = [v for p in profiles for v in p["long_task_ms"]]
+        frames = sum(p["frames"] for p in profiles)
+        dropped = sum(p["dropped_frames"] for p in profiles)
+        cells = "".join(f"{percentile(latencies, pct):7.1f}" for pct in PERCENTILES)
+        tr.write_line(
+            f"{size:>8}{len(latencies):>6}{cells}{max(latencies, default=0.0):7.1f}"
+            f"{len(long_tasks):>12}{max(long_tasks, default=0.0):7.0f}ms"
+            f"{dropped:>6}/{frames:<6}"
+        )
+    tr.write_line("latencies are keystroke-to-paint in ms; dropped is dropped/frames")
+    # Written at the end: pytest-playwright empties its output directory when
+    # each worker starts, which would race with incremental writes.
+    path = _output["path"]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(json.dumps(s) + "\n" for s in _summaries))
+    tr.write_line(f"records written to {path}")
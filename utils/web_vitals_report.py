@@ -0,0 +1,126 @@
+"""Pytest plugin recording web vitals for every page object ``open()``.
+
+With ``--web-vitals`` each context gets the observers from
+``pages/web_vitals.py`` and every ``navigate`` + ``wait_for_page_load``
+pair is measured. Measurements travel to the xdist controller as user
+properties; the controller keeps them in memory, writes them to
+``--web-vitals-file`` (JSONL, one line per page open) when the session
+finishes and prints p50/p95 per route.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from pages.web_vitals import VITALS
+from utils.stats import percentile
+
+USER_PROPERTY = "web_vitals"
+
+SUMMARY_METRICS = [
+    ("ttfb_ms", "TTFB", "ms"),
+    ("fcp_ms", "FCP", "ms"),
+    ("lcp_ms", "LCP", "ms"),
+    ("cls", "CLS", ""),
+    ("tbt_ms", "TBT", "ms"),
+    ("js_heap_bytes", "heap", "MB"),
+    ("dom_nodes", "nodes", ""),
+]
+
+_by_route: Dict[str, List[dict]] = {}
+_lines: List[dict] = []
+_output: Dict[str, Path] = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--web-vitals",
+        action="store_true",
+        default=False,
+        help="Measure web vitals each time a page object opens its route",
+    )
+    parser.addoption(
+        "--web-vitals-file",
+        action="store",
+        default="test-results/web-vitals.jsonl",
+        help="JSONL file receiving one web vitals record per page open",
+    )
+
+
+def pytest_configure(config):
+    VITALS.enabled = config.getoption("--web-vitals")
+    if VITALS.enabled and not hasattr(config, "workerinput"):
+        _output["file"] = Path(config.getoption("--web-vitals-file"))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    VITALS.drain()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when != "teardown":
+        return
+    records = VITALS.drain()
+    if records:
+        outcome.get_result().user_properties.append((USER_PROPERTY, records))
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown":
+        return
+    for name, value in report.user_properties:
+        if name != USER_PROPERTY or "file" not in _output:
+            continue
+        now = time.time()
+        for record in value:
+            _by_route.setdefault(record["route"], []).append(record)
+            _lines.append({"test": report.nodeid, "time": now, **record})
+
+
+def pytest_sessionfinish(session):
+    # Written at the end: pytest-playwright empties its output directory when
+    # the session starts, which would delete a file created earlier.
+    if "file" not in _output:
+        return
+    path = _output["file"]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(json.dumps(line) + "\n" for line in _lines))
+
+
+def _format(values: List[float], unit: str) -> str:
+    """Format p50/p95 of a metric for the summary table."""
+    if not values:
+        return f"{'-':^13}"
+    p50, p95 = percentile(values, 50), percentile(values, 95)
+    if unit == "MB":
+        p50, p95 = p50 / 1e6, p95 / 1e6
+    if unit == "" and max(values) < 10:
+        return f"{p50:6.3f}/{p95:<6.3f}"
+    return f"{p50:6.0f}/{p95:<6.0f}"
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not config.getoption("--web-vitals") or not _by_route:
+        return
+    tr = terminalreporter
+    tr.write_sep("=", "web vitals per route (p50/p95)")
+    header = "".join(
+        f" {f'{label} {unit}'.strip():^13}" for _, label, unit in SUMMARY_METRICS
+    )
+    tr.write_line(f"{'route':<24}{'n':>4}{header}")
+    for route in sorted(_by_route):
+        records = _by_route[route]
+        cells = "".join(
+            f" {_format([r[key] for r in records if r.get(key) is not None], unit)}"
+            for key, _, unit in SUMMARY_METRICS
+        )
+        tr.write_line(f"{route:<24}{len(records):>4}{cells}")
+    tr.write_line(f"records written to {_output['file']}")